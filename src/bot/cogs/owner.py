@@ -25,6 +25,9 @@ async def owner(self, ctx: commands.Context) -> commands.Command | None:
             owner servers - List all servers in database
             owner prefix <new_prefix> - Change bot command prefix
             owner botdescription <new_description> - Update bot description
+            owner gw2api - Show GW2 API circuit breaker state
+            owner gw2metrics - Show GW2 API latency and error metrics per endpoint
+            owner gw2sessions - Show GW2 session pipeline counters and latencies
         """
         return await bot_utils.invoke_subcommand(ctx, "owner")
 
@@ -120,6 +123,153 @@ async def owner_servers(self, ctx: commands.Context) -> None:
         await bot_utils.send_embed(ctx, embed, True)
         return None
 
+    @owner.command(name="gw2api")
+    async def owner_gw2api(self, ctx: commands.Context) -> None:
+        """Display the GW2 API circuit breaker state per endpoint family.
+
+        An open circuit means requests to that family fail fast
+        until the API answers a probe request again.
+
+        Usage:
+            owner gw2api
+        """
+        await ctx.message.channel.typing()
+
+        circuits = self.bot.gw2_client.circuit_breaker.stats()
+        if not circuits:
+            embed = self._create_owner_embed("No GW2 API requests have been made yet.")
+            return await bot_utils.send_embed(ctx, embed, True)
+
+        embed = self._create_owner_embed("GW2 API circuit breakers")
+        max_fields = 25  # Discord embed field limit
+        for family, circuit in list(circuits.items())[:max_fields]:
+            value = (
+                f"State: `{circuit['state']}`\n"
+                f"Failures: {circuit['failures']}\n"
+                f"Opened: {circuit['times_opened']}x\n"
+                f"Rejected: {circuit['rejected']}"
+            )
+            if circuit["retry_in"]:
+                value += f"\nProbe in: {circuit['retry_in']}s"
+            embed.add_field(name=family, value=value)
+
+        open_count = sum(1 for circuit in circuits.values() if circuit["state"] != "closed")
+        embed.set_footer(text=f"Endpoint families: {len(circuits)} | Not closed: {open_count}")
+
+        await bot_utils.send_embed(ctx, embed, True)
+        return None
+
+    @owner.command(name="gw2metrics")
+    async def owner_gw2metrics(self, ctx: commands.Context) -> None:
+        """Display GW2 API request metrics per endpoint, most requested first.
+
+        Shows latency percentiles, status codes, retries, bytes received and cache hits,
+        to tell whether slow commands are waiting on the GW2 API.
+
+        Usage:
+            owner gw2metrics
+        """
+        await ctx.message.channel.typing()
+
+        endpoints = self.bot.gw2_client.metrics.stats()
+        if not endpoints:
+            embed = self._create_owner_embed("No GW2 API requests have been made yet.")
+            return await bot_utils.send_embed(ctx, embed, True)
+
+        embed = self._create_owner_embed("GW2 API metrics per endpoint")
+        max_fields = 25  # Discord embed field limit
+        for endpoint, metrics in list(endpoints.items())[:max_fields]:
+            statuses = ", ".join(f"{status}: {count}" for status, count in metrics["statuses"].items()) or "-"
+            value = (
+                f"Requests: {metrics['requests']} | Cache hits: {metrics['cache_hits']}\n"
+                f"p50/p95/p99: {metrics['p50_ms']:g}/{metrics['p95_ms']:g}/{metrics['p99_ms']:g} ms\n"
+                f"Statuses: {statuses}\n"
+                f"Retries: {metrics['retries']} | Received: {metrics['bytes'] / 1024:.1f} KiB"
+            )
+            embed.add_field(name=endpoint, value=value)
+
+        requests = sum(metrics["requests"] for metrics in endpoints.values())
+        errors = sum(metrics["errors"] for metrics in endpoints.values())
+        embed.set_footer(text=f"Endpoints: {len(endpoints)} | Requests: {requests} | Errors: {errors}")
+
+        await bot_utils.send_embed(ctx, embed, True)
+        return None
+
+    @owner.command(name="gw2sessions")
+    async def owner_gw2sessions(self, ctx: commands.Context) -> None:
+        """Display the GW2 session pipeline metrics, from presence events to database writes.
+
+        Shows what happened to presence events at each stage, session outcomes, retries
+        and the latency of API snapshots, database writes, session jobs and end delays,
+        to tune the session settings with data.
+
+        Usage:
+            owner gw2sessions
+        """
+        from src.gw2.tools import gw2_utils
+
+        await ctx.message.channel.typing()
+
+        stats = gw2_utils.get_session_pipeline_stats()
+        presence, actors, batches, jobs = stats["presence"], stats["actors"], stats["batches"], stats["jobs"]
+        counters = stats["pipeline"]["counters"]
+
+        embed = self._create_owner_embed("GW2 session pipeline metrics")
+        embed.add_field(
+            name="Presence",
+            value=(
+                f"Seen: {presence['seen']}\n"
+                f"Filtered: {presence['dropped']}\n"
+                f"Activity changes: {counters.get('activity_changes', 0)}"
+            ),
+        )
+        embed.add_field(
+            name="Actors",
+            value=(
+                f"Posted: {actors['posted']}\n"
+                f"Duplicates: {actors['duplicates']} | Cancelled: {actors['cancelled']}\n"
+                f"Queued: {actors['mailbox_depth']} | Running: {actors['running']}"
+            ),
+        )
+        embed.add_field(
+            name="Batches",
+            value=(
+                f"Batches: {batches['batches']} | Intents: {batches['intents']}\n"
+                f"Deduplicated: {batches['deduplicated']} | Coalesced: {counters.get('coalesced', 0)}\n"
+                f"Untracked: {counters.get('untracked', 0)}"
+            ),
+        )
+        embed.add_field(
+            name="Outcomes",
+            value=(
+                f"Started: {counters.get('started', 0)} | Ended: {counters.get('ended', 0)}\n"
+                f"Snapshot failures: {counters.get('snapshot_failures', 0)}\n"
+                f"DB errors: {counters.get('db_errors', 0)} | No active session: {counters.get('no_active_session', 0)}"
+            ),
+        )
+        embed.add_field(
+            name="Retries",
+            value=(
+                f"Scheduled: {counters.get('retries_scheduled', 0)} | Exhausted: {counters.get('retries_exhausted', 0)}\n"
+                f"Waiting: {jobs['retries']} | Drained: {jobs['drained']}\n"
+                f"Probing: {'yes' if jobs['probing'] else 'no'}"
+            ),
+        )
+        for name, latency in stats["pipeline"]["latency"].items():
+            embed.add_field(
+                name=f"Latency: {name}",
+                value=(
+                    f"Count: {latency['count']}\n"
+                    f"p50/p95/p99: {latency['p50_ms']:g}/{latency['p95_ms']:g}/{latency['p99_ms']:g} ms\n"
+                    f"Max: {latency['max_ms']:g} ms"
+                ),
+            )
+
+        embed.set_footer(text=f"Session jobs pending: {jobs['pending']} | Sampled users: {stats['sampler']['users']}")
+
+        await bot_utils.send_embed(ctx, embed, True)
+        return None
+
     async def _update_bot_activity_prefix(self, new_prefix: str) -> None:
         """Update bot activity to reflect the new prefix."""
         # Get the first available guild to check current activity
@@ -16,6 +16,7 @@ class Bot(commands.Bot):
     start_time: datetime
     settings: dict
     profanity: Any
+    gw2_client: Any
 
     def __init__(self, *args, **kwargs):
         self.aiosession = kwargs.pop("aiosession")
@@ -35,6 +36,11 @@ def __init__(self, *args, **kwargs):
         # Load settings
         self._load_settings()
 
+        # Shared GW2 API client (connection pool, response cache, rate limiter and circuit breaker)
+        from src.gw2.tools.gw2_client import Gw2Client
+
+        self.gw2_client = Gw2Client(self)
+
     async def setup_hook(self) -> None:
         """Called after login - loads all cogs and registers persistent views."""
         try:
@@ -45,6 +51,18 @@ async def setup_hook(self) -> None:
             self.log.error(f"{messages.BOT_LOAD_COGS_FAILED}: {e}")
             raise
 
+        bot_utils.init_gw2_warm_up(self)
+        bot_utils.init_gw2_presence_filter(self)
+        bot_utils.init_gw2_session_jobs(self)
+        bot_utils.init_gw2_session_sampler(self)
+        bot_utils.init_gw2_session_metrics_log(self)
+        bot_utils.init_gw2_session_partitions(self)
+
+    async def close(self) -> None:
+        """Close the GW2 API connection pool, then the bot."""
+        await self.gw2_client.close()
+        await super().close()
+
     def _load_settings(self) -> None:
         """Load all bot and cog settings."""
         try:
@@ -46,6 +46,48 @@ async def insert_server(bot: commands.Bot, server: discord.Guild) -> None:
     await gw2_utils.insert_gw2_server_configs(bot, server)
 
 
+def init_gw2_warm_up(bot: commands.Bot) -> None:
+    """Start prefetching GW2 static data in the background."""
+    from src.gw2.tools import gw2_utils
+
+    gw2_utils.start_warm_up(bot)
+
+
+def init_gw2_presence_filter(bot: commands.Bot) -> None:
+    """Load the GW2 presence prefilter in the background."""
+    from src.gw2.tools import gw2_utils
+
+    gw2_utils.start_presence_filter(bot)
+
+
+def init_gw2_session_jobs(bot: commands.Bot) -> None:
+    """Resume stored GW2 session jobs and start running them in the background."""
+    from src.gw2.tools import gw2_utils
+
+    gw2_utils.start_session_jobs(bot)
+
+
+def init_gw2_session_sampler(bot: commands.Bot) -> None:
+    """Start sampling the stats of users playing GW2 in the background, when enabled."""
+    from src.gw2.tools import gw2_utils
+
+    gw2_utils.start_session_sampler(bot)
+
+
+def init_gw2_session_metrics_log(bot: commands.Bot) -> None:
+    """Log the GW2 session pipeline metrics as JSON periodically in the background, when enabled."""
+    from src.gw2.tools import gw2_utils
+
+    gw2_utils.start_session_metrics_log(bot)
+
+
+def init_gw2_session_partitions(bot: commands.Bot) -> None:
+    """Create upcoming GW2 session partitions and drop expired ones, daily in the background."""
+    from src.gw2.tools import gw2_utils
+
+    gw2_utils.start_session_partitions(bot)
+
+
 def init_background_tasks(bot: commands.Bot) -> None:
     """Initialize bot background tasks if configured."""
     bg_activity_timer = bot.settings["bot"]["BGActivityTimer"]
@@ -26,3 +26,13 @@ async def get_gw2_server_configs(self, server_id: int):
         stmt = select(*self.columns).where(Gw2Configs.server_id == server_id)
         results = await self.db_utils.fetchall(stmt, True)
         return results
+
+    async def get_gw2_servers_configs(self, server_ids: list[int]):
+        stmt = select(*self.columns).where(Gw2Configs.server_id.in_(server_ids))
+        results = await self.db_utils.fetchall(stmt, True)
+        return results
+
+    async def get_session_server_ids(self):
+        stmt = select(Gw2Configs.server_id).where(Gw2Configs.session.is_(True))
+        results = await self.db_utils.fetchall(stmt, True)
+        return results
@@ -57,3 +57,13 @@ async def get_api_key_by_user(self, user_id: int):
         stmt = select(*self.columns).where(Gw2Keys.user_id == user_id)
         results = await self.db_utils.fetchall(stmt, True)
         return results
+
+    async def get_user_ids(self):
+        stmt = select(Gw2Keys.user_id)
+        results = await self.db_utils.fetchall(stmt, True)
+        return results
+
+    async def get_api_keys_by_users(self, user_ids: list[int]):
+        stmt = select(Gw2Keys.user_id, Gw2Keys.key).where(Gw2Keys.user_id.in_(user_ids))
+        results = await self.db_utils.fetchall(stmt, True)
+        return results
@@ -1,5 +1,5 @@
 from ddcdatabases import DBUtilsAsync
-from sqlalchemy import update
+from sqlalchemy import Integer, String, column, insert, update, values
 from sqlalchemy.future import select
 from src.database.models.gw2_models import Gw2SessionCharDeaths
 
@@ -11,28 +11,37 @@ def __init__(self, db_session, log):
         self.log = log
 
     async def insert_start_char_deaths(self, session_id, user_id: int, characters_data: list[dict]):
-        for char in characters_data:
-            stmt = Gw2SessionCharDeaths(
-                session_id=session_id,
-                user_id=user_id,
-                name=char["name"],
-                profession=char["profession"],
-                start=char["deaths"],
-                end=None,
-            )
-            await self.db_utils.insert(stmt)
+        if not characters_data:
+            return
+        rows = [
+            {
+                "session_id": session_id,
+                "user_id": user_id,
+                "name": char["name"],
+                "profession": char["profession"],
+                "start": char["deaths"],
+                "end": None,
+            }
+            for char in characters_data
+        ]
+        stmt = insert(Gw2SessionCharDeaths).values(rows)
+        await self.db_utils.execute(stmt)
 
     async def update_end_char_deaths(self, session_id, user_id: int, characters_data: list[dict]):
-        for char in characters_data:
-            stmt = (
-                update(Gw2SessionCharDeaths)
-                .where(
-                    Gw2SessionCharDeaths.session_id == session_id,
-                    Gw2SessionCharDeaths.name == char["name"],
-                )
-                .values(end=char["deaths"])
+        if not characters_data:
+            return
+        end_deaths = values(column("name", String), column("deaths", Integer), name="end_deaths").data(
+            [(char["name"], char["deaths"]) for char in characters_data]
+        )
+        stmt = (
+            update(Gw2SessionCharDeaths)
+            .where(
+                Gw2SessionCharDeaths.session_id == session_id,
+                Gw2SessionCharDeaths.name == end_deaths.c.name,
             )
-            await self.db_utils.execute(stmt)
+            .values(end=end_deaths.c.deaths)
+        )
+        await self.db_utils.execute(stmt)
 
     async def get_char_deaths(self, user_id: int):
         stmt = select(*self.columns).where(Gw2SessionCharDeaths.user_id == user_id)
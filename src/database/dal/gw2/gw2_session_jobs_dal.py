@@ -0,0 +1,98 @@
+import sqlalchemy as sa
+from datetime import datetime
+from ddcdatabases import DBUtilsAsync
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+from src.database.models.gw2_models import Gw2SessionJobs
+from uuid_utils import uuid7
+
+
+class Gw2SessionJobsDal:
+    def __init__(self, db_session, log):
+        self.columns = list(Gw2SessionJobs.__table__.columns.values())
+        self.db_utils = DBUtilsAsync(db_session)
+        self.log = log
+
+    async def insert_job(self, user_id: int, action: str, run_at: datetime, attempt: int = 0):
+        stmt = Gw2SessionJobs(user_id=user_id, action=action, run_at=run_at, attempt=attempt)
+        await self.db_utils.insert(stmt)
+        return stmt.id
+
+    async def insert_jobs(self, jobs: list[dict]):
+        if not jobs:
+            return []
+        rows = [{"id": uuid7(), **job} for job in jobs]
+        await self.db_utils.execute(sa.insert(Gw2SessionJobs).values(rows))
+        return [row["id"] for row in rows]
+
+    async def get_jobs(self):
+        stmt = select(*self.columns).order_by(Gw2SessionJobs.id)
+        results = await self.db_utils.fetchall(stmt, True)
+        return results
+
+    async def claim_due_jobs(self, now: datetime, limit: int):
+        # Only the oldest job of each user can be claimed (ids are time ordered), and not while it is running,
+        # so the jobs of one user run one at a time and in the order they were scheduled
+        earlier = aliased(Gw2SessionJobs)
+        has_earlier_job = (
+            select(earlier.id).where(earlier.user_id == Gw2SessionJobs.user_id, earlier.id < Gw2SessionJobs.id).exists()
+        )
+        stmt = (
+            select(Gw2SessionJobs.id)
+            .where(Gw2SessionJobs.claimed_at.is_(None), Gw2SessionJobs.run_at <= now, ~has_earlier_job)
+            .order_by(Gw2SessionJobs.run_at)
+            .limit(limit)
+        )
+        due = await self.db_utils.fetchall(stmt, True)
+        if not due:
+            return []
+
+        job_ids = [row["id"] for row in due]
+        stmt = (
+            sa.update(Gw2SessionJobs)
+            .where(Gw2SessionJobs.id.in_(job_ids), Gw2SessionJobs.claimed_at.is_(None))
+            .values(claimed_at=now)
+        )
+        await self.db_utils.execute(stmt)
+        stmt = (
+            select(*self.columns)
+            .where(Gw2SessionJobs.id.in_(job_ids), Gw2SessionJobs.claimed_at == now)
+            .order_by(Gw2SessionJobs.run_at)
+        )
+        results = await self.db_utils.fetchall(stmt, True)
+        return results
+
+    async def release_claimed_jobs(self):
+        stmt = sa.update(Gw2SessionJobs).where(Gw2SessionJobs.claimed_at.is_not(None)).values(claimed_at=None)
+        await self.db_utils.execute(stmt)
+
+    async def reschedule_job(self, job_id, attempt: int, run_at: datetime):
+        stmt = (
+            sa.update(Gw2SessionJobs)
+            .where(Gw2SessionJobs.id == job_id)
+            .values(attempt=attempt, run_at=run_at, claimed_at=None)
+        )
+        await self.db_utils.execute(stmt)
+
+    async def expedite_retries(self, now: datetime):
+        stmt = select(Gw2SessionJobs.id).where(
+            Gw2SessionJobs.attempt > 0,
+            Gw2SessionJobs.claimed_at.is_(None),
+            Gw2SessionJobs.run_at > now,
+        )
+        retries = await self.db_utils.fetchall(stmt, True)
+        if not retries:
+            return 0
+
+        job_ids = [row["id"] for row in retries]
+        stmt = (
+            sa.update(Gw2SessionJobs)
+            .where(Gw2SessionJobs.id.in_(job_ids), Gw2SessionJobs.claimed_at.is_(None))
+            .values(run_at=now)
+        )
+        await self.db_utils.execute(stmt)
+        return len(job_ids)
+
+    async def delete_job(self, job_id):
+        stmt = sa.delete(Gw2SessionJobs).where(Gw2SessionJobs.id == job_id)
+        await self.db_utils.execute(stmt)
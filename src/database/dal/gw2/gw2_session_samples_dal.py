@@ -0,0 +1,48 @@
+import sqlalchemy as sa
+from datetime import datetime
+from ddcdatabases import DBUtilsAsync
+from sqlalchemy.future import select
+from src.database.dal.gw2.gw2_session_snapshots import SNAPSHOT_LAYOUT, SNAPSHOT_LAYOUTS, metric_ids
+from src.database.models.gw2_models import Gw2SessionSamples
+
+# Rows per insert statement: 4 bind parameters each, below the 32767 parameters of a PostgreSQL statement
+INSERT_CHUNK_SIZE = 5000
+
+
+class Gw2SessionSamplesDal:
+    def __init__(self, db_session, log):
+        self.columns = list(Gw2SessionSamples.__table__.columns.values())
+        self.db_utils = DBUtilsAsync(db_session)
+        self.log = log
+
+    async def insert_samples(self, samples: list[dict]):
+        # Each chunk commits on its own: samples are independent rows, a failed chunk only leaves a gap in the series
+        for offset in range(0, len(samples), INSERT_CHUNK_SIZE):
+            chunk = samples[offset : offset + INSERT_CHUNK_SIZE]
+            await self.db_utils.execute(sa.insert(Gw2SessionSamples).values(chunk))
+
+    async def get_user_samples(self, user_id: int, since: datetime, until: datetime, fields: list[str]):
+        stmt = (
+            select(Gw2SessionSamples.ts, Gw2SessionSamples.metric_id, Gw2SessionSamples.value)
+            .where(
+                Gw2SessionSamples.user_id == user_id,
+                Gw2SessionSamples.metric_id.in_(metric_ids(fields)),
+                Gw2SessionSamples.ts >= since,
+                Gw2SessionSamples.ts <= until,
+            )
+            .order_by(Gw2SessionSamples.ts)
+        )
+        results = await self.db_utils.fetchall(stmt, True)
+        layout = SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT]
+        return [{"ts": row["ts"], "field": layout[row["metric_id"]], "value": row["value"]} for row in results]
+
+    async def delete_samples_before(self, before: datetime):
+        # execute returns nothing, the expired samples are counted before they are deleted
+        stmt = select(sa.func.count()).select_from(Gw2SessionSamples).where(Gw2SessionSamples.ts < before)
+        expired = int(await self.db_utils.fetchvalue(stmt) or 0)
+        if not expired:
+            return 0
+
+        stmt = sa.delete(Gw2SessionSamples).where(Gw2SessionSamples.ts < before)
+        await self.db_utils.execute(stmt)
+        return expired
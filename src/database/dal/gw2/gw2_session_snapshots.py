@@ -0,0 +1,142 @@
+from typing import Final
+
+# Packed field order of each snapshot layout. A layout never changes once rows use it:
+# tracking a new stat means adding a layout with the field appended and bumping SNAPSHOT_LAYOUT.
+SNAPSHOT_LAYOUTS: Final[dict[int, tuple[str, ...]]] = {
+    1: (
+        "wvw_rank",
+        "players",
+        "yaks_scorted",
+        "yaks",
+        "camps",
+        "castles",
+        "towers",
+        "keeps",
+        "gold",
+        "karma",
+        "laurels",
+        "gems",
+        "ascalonian_tears",
+        "shards_of_zhaitan",
+        "fractal_relics",
+        "seals_of_beetletun",
+        "manifesto_of_the_moletariate",
+        "deadly_blooms",
+        "symbols_of_koda",
+        "flame_legion_charr_carvings",
+        "knowledge_crystals",
+        "badges_honor",
+        "guild_commendations",
+        "transmutation_charges",
+        "airship_parts",
+        "ley_line_crystals",
+        "lumps_of_aurillium",
+        "spirit_shards",
+        "pristine_fractal_relics",
+        "geodes",
+        "wvw_tickets",
+        "bandit_crests",
+        "magnetite_shards",
+        "provisioner_tokens",
+        "pvp_league_tickets",
+        "proof_heroics",
+        "unbound_magic",
+        "ascended_shards_of_glory",
+        "trade_contracts",
+        "elegy_mosaics",
+        "test_heroics",
+        "exalted_keys",
+        "machetes",
+        "gaeting_crystals",
+        "bandit_skeleton_keys",
+        "pact_crowbars",
+        "vials_of_chak_acid",
+        "zephyrite_lockpicks",
+        "traders_keys",
+        "volatile_magic",
+        "pvp_tournament_vouchers",
+        "racing_medallions",
+        "mistborn_keys",
+        "festival_tokens",
+        "cache_keys",
+        "red_prophet_shards",
+        "green_prophet_shards",
+        "blue_prophet_crystals",
+        "green_prophet_crystals",
+        "red_prophet_crystals",
+        "blue_prophet_shards",
+        "war_supplies",
+        "unstable_fractal_essences",
+        "tyrian_defense_seals",
+        "research_notes",
+        "unusual_coins",
+        "astral_acclaim",
+        "jade_slivers",
+        "testimony_of_jade_heroics",
+        "ancient_coins",
+        "canach_coins",
+        "imperial_favors",
+        "tales_of_dungeon_delving",
+        "legendary_insights",
+        "jade_miner_keycards",
+        "static_charges",
+        "pinch_of_stardust",
+        "unnamed_currency_74",
+        "calcified_gasps",
+        "ursus_oblige",
+        "gaeting_crystals_2",
+        "fine_rift_essences",
+        "rare_rift_essences",
+        "masterwork_rift_essences",
+        "antiquated_ducats",
+        "testimony_of_castoran_heroics",
+        "aether_rich_sap",
+    ),
+}
+SNAPSHOT_LAYOUT: Final[int] = 1
+
+
+def metric_ids(fields: list[str]) -> list[int]:
+    """Get the gw2_session_samples metric ids of stats: their positions in the current layout.
+
+    Layouts only ever append stats, so the id of a stat never changes.
+    """
+    layout = SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT]
+    return [layout.index(field) for field in fields]
+
+
+def pack_start(session: dict) -> list[int | None]:
+    """Pack the stats of a start snapshot into a list in the order of the current layout."""
+    return [session.get(field) for field in SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT]]
+
+
+def pack_end(session: dict, layout: int, start: list[int | None]) -> dict[str, int | None]:
+    """Keep only the stats of an end snapshot that differ from the packed start snapshot."""
+    return {
+        field: session.get(field)
+        for field, start_value in zip(SNAPSHOT_LAYOUTS[layout], start, strict=True)
+        if session.get(field) != start_value
+    }
+
+
+def unpack_session(row: dict) -> dict:
+    """Rebuild the full start and end snapshots of a gw2_sessions row.
+
+    The snapshots get back the date, acc_name and user_id keys stored in their own columns;
+    stats that were missing from a snapshot stay missing.
+    """
+    row = dict(row)
+    layout = row.pop("layout")
+    start_date = row.pop("start_date")
+    end_date = row.pop("end_date")
+    start_stats = dict(zip(SNAPSHOT_LAYOUTS[layout], row["start"], strict=True))
+    row["start"] = _build_snapshot(row, start_date, start_stats)
+    if end_date is not None:
+        row["end"] = _build_snapshot(row, end_date, {**start_stats, **(row["end"] or {})})
+    return row
+
+
+def _build_snapshot(row: dict, date: str, stats: dict) -> dict:
+    snapshot = {"acc_name": row["acc_name"], "user_id": row["user_id"]}
+    snapshot.update((field, value) for field, value in stats.items() if value is not None)
+    return {"date": date, **dict(sorted(snapshot.items()))}
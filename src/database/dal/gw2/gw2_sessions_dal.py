@@ -1,7 +1,10 @@
 import sqlalchemy as sa
+from datetime import date
 from ddcdatabases import DBUtilsAsync
 from sqlalchemy.future import select
+from src.database.dal.gw2.gw2_session_snapshots import SNAPSHOT_LAYOUT, pack_end, pack_start, unpack_session
 from src.database.models.gw2_models import Gw2SessionCharDeaths, Gw2Sessions
+from uuid_utils import uuid7
 
 
 class Gw2SessionsDal:
@@ -10,28 +13,62 @@ def __init__(self, db_session, log):
         self.db_utils = DBUtilsAsync(db_session)
         self.log = log
 
-    async def insert_start_session(self, session: dict):
-        stmt = sa.delete(Gw2SessionCharDeaths).where(
-            Gw2SessionCharDeaths.user_id == session["user_id"],
-        )
-        await self.db_utils.execute(stmt)
-
-        stmt = sa.delete(Gw2Sessions).where(
-            Gw2Sessions.user_id == session["user_id"],
-        )
-        await self.db_utils.execute(stmt)
+    async def insert_start_session(self, session: dict, keep_history: bool = False):
+        await self._delete_previous_sessions([session["user_id"]], keep_history)
 
         stmt = Gw2Sessions(
             user_id=session["user_id"],
             acc_name=session["acc_name"],
-            start=session,
+            layout=SNAPSHOT_LAYOUT,
+            start=pack_start(session),
+            start_date=session["date"],
         )
         await self.db_utils.insert(stmt)
         return stmt.id
 
+    async def insert_start_sessions(self, sessions: list[dict], keep_history: bool = False):
+        if not sessions:
+            return {}
+        await self._delete_previous_sessions([session["user_id"] for session in sessions], keep_history)
+
+        rows = [
+            {
+                "id": uuid7(),
+                "user_id": session["user_id"],
+                "acc_name": session["acc_name"],
+                "layout": SNAPSHOT_LAYOUT,
+                "start": pack_start(session),
+                "start_date": session["date"],
+            }
+            for session in sessions
+        ]
+        await self.db_utils.execute(sa.insert(Gw2Sessions).values(rows))
+        return {row["user_id"]: row["id"] for row in rows}
+
+    async def _delete_previous_sessions(self, user_ids: list[int], keep_history: bool):
+        # The deletes run through fetchall, which doesn't commit: the insert of the new sessions commits them,
+        # so a failed insert rolls them back and the previous sessions are kept
+        # Character deaths are only kept for the last session of each user
+        stmt = (
+            sa.delete(Gw2SessionCharDeaths)
+            .where(Gw2SessionCharDeaths.user_id.in_(user_ids))
+            .returning(Gw2SessionCharDeaths.user_id)
+        )
+        await self.db_utils.fetchall(stmt, True)
+
+        stmt = sa.delete(Gw2Sessions).where(Gw2Sessions.user_id.in_(user_ids)).returning(Gw2Sessions.user_id)
+        if keep_history:
+            # Finished sessions are history, only the ones that never got an end are replaced
+            stmt = stmt.where(Gw2Sessions.end.is_(None))
+        await self.db_utils.fetchall(stmt, True)
+
     async def update_end_session(self, session: dict):
+        # Only an open session gets an end, a stray end must not overwrite a finished session of the history
         results = await self.db_utils.fetchall(
-            select(Gw2Sessions.id).where(Gw2Sessions.user_id == session["user_id"]),
+            select(Gw2Sessions.id, Gw2Sessions.created_at, Gw2Sessions.layout, Gw2Sessions.start)
+            .where(Gw2Sessions.user_id == session["user_id"], Gw2Sessions.end.is_(None))
+            .order_by(Gw2Sessions.created_at.desc())
+            .limit(1),
             True,
         )
         if not results:
@@ -40,14 +77,50 @@ async def update_end_session(self, session: dict):
         stmt = (
             sa.update(Gw2Sessions)
             .where(
-                Gw2Sessions.user_id == session["user_id"],
+                Gw2Sessions.id == results[0]["id"],
+                Gw2Sessions.created_at == results[0]["created_at"],
+                Gw2Sessions.end.is_(None),
+            )
+            .values(
+                end=pack_end(session, results[0]["layout"], results[0]["start"]),
+                end_date=session["date"],
             )
-            .values(end=session)
         )
         await self.db_utils.execute(stmt)
         return results[0]["id"]
 
     async def get_user_last_session(self, user_id: int):
-        stmt = select(*self.columns).where(Gw2Sessions.user_id == user_id)
+        stmt = (
+            select(*self.columns).where(Gw2Sessions.user_id == user_id).order_by(Gw2Sessions.created_at.desc()).limit(1)
+        )
         results = await self.db_utils.fetchall(stmt, True)
-        return results
+        return [unpack_session(row) for row in results]
+
+    async def get_user_sessions(self, user_id: int, limit: int):
+        stmt = (
+            select(*self.columns)
+            .where(Gw2Sessions.user_id == user_id, Gw2Sessions.end.is_not(None))
+            .order_by(Gw2Sessions.created_at.desc())
+            .limit(limit)
+        )
+        results = await self.db_utils.fetchall(stmt, True)
+        return [unpack_session(row) for row in results]
+
+    async def create_partition(self, month: date):
+        # execute commits the partition created by the function, its name is the one the function gives it
+        stmt = select(sa.func.gw2.create_gw2_sessions_partition(month))
+        await self.db_utils.execute(stmt)
+        return f"gw2_sessions_p{month:%Y%m}"
+
+    async def drop_partitions_before(self, month: date):
+        # fetchall doesn't commit: the partitions are dropped with the delete of their character deaths
+        stmt = select(sa.func.gw2.drop_gw2_sessions_partitions(month).label("partition_name"))
+        results = await self.db_utils.fetchall(stmt, True)
+        dropped = [row["partition_name"] for row in results]
+
+        # Character deaths of users whose last session was in a dropped partition
+        stmt = sa.delete(Gw2SessionCharDeaths).where(
+            ~sa.exists().where(Gw2Sessions.id == Gw2SessionCharDeaths.session_id),
+        )
+        await self.db_utils.execute(stmt)
+        return dropped
@@ -0,0 +1,50 @@
+import sqlalchemy as sa
+from ddcdatabases import DBUtilsAsync
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+from src.database.models.gw2_models import Gw2StaticData
+
+# Rows per upsert statement: 5 bind parameters each (id included), below the 32767 parameters of a PostgreSQL statement
+UPSERT_CHUNK_SIZE = 5000
+
+
+class Gw2StaticDataDal:
+    def __init__(self, db_session, log):
+        self.columns = list(Gw2StaticData.__table__.columns.values())
+        self.db_utils = DBUtilsAsync(db_session)
+        self.log = log
+
+    async def upsert_static_data(self, kind: str, objects: dict[str, dict], build_id: int | None):
+        rows = [
+            {"kind": kind, "object_id": object_id, "build_id": build_id, "data": data}
+            for object_id, data in objects.items()
+        ]
+        # Each chunk commits on its own: the upsert is idempotent, a failed chunk is written again on the next one
+        for offset in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = insert(Gw2StaticData).values(rows[offset : offset + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["kind", "object_id"],
+                set_={"build_id": stmt.excluded.build_id, "data": stmt.excluded.data},
+            )
+            await self.db_utils.execute(stmt)
+
+    async def get_static_data(self, kind: str, object_ids: list[str]):
+        stmt = select(Gw2StaticData.object_id, Gw2StaticData.build_id, Gw2StaticData.data).where(
+            Gw2StaticData.kind == kind,
+            Gw2StaticData.object_id.in_(object_ids),
+        )
+        results = await self.db_utils.fetchall(stmt, True)
+        return results
+
+    async def get_static_data_by_kind(self, kind: str, limit: int):
+        stmt = (
+            select(Gw2StaticData.object_id, Gw2StaticData.build_id, Gw2StaticData.data)
+            .where(Gw2StaticData.kind == kind)
+            .limit(limit)
+        )
+        results = await self.db_utils.fetchall(stmt, True)
+        return results
+
+    async def delete_outdated_static_data(self, build_id: int):
+        stmt = sa.delete(Gw2StaticData).where(Gw2StaticData.build_id.is_distinct_from(build_id))
+        await self.db_utils.execute(stmt)
@@ -0,0 +1,46 @@
+"""gw2_static_data
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from collections.abc import Sequence
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: str | None = "0011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "gw2_static_data",
+        sa.Column("id", sa.Uuid(), nullable=False, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("object_id", sa.String(), nullable=False),
+        sa.Column("build_id", sa.Integer(), nullable=True),
+        sa.Column("data", JSONB(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("id"),
+        sa.UniqueConstraint("kind", "object_id"),
+        schema="gw2",
+    )
+    op.execute("""
+        CREATE TRIGGER before_update_gw2_static_data_tr
+            BEFORE UPDATE ON gw2.gw2_static_data
+            FOR EACH ROW
+            EXECUTE PROCEDURE updated_at_column_func();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS before_update_gw2_static_data_tr ON gw2.gw2_static_data")
+    op.drop_table("gw2_static_data", schema="gw2")
@@ -0,0 +1,49 @@
+"""gw2_session_jobs
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: str | None = "0012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "gw2_session_jobs",
+        sa.Column("id", sa.Uuid(), nullable=False, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("attempt", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("id"),
+        schema="gw2",
+    )
+    op.create_index(op.f("ix_gw2_session_jobs_user_id"), "gw2_session_jobs", ["user_id"], unique=False, schema="gw2")
+    op.create_index(op.f("ix_gw2_session_jobs_run_at"), "gw2_session_jobs", ["run_at"], unique=False, schema="gw2")
+    op.execute("""
+        CREATE TRIGGER before_update_gw2_session_jobs_tr
+            BEFORE UPDATE ON gw2.gw2_session_jobs
+            FOR EACH ROW
+            EXECUTE PROCEDURE updated_at_column_func();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS before_update_gw2_session_jobs_tr ON gw2.gw2_session_jobs")
+    op.drop_index(op.f("ix_gw2_session_jobs_run_at"), table_name="gw2_session_jobs", schema="gw2")
+    op.drop_index(op.f("ix_gw2_session_jobs_user_id"), table_name="gw2_session_jobs", schema="gw2")
+    op.drop_table("gw2_session_jobs", schema="gw2")
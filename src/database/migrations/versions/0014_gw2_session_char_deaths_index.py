@@ -0,0 +1,34 @@
+"""gw2_session_char_deaths session_id, name index
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from alembic import op
+from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: str | None = "0013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_gw2_session_char_deaths_session_id_name"),
+        "gw2_session_char_deaths",
+        ["session_id", "name"],
+        unique=False,
+        schema="gw2",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_gw2_session_char_deaths_session_id_name"),
+        table_name="gw2_session_char_deaths",
+        schema="gw2",
+    )
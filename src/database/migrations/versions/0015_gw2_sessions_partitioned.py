@@ -0,0 +1,160 @@
+"""gw2_sessions partitioned by month
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from collections.abc import Sequence
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: str | None = "0014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # A partitioned table can't be referenced by a foreign key on id alone
+    op.drop_constraint(
+        "gw2_session_char_deaths_session_id_fkey",
+        "gw2_session_char_deaths",
+        type_="foreignkey",
+        schema="gw2",
+    )
+    op.execute("DROP TRIGGER IF EXISTS before_update_gw2_sessions_tr ON gw2.gw2_sessions")
+    op.rename_table("gw2_sessions", "gw2_sessions_old", schema="gw2")
+    op.execute("ALTER TABLE gw2.gw2_sessions_old RENAME CONSTRAINT gw2_sessions_pkey TO gw2_sessions_old_pkey")
+    op.execute("ALTER TABLE gw2.gw2_sessions_old RENAME CONSTRAINT gw2_sessions_id_key TO gw2_sessions_old_id_key")
+
+    op.create_table(
+        "gw2_sessions",
+        sa.Column("id", sa.Uuid(), nullable=False, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("acc_name", sa.String(), nullable=False),
+        sa.Column("start", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("end", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        schema="gw2",
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "ix_gw2_sessions_user_id_created_at",
+        "gw2_sessions",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+        schema="gw2",
+    )
+    op.execute("""
+        CREATE TRIGGER before_update_gw2_sessions_tr
+            BEFORE UPDATE ON gw2.gw2_sessions
+            FOR EACH ROW
+            EXECUTE PROCEDURE updated_at_column_func();
+    """)
+
+    # Creates the partition holding the month of month_date, named gw2_sessions_pYYYYMM
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gw2.create_gw2_sessions_partition(month_date date)
+            RETURNS text LANGUAGE plpgsql AS $$
+            DECLARE
+                month_start date := date_trunc('month', month_date)::date;
+                partition_name text := 'gw2_sessions_p' || to_char(month_start, 'YYYYMM');
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS gw2.%I PARTITION OF gw2.gw2_sessions FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, (month_start + interval '1 month')::date
+                );
+                RETURN partition_name;
+            END $$;
+    """)
+    # Drops the partitions of the months before the month of before_date, returning their names
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gw2.drop_gw2_sessions_partitions(before_date date)
+            RETURNS SETOF text LANGUAGE plpgsql AS $$
+            DECLARE
+                partition_name text;
+            BEGIN
+                FOR partition_name IN
+                    SELECT c.relname
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = 'gw2.gw2_sessions'::regclass
+                        AND c.relname ~ '^gw2_sessions_p[0-9]{6}$'
+                        AND to_date(right(c.relname, 6), 'YYYYMM') < date_trunc('month', before_date)::date
+                    ORDER BY c.relname
+                LOOP
+                    EXECUTE format('DROP TABLE gw2.%I', partition_name);
+                    RETURN NEXT partition_name;
+                END LOOP;
+            END $$;
+    """)
+
+    op.execute("""
+        SELECT gw2.create_gw2_sessions_partition(month_date)
+        FROM (
+            SELECT DISTINCT created_at::date AS month_date FROM gw2.gw2_sessions_old
+            UNION SELECT (now() at time zone 'utc')::date
+            UNION SELECT ((now() at time zone 'utc') + interval '1 month')::date
+        ) months
+    """)
+    op.execute("""
+        INSERT INTO gw2.gw2_sessions (id, user_id, acc_name, start, "end", updated_at, created_at)
+        SELECT id, user_id, acc_name, start, "end", updated_at, created_at FROM gw2.gw2_sessions_old
+    """)
+    op.drop_table("gw2_sessions_old", schema="gw2")
+
+
+def downgrade() -> None:
+    op.rename_table("gw2_sessions", "gw2_sessions_partitioned", schema="gw2")
+    op.execute("ALTER INDEX gw2.ix_gw2_sessions_user_id_created_at RENAME TO ix_gw2_sessions_partitioned_user_id")
+    op.execute(
+        "ALTER TABLE gw2.gw2_sessions_partitioned RENAME CONSTRAINT gw2_sessions_pkey TO gw2_sessions_partitioned_pkey"
+    )
+    op.create_table(
+        "gw2_sessions",
+        sa.Column("id", sa.Uuid(), nullable=False, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("acc_name", sa.String(), nullable=False),
+        sa.Column("start", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("end", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("(now() at time zone 'utc')"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("id"),
+        schema="gw2",
+    )
+    # The unpartitioned table only ever held the last session of each user
+    op.execute("""
+        INSERT INTO gw2.gw2_sessions (id, user_id, acc_name, start, "end", updated_at, created_at)
+        SELECT DISTINCT ON (user_id) id, user_id, acc_name, start, "end", updated_at, created_at
+        FROM gw2.gw2_sessions_partitioned
+        ORDER BY user_id, created_at DESC
+    """)
+    op.execute("""
+        DELETE FROM gw2.gw2_session_char_deaths d
+        WHERE NOT EXISTS (SELECT 1 FROM gw2.gw2_sessions s WHERE s.id = d.session_id)
+    """)
+    op.execute("DROP TABLE gw2.gw2_sessions_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS gw2.drop_gw2_sessions_partitions")
+    op.execute("DROP FUNCTION IF EXISTS gw2.create_gw2_sessions_partition")
+    op.execute("""
+        CREATE TRIGGER before_update_gw2_sessions_tr
+            BEFORE UPDATE ON gw2.gw2_sessions
+            FOR EACH ROW
+            EXECUTE PROCEDURE updated_at_column_func();
+    """)
+    op.create_foreign_key(
+        "gw2_session_char_deaths_session_id_fkey",
+        "gw2_session_char_deaths",
+        "gw2_sessions",
+        ["session_id"],
+        ["id"],
+        source_schema="gw2",
+        referent_schema="gw2",
+    )
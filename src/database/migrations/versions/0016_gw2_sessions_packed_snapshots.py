@@ -0,0 +1,161 @@
+"""gw2_sessions packed snapshots
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from collections.abc import Sequence
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0016"
+down_revision: str | None = "0015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Snapshot layout 1, the field order of the packed start array (SNAPSHOT_LAYOUTS[1] in gw2_session_snapshots)
+LAYOUT_1_FIELDS = (
+    "wvw_rank",
+    "players",
+    "yaks_scorted",
+    "yaks",
+    "camps",
+    "castles",
+    "towers",
+    "keeps",
+    "gold",
+    "karma",
+    "laurels",
+    "gems",
+    "ascalonian_tears",
+    "shards_of_zhaitan",
+    "fractal_relics",
+    "seals_of_beetletun",
+    "manifesto_of_the_moletariate",
+    "deadly_blooms",
+    "symbols_of_koda",
+    "flame_legion_charr_carvings",
+    "knowledge_crystals",
+    "badges_honor",
+    "guild_commendations",
+    "transmutation_charges",
+    "airship_parts",
+    "ley_line_crystals",
+    "lumps_of_aurillium",
+    "spirit_shards",
+    "pristine_fractal_relics",
+    "geodes",
+    "wvw_tickets",
+    "bandit_crests",
+    "magnetite_shards",
+    "provisioner_tokens",
+    "pvp_league_tickets",
+    "proof_heroics",
+    "unbound_magic",
+    "ascended_shards_of_glory",
+    "trade_contracts",
+    "elegy_mosaics",
+    "test_heroics",
+    "exalted_keys",
+    "machetes",
+    "gaeting_crystals",
+    "bandit_skeleton_keys",
+    "pact_crowbars",
+    "vials_of_chak_acid",
+    "zephyrite_lockpicks",
+    "traders_keys",
+    "volatile_magic",
+    "pvp_tournament_vouchers",
+    "racing_medallions",
+    "mistborn_keys",
+    "festival_tokens",
+    "cache_keys",
+    "red_prophet_shards",
+    "green_prophet_shards",
+    "blue_prophet_crystals",
+    "green_prophet_crystals",
+    "red_prophet_crystals",
+    "blue_prophet_shards",
+    "war_supplies",
+    "unstable_fractal_essences",
+    "tyrian_defense_seals",
+    "research_notes",
+    "unusual_coins",
+    "astral_acclaim",
+    "jade_slivers",
+    "testimony_of_jade_heroics",
+    "ancient_coins",
+    "canach_coins",
+    "imperial_favors",
+    "tales_of_dungeon_delving",
+    "legendary_insights",
+    "jade_miner_keycards",
+    "static_charges",
+    "pinch_of_stardust",
+    "unnamed_currency_74",
+    "calcified_gasps",
+    "ursus_oblige",
+    "gaeting_crystals_2",
+    "fine_rift_essences",
+    "rare_rift_essences",
+    "masterwork_rift_essences",
+    "antiquated_ducats",
+    "testimony_of_castoran_heroics",
+    "aether_rich_sap",
+)
+FIELDS_ARRAY = "ARRAY[" + ", ".join(f"'{field}'" for field in LAYOUT_1_FIELDS) + "]::text[]"
+
+
+def upgrade() -> None:
+    op.add_column("gw2_sessions", sa.Column("layout", sa.SmallInteger(), nullable=True), schema="gw2")
+    op.add_column("gw2_sessions", sa.Column("start_date", sa.String(), nullable=True), schema="gw2")
+    op.add_column("gw2_sessions", sa.Column("end_date", sa.String(), nullable=True), schema="gw2")
+
+    # end keeps only the fields that changed since start, a field missing from end becomes null
+    op.execute(f"""
+        UPDATE gw2.gw2_sessions SET
+            layout = 1,
+            start_date = start->>'date',
+            end_date = "end"->>'date',
+            "end" = CASE WHEN "end" IS NULL THEN NULL ELSE (
+                SELECT coalesce(jsonb_object_agg(f, "end"->f), '{{}}'::jsonb)
+                FROM unnest({FIELDS_ARRAY}) AS f
+                WHERE ("end"->f) IS DISTINCT FROM (start->f)
+            ) END
+    """)  # noqa: S608
+    packed = ", ".join(f"(start->>'{field}')::bigint" for field in LAYOUT_1_FIELDS)
+    op.execute(f"ALTER TABLE gw2.gw2_sessions ALTER COLUMN start TYPE bigint[] USING ARRAY[{packed}]")
+    op.alter_column("gw2_sessions", "layout", nullable=False, schema="gw2")
+    op.alter_column("gw2_sessions", "start_date", nullable=False, schema="gw2")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "gw2_sessions",
+        sa.Column("start_snapshot", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        schema="gw2",
+    )
+    # jsonb_build_object is limited to 100 arguments, the stats are aggregated from the array instead
+    op.execute(f"""
+        UPDATE gw2.gw2_sessions SET start_snapshot =
+            jsonb_build_object('date', start_date, 'acc_name', acc_name, 'user_id', user_id)
+            || coalesce((
+                SELECT jsonb_object_agg(f, v)
+                FROM unnest({FIELDS_ARRAY}, start) AS u(f, v)
+                WHERE v IS NOT NULL
+            ), '{{}}'::jsonb)
+    """)  # noqa: S608
+    op.execute("""
+        UPDATE gw2.gw2_sessions
+        SET "end" = jsonb_strip_nulls(start_snapshot || "end") || jsonb_build_object('date', end_date)
+        WHERE end_date IS NOT NULL
+    """)
+    op.drop_column("gw2_sessions", "start", schema="gw2")
+    op.alter_column("gw2_sessions", "start_snapshot", new_column_name="start", nullable=False, schema="gw2")
+    op.drop_column("gw2_sessions", "end_date", schema="gw2")
+    op.drop_column("gw2_sessions", "start_date", schema="gw2")
+    op.drop_column("gw2_sessions", "layout", schema="gw2")
@@ -0,0 +1,44 @@
+"""gw2_session_samples
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "0017"
+down_revision: str | None = "0016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Narrow append-only time series: no updated_at/created_at columns nor trigger
+    op.create_table(
+        "gw2_session_samples",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("metric_id", sa.SmallInteger(), nullable=False),
+        sa.Column("ts", sa.DateTime(), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "metric_id", "ts"),
+        schema="gw2",
+    )
+    # Samples are written in time order, so a BRIN index on ts stays tiny and prunes time ranges
+    op.create_index(
+        "ix_gw2_session_samples_ts",
+        "gw2_session_samples",
+        ["ts"],
+        unique=False,
+        schema="gw2",
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_gw2_session_samples_ts", table_name="gw2_session_samples", schema="gw2")
+    op.drop_table("gw2_session_samples", schema="gw2")
@@ -0,0 +1,121 @@
+"""gw2_sessions default partition
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+
+from alembic import op
+from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "0018"
+down_revision: str | None = "0017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Holds the sessions of a month whose partition wasn't created in time, instead of failing their insert
+    op.execute("CREATE TABLE IF NOT EXISTS gw2.gw2_sessions_default PARTITION OF gw2.gw2_sessions DEFAULT")
+
+    # A partition can't be created while the default one holds rows of its month:
+    # they are moved out of the default partition and back in once the month partition exists
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gw2.create_gw2_sessions_partition(month_date date)
+            RETURNS text LANGUAGE plpgsql AS $$
+            DECLARE
+                month_start date := date_trunc('month', month_date)::date;
+                month_end date := (month_start + interval '1 month')::date;
+                partition_name text := 'gw2_sessions_p' || to_char(month_start, 'YYYYMM');
+            BEGIN
+                IF to_regclass(format('gw2.%I', partition_name)) IS NOT NULL THEN
+                    RETURN partition_name;
+                END IF;
+                CREATE TEMP TABLE gw2_sessions_moved AS
+                    SELECT * FROM gw2.gw2_sessions_default WHERE created_at >= month_start AND created_at < month_end;
+                DELETE FROM gw2.gw2_sessions_default WHERE created_at >= month_start AND created_at < month_end;
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS gw2.%I PARTITION OF gw2.gw2_sessions FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_end
+                );
+                INSERT INTO gw2.gw2_sessions SELECT * FROM gw2_sessions_moved;
+                DROP TABLE gw2_sessions_moved;
+                RETURN partition_name;
+            END $$;
+    """)
+    # Expired sessions left in the default partition are deleted with the expired partitions
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gw2.drop_gw2_sessions_partitions(before_date date)
+            RETURNS SETOF text LANGUAGE plpgsql AS $$
+            DECLARE
+                partition_name text;
+            BEGIN
+                DELETE FROM gw2.gw2_sessions_default WHERE created_at < date_trunc('month', before_date);
+                FOR partition_name IN
+                    SELECT c.relname
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = 'gw2.gw2_sessions'::regclass
+                        AND c.relname ~ '^gw2_sessions_p[0-9]{6}$'
+                        AND to_date(right(c.relname, 6), 'YYYYMM') < date_trunc('month', before_date)::date
+                    ORDER BY c.relname
+                LOOP
+                    EXECUTE format('DROP TABLE gw2.%I', partition_name);
+                    RETURN NEXT partition_name;
+                END LOOP;
+            END $$;
+    """)
+
+    op.execute("""
+        SELECT gw2.create_gw2_sessions_partition(month_date)
+        FROM (
+            SELECT (now() at time zone 'utc')::date AS month_date
+            UNION SELECT ((now() at time zone 'utc') + interval '1 month')::date
+        ) months
+    """)
+
+
+def downgrade() -> None:
+    # Sessions of the default partition get their month partition before it is dropped
+    op.execute("""
+        SELECT gw2.create_gw2_sessions_partition(month_date)
+        FROM (SELECT DISTINCT date_trunc('month', created_at)::date AS month_date FROM gw2.gw2_sessions_default) months
+    """)
+    op.execute("DROP TABLE gw2.gw2_sessions_default")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gw2.create_gw2_sessions_partition(month_date date)
+            RETURNS text LANGUAGE plpgsql AS $$
+            DECLARE
+                month_start date := date_trunc('month', month_date)::date;
+                partition_name text := 'gw2_sessions_p' || to_char(month_start, 'YYYYMM');
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS gw2.%I PARTITION OF gw2.gw2_sessions FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, (month_start + interval '1 month')::date
+                );
+                RETURN partition_name;
+            END $$;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gw2.drop_gw2_sessions_partitions(before_date date)
+            RETURNS SETOF text LANGUAGE plpgsql AS $$
+            DECLARE
+                partition_name text;
+            BEGIN
+                FOR partition_name IN
+                    SELECT c.relname
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = 'gw2.gw2_sessions'::regclass
+                        AND c.relname ~ '^gw2_sessions_p[0-9]{6}$'
+                        AND to_date(right(c.relname, 6), 'YYYYMM') < date_trunc('month', before_date)::date
+                    ORDER BY c.relname
+                LOOP
+                    EXECUTE format('DROP TABLE gw2.%I', partition_name);
+                    RETURN NEXT partition_name;
+                END LOOP;
+            END $$;
+    """)
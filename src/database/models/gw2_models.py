@@ -1,6 +1,8 @@
-from sqlalchemy import BigInteger, Boolean, ForeignKey, Integer, Uuid
-from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, SmallInteger, UniqueConstraint, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import text
 from src.database.models import BotBase
 from typing import Any
 from uuid import UUID
@@ -35,23 +37,84 @@ class Gw2Configs(BotBase):
 
 class Gw2Sessions(BotBase):
     __tablename__ = "gw2_sessions"
-    __table_args__ = {"schema": "gw2"}
+    # Range partitioned by month of created_at (gw2_sessions_pYYYYMM), see Gw2SessionsDal.create_partition,
+    # sessions of a month without partition go to gw2_sessions_default until it is created
+    __table_args__ = (
+        Index("ix_gw2_sessions_user_id_created_at", "user_id", text("created_at DESC")),
+        {"schema": "gw2", "postgresql_partition_by": "RANGE (created_at)"},
+    )
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     user_id: Mapped[int] = mapped_column(BigInteger)
     acc_name: Mapped[str] = mapped_column()
-    start: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    # Snapshots are packed, see gw2_session_snapshots: start holds the stats in the order of
+    # the layout, end only the stats that changed since start
+    layout: Mapped[int] = mapped_column(SmallInteger)
+    start: Mapped[list[int | None]] = mapped_column(ARRAY(BigInteger))
     end: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=True)
-    session_char_deaths = relationship("Gw2SessionCharDeaths", back_populates="session")
+    start_date: Mapped[str] = mapped_column()
+    end_date: Mapped[str] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, server_default=text("(now() at time zone 'utc')")
+    )
+    session_char_deaths = relationship(
+        "Gw2SessionCharDeaths",
+        back_populates="session",
+        primaryjoin="Gw2Sessions.id == foreign(Gw2SessionCharDeaths.session_id)",
+    )
 
 
 class Gw2SessionCharDeaths(BotBase):
     __tablename__ = "gw2_session_char_deaths"
-    __table_args__ = {"schema": "gw2"}
+    __table_args__ = (
+        Index("ix_gw2_session_char_deaths_session_id_name", "session_id", "name"),
+        {"schema": "gw2"},
+    )
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
-    session_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("gw2.gw2_sessions.id"))
+    session_id: Mapped[UUID] = mapped_column(Uuid)
     user_id: Mapped[int] = mapped_column(BigInteger)
     name: Mapped[str] = mapped_column()
     profession: Mapped[str] = mapped_column()
     start: Mapped[int] = mapped_column(Integer)
     end: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    session = relationship("Gw2Sessions", back_populates="session_char_deaths")
+    session = relationship(
+        "Gw2Sessions",
+        back_populates="session_char_deaths",
+        primaryjoin="foreign(Gw2SessionCharDeaths.session_id) == Gw2Sessions.id",
+    )
+
+
+class Gw2StaticData(BotBase):
+    __tablename__ = "gw2_static_data"
+    __table_args__ = (UniqueConstraint("kind", "object_id"), {"schema": "gw2"})
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
+    kind: Mapped[str] = mapped_column()
+    object_id: Mapped[str] = mapped_column()
+    build_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    data: Mapped[dict[str, Any]] = mapped_column(JSONB)
+
+
+class Gw2SessionJobs(BotBase):
+    __tablename__ = "gw2_session_jobs"
+    __table_args__ = {"schema": "gw2"}
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
+    user_id: Mapped[int] = mapped_column(BigInteger, index=True)
+    action: Mapped[str] = mapped_column()
+    attempt: Mapped[int] = mapped_column(Integer, server_default="0")
+    run_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    claimed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class Gw2SessionSamples(BotBase):
+    __tablename__ = "gw2_session_samples"
+    # metric_id is the position of the stat in the session snapshot layout, see gw2_session_snapshots.metric_ids
+    __table_args__ = (
+        Index("ix_gw2_session_samples_ts", "ts", postgresql_using="brin"),
+        {"schema": "gw2"},
+    )
+    # Narrow time series, without the timestamp columns of BotBase
+    updated_at = None
+    created_at = None
+    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    metric_id: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    ts: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger)
@@ -7,7 +7,6 @@
 from src.gw2.constants import gw2_messages
 from src.gw2.constants.gw2_teams import get_team_name, is_wr_team_id
 from src.gw2.tools import gw2_utils
-from src.gw2.tools.gw2_client import Gw2Client
 from src.gw2.tools.gw2_cooldowns import GW2CoolDowns
 
 
@@ -28,18 +27,6 @@ async def _keep_typing_alive(ctx, stop_event):
         raise
 
 
-async def _fetch_guild_info_standalone(gw2_api, guild_id, api_key, ctx):
-    """Helper to fetch individual guild information."""
-    try:
-        api_req_guild = await gw2_api.call_api(f"guild/{guild_id}", api_key)
-        name = api_req_guild["name"]
-        tag = api_req_guild["tag"]
-        return f"[{tag}] {name}", guild_id
-    except Exception as e:
-        ctx.bot.log.error(f"Error fetching guild {guild_id}: {e}")
-        return None, guild_id
-
-
 class GW2Account(GuildWars2):
     """Guild Wars 2 commands for account information."""
 
@@ -69,7 +56,7 @@ async def account(ctx):
 
     api_key = str(rs[0]["key"])
     permissions = str(rs[0]["permissions"])
-    gw2_api = Gw2Client(ctx.bot)
+    gw2_api = ctx.bot.gw2_client
 
     # Validate API key
     is_valid_key = await gw2_api.check_api_key(api_key)
@@ -200,34 +187,18 @@ async def account(ctx):
             progress_embed.description = f"🔄 **Please wait, I'm fetching guild information...** ({guild_count} guilds)"
             await progress_msg.edit(embed=progress_embed)
 
-            # Fetch guild info in parallel with limited concurrency to avoid rate limits
-            guild_tasks = []
-            for guild_id in api_req_acc["guilds"]:
-                guild_tasks.append(_fetch_guild_info_standalone(gw2_api, guild_id, api_key, ctx))
-
-            # Limit concurrent guild requests to avoid overwhelming the API
-            sem = asyncio.Semaphore(3)  # Max 3 concurrent guild requests
-
-            async def limited_guild_fetch(task):
-                async with sem:
-                    return await task
-
-            guild_results = await asyncio.gather(
-                *[limited_guild_fetch(task) for task in guild_tasks], return_exceptions=True
-            )
+            # Guild names and tags come from the static data store, fetched from the API only when unknown
+            guilds = await gw2_utils.get_static_data(ctx.bot, "guild", api_req_acc["guilds"])
 
             guilds_names = []
             guild_leader_names = []
             guild_leader_ids = set(api_req_acc.get("guild_leader", []))
 
-            for result in guild_results:
-                if isinstance(result, Exception):
-                    continue
-                guild_name, guild_id = result
-                if guild_name:
-                    guilds_names.append(guild_name)
-                    if guild_id in guild_leader_ids:
-                        guild_leader_names.append(guild_name)
+            for guild_id, guild in guilds.items():
+                guild_name = f"[{guild['tag']}] {guild['name']}"
+                guilds_names.append(guild_name)
+                if guild_id in guild_leader_ids:
+                    guild_leader_names.append(guild_name)
 
             if guilds_names:
                 embed.add_field(name="Guilds", value=chat_formatting.inline("\n".join(guilds_names)), inline=False)
@@ -6,7 +6,6 @@
 from src.gw2.cogs.gw2 import GuildWars2
 from src.gw2.constants import gw2_messages
 from src.gw2.tools import gw2_utils
-from src.gw2.tools.gw2_client import Gw2Client
 from src.gw2.tools.gw2_cooldowns import GW2CoolDowns
 
 
@@ -38,7 +37,7 @@ async def characters(ctx):
             return await bot_utils.send_error_msg(ctx, msg)
 
         api_key = str(rs[0]["key"])
-        gw2_api = Gw2Client(ctx.bot)
+        gw2_api = ctx.bot.gw2_client
         is_valid_key = await gw2_api.check_api_key(api_key)
         if not isinstance(is_valid_key, dict):
             msg = f"{is_valid_key.message}\n"
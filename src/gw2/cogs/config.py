@@ -5,6 +5,7 @@
 from src.database.dal.gw2.gw2_configs_dal import Gw2ConfigsDal
 from src.gw2.cogs.gw2 import GuildWars2
 from src.gw2.constants import gw2_messages
+from src.gw2.tools import gw2_utils
 from src.gw2.tools.gw2_cooldowns import GW2CoolDowns
 
 
@@ -101,6 +102,7 @@ async def config_session(ctx, subcommand_passed: str):
     embed = discord.Embed(description=msg, color=color)
     gw2_configs = Gw2ConfigsDal(ctx.bot.db_session, ctx.bot.log)
     await gw2_configs.update_gw2_session_config(ctx.message.channel.guild.id, new_status, ctx.author.id)
+    gw2_utils.set_guild_session_enabled(ctx.message.channel.guild.id, new_status)
     await bot_utils.send_embed(ctx, embed)
 
 
@@ -155,6 +157,7 @@ async def _handle_update(
             gw2_configs = Gw2ConfigsDal(self.ctx.bot.db_session, self.ctx.bot.log)
             new_status = not self.server_config[config_key]
             await gw2_configs.update_gw2_session_config(self.ctx.guild.id, new_status, self.ctx.author.id)
+            gw2_utils.set_guild_session_enabled(self.ctx.guild.id, new_status)
             self.server_config[config_key] = new_status
             self.ctx.bot.log.info(
                 f"Successfully updated GW2 config {config_key} "
@@ -4,7 +4,7 @@
 from src.database.dal.gw2.gw2_key_dal import Gw2KeyDal
 from src.gw2.cogs.gw2 import GuildWars2
 from src.gw2.constants import gw2_messages
-from src.gw2.tools.gw2_client import Gw2Client
+from src.gw2.tools import gw2_utils
 from src.gw2.tools.gw2_cooldowns import GW2CoolDowns
 
 
@@ -36,7 +36,7 @@ async def _send_error(ctx_or_interaction, msg):
 
 async def _validate_api_key(bot, api_key):
     """Validate API key with GW2 servers and return account info dict."""
-    gw2_api = Gw2Client(bot)
+    gw2_api = bot.gw2_client
     is_valid_key = await gw2_api.check_api_key(api_key)
     if not isinstance(is_valid_key, dict):
         raise ValueError(f"{is_valid_key.message}\n`{api_key}`")
@@ -99,6 +99,7 @@ async def _process_add_key(ctx_or_interaction, api_key, bot, prefix):
                 "api_key": api_key,
             }
         )
+        gw2_utils.add_key_user(user_id)
         msg = gw2_messages.key_added_successfully(key_info["key_name"], key_info["gw2_server_name"])
         msg += gw2_messages.key_more_info_help(prefix)
         await _send_success(ctx_or_interaction, msg, embed_color)
@@ -324,6 +325,7 @@ async def remove(ctx):
     else:
         color = ctx.bot.settings["gw2"]["EmbedColor"]
         await gw2_key_dal.delete_user_api_key(user_id)
+        gw2_utils.remove_key_user(user_id)
         await bot_utils.send_msg(ctx, gw2_messages.KEY_REMOVED_SUCCESSFULLY, True, color)
         return None
 
@@ -341,7 +343,7 @@ async def info(ctx):
     author_icon_url = ctx.message.author.display_avatar.url
     color = ctx.bot.settings["gw2"]["EmbedColor"]
     gw2_key_dal = Gw2KeyDal(ctx.bot.db_session, ctx.bot.log)
-    gw2_api = Gw2Client(ctx.bot)
+    gw2_api = ctx.bot.gw2_client
 
     # Get user's API key
     rs = await gw2_key_dal.get_api_key_by_user(user_id)
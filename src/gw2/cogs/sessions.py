@@ -1,16 +1,29 @@
 import discord
+import math
+from datetime import datetime, timedelta
 from discord.ext import commands
 from src.bot.tools import bot_utils, chat_formatting
 from src.database.dal.gw2.gw2_configs_dal import Gw2ConfigsDal
 from src.database.dal.gw2.gw2_key_dal import Gw2KeyDal
 from src.database.dal.gw2.gw2_session_chars_dal import Gw2SessionCharDeathsDal
+from src.database.dal.gw2.gw2_session_samples_dal import Gw2SessionSamplesDal
 from src.database.dal.gw2.gw2_sessions_dal import Gw2SessionsDal
 from src.gw2.cogs.gw2 import GuildWars2
 from src.gw2.constants import gw2_messages
 from src.gw2.constants.gw2_currencies import WALLET_DISPLAY_NAMES
 from src.gw2.tools import gw2_utils
-from src.gw2.tools.gw2_client import Gw2Client
 from src.gw2.tools.gw2_cooldowns import GW2CoolDowns
+from src.gw2.tools.gw2_scheduler import RequestPriority
+
+# Finished sessions listed by gw2 sessions
+SESSION_HISTORY_LIMIT = 10
+# Stats shown hour by hour by gw2 session, from the session samples, and the hours shown
+HOURLY_STATS = {
+    "gold": WALLET_DISPLAY_NAMES["gold"],
+    "karma": WALLET_DISPLAY_NAMES["karma"],
+    "players": gw2_messages.PLAYERS_KILLED,
+}
+HOURLY_GAINS_LIMIT = 12
 
 
 class GW2Session(GuildWars2):
@@ -97,7 +110,7 @@ async def session(ctx):
         if is_playing:
             # User is still playing - fetch live snapshot from API without saving to DB
             progress_msg = await gw2_utils.send_progress_embed(ctx)
-            live_stats = await gw2_utils.get_user_stats(ctx.bot, api_key)
+            live_stats = await gw2_utils.get_user_stats(ctx.bot, api_key, RequestPriority.INTERACTIVE)
             if not live_stats:
                 await progress_msg.delete()
                 return await gw2_utils.send_msg(ctx, gw2_messages.SESSION_IN_PROGRESS)
@@ -164,6 +177,12 @@ async def session(ctx):
         # Gold (special formatting)
         _add_gold_field(embed, rs_start, rs_end)
 
+        # Gains hour by hour, when the session was sampled while played
+        gw2_session_samples_dal = Gw2SessionSamplesDal(ctx.bot.db_session, ctx.bot.log)
+        samples = await gw2_session_samples_dal.get_user_samples(user_id, start_time, end_time, list(HOURLY_STATS))
+        if samples:
+            _add_hourly_gains_field(embed, rs_start, rs_end, start_time, end_time, samples)
+
         # Deaths
         if is_live_snapshot:
             char_deaths = await _build_live_char_deaths(ctx, api_key, user_id)
@@ -201,6 +220,53 @@ async def session(ctx):
     return None
 
 
+@GW2Session.gw2.command()
+@commands.guild_only()
+@commands.cooldown(1, GW2CoolDowns.Session.seconds, commands.BucketType.user)
+async def sessions(ctx):
+    """Display your past Guild Wars 2 game sessions, newest first.
+
+    Shows the play time and gold of your last finished sessions.
+    Use gw2 session for the full stats of the last one.
+
+    Usage:
+        gw2 sessions
+    """
+
+    user_id = ctx.message.author.id
+    gw2_session_dal = Gw2SessionsDal(ctx.bot.db_session, ctx.bot.log)
+    rs_sessions = await gw2_session_dal.get_user_sessions(user_id, SESSION_HISTORY_LIMIT)
+    if not rs_sessions:
+        return await bot_utils.send_error_msg(ctx, gw2_messages.USER_NO_SESSION_FOUND)
+
+    color = ctx.bot.settings["gw2"]["EmbedColor"]
+    embed = discord.Embed(color=color)
+    embed.set_author(
+        name=f"{ctx.message.author.display_name}'s {gw2_messages.SESSION_HISTORY_TITLE}",
+        icon_url=ctx.message.author.display_avatar.url,
+    )
+    for rs_session in rs_sessions:
+        rs_start = rs_session["start"]
+        rs_end = rs_session["end"]
+        start_time = bot_utils.convert_str_to_datetime_short(rs_start["date"])
+        end_time = bot_utils.convert_str_to_datetime_short(rs_end["date"])
+        time_passed = gw2_utils.get_time_passed(start_time, end_time)
+        play_time_str = gw2_utils.format_seconds_to_time(int(time_passed.timedelta.total_seconds()))
+        value = f"{gw2_messages.PLAY_TIME}: {play_time_str}"
+        if "gold" in rs_start and "gold" in rs_end and rs_start["gold"] != rs_end["gold"]:
+            diff = rs_end["gold"] - rs_start["gold"]
+            formatted_gold = gw2_utils.format_gold(str(abs(diff)).zfill(2))
+            value += f"\nGold: {'+' if diff > 0 else '-'}{formatted_gold}"
+        embed.add_field(name=rs_start["date"], value=chat_formatting.inline(value), inline=False)
+
+    embed.set_footer(
+        icon_url=ctx.bot.user.avatar.url if ctx.bot.user.avatar else None,
+        text=f"{bot_utils.get_current_date_time_str_long()} UTC",
+    )
+    await bot_utils.send_paginated_embed(ctx, embed)
+    return None
+
+
 def _is_user_playing_gw2(ctx) -> bool:
     """Check if the user is currently playing GW2 by checking all activities."""
     if isinstance(ctx.channel, discord.DMChannel):
@@ -225,7 +291,7 @@ async def _build_live_char_deaths(ctx, api_key: str, user_id: int) -> list[dict]
         return None
 
     try:
-        gw2_api = Gw2Client(ctx.bot)
+        gw2_api = ctx.bot.gw2_client
         characters_data = await gw2_api.call_api("characters?ids=all", api_key)
     except Exception:
         return None
@@ -261,6 +327,47 @@ def _add_gold_field(embed: discord.Embed, rs_start: dict, rs_end: dict) -> None:
             embed.add_field(name="Gold", value=chat_formatting.inline(str(final_result)), inline=False)
 
 
+def _add_hourly_gains_field(
+    embed: discord.Embed, rs_start: dict, rs_end: dict, start_time: datetime, end_time: datetime, samples: list[dict]
+) -> None:
+    """Add the gains of each hour of the session to embed.
+
+    A stat keeps its value until the next sample that changed it, starting from the start
+    snapshot; the hour the session ended in runs up to the end snapshot.
+    """
+    hours = min(HOURLY_GAINS_LIMIT, max(1, math.ceil((end_time - start_time).total_seconds() / 3600)))
+    current = {stat: rs_start.get(stat) for stat in HOURLY_STATS}
+    hour_lines: list[str] = []
+    index = 0
+
+    for hour in range(hours):
+        hour_start = dict(current)
+        hour_end_time = start_time + timedelta(hours=hour + 1)
+        while index < len(samples) and samples[index]["ts"] < hour_end_time:
+            current[samples[index]["field"]] = samples[index]["value"]
+            index += 1
+        if hour_end_time >= end_time:
+            current.update({stat: rs_end[stat] for stat in HOURLY_STATS if rs_end.get(stat) is not None})
+
+        gains: list[str] = []
+        for stat, display_name in HOURLY_STATS.items():
+            if hour_start[stat] is None or current[stat] is None or hour_start[stat] == current[stat]:
+                continue
+            diff = current[stat] - hour_start[stat]
+            sign = "+" if diff > 0 else "-"
+            if stat == "gold":
+                # Gold/Silver/Copper formatting names itself
+                gains.append(f"{sign}{gw2_utils.format_gold(f'{abs(diff):02d}')}")
+            else:
+                gains.append(f"{sign}{abs(diff)} {display_name}")
+        hour_lines.append(f"{hour + 1}h: {', '.join(gains) or '-'}")
+
+    value = "\n".join(hour_lines)
+    if len(value) > 1020:
+        value = value[:1017] + "..."
+    embed.add_field(name=gw2_messages.HOURLY_GAINS, value=chat_formatting.inline(value), inline=False)
+
+
 def _add_deaths_field(embed: discord.Embed, char_deaths: list[dict]) -> None:
     """Add deaths field to embed.
 
@@ -6,7 +6,6 @@
 from src.gw2.cogs.gw2 import GuildWars2
 from src.gw2.constants import gw2_messages
 from src.gw2.tools import gw2_utils
-from src.gw2.tools.gw2_client import Gw2Client
 from src.gw2.tools.gw2_cooldowns import GW2CoolDowns
 
 
@@ -81,7 +80,7 @@ async def worlds_eu(ctx):
 
 async def _fetch_worlds_matches(ctx, worlds, title, region_prefix):
     """Fetch WvW match data for a list of worlds in parallel."""
-    gw2_api = Gw2Client(ctx.bot)
+    gw2_api = ctx.bot.gw2_client
     embed = discord.Embed(description=chat_formatting.inline(title))
     failed_worlds = []
     sem = asyncio.Semaphore(5)
@@ -7,7 +7,6 @@
 from src.gw2.constants import gw2_messages
 from src.gw2.constants.gw2_teams import get_team_name, is_wr_team_id
 from src.gw2.tools import gw2_utils
-from src.gw2.tools.gw2_client import Gw2Client
 from src.gw2.tools.gw2_cooldowns import GW2CoolDowns
 from src.gw2.tools.gw2_exceptions import APIKeyError
 
@@ -42,7 +41,7 @@ async def info(ctx, *, world: str = None):
         gw2 wvw info Blackgate
     """
     await ctx.message.channel.typing()
-    gw2_api = Gw2Client(ctx.bot)
+    gw2_api = ctx.bot.gw2_client
 
     no_api_key_msg = gw2_messages.NO_API_KEY
     no_api_key_msg += gw2_messages.key_add_info_help(ctx.prefix)
@@ -147,7 +146,7 @@ async def match(ctx, *, world: str = None):
     """
 
     await ctx.message.channel.typing()
-    gw2_api = Gw2Client(ctx.bot)
+    gw2_api = ctx.bot.gw2_client
 
     no_key_msg = gw2_messages.MISSING_WORLD_NAME
     no_key_msg += gw2_messages.match_world_name_help(ctx.prefix)
@@ -213,7 +212,7 @@ async def kdr(ctx, *, world: str = None):
     """
 
     await ctx.message.channel.typing()
-    gw2_api = Gw2Client(ctx.bot)
+    gw2_api = ctx.bot.gw2_client
 
     no_key_msg = gw2_messages.INVALID_WORLD_NAME
     no_key_msg += gw2_messages.match_world_name_help(ctx.prefix)
@@ -13,6 +13,7 @@
 API_ERROR: Final = "GW2 API ERROR"
 API_DOWN: Final = "GW2 API is currently down. Try again later."
 API_NOT_FOUND: Final = "GW2 API Not found."
+API_CIRCUIT_OPEN: Final = "GW2 API is not responding. Try again in a few seconds."
 API_REQUEST_REACHED: Final = "GW2 API Requests limit has been saturated. Try again later."
 API_ACCESS_DENIED: Final = "Access denied with your GW2 API key."
 #################################
@@ -86,6 +87,7 @@ def displaying_wiki_search_title(count: int, keyword: str) -> str:
 # GW2 SESSIONS
 #################################
 SESSION_TITLE: Final = "GW2 Last Session"
+SESSION_HISTORY_TITLE: Final = "GW2 Session History"
 
 
 def session_not_active(prefix: str) -> str:
@@ -107,6 +109,7 @@ def session_not_active(prefix: str) -> str:
 ACCOUNT_NAME: Final = "Account Name"
 SERVER: Final = "Server"
 PLAY_TIME: Final = "Play time"
+HOURLY_GAINS: Final = "Gains per hour"
 TIMES_YOU_DIED: Final = "Times you died"
 WVW_RANKS: Final = "WvW ranks"
 YAKS_KILLED: Final = "Yaks killed"
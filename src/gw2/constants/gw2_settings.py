@@ -14,6 +14,7 @@ class Gw2Settings(BaseSettings):
 
     # GW2 configuration
     api_version: int | None = Field(default=2)
+    api_base_url: str | None = Field(default="https://api.guildwars2.com")
     embed_color: str | None = Field(default="green")
 
     # GW2 cooldowns
@@ -30,9 +31,86 @@ class Gw2Settings(BaseSettings):
     # GW2 API retry
     api_retry_max_attempts: int | None = Field(default=5)
     api_retry_delay: float | None = Field(default=3.0)
+    api_retry_max_delay: float | None = Field(default=30.0)
+    api_retry_max_elapsed: float | None = Field(default=60.0)
     api_session_retry_bg_delay: float | None = Field(default=30.0)
+    api_session_retry_bg_max_delay: float | None = Field(default=300.0)
     api_session_end_delay: float | None = Field(default=180.0)
 
+    # GW2 session jobs (delayed session ends and background retries persisted in gw2.gw2_session_jobs)
+    api_session_jobs_concurrency: int | None = Field(default=4)
+    api_session_jobs_poll_interval: float | None = Field(default=5.0)
+
+    # GW2 session batching (presence events gathered per window, users per batch, concurrent snapshots)
+    api_session_batch_window: float | None = Field(default=1.0)
+    api_session_batch_max_size: int | None = Field(default=200)
+    api_session_batch_concurrency: int | None = Field(default=10)
+
+    # GW2 session actors (one mailbox per active user, session actions running at once across users)
+    api_session_actor_workers: int | None = Field(default=200)
+
+    # GW2 session sampling (stats of playing users stored every interval seconds, snapshots taken at once)
+    api_session_sampling_enabled: bool | None = Field(default=False)
+    api_session_sample_interval: float | None = Field(default=900.0)
+    api_session_sample_concurrency: int | None = Field(default=2)
+
+    # GW2 session metrics (pipeline counters and latencies logged as one JSON line every interval seconds, 0 disables)
+    api_session_metrics_log_interval: float | None = Field(default=0.0)
+
+    # GW2 session history (keep finished sessions; months kept before their partition is dropped, 0 keeps all)
+    api_session_history: bool | None = Field(default=True)
+    api_session_retention_months: int | None = Field(default=12)
+
+    # GW2 API connection pool (shared bot.gw2_client session)
+    api_connection_limit: int | None = Field(default=100)
+    api_connection_limit_per_host: int | None = Field(default=30)
+    api_dns_cache_ttl: int | None = Field(default=300)
+    api_keepalive_timeout: float | None = Field(default=30.0)
+    api_request_timeout: float | None = Field(default=30.0)
+    api_connect_timeout: float | None = Field(default=10.0)
+
+    # GW2 API priority scheduler (requests in flight, in total and per class; max_wait is the starvation limit)
+    api_scheduler_enabled: bool | None = Field(default=True)
+    api_scheduler_max_concurrency: int | None = Field(default=10)
+    api_scheduler_interactive_limit: int | None = Field(default=10)
+    api_scheduler_background_limit: int | None = Field(default=4)
+    api_scheduler_prefetch_limit: int | None = Field(default=2)
+    api_scheduler_max_wait: float | None = Field(default=10.0)
+
+    # GW2 API bulk fetch (concurrent ?ids= chunk requests per fetch_many call)
+    api_fetch_many_concurrency: int | None = Field(default=5)
+
+    # GW2 static data store (achievements, worlds, currencies, guilds persisted in gw2.gw2_static_data)
+    api_static_store_max_entries: int | None = Field(default=10000)
+    api_static_store_build_check_interval: float | None = Field(default=3600.0)
+
+    # GW2 startup warm-up (prefetch static data in the background after the cogs are loaded)
+    api_warm_up_enabled: bool | None = Field(default=True)
+    api_warm_up_concurrency: int | None = Field(default=2)
+
+    # GW2 API response cache
+    api_cache_enabled: bool | None = Field(default=True)
+    api_cache_max_entries: int | None = Field(default=2048)
+
+    # GW2 API conditional requests (revalidate stored responses with ETag / Last-Modified)
+    api_revalidation_enabled: bool | None = Field(default=True)
+    api_revalidation_max_entries: int | None = Field(default=256)
+
+    # GW2 API response decoding (bodies larger than this many bytes are decoded in a worker thread, 0 disables)
+    api_decode_thread_threshold: int | None = Field(default=65536)
+
+    # GW2 API client-side rate limit (requests per second and burst size)
+    api_rate_limit_enabled: bool | None = Field(default=True)
+    api_rate_limit_global_rate: float | None = Field(default=5.0)
+    api_rate_limit_global_burst: int | None = Field(default=100)
+    api_rate_limit_key_rate: float | None = Field(default=2.0)
+    api_rate_limit_key_burst: int | None = Field(default=20)
+
+    # GW2 API circuit breaker (per endpoint family)
+    api_circuit_breaker_enabled: bool | None = Field(default=True)
+    api_circuit_breaker_failure_threshold: int | None = Field(default=5)
+    api_circuit_breaker_recovery_timeout: float | None = Field(default=30.0)
+
     @model_validator(mode="after")
     def _clamp_session_end_delay(self) -> Gw2Settings:
         if self.api_session_end_delay is not None and self.api_session_end_delay < 180.0:
@@ -7,7 +7,9 @@
 
 # API configuration
 _gw2_settings = get_gw2_settings()
-API_URI: Final[str] = f"https://api.guildwars2.com/v{_gw2_settings.api_version}"
+# Point GW2_API_BASE_URL at the local emulator (python -m src.gw2.emulator) to run without the real API
+API_URI: Final[str] = f"{_gw2_settings.api_base_url.rstrip('/')}/v{_gw2_settings.api_version}"
+API_MAX_IDS_PER_REQUEST: Final[int] = 200
 
 # Wiki and external URLs
 WIKI_URL: Final[str] = "https://wiki.guildwars2.com"
@@ -0,0 +1,40 @@
+"""Run the local GW2 API emulator.
+
+Usage:
+    python -m src.gw2.emulator --port 8800 --latency 0.05 --error-rate 0.02 --rate-limit 10
+
+Then point the bot at it with GW2_API_BASE_URL=http://127.0.0.1:8800
+"""
+
+import argparse
+from aiohttp import web
+from src.gw2.emulator.gw2_api_emulator import Gw2ApiEmulator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local GW2 API emulator serving recorded fixtures")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra seconds, up to this value")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 429/502/503")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="requests per second per API key, 0 disables")
+    parser.add_argument("--rate-burst", type=int, default=300)
+    parser.add_argument("--characters", type=int, default=None, help="characters per account")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    emulator = Gw2ApiEmulator(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        rate_burst=args.rate_burst,
+        character_count=args.characters,
+        seed=args.seed,
+    )
+    web.run_app(emulator.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
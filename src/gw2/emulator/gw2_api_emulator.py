@@ -0,0 +1,203 @@
+import asyncio
+import hashlib
+import json
+import random
+from aiohttp import web
+from pathlib import Path
+from src.gw2.tools.gw2_rate_limiter import TokenBucket
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+# Statuses injected by error_rate: rate limited, bad gateway, service unavailable
+DEFAULT_ERROR_STATUSES = (429, 502, 503)
+
+
+class Endpoint:
+    """An emulated GW2 API endpoint served from a fixture file.
+
+    Args:
+        fixture: File name in the fixtures directory
+        authenticated: Requests need an API key
+        bulk: The fixture is a list of objects that can be looked up by id (?ids=, ?id=, /<id>)
+        id_field: Field holding the id of each object
+    """
+
+    __slots__ = ("authenticated", "bulk", "fixture", "id_field")
+
+    def __init__(self, fixture: str, authenticated: bool = False, bulk: bool = False, id_field: str = "id"):
+        self.fixture = fixture
+        self.authenticated = authenticated
+        self.bulk = bulk
+        self.id_field = id_field
+
+
+ENDPOINTS: dict[str, Endpoint] = {
+    "build": Endpoint("build.json"),
+    "tokeninfo": Endpoint("tokeninfo.json", authenticated=True),
+    "account": Endpoint("account.json", authenticated=True),
+    "account/wallet": Endpoint("account_wallet.json", authenticated=True),
+    "account/achievements": Endpoint("account_achievements.json", authenticated=True, bulk=True),
+    "characters": Endpoint("characters.json", authenticated=True, bulk=True, id_field="name"),
+    "pvp/stats": Endpoint("pvp_stats.json", authenticated=True),
+    "achievements": Endpoint("achievements.json", bulk=True),
+    "currencies": Endpoint("currencies.json", bulk=True),
+    "worlds": Endpoint("worlds.json", bulk=True),
+    "guild": Endpoint("guild.json", bulk=True),
+    "wvw/matches": Endpoint("wvw_matches.json", bulk=True),
+}
+
+
+class Gw2ApiEmulator:
+    """Local stand-in for api.guildwars2.com serving recorded fixtures, for offline benchmarks and soak tests.
+
+    Routes live under /v<api_version>/ like the real API, so pointing GW2_API_BASE_URL at the
+    emulator is enough for the bot to use it. Responses carry an ETag and honour If-None-Match,
+    bulk endpoints answer 206 for partially known ids, and errors use the API's {"text": ...} body.
+
+    Args:
+        fixtures_dir: Directory with the JSON fixtures
+        latency: Seconds added to every response
+        jitter: Extra random seconds added on top of latency, up to this value
+        error_rate: Fraction of requests answered with one of error_statuses (0 to 1)
+        error_statuses: Statuses used for injected errors
+        rate_limit: Requests per second allowed per API key (or per client without a key), 0 disables
+        rate_burst: Burst size of the rate limit
+        character_count: Characters per account, repeating the fixture characters (None keeps the fixture)
+        seed: Seed of the random generator, for reproducible jitter and error injection
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: Path = FIXTURES_DIR,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = DEFAULT_ERROR_STATUSES,
+        rate_limit: float = 0.0,
+        rate_burst: int = 300,
+        character_count: int | None = None,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        # Reproducible load tests need a seedable generator, this is not used for anything secret
+        self._random = random.Random(seed)  # noqa: S311
+        self._buckets: dict[str, TokenBucket] = {}
+        self._data = {path: json.loads((fixtures_dir / e.fixture).read_text()) for path, e in ENDPOINTS.items()}
+        if character_count is not None:
+            self._data["characters"] = self._repeat_characters(self._data["characters"], character_count)
+        self.requests = 0
+        self.injected_errors = 0
+        self.rate_limited = 0
+        self.not_modified = 0
+
+    @staticmethod
+    def _repeat_characters(characters: list[dict], count: int) -> list[dict]:
+        """Build an account with count characters, numbering the fixture ones past the first round."""
+        repeated = []
+        for index in range(count):
+            character = dict(characters[index % len(characters)])
+            if index >= len(characters):
+                character["name"] = f"{character['name']} {index // len(characters) + 1}"
+            repeated.append(character)
+        return repeated
+
+    def make_app(self, api_version: int = 2) -> web.Application:
+        """Build the aiohttp application serving the emulated API."""
+        app = web.Application()
+        app.router.add_get(f"/v{api_version}/{{path:.*}}", self.handle)
+        return app
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Answer one API request."""
+        self.requests += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        api_key = self._get_api_key(request)
+        if self.rate_limit and not self._get_bucket(api_key or request.remote or "").try_acquire():
+            self.rate_limited += 1
+            return self._error(429, "too many requests")
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.injected_errors += 1
+            status = self._random.choice(self.error_statuses)
+            return self._error(status, "emulated error")
+
+        status, payload = self.resolve(request.match_info["path"], request.query, api_key)
+        if status >= 400:
+            return self._error(status, payload)
+
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(status=status, body=body, content_type="application/json", headers={"ETag": etag})
+
+    def resolve(self, path: str, query, api_key: str | None) -> tuple[int, object]:
+        """Get the status and payload (or error text) for a request path and query string."""
+        path = path.strip("/")
+        endpoint_path, object_id = path, None
+        if endpoint_path not in ENDPOINTS and "/" in path:
+            endpoint_path, object_id = path.rsplit("/", 1)
+
+        endpoint = ENDPOINTS.get(endpoint_path)
+        if endpoint is None:
+            return 404, "not found"
+        if endpoint.authenticated and not api_key:
+            return 400, "invalid key"
+
+        data = self._data[endpoint_path]
+        if not endpoint.bulk:
+            return (404, "not found") if object_id else (200, data)
+
+        if endpoint_path == "wvw/matches" and "world" in query:
+            world = int(query["world"]) if query["world"].isdigit() else None
+            for match in data:
+                if any(world in worlds for worlds in match["all_worlds"].values()):
+                    return 200, match
+            return 404, "world not currently in a match"
+
+        by_id = {str(obj[endpoint.id_field]): obj for obj in data}
+        if object_id is not None or "id" in query:
+            obj = by_id.get(object_id if object_id is not None else query["id"])
+            return (200, obj) if obj is not None else (404, "no such id")
+        if "ids" in query:
+            if query["ids"] == "all":
+                return 200, data
+            found = [by_id[i] for i in query["ids"].split(",") if i in by_id]
+            if not found:
+                return 404, "all ids provided are invalid"
+            return (200 if len(found) == len(query["ids"].split(",")) else 206), found
+        return 200, [obj[endpoint.id_field] for obj in data]
+
+    @staticmethod
+    def _get_api_key(request: web.Request) -> str | None:
+        authorization = request.headers.get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            return authorization.removeprefix("Bearer ").strip() or None
+        return request.query.get("access_token")
+
+    def _get_bucket(self, client: str) -> TokenBucket:
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = TokenBucket(self.rate_limit, self.rate_burst)
+        return bucket
+
+    @staticmethod
+    def _error(status: int, text: str) -> web.Response:
+        return web.json_response({"text": text}, status=status)
+
+    def stats(self) -> dict[str, int]:
+        """Get the request and injected failure counters."""
+        return {
+            "requests": self.requests,
+            "injected_errors": self.injected_errors,
+            "rate_limited": self.rate_limited,
+            "not_modified": self.not_modified,
+        }
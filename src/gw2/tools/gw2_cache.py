@@ -0,0 +1,126 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Final
+
+MISSING: Final = object()
+
+
+class CachePolicy:
+    """TTL policy for a family of GW2 API endpoints.
+
+    Args:
+        prefix: Endpoint path prefix (without query string), e.g. "worlds" or "wvw/matches"
+        ttl: Seconds a cached response stays fresh
+        per_key: Scope cached responses by API key (authenticated endpoints)
+    """
+
+    def __init__(self, prefix: str, ttl: float, per_key: bool = False):
+        self.prefix = prefix
+        self.ttl = ttl
+        self.per_key = per_key
+
+    def matches(self, path: str) -> bool:
+        """Check if an endpoint path belongs to this policy."""
+        return path == self.prefix or path.startswith(f"{self.prefix}/")
+
+    def cache_key(self, uri: str, api_key: str | None = None) -> tuple[str, str | None]:
+        """Build the cache key for a request, scoping by a hashed API key when required."""
+        if self.per_key and api_key:
+            return uri, hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return uri, None
+
+
+# Most specific prefixes first. Endpoints without a policy (e.g. tokeninfo) are never cached.
+DEFAULT_CACHE_POLICIES: Final[tuple[CachePolicy, ...]] = (
+    # Static game data, shared by every user
+    CachePolicy("achievements", ttl=86400),
+    CachePolicy("currencies", ttl=86400),
+    CachePolicy("items", ttl=86400),
+    CachePolicy("worlds", ttl=3600),
+    # Live WvW data refreshes every few seconds upstream
+    CachePolicy("wvw/matches", ttl=30),
+    # Guild details may include member-only fields when requested with a key
+    CachePolicy("guild", ttl=3600, per_key=True),
+    # Authenticated account data, the GW2 API itself caches these for a few minutes
+    CachePolicy("account", ttl=60, per_key=True),
+    CachePolicy("characters", ttl=60, per_key=True),
+    CachePolicy("pvp/stats", ttl=60, per_key=True),
+)
+
+
+class Gw2ResponseCache:
+    """In-process LRU cache for decoded GW2 API responses with per-endpoint TTLs.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        policies: tuple[CachePolicy, ...] = DEFAULT_CACHE_POLICIES,
+        enabled: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.policies = policies
+        self.enabled = enabled
+        self._entries: OrderedDict[tuple[str, str | None], tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_policy(self, uri: str) -> CachePolicy | None:
+        """Get the TTL policy for an endpoint, or None if it must not be cached."""
+        if not self.enabled:
+            return None
+        path = uri.split("?")[0]
+        for policy in self.policies:
+            if policy.matches(path):
+                return policy
+        return None
+
+    def get(self, cache_key: tuple[str, str | None]) -> Any:
+        """Get a fresh cached response, or MISSING if absent or expired."""
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[cache_key]
+            self.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(cache_key)
+        self.hits += 1
+        return value
+
+    def set(self, cache_key: tuple[str, str | None], value: Any, ttl: float) -> None:
+        """Store a response, evicting the least recently used entries when full."""
+        if ttl <= 0:
+            return
+        self._entries[cache_key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached responses and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Get cache size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,136 @@
+import time
+from enum import Enum
+
+# Statuses that mean the API itself is unhealthy, as opposed to a bad request or key
+OUTAGE_STATUSES = (500, 502, 503, 504)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single GW2 API endpoint family.
+
+    closed: requests flow; consecutive outage failures are counted.
+    open: requests fail fast until recovery_timeout has passed.
+    half-open: one probe request is let through; success closes the circuit, failure opens it again.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds to stay open before letting a probe through
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at: float | None = None
+        self.times_opened = 0
+        self.rejected = 0
+
+    def allow_request(self) -> bool:
+        """Check if a request may be sent, moving from open to half-open once the timeout has passed."""
+        now = time.monotonic()
+        if self.state == CircuitState.OPEN:
+            if now - self.opened_at < self.recovery_timeout:
+                self.rejected += 1
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self.probe_started_at = None
+
+        if self.state == CircuitState.HALF_OPEN:
+            # A probe that never reported back (e.g. cancelled) must not block the circuit forever
+            if self.probe_started_at is not None and now - self.probe_started_at < self.recovery_timeout:
+                self.rejected += 1
+                return False
+            self.probe_started_at = now
+
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a healthy response."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Count an outage failure, opening the circuit when the threshold is reached or a probe fails."""
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                self.times_opened += 1
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+            self.probe_started_at = None
+
+    def retry_in(self) -> float:
+        """Get the seconds left before an open circuit lets a probe through."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+
+class Gw2CircuitBreaker:
+    """Registry of circuit breakers keyed by endpoint family (the first path segment, e.g. "account", "wvw")."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, enabled: bool = True):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.enabled = enabled
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    @staticmethod
+    def get_family(uri: str) -> str:
+        """Get the endpoint family of a GW2 API uri."""
+        return uri.split("?")[0].strip("/").split("/")[0]
+
+    def get_breaker(self, uri: str) -> CircuitBreaker:
+        """Get or create the circuit breaker for the uri's endpoint family."""
+        family = self.get_family(uri)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+            self._breakers[family] = breaker
+        return breaker
+
+    def allow_request(self, uri: str) -> bool:
+        """Check if a request to this uri may be sent."""
+        if not self.enabled:
+            return True
+        return self.get_breaker(uri).allow_request()
+
+    def record_status(self, uri: str, status: int) -> None:
+        """Record the outcome of a request from its HTTP status."""
+        if not self.enabled:
+            return
+        if status in OUTAGE_STATUSES:
+            self.get_breaker(uri).record_failure()
+        else:
+            self.get_breaker(uri).record_success()
+
+    def record_failure(self, uri: str) -> None:
+        """Record a request that failed without a response (connection error, timeout)."""
+        if self.enabled:
+            self.get_breaker(uri).record_failure()
+
+    def reset(self) -> None:
+        """Close every circuit and forget all families."""
+        self._breakers.clear()
+
+    def stats(self) -> dict[str, dict[str, str | int | float]]:
+        """Get the state of every endpoint family seen so far."""
+        return {
+            family: {
+                "state": breaker.state.value,
+                "failures": breaker.failures,
+                "times_opened": breaker.times_opened,
+                "rejected": breaker.rejected,
+                "retry_in": round(breaker.retry_in(), 1),
+            }
+            for family, breaker in sorted(self._breakers.items())
+        }
@@ -1,6 +1,11 @@
 import asyncio
+import time
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from src.gw2.constants import gw2_messages, gw2_variables
 from src.gw2.constants.gw2_settings import get_gw2_settings
+from src.gw2.tools.gw2_cache import MISSING, Gw2ResponseCache
+from src.gw2.tools.gw2_circuit_breaker import Gw2CircuitBreaker
+from src.gw2.tools.gw2_decoder import Gw2ResponseDecoder, JsonDecoder
 from src.gw2.tools.gw2_exceptions import (
     APIBadRequest,
     APIConnectionError,
@@ -10,15 +15,113 @@
     APIInvalidKey,
     APINotFound,
 )
-from typing import Final
+from src.gw2.tools.gw2_metrics import Gw2ApiMetrics
+from src.gw2.tools.gw2_rate_limiter import Gw2RateLimiter
+from src.gw2.tools.gw2_retry import RetryPolicy, parse_retry_after
+from src.gw2.tools.gw2_revalidation import Gw2RevalidationStore
+from src.gw2.tools.gw2_scheduler import Gw2RequestScheduler, RequestPriority
+from src.gw2.tools.gw2_singleflight import Gw2SingleFlight
 
 _gw2_settings = get_gw2_settings()
-_RETRYABLE_STATUSES: Final = (502, 503, 504)
+
+
+def get_default_retry_policy() -> RetryPolicy:
+    """Build the retry policy used when a call site doesn't provide one."""
+    return RetryPolicy(
+        max_attempts=_gw2_settings.api_retry_max_attempts,
+        base_delay=_gw2_settings.api_retry_delay,
+        max_delay=_gw2_settings.api_retry_max_delay,
+        max_elapsed=_gw2_settings.api_retry_max_elapsed,
+    )
 
 
 class Gw2Client:
-    def __init__(self, bot):
+    """GW2 API client. The bot owns one shared instance (bot.gw2_client).
+
+    It is the single home of the HTTP connection pool, response cache, conditional request store,
+    request coalescing, priority scheduler, rate limiter, circuit breaker and per-endpoint metrics, so every
+    cog and helper reuses the same keep-alive connections and sees the same state.
+
+    Args:
+        bot: The bot, used for logging and as the User-Agent
+        session: HTTP session to use instead of the client's own pooled session (not closed by the client)
+        decoder: JSON decoder for response bodies (orjson when installed, the stdlib otherwise)
+    """
+
+    def __init__(self, bot, session: ClientSession | None = None, decoder: JsonDecoder | None = None):
         self.bot = bot
+        self.decoder = Gw2ResponseDecoder(decoder, thread_threshold=_gw2_settings.api_decode_thread_threshold)
+        self.cache = Gw2ResponseCache(
+            max_entries=_gw2_settings.api_cache_max_entries,
+            enabled=_gw2_settings.api_cache_enabled,
+        )
+        self.revalidation = Gw2RevalidationStore(
+            max_entries=_gw2_settings.api_revalidation_max_entries,
+            enabled=_gw2_settings.api_revalidation_enabled,
+        )
+        self.singleflight = Gw2SingleFlight()
+        self.rate_limiter = Gw2RateLimiter(
+            global_rate=_gw2_settings.api_rate_limit_global_rate,
+            global_burst=_gw2_settings.api_rate_limit_global_burst,
+            key_rate=_gw2_settings.api_rate_limit_key_rate,
+            key_burst=_gw2_settings.api_rate_limit_key_burst,
+            enabled=_gw2_settings.api_rate_limit_enabled,
+        )
+        self.circuit_breaker = Gw2CircuitBreaker(
+            failure_threshold=_gw2_settings.api_circuit_breaker_failure_threshold,
+            recovery_timeout=_gw2_settings.api_circuit_breaker_recovery_timeout,
+            enabled=_gw2_settings.api_circuit_breaker_enabled,
+        )
+        self.scheduler = Gw2RequestScheduler(
+            max_concurrency=_gw2_settings.api_scheduler_max_concurrency,
+            class_limits={
+                RequestPriority.INTERACTIVE: _gw2_settings.api_scheduler_interactive_limit,
+                RequestPriority.BACKGROUND: _gw2_settings.api_scheduler_background_limit,
+                RequestPriority.PREFETCH: _gw2_settings.api_scheduler_prefetch_limit,
+            },
+            max_wait=_gw2_settings.api_scheduler_max_wait,
+            enabled=_gw2_settings.api_scheduler_enabled,
+        )
+        self.metrics = Gw2ApiMetrics()
+        self.fetch_many_concurrency = _gw2_settings.api_fetch_many_concurrency
+        self._session = session
+        self._owns_session = session is None
+
+    @property
+    def session(self) -> ClientSession:
+        """The HTTP session, created on first use with a connection pool tuned for api.guildwars2.com."""
+        if self._session is None or (self._owns_session and self._session.closed):
+            connector = TCPConnector(
+                limit=_gw2_settings.api_connection_limit,
+                limit_per_host=_gw2_settings.api_connection_limit_per_host,
+                ttl_dns_cache=_gw2_settings.api_dns_cache_ttl,
+                keepalive_timeout=_gw2_settings.api_keepalive_timeout,
+            )
+            timeout = ClientTimeout(
+                total=_gw2_settings.api_request_timeout,
+                connect=_gw2_settings.api_connect_timeout,
+            )
+            self._session = ClientSession(connector=connector, timeout=timeout)
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Close the client's own HTTP session and its pooled connections."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def stats(self) -> dict[str, dict]:
+        """Get the counters of every component of the client."""
+        return {
+            "cache": self.cache.stats(),
+            "revalidation": self.revalidation.stats(),
+            "singleflight": self.singleflight.stats(),
+            "scheduler": self.scheduler.stats(),
+            "rate_limiter": self.rate_limiter.stats(),
+            "circuit_breaker": self.circuit_breaker.stats(),
+            "decoder": self.decoder.stats(),
+            "metrics": self.metrics.stats(),
+        }
 
     async def check_api_key(self, api_key):
         """checks if apy key is valid"""
@@ -32,44 +135,219 @@ async def check_api_key(self, api_key):
             api_req_key_info["permissions"] = sorted(api_req_key_info["permissions"])
         return api_req_key_info
 
-    async def call_api(self, uri: str, key=None):
-        """api languages can be ('en','es','de','fr','ko','zh')"""
+    async def call_api(
+        self,
+        uri: str,
+        key=None,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ):
+        """api languages can be ('en','es','de','fr','ko','zh')
+
+        retry_policy overrides the default retry behaviour for this call site.
+        priority is the scheduling class; callers nobody is waiting on should pass BACKGROUND or PREFETCH.
+        """
+
+        policy = self.cache.get_policy(uri)
+        cache_key = policy.cache_key(uri, key) if policy else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not MISSING:
+                self.bot.log.debug(f"GW2 API cache hit: {uri.split('?')[0]}")
+                self.metrics.record_cache_hit(uri)
+                return cached
+
+        # Concurrent identical calls share one in-flight request, unless it was sent at a lower priority
+        flight_key = cache_key if cache_key is not None else (uri, key)
+        result = await self.singleflight.do(
+            flight_key, lambda: self._request(uri, key, retry_policy, priority), priority
+        )
+        if cache_key is not None and result is not None:
+            self.cache.set(cache_key, result, policy.ttl)
+        return result
+
+    async def fetch_many(
+        self,
+        endpoint: str,
+        ids,
+        key=None,
+        *,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        strict: bool = False,
+    ) -> tuple[dict, list]:
+        """Fetch many objects from a bulk endpoint such as "achievements", "worlds" or "items".
+
+        Ids are deduplicated and looked up in the cache one by one. The rest are requested
+        with ?ids= in chunks of API_MAX_IDS_PER_REQUEST, running a bounded number of chunks
+        at a time. Ids must have the same type the API uses (int for most endpoints).
+        A chunk the API answered with 404 has none of its ids. Any other failed chunk only
+        marks its ids missing, unless strict is set: then its error is raised once every
+        chunk is done, so callers needing all the ids can't mistake a failure for missing ids.
+
+        Returns:
+            The objects found keyed by id, in request order, and the ids the API didn't return
+        """
+
+        unique_ids = list(dict.fromkeys(ids))
+        policy = self.cache.get_policy(endpoint)
+        found: dict = {}
+        needed = []
+        for object_id in unique_ids:
+            if policy:
+                cached = self.cache.get(policy.cache_key(f"{endpoint}/{object_id}", key))
+                if cached is not MISSING:
+                    found[object_id] = cached
+                    continue
+            needed.append(object_id)
+        self.metrics.record_cache_hit(endpoint, len(found))
+
+        if needed:
+            chunk_size = gw2_variables.API_MAX_IDS_PER_REQUEST
+            chunks = [needed[i : i + chunk_size] for i in range(0, len(needed), chunk_size)]
+            semaphore = asyncio.Semaphore(self.fetch_many_concurrency)
+            self.bot.log.debug(f"GW2 API bulk fetch: {len(needed)} {endpoint} ids in {len(chunks)} request(s)")
+            results = await asyncio.gather(
+                *(self._fetch_chunk(endpoint, chunk, key, semaphore, priority) for chunk in chunks),
+                return_exceptions=True,
+            )
+            errors = []
+            for objects in results:
+                if isinstance(objects, BaseException):
+                    if not isinstance(objects, Exception):
+                        raise objects
+                    self.bot.log.warning(f"GW2 API bulk fetch failed for {endpoint} ids: {objects}")
+                    errors.append(objects)
+                    continue
+                for obj in objects:
+                    found[obj["id"]] = obj
+                    if policy:
+                        self.cache.set(policy.cache_key(f"{endpoint}/{obj['id']}", key), obj, policy.ttl)
+            if strict and errors:
+                raise errors[0]
+
+        ordered = {object_id: found[object_id] for object_id in unique_ids if object_id in found}
+        missing = [object_id for object_id in unique_ids if object_id not in found]
+        return ordered, missing
+
+    async def _fetch_chunk(
+        self,
+        endpoint: str,
+        chunk: list,
+        key,
+        semaphore: asyncio.Semaphore,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ) -> list[dict]:
+        """Fetch one ?ids= chunk for fetch_many. A 404 means none of the ids exist, other errors are raised."""
+        uri = f"{endpoint}?ids={','.join(str(object_id) for object_id in chunk)}"
+        async with semaphore:
+            try:
+                result = await self.singleflight.do(
+                    (uri, key), lambda: self._request(uri, key, priority=priority), priority
+                )
+            except APINotFound:
+                self.bot.log.debug(f"GW2 API bulk fetch: none of {len(chunk)} {endpoint} ids found")
+                return []
+        return result or []
+
+    async def _request(
+        self,
+        uri: str,
+        key=None,
+        retry_policy: RetryPolicy | None = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ):
+        """Send the request to the GW2 API, retrying transient errors with backoff and jitter."""
 
         endpoint = f"{gw2_variables.API_URI}/{uri}"
         headers = self._build_headers(key)
-        max_attempts = _gw2_settings.api_retry_max_attempts
-        retry_delay = _gw2_settings.api_retry_delay
+        # A stale response with validators is refreshed with a conditional GET
+        stored = self.revalidation.get(uri, key)
+        if stored is not None:
+            headers.update(stored.conditional_headers())
+        policy = retry_policy or get_default_retry_policy()
+        started_at = time.monotonic()
 
         clean_endpoint = endpoint.split("?")[0]
         self.bot.log.debug(f"GW2 API call: {clean_endpoint}")
 
-        for attempt in range(1, max_attempts + 1):
-            try:
-                async with self.bot.aiosession.get(endpoint, headers=headers) as response:
-                    if response.status in (200, 206):
-                        self.bot.log.debug(f"GW2 API response: {response.status} for {clean_endpoint}")
-                        return await response.json()
+        attempt = 0
+        while True:
+            attempt += 1
+            if not self.circuit_breaker.allow_request(uri):
+                family = self.circuit_breaker.get_family(uri)
+                raise APIInactiveError(self.bot, f"(circuit open)({family}) {gw2_messages.API_CIRCUIT_OPEN}")
+
+            # The rate limit is waited on before taking a slot, so a key waiting on its bucket
+            # doesn't hold a slot other keys could use
+            await self.rate_limiter.acquire(key)
+            # Interactive requests get free slots before background snapshots and prefetches
+            async with self.scheduler.slot(priority):
+                sent_at = time.monotonic()
+                try:
+                    async with self.session.get(endpoint, headers=headers) as response:
+                        self.circuit_breaker.record_status(uri, response.status)
+                        if response.status == 304 and stored is not None:
+                            self.bot.log.debug(f"GW2 API response: 304 for {clean_endpoint}, using stored body")
+                            self.metrics.record_request(uri, response.status, time.monotonic() - sent_at)
+                            return self.revalidation.record_not_modified(stored)
+                        if response.status in (200, 206):
+                            self.bot.log.debug(f"GW2 API response: {response.status} for {clean_endpoint}")
+                            body = await response.read()
+                            latency = time.monotonic() - sent_at
+                            result = await self.decoder.decode(uri, body)
+                            self.metrics.record_request(uri, response.status, latency, len(body))
+                            if response.status == 200:
+                                self._store_validators(uri, key, response, result, len(body))
+                            return result
 
-                    if response.status not in _RETRYABLE_STATUSES or attempt == max_attempts:
-                        await self._handle_api_error(response, endpoint)
-                        return None
+                        self.metrics.record_request(uri, response.status, time.monotonic() - sent_at)
+                        delay = policy.compute_delay(attempt, self._get_retry_after(response))
+                        elapsed = time.monotonic() - started_at
+                        if not policy.is_retryable_status(response.status) or not policy.can_retry(
+                            attempt, elapsed, delay
+                        ):
+                            await self._handle_api_error(response, endpoint)
+                            return None
 
+                        self.bot.log.warning(
+                            f"GW2 API returned {response.status} for {clean_endpoint}, "
+                            f"retrying in {delay:.1f}s ({attempt}/{policy.max_attempts})..."
+                        )
+                        self.metrics.record_retry(uri)
+                except APIError:
+                    raise
+                except Exception:
+                    self.circuit_breaker.record_failure(uri)
+                    self.metrics.record_request(uri, "error", time.monotonic() - sent_at)
+                    delay = policy.compute_delay(attempt)
+                    if not policy.can_retry(attempt, time.monotonic() - started_at, delay):
+                        raise
                     self.bot.log.warning(
-                        f"GW2 API returned {response.status} for {clean_endpoint}, "
-                        f"retrying ({attempt}/{max_attempts})..."
+                        f"GW2 API connection error for {clean_endpoint}, "
+                        f"retrying in {delay:.1f}s ({attempt}/{policy.max_attempts})..."
                     )
-            except APIError:
-                raise
-            except Exception:
-                if attempt == max_attempts:
-                    raise
-                self.bot.log.warning(
-                    f"GW2 API connection error for {clean_endpoint}, retrying ({attempt}/{max_attempts})..."
-                )
+                    self.metrics.record_retry(uri)
+
+            await asyncio.sleep(delay)
 
-            await asyncio.sleep(retry_delay)
+    def _store_validators(self, uri: str, key, response, result, size: int) -> None:
+        """Keep a 200 response with its ETag / Last-Modified so the next refresh can be conditional."""
+        self.revalidation.store(
+            uri,
+            key,
+            result,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            size,
+        )
 
-        return None
+    @staticmethod
+    def _get_retry_after(response) -> float | None:
+        """Get the Retry-After delay sent with an error response, if any."""
+        if "Retry-After" not in response.headers:
+            return None
+        return parse_retry_after(response.headers["Retry-After"])
 
     def _build_headers(self, key=None):
         """Build HTTP headers for API request."""
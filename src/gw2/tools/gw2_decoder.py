@@ -0,0 +1,106 @@
+import asyncio
+import importlib
+import json
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+# Decodes a raw response body (bytes) into Python objects
+JsonDecoder = Callable[[bytes], Any]
+
+# Path segments that are ids (guild ids, character names, numbers) are folded into one endpoint
+_ID_SEGMENT = re.compile(r"[^a-z_]")
+
+
+def get_default_decoder() -> JsonDecoder:
+    """Get the fastest JSON decoder available: orjson when installed, the stdlib otherwise."""
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def get_endpoint(uri: str) -> str:
+    """Get the endpoint of a GW2 API uri, without query string and with id segments replaced by ':id'."""
+    segments = uri.split("?")[0].strip("/").split("/")
+    return "/".join(":id" if _ID_SEGMENT.search(segment) else segment for segment in segments)
+
+
+class EndpointStats:
+    """Response size and decode time counters of one endpoint."""
+
+    __slots__ = ("bytes", "decode_time", "max_bytes", "max_decode_time", "responses", "threaded")
+
+    def __init__(self):
+        self.responses = 0
+        self.threaded = 0
+        self.bytes = 0
+        self.max_bytes = 0
+        self.decode_time = 0.0
+        self.max_decode_time = 0.0
+
+    def record(self, size: int, decode_time: float, threaded: bool) -> None:
+        self.responses += 1
+        self.threaded += threaded
+        self.bytes += size
+        self.max_bytes = max(self.max_bytes, size)
+        self.decode_time += decode_time
+        self.max_decode_time = max(self.max_decode_time, decode_time)
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "responses": self.responses,
+            "threaded": self.threaded,
+            "avg_bytes": self.bytes // self.responses if self.responses else 0,
+            "max_bytes": self.max_bytes,
+            "avg_decode_ms": round(self.decode_time * 1000 / self.responses, 3) if self.responses else 0.0,
+            "max_decode_ms": round(self.max_decode_time * 1000, 3),
+        }
+
+
+class Gw2ResponseDecoder:
+    """Decodes GW2 API response bodies, moving large ones off the event loop.
+
+    Bodies up to thread_threshold bytes are decoded inline. Bigger ones (e.g. characters?ids=all
+    with full equipment, account/achievements) are decoded in a worker thread, so one big account
+    doesn't stall the event loop for every other guild. Size and decode time are recorded per endpoint.
+
+    Args:
+        decoder: Callable decoding a bytes body, defaults to get_default_decoder()
+        thread_threshold: Body size in bytes above which decoding runs in a worker thread (0 disables threading)
+    """
+
+    def __init__(self, decoder: JsonDecoder | None = None, thread_threshold: int = 65536):
+        self.decoder = decoder or get_default_decoder()
+        self.thread_threshold = thread_threshold
+        self._endpoints: dict[str, EndpointStats] = {}
+
+    async def decode(self, uri: str, body: bytes) -> Any:
+        """Decode a response body and record its size and decode time."""
+        threaded = 0 < self.thread_threshold < len(body)
+        started_at = time.perf_counter()
+        if threaded:
+            result = await asyncio.to_thread(self.decoder, body)
+        else:
+            result = self.decoder(body)
+        self.record(uri, len(body), time.perf_counter() - started_at, threaded)
+        return result
+
+    def record(self, uri: str, size: int, decode_time: float, threaded: bool = False) -> None:
+        """Record a decoded response of an endpoint."""
+        endpoint = get_endpoint(uri)
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = EndpointStats()
+        stats.record(size, decode_time, threaded)
+
+    def clear(self) -> None:
+        """Forget all endpoint counters."""
+        self._endpoints.clear()
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """Get size and decode time counters per endpoint, biggest responses first."""
+        ordered = sorted(self._endpoints.items(), key=lambda item: item[1].max_bytes, reverse=True)
+        return {endpoint: stats.stats() for endpoint, stats in ordered}
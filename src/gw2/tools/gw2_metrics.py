@@ -0,0 +1,121 @@
+import bisect
+from collections import Counter
+from src.gw2.tools.gw2_decoder import get_endpoint
+
+# Upper bounds of the latency histogram buckets, in milliseconds (the last bucket is unbounded)
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with percentile estimates.
+
+    Args:
+        bounds: Upper bounds of the buckets in milliseconds, ascending (the last bucket is unbounded)
+    """
+
+    __slots__ = ("bounds", "buckets", "count", "max_ms", "total_ms")
+
+    def __init__(self, bounds: tuple[int, ...] = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile as the upper bound of the bucket it falls in (max for the last bucket)."""
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(self.bounds):
+                    return float(min(self.bounds[index], self.max_ms))
+                break
+        return round(self.max_ms, 1)
+
+
+class EndpointMetrics:
+    """Request counters of one endpoint."""
+
+    __slots__ = ("bytes", "cache_hits", "latency", "requests", "retries", "statuses")
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.statuses: Counter[str] = Counter()
+        self.latency = LatencyHistogram()
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "bytes": self.bytes,
+            "statuses": dict(self.statuses.most_common()),
+            "errors": sum(count for status, count in self.statuses.items() if not status.startswith(("2", "3"))),
+            "p50_ms": self.latency.percentile(50),
+            "p95_ms": self.latency.percentile(95),
+            "p99_ms": self.latency.percentile(99),
+            "avg_ms": round(self.latency.total_ms / self.latency.count, 1) if self.latency.count else 0.0,
+        }
+
+
+class Gw2ApiMetrics:
+    """Per-endpoint instrumentation of the GW2 API client.
+
+    Every HTTP attempt records its latency and status (or "error" when no response came
+    back), retries and cache hits are counted separately, and bytes are the response
+    bodies received. Endpoints are normalized URIs without query strings or ids, so
+    "guild/<id>" and "characters/<name>/core" each aggregate into one entry.
+    """
+
+    def __init__(self):
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    def _get(self, uri: str) -> EndpointMetrics:
+        endpoint = get_endpoint(uri)
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def record_request(self, uri: str, status: int | str, latency: float, size: int = 0) -> None:
+        """Record one HTTP attempt; latency is in seconds."""
+        metrics = self._get(uri)
+        metrics.requests += 1
+        metrics.statuses[str(status)] += 1
+        metrics.bytes += size
+        metrics.latency.observe(latency * 1000)
+
+    def record_retry(self, uri: str) -> None:
+        """Record an attempt that is going to be retried."""
+        self._get(uri).retries += 1
+
+    def record_cache_hit(self, uri: str, count: int = 1) -> None:
+        """Record responses served from the cache without a request."""
+        if count:
+            self._get(uri).cache_hits += count
+
+    def clear(self) -> None:
+        """Forget all endpoint counters."""
+        self._endpoints.clear()
+
+    def stats(self) -> dict[str, dict]:
+        """Get the counters per endpoint, most requested first."""
+        ordered = sorted(
+            self._endpoints.items(),
+            key=lambda item: item[1].requests + item[1].cache_hits,
+            reverse=True,
+        )
+        return {endpoint: metrics.stats() for endpoint, metrics in ordered}
@@ -0,0 +1,94 @@
+import re
+from src.database.dal.gw2.gw2_configs_dal import Gw2ConfigsDal
+from src.database.dal.gw2.gw2_key_dal import Gw2KeyDal
+from src.gw2.constants import gw2_messages
+
+# Matches the GW2 activity name without lowering a copy of every activity name seen
+_GW2_ACTIVITY_NAME = re.compile(re.escape(gw2_messages.GW2_FULL_NAME), re.IGNORECASE)
+
+
+def is_gw2_activity(activity) -> bool:
+    """Check if a presence activity is Guild Wars 2."""
+    return activity is not None and _GW2_ACTIVITY_NAME.search(str(activity.name)) is not None
+
+
+class Gw2PresenceFilter:
+    """In-memory prefilter dropping the presence events that can't touch a GW2 session.
+
+    Presence updates fire for every status and activity change of every member the bot
+    sees, and only members of guilds with session tracking on and with an API key can
+    have a session. Both are kept as sets loaded once at startup and kept current by
+    gw2 config session and gw2 key add/remove, so other events are dropped with two set
+    lookups. Until the sets are loaded every event goes through: the session batch still
+    checks the configs and keys in the database. Changes made while the sets are loading
+    are applied again on top of the loaded sets, which may have been read before them.
+    """
+
+    def __init__(self):
+        self._session_guilds: set[int] = set()
+        self._key_users: set[int] = set()
+        # ("guild" or "key_user", id, added) of the changes made while a load is running
+        self._changes: list[tuple[str, int, bool]] | None = None
+        self.loaded = False
+        self.seen = 0
+        self.dropped = 0
+
+    async def load(self, bot) -> None:
+        """Load the guilds with session tracking on and the users with an API key."""
+        gw2_configs_dal = Gw2ConfigsDal(bot.db_session, bot.log)
+        gw2_key_dal = Gw2KeyDal(bot.db_session, bot.log)
+        self._changes = []
+        try:
+            session_guilds = {row["server_id"] for row in await gw2_configs_dal.get_session_server_ids()}
+            key_users = {row["user_id"] for row in await gw2_key_dal.get_user_ids()}
+        finally:
+            changes, self._changes = self._changes, None
+
+        loaded = {"guild": session_guilds, "key_user": key_users}
+        for kind, object_id, added in changes:
+            self._apply(loaded[kind], object_id, added)
+        self._session_guilds = session_guilds
+        self._key_users = key_users
+        self.loaded = True
+
+    def is_tracked(self, guild_id: int, user_id: int) -> bool:
+        """Check if the presence events of a member in a guild can start or end a session."""
+        self.seen += 1
+        if not self.loaded or (guild_id in self._session_guilds and user_id in self._key_users):
+            return True
+        self.dropped += 1
+        return False
+
+    def set_session_enabled(self, guild_id: int, enabled: bool) -> None:
+        """Follow a change of the session tracking config of a guild."""
+        self._change("guild", guild_id, enabled)
+
+    def add_key_user(self, user_id: int) -> None:
+        """Follow an API key added by a user."""
+        self._change("key_user", user_id, True)
+
+    def remove_key_user(self, user_id: int) -> None:
+        """Follow the API key of a user being removed."""
+        self._change("key_user", user_id, False)
+
+    def _change(self, kind: str, object_id: int, added: bool) -> None:
+        self._apply(self._session_guilds if kind == "guild" else self._key_users, object_id, added)
+        if self._changes is not None:
+            self._changes.append((kind, object_id, added))
+
+    @staticmethod
+    def _apply(target: set[int], object_id: int, added: bool) -> None:
+        if added:
+            target.add(object_id)
+        else:
+            target.discard(object_id)
+
+    def stats(self) -> dict[str, int]:
+        """Get the prefilter counters."""
+        return {
+            "loaded": int(self.loaded),
+            "session_guilds": len(self._session_guilds),
+            "key_users": len(self._key_users),
+            "seen": self.seen,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
+
+class TokenBucket:
+    """Async token bucket with FIFO waiting.
+
+    Args:
+        rate: Tokens refilled per second
+        capacity: Maximum burst size
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        # asyncio.Lock wakes waiters in arrival order, which gives fair queuing
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for a refill if the bucket is empty.
+
+        Returns:
+            Seconds spent waiting for the token
+        """
+        async with self._lock:
+            self._refill()
+            waited = 0.0
+            if self.tokens < 1:
+                waited = (1 - self.tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._refill()
+            self.tokens -= 1
+            return waited
+
+    def try_acquire(self) -> bool:
+        """Take one token only if one is available right now."""
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class Gw2RateLimiter:
+    """Client-side GW2 API rate limiter with a global bucket and one bucket per API key.
+
+    Each request first waits on its key bucket (so one busy key only delays itself)
+    and then on the global bucket shared by every request from this process.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = 5.0,
+        global_burst: int = 100,
+        key_rate: float = 2.0,
+        key_burst: int = 20,
+        max_keys: int = 1024,
+        enabled: bool = True,
+    ):
+        self.global_rate = global_rate
+        self.global_burst = global_burst
+        self.key_rate = key_rate
+        self.key_burst = key_burst
+        self.max_keys = max_keys
+        self.enabled = enabled
+        self._global_bucket = TokenBucket(global_rate, global_burst)
+        self._key_buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def _get_key_bucket(self, api_key: str) -> TokenBucket:
+        """Get or create the bucket for an API key, dropping the least recently used when full."""
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        bucket = self._key_buckets.get(key_hash)
+        if bucket is None:
+            bucket = TokenBucket(self.key_rate, self.key_burst)
+            self._key_buckets[key_hash] = bucket
+            while len(self._key_buckets) > self.max_keys:
+                self._key_buckets.popitem(last=False)
+        else:
+            self._key_buckets.move_to_end(key_hash)
+        return bucket
+
+    async def acquire(self, api_key: str | None = None) -> None:
+        """Wait until a request for this key may be sent."""
+        if not self.enabled:
+            return
+
+        waited = 0.0
+        if api_key:
+            waited += await self._get_key_bucket(api_key).acquire()
+        waited += await self._global_bucket.acquire()
+
+        self.acquired += 1
+        if waited > 0:
+            self.throttled += 1
+            self.total_wait += waited
+
+    def reset(self) -> None:
+        """Refill all buckets and reset counters."""
+        self._global_bucket = TokenBucket(self.global_rate, self.global_burst)
+        self._key_buckets.clear()
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        """Get rate limiter counters."""
+        return {
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait": round(self.total_wait, 3),
+            "global_tokens": round(self._global_bucket.tokens, 2),
+            "key_buckets": len(self._key_buckets),
+        }
@@ -0,0 +1,71 @@
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Final
+
+RETRYABLE_STATUSES: Final = (429, 502, 503, 504)
+_random = random.SystemRandom()
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for GW2 API retries.
+
+    The delay before retry n is uniform in [0, min(max_delay, base_delay * 2 ** (n - 1))],
+    so callers that failed together spread their retries out instead of retrying in lockstep.
+    A server-provided Retry-After always wins over the computed delay.
+
+    Args:
+        max_attempts: Total attempts, including the first one
+        base_delay: Backoff ceiling for the first retry, in seconds
+        max_delay: Upper bound for a single backoff, in seconds
+        max_elapsed: Give up when the next retry would start after this many seconds (None for no limit)
+        retry_statuses: HTTP statuses worth retrying
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_elapsed: float | None = 60.0,
+        retry_statuses: tuple[int, ...] = RETRYABLE_STATUSES,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.retry_statuses = retry_statuses
+
+    def is_retryable_status(self, status: int) -> bool:
+        """Check if an HTTP status is worth retrying."""
+        return status in self.retry_statuses
+
+    def compute_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Get the delay before the retry that follows the given failed attempt."""
+        if retry_after is not None:
+            return max(0.0, retry_after)
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return _random.uniform(0, ceiling)
+
+    def can_retry(self, attempt: int, elapsed: float, delay: float) -> bool:
+        """Check if another attempt is allowed after the given failed attempt."""
+        if attempt >= self.max_attempts:
+            return False
+        return self.max_elapsed is None or elapsed + delay <= self.max_elapsed
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
@@ -0,0 +1,117 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any
+
+
+class StoredResponse:
+    """A decoded GW2 API response with the validators it was sent with.
+
+    Args:
+        body: The decoded response, shared between callers and treated as read-only
+        etag: ETag header of the response
+        last_modified: Last-Modified header of the response
+        size: Size of the response body in bytes, 0 if unknown
+    """
+
+    __slots__ = ("body", "etag", "last_modified", "size")
+
+    def __init__(self, body: Any, etag: str | None, last_modified: str | None, size: int = 0):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the If-None-Match / If-Modified-Since headers that revalidate this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class Gw2RevalidationStore:
+    """LRU store of GW2 API responses that can be revalidated with a conditional GET.
+
+    The TTL cache decides when a response is stale; this store keeps the last body and
+    its validators past that point, so the refresh is sent with If-None-Match /
+    If-Modified-Since and a 304 Not Modified is answered from the stored body instead
+    of downloading and decoding the payload again.
+    """
+
+    def __init__(self, max_entries: int = 256, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: OrderedDict[tuple[str, str | None], StoredResponse] = OrderedDict()
+        self.not_modified = 0
+        self.modified = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(uri: str, api_key: str | None) -> tuple[str, str | None]:
+        # Responses fetched with an API key are private to that key
+        if api_key:
+            return uri, hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return uri, None
+
+    def get(self, uri: str, api_key: str | None = None) -> StoredResponse | None:
+        """Get the stored response for a request, or None if it can't be revalidated."""
+        if not self.enabled:
+            return None
+        key = self._key(uri, api_key)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(
+        self,
+        uri: str,
+        api_key: str | None,
+        body: Any,
+        etag: str | None,
+        last_modified: str | None,
+        size: int = 0,
+    ) -> None:
+        """Remember a 200 response; responses without validators are not stored."""
+        if not self.enabled:
+            return
+        key = self._key(uri, api_key)
+        if key in self._entries:
+            self.modified += 1
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = StoredResponse(body, etag, last_modified, size)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def record_not_modified(self, entry: StoredResponse) -> Any:
+        """Count a 304 answered from a stored response and return its body."""
+        self.not_modified += 1
+        self.bytes_saved += entry.size
+        return entry.body
+
+    def clear(self) -> None:
+        """Drop all stored responses and reset counters."""
+        self._entries.clear()
+        self.not_modified = 0
+        self.modified = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get store size and revalidation counters."""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "not_modified": self.not_modified,
+            "modified": self.modified,
+            "bytes_saved": self.bytes_saved,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,154 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+
+
+class RequestPriority(IntEnum):
+    """Scheduling class of a GW2 API request, most urgent first."""
+
+    INTERACTIVE = 0  # a user is waiting on a command
+    BACKGROUND = 1  # presence-triggered session snapshots
+    PREFETCH = 2  # cache warm-up, nobody is waiting
+
+
+class _Waiter:
+    __slots__ = ("enqueued_at", "future", "priority")
+
+    def __init__(self, priority: RequestPriority, future: asyncio.Future):
+        self.priority = priority
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class Gw2RequestScheduler:
+    """Priority scheduler for GW2 API requests.
+
+    Requests take a slot before they are sent. Free slots go to the most urgent class
+    with waiters, so an interactive command doesn't queue behind a burst of background
+    session snapshots. Each class has its own concurrency cap on top of the total one,
+    and a request that has waited longer than max_wait is served before any fresher
+    request regardless of class, so lower classes are never starved.
+
+    Args:
+        max_concurrency: Requests in flight across all classes
+        class_limits: Requests in flight per class (missing classes use max_concurrency)
+        max_wait: Seconds after which a waiting request is served first (starvation protection)
+        enabled: If False, slots are granted immediately
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        class_limits: dict[RequestPriority, int] | None = None,
+        max_wait: float = 10.0,
+        enabled: bool = True,
+    ):
+        self.max_concurrency = max_concurrency
+        self.class_limits = {p: (class_limits or {}).get(p, max_concurrency) for p in RequestPriority}
+        self.max_wait = max_wait
+        self.enabled = enabled
+        self._waiting: dict[RequestPriority, deque[_Waiter]] = {p: deque() for p in RequestPriority}
+        self._in_flight: dict[RequestPriority, int] = dict.fromkeys(RequestPriority, 0)
+        self.granted: dict[RequestPriority, int] = dict.fromkeys(RequestPriority, 0)
+        self.total_wait: dict[RequestPriority, float] = dict.fromkeys(RequestPriority, 0.0)
+        self.aged = 0
+
+    def _has_capacity(self, priority: RequestPriority) -> bool:
+        return (
+            sum(self._in_flight.values()) < self.max_concurrency
+            and self._in_flight[priority] < self.class_limits[priority]
+        )
+
+    def _next_waiter(self) -> _Waiter | None:
+        """Pick the next waiter: the oldest starved one first, otherwise the most urgent class."""
+        now = time.monotonic()
+        starved = [
+            queue[0]
+            for priority, queue in self._waiting.items()
+            if queue and now - queue[0].enqueued_at >= self.max_wait and self._has_capacity(priority)
+        ]
+        if starved:
+            waiter = min(starved, key=lambda w: w.enqueued_at)
+            if waiter.priority != RequestPriority.INTERACTIVE:
+                self.aged += 1
+            return waiter
+
+        for priority in RequestPriority:
+            if self._waiting[priority] and self._has_capacity(priority):
+                return self._waiting[priority][0]
+        return None
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiters until no class with waiters has capacity."""
+        for queue in self._waiting.values():
+            while queue and queue[0].future.done():
+                queue.popleft()  # cancelled while waiting
+
+        while (waiter := self._next_waiter()) is not None:
+            self._waiting[waiter.priority].popleft()
+            self._grant(waiter.priority, waiter.enqueued_at)
+            waiter.future.set_result(None)
+            for queue in self._waiting.values():
+                while queue and queue[0].future.done():
+                    queue.popleft()
+
+    def _grant(self, priority: RequestPriority, enqueued_at: float) -> None:
+        self._in_flight[priority] += 1
+        self.granted[priority] += 1
+        self.total_wait[priority] += time.monotonic() - enqueued_at
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.INTERACTIVE) -> None:
+        """Wait for a slot for a request of this class."""
+        if not self.enabled:
+            return
+
+        if not any(self._waiting.values()) and self._has_capacity(priority):
+            self._grant(priority, time.monotonic())
+            return
+
+        waiter = _Waiter(priority, asyncio.get_running_loop().create_future())
+        self._waiting[priority].append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(priority)  # the slot was granted just as the caller was cancelled
+            else:
+                self._dispatch()
+            raise
+
+    def release(self, priority: RequestPriority = RequestPriority.INTERACTIVE) -> None:
+        """Free a slot and hand it to the next waiter."""
+        if not self.enabled:
+            return
+        self._in_flight[priority] -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority = RequestPriority.INTERACTIVE):
+        """Hold a slot for the duration of the block."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def stats(self) -> dict[str, dict[str, int | float] | int]:
+        """Get in-flight, waiting and wait-time counters per class."""
+        stats: dict[str, dict[str, int | float] | int] = {
+            priority.name.lower(): {
+                "in_flight": self._in_flight[priority],
+                "waiting": sum(1 for w in self._waiting[priority] if not w.future.done()),
+                "limit": self.class_limits[priority],
+                "granted": self.granted[priority],
+                "avg_wait": round(self.total_wait[priority] / self.granted[priority], 3)
+                if self.granted[priority]
+                else 0.0,
+            }
+            for priority in RequestPriority
+        }
+        stats["aged"] = self.aged
+        return stats
@@ -0,0 +1,233 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import Enum
+
+
+class SessionState(Enum):
+    """Where the session of a user stands, as seen by its session actor."""
+
+    IDLE = "idle"  # no session activity being tracked
+    STARTING = "starting"  # start snapshot being taken, or waiting in a session job
+    PLAYING = "playing"  # session started
+    ENDING_DELAY = "ending-delay"  # end waiting in a session job for the GW2 API cache refresh
+    ENDING = "ending"  # end snapshot being taken
+
+
+# Runs one session action of a member; returns the state the session is in afterwards
+SessionActionHandler = Callable[[object, object, str], Awaitable[SessionState]]
+
+# The state of an action while a worker runs it
+_RUNNING_STATES = {"start": SessionState.STARTING, "end": SessionState.ENDING}
+# The states of an action stored as a session job: waiting for it, running it, done
+_JOB_STATES = {
+    "start": (SessionState.STARTING, SessionState.STARTING, SessionState.PLAYING),
+    "end": (SessionState.ENDING_DELAY, SessionState.ENDING, SessionState.IDLE),
+}
+# The action a user has last asked for, given the state of its session
+_STATE_ACTIONS = {
+    SessionState.STARTING: "start",
+    SessionState.PLAYING: "start",
+    SessionState.ENDING_DELAY: "end",
+    SessionState.ENDING: "end",
+}
+
+
+class _SessionActor:
+    __slots__ = ("entered_at", "mailbox", "member", "scheduled", "state")
+
+    def __init__(self, member, now: float):
+        self.member = member
+        self.state = SessionState.IDLE
+        self.entered_at = now
+        self.mailbox: deque[str] = deque()
+        # In the ready queue or being run by a worker
+        self.scheduled = False
+
+    def last_action(self) -> str | None:
+        if self.mailbox:
+            return self.mailbox[-1]
+        return _STATE_ACTIONS.get(self.state)
+
+
+class Gw2SessionActors:
+    """One session actor per active user, drained by a bounded pool of workers.
+
+    Presence events only post an action to the mailbox of the user's actor and return;
+    workers take ready actors in turn and run one action at a time per user, so the
+    actions of a user never overlap and a burst of events never runs more than workers
+    actions at once. Posting coalesces: an action the user already asked for last is
+    dropped, and an action undoing a queued one cancels it (GW2 closed and opened again
+    before the end ran). Actors with nothing to do are dropped, so memory follows the
+    number of playing users.
+
+    Args:
+        handler: Coroutine running one action, returning the state the session is in afterwards
+        workers: Actions running at the same time, across all users
+    """
+
+    def __init__(self, handler: SessionActionHandler, workers: int = 200):
+        self.handler = handler
+        self.workers = workers
+        self._actors: dict[int, _SessionActor] = {}
+        self._ready: asyncio.Queue[int] = asyncio.Queue()
+        self._worker_tasks: list[asyncio.Task] = []
+        self._running = 0
+        # Seconds spent in each state by the actors that left it, and how many times
+        self._state_seconds = dict.fromkeys(SessionState, 0.0)
+        self._state_max_seconds = dict.fromkeys(SessionState, 0.0)
+        self._state_exits = dict.fromkeys(SessionState, 0)
+        self.posted = 0
+        self.duplicates = 0
+        self.cancelled = 0
+        self.processed = 0
+        self.failed = 0
+
+    def post(self, bot, member, action: str) -> None:
+        """Queue a start or end action for a member, without waiting for it to run."""
+        self.posted += 1
+        actor = self._actors.get(member.id)
+        if actor is None:
+            actor = self._actors[member.id] = _SessionActor(member, time.monotonic())
+        actor.member = member
+
+        last_action = actor.last_action()
+        if action == last_action:
+            self.duplicates += 1
+            bot.log.debug(f"Duplicate '{action}' event for user {member.id}, ignoring")
+            return
+        if actor.mailbox:
+            # The queued action is the opposite one and has not run yet: both are dropped
+            actor.mailbox.pop()
+            self.cancelled += 1
+            bot.log.debug(f"'{action}' event for user {member.id} cancels its queued '{last_action}'")
+            self._forget_if_idle(member.id)
+            return
+
+        actor.mailbox.append(action)
+        if not actor.scheduled:
+            actor.scheduled = True
+            self._ready.put_nowait(member.id)
+        self._ensure_workers(bot)
+
+    def _ensure_workers(self, bot) -> None:
+        if not self._worker_tasks:
+            self._worker_tasks = [asyncio.create_task(self._work(bot)) for _ in range(max(1, self.workers))]
+
+    async def stop(self) -> None:
+        """Stop the workers; actions still queued are dropped."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    async def _work(self, bot) -> None:
+        while True:
+            user_id = await self._ready.get()
+            actor = self._actors.get(user_id)
+            if actor is None:
+                continue
+            if not actor.mailbox:
+                # Its action was cancelled while it waited in the ready queue
+                actor.scheduled = False
+                self._forget_if_idle(user_id)
+                continue
+            action = actor.mailbox.popleft()
+            self._set_state(actor, _RUNNING_STATES[action])
+            self._running += 1
+            try:
+                state = await self.handler(bot, actor.member, action)
+                self.processed += 1
+            except Exception as e:
+                bot.log.error(f"GW2 session {action} for user {user_id} failed: {e}")
+                self.failed += 1
+                state = SessionState.IDLE
+            finally:
+                self._running -= 1
+            self._set_state(actor, state)
+
+            if actor.mailbox:
+                # Back of the queue, so a user with many events doesn't hold a worker
+                self._ready.put_nowait(user_id)
+            else:
+                actor.scheduled = False
+                self._forget_if_idle(user_id)
+
+    def job_started(self, user_id: int, action: str) -> None:
+        """Move the actor of a user to the running state of a session job of its own."""
+        actor = self._actors.get(user_id)
+        waiting, running, _ = _JOB_STATES[action]
+        if actor is not None and actor.state is waiting:
+            self._set_state(actor, running)
+
+    def job_finished(self, user_id: int, action: str, retrying: bool = False) -> None:
+        """Move the actor of a user out of a session job it was running."""
+        actor = self._actors.get(user_id)
+        waiting, running, done = _JOB_STATES[action]
+        if actor is not None and actor.state is running:
+            self._set_state(actor, waiting if retrying else done)
+            self._forget_if_idle(user_id)
+
+    def _set_state(self, actor: _SessionActor, state: SessionState) -> None:
+        if state is actor.state:
+            return
+        now = time.monotonic()
+        seconds = now - actor.entered_at
+        self._state_seconds[actor.state] += seconds
+        self._state_max_seconds[actor.state] = max(self._state_max_seconds[actor.state], seconds)
+        self._state_exits[actor.state] += 1
+        actor.state = state
+        actor.entered_at = now
+
+    def _forget_if_idle(self, user_id: int) -> None:
+        actor = self._actors.get(user_id)
+        if actor is not None and actor.state is SessionState.IDLE and not actor.mailbox and not actor.scheduled:
+            del self._actors[user_id]
+
+    def get_state(self, user_id: int) -> SessionState:
+        """Get the session state of a user."""
+        actor = self._actors.get(user_id)
+        return actor.state if actor is not None else SessionState.IDLE
+
+    def playing_members(self) -> list:
+        """Get the members whose session is started."""
+        return [actor.member for actor in self._actors.values() if actor.state is SessionState.PLAYING]
+
+    def is_ending(self, user_id: int) -> bool:
+        """Check if the session of a user is ending or has an end queued."""
+        actor = self._actors.get(user_id)
+        if actor is None:
+            return False
+        return actor.state in (SessionState.ENDING_DELAY, SessionState.ENDING) or "end" in actor.mailbox
+
+    def stats(self) -> dict[str, int]:
+        """Get the actor counters."""
+        return {
+            "actors": len(self._actors),
+            "mailbox_depth": sum(len(actor.mailbox) for actor in self._actors.values()),
+            "running": self._running,
+            "workers": len(self._worker_tasks),
+            "posted": self.posted,
+            "duplicates": self.duplicates,
+            "cancelled": self.cancelled,
+            "processed": self.processed,
+            "failed": self.failed,
+        }
+
+    def state_stats(self) -> dict[str, dict[str, int | float]]:
+        """Get the actors in each active state and how long actors stayed in it, in seconds."""
+        current = dict.fromkeys(SessionState, 0)
+        for actor in self._actors.values():
+            current[actor.state] += 1
+        return {
+            state.value: {
+                "actors": current[state],
+                "avg_seconds": round(self._state_seconds[state] / self._state_exits[state], 3)
+                if self._state_exits[state]
+                else 0.0,
+                "max_seconds": round(self._state_max_seconds[state], 3),
+            }
+            for state in SessionState
+            if state is not SessionState.IDLE
+        }
@@ -0,0 +1,94 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+# Processes one batch of (member, action) intents, at most one per user; returns a result per user_id
+SessionBatchHandler = Callable[[object, list[tuple[object, str]]], Awaitable[dict]]
+
+
+class Gw2SessionBatcher:
+    """Collects session start/end intents from presence events into micro-batches.
+
+    A raid start or WvW reset brings hundreds of presence updates within a minute; instead of
+    querying configs and keys and writing sessions once per event, intents are gathered for
+    up to window seconds (or until max_batch users are waiting) and handed to the batch handler
+    together. A user has at most one intent per batch: a newer one replaces the older, and both
+    submitters wait for the same batch and get the handler's result for that user.
+
+    Args:
+        handler: Coroutine processing a batch of (member, action) intents
+        window: Seconds to wait for more intents after the first one of a batch
+        max_batch: Users per batch; a full batch is processed right away
+    """
+
+    def __init__(self, handler: SessionBatchHandler, window: float = 1.0, max_batch: int = 200):
+        self.handler = handler
+        self.window = window
+        self.max_batch = max_batch
+        # user_id -> (member, action), in arrival order
+        self._intents: dict[int, tuple[object, str]] = {}
+        self._batch_done: asyncio.Future | None = None
+        self._timer: asyncio.Task | None = None
+        self.batches = 0
+        self.intents = 0
+        self.deduplicated = 0
+        self.largest_batch = 0
+
+    async def submit(self, bot, member, action: str):
+        """Add an intent to the next batch and wait until that batch has been processed.
+
+        Returns:
+            The handler's result for the member, or None when it has none or the batch failed
+        """
+        self.intents += 1
+        if member.id in self._intents:
+            self.deduplicated += 1
+            del self._intents[member.id]
+        self._intents[member.id] = (member, action)
+
+        if self._batch_done is None:
+            self._batch_done = asyncio.get_running_loop().create_future()
+        batch_done = self._batch_done
+
+        if len(self._intents) >= self.max_batch:
+            await self.flush(bot)
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later(bot))
+        results = await asyncio.shield(batch_done)
+        return results.get(member.id)
+
+    async def _flush_later(self, bot) -> None:
+        await asyncio.sleep(self.window)
+        self._timer = None
+        await self.flush(bot)
+
+    async def flush(self, bot) -> None:
+        """Process the intents gathered so far as one batch."""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+            self._timer = None
+        intents, batch_done = list(self._intents.values()), self._batch_done
+        self._intents = {}
+        self._batch_done = None
+        if not intents:
+            return
+
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(intents))
+        results = {}
+        try:
+            results = await self.handler(bot, intents) or {}
+        except Exception as e:
+            bot.log.error(f"GW2 session batch of {len(intents)} intents failed: {e}")
+        finally:
+            if batch_done is not None and not batch_done.done():
+                batch_done.set_result(results)
+
+    def stats(self) -> dict[str, int]:
+        """Get the batching counters."""
+        return {
+            "waiting": len(self._intents),
+            "batches": self.batches,
+            "intents": self.intents,
+            "deduplicated": self.deduplicated,
+            "largest_batch": self.largest_batch,
+        }
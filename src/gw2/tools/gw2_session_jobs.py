@@ -0,0 +1,282 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from src.database.dal.gw2.gw2_session_jobs_dal import Gw2SessionJobsDal
+
+# Runs one job; returns None when the job is done, or the seconds to wait before retrying it
+SessionJobHandler = Callable[[object, dict], Awaitable[float | None]]
+
+
+def _utc_now() -> datetime:
+    # Job times are naive UTC, like the timestamps the database writes
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class Gw2SessionJobScheduler:
+    """Deferred session snapshots persisted in gw2.gw2_session_jobs.
+
+    Delayed session ends and background retries are stored as jobs with a due time instead
+    of sleeping coroutines, so a restart resumes them rather than losing them. A poll loop
+    claims due jobs and runs at most concurrency of them at a time; the jobs of one user
+    run one at a time in the order they were scheduled. A copy of the pending jobs is kept
+    in memory so presence events and commands can check them without a query.
+
+    While session snapshots fail on the GW2 API, jobs run one at a time: each one probes
+    the API instead of a whole batch of retries failing together. Once a snapshot succeeds,
+    the retries still waiting out their backoff are made due at once and drained at most
+    concurrency at a time, so an outage ends with a steady catch-up rather than a herd.
+
+    Args:
+        concurrency: Maximum jobs running at the same time
+        poll_interval: Maximum seconds between checks for due jobs
+    """
+
+    def __init__(self, concurrency: int = 4, poll_interval: float = 5.0):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        # user_id -> {str(job_id): (action, run_at)}, in scheduling order
+        self._pending: dict[int, dict[str, tuple[str, datetime]]] = {}
+        self._running: set[asyncio.Task] = set()
+        self._claimed: set[str] = set()
+        # Ids of the pending jobs that retry a failed snapshot
+        self._retries: set[str] = set()
+        # Session snapshots are failing on the GW2 API: run one job at a time
+        self._probing = False
+        # The GW2 API answered again: run the waiting retries now
+        self._drain = False
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._handler: SessionJobHandler | None = None
+        self.scheduled = 0
+        self.completed = 0
+        self.retried = 0
+        self.failed = 0
+        self.drained = 0
+
+    def get_pending_actions(self, user_id: int) -> list[str]:
+        """Get the actions scheduled for a user, in the order they will run."""
+        return [action for action, _ in self._pending.get(user_id, {}).values()]
+
+    def get_run_at(self, user_id: int, action: str) -> datetime | None:
+        """Get when the first pending job with this action is due for a user (naive UTC)."""
+        for job_action, run_at in self._pending.get(user_id, {}).values():
+            if job_action == action:
+                return run_at
+        return None
+
+    async def schedule(self, bot, user_id: int, action: str, delay: float = 0.0, attempt: int = 0) -> datetime:
+        """Persist a job due in delay seconds; it still waits for the earlier jobs of the same user.
+
+        Returns:
+            When the job is due (naive UTC)
+        """
+        run_at = _utc_now() + timedelta(seconds=max(0.0, delay))
+        dal = Gw2SessionJobsDal(bot.db_session, bot.log)
+        job_id = await dal.insert_job(user_id, action, run_at, attempt)
+        self._pending.setdefault(user_id, {})[str(job_id)] = (action, run_at)
+        if attempt:
+            self._retries.add(str(job_id))
+        self.scheduled += 1
+        self._wakeup.set()
+        return run_at
+
+    async def schedule_many(self, bot, jobs: list[tuple[int, str, float, int]]) -> None:
+        """Persist several (user_id, action, delay, attempt) jobs with one insert."""
+        if not jobs:
+            return
+        now = _utc_now()
+        rows = [
+            {
+                "user_id": user_id,
+                "action": action,
+                "run_at": now + timedelta(seconds=max(0.0, delay)),
+                "attempt": attempt,
+            }
+            for user_id, action, delay, attempt in jobs
+        ]
+        dal = Gw2SessionJobsDal(bot.db_session, bot.log)
+        job_ids = await dal.insert_jobs(rows)
+        for job_id, row in zip(job_ids, rows, strict=True):
+            self._pending.setdefault(row["user_id"], {})[str(job_id)] = (row["action"], row["run_at"])
+            if row["attempt"]:
+                self._retries.add(str(job_id))
+        self.scheduled += len(rows)
+        self._wakeup.set()
+
+    def start(self, bot, handler: SessionJobHandler) -> asyncio.Task:
+        """Resume the stored jobs and start the poll loop in the background."""
+        self._handler = handler
+        self._task = asyncio.create_task(self._run(bot))
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the poll loop and cancel running jobs; their claims are released on the next start."""
+        tasks = [t for t in (self._task, *self._running) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    async def resume(self, bot) -> int:
+        """Release the jobs claimed by a previous run and reload the pending jobs.
+
+        Returns:
+            Number of pending jobs
+        """
+        dal = Gw2SessionJobsDal(bot.db_session, bot.log)
+        await dal.release_claimed_jobs()
+        self._pending.clear()
+        self._retries.clear()
+        jobs = await dal.get_jobs()
+        for job in jobs:
+            self._pending.setdefault(job["user_id"], {})[str(job["id"])] = (job["action"], job["run_at"])
+            if job["attempt"]:
+                self._retries.add(str(job["id"]))
+        return len(jobs)
+
+    def api_failed(self) -> None:
+        """Note a session snapshot the GW2 API failed; jobs run one at a time until one succeeds."""
+        self._probing = True
+
+    def api_answered(self) -> None:
+        """Note a session snapshot the GW2 API answered; after failures, the waiting retries run now."""
+        if self._probing:
+            self._probing = False
+            self._drain = True
+            self._wakeup.set()
+
+    async def drain_retries(self, bot) -> int:
+        """Make the retries waiting out their backoff due now.
+
+        Returns:
+            Number of retries made due
+        """
+        now = _utc_now()
+        dal = Gw2SessionJobsDal(bot.db_session, bot.log)
+        drained = await dal.expedite_retries(now)
+        for jobs in self._pending.values():
+            for job_id, (action, run_at) in jobs.items():
+                if job_id in self._retries and job_id not in self._claimed and run_at > now:
+                    jobs[job_id] = (action, now)
+        self.drained += drained
+        if drained:
+            bot.log.info(
+                f"GW2 session jobs: GW2 API answering again, running {drained} waiting retries "
+                f"{self.concurrency} at a time"
+            )
+        return drained
+
+    def _limit(self) -> int:
+        return 1 if self._probing else self.concurrency
+
+    async def _run(self, bot) -> None:
+        try:
+            resumed = await self.resume(bot)
+            if resumed:
+                bot.log.info(f"GW2 session jobs: resumed {resumed} pending jobs")
+        except Exception as e:
+            bot.log.error(f"GW2 session jobs: error loading pending jobs: {e}")
+
+        while True:
+            self._wakeup.clear()
+            if self._drain:
+                self._drain = False
+                try:
+                    await self.drain_retries(bot)
+                except Exception as e:
+                    bot.log.error(f"GW2 session jobs: error draining retries: {e}")
+            free = self._limit() - len(self._running)
+            if free > 0:
+                try:
+                    await self.run_due(bot, free)
+                except Exception as e:
+                    bot.log.error(f"GW2 session jobs: error claiming due jobs: {e}")
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_wait())
+            except TimeoutError:
+                pass
+
+    def _next_wait(self) -> float:
+        """Sleep until the next claimable job is due, polling at least every poll_interval."""
+        if len(self._running) >= self._limit():
+            return self.poll_interval
+        # Only the first job of each user can be claimed, and not while it is running
+        run_ats = []
+        for jobs in self._pending.values():
+            job_id, (_, run_at) = next(iter(jobs.items()))
+            if job_id not in self._claimed:
+                run_ats.append(run_at)
+        if not run_ats:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, (min(run_ats) - _utc_now()).total_seconds()))
+
+    async def run_due(self, bot, limit: int) -> int:
+        """Claim up to limit due jobs and start running them.
+
+        Returns:
+            Number of jobs started
+        """
+        dal = Gw2SessionJobsDal(bot.db_session, bot.log)
+        jobs = await dal.claim_due_jobs(_utc_now(), limit)
+        for job in jobs:
+            self._claimed.add(str(job["id"]))
+            task = asyncio.create_task(self._run_job(bot, job))
+            self._running.add(task)
+            task.add_done_callback(self._job_done)
+        return len(jobs)
+
+    def _job_done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        self._wakeup.set()
+
+    async def _run_job(self, bot, job: dict) -> None:
+        user_id = job["user_id"]
+        try:
+            retry_delay = await self._handler(bot, job)
+        except Exception as e:
+            bot.log.error(f"GW2 session jobs: {job['action']} job for user {user_id} failed: {e}")
+            self.failed += 1
+            retry_delay = None
+
+        dal = Gw2SessionJobsDal(bot.db_session, bot.log)
+        try:
+            if retry_delay is None:
+                await dal.delete_job(job["id"])
+                self._forget(user_id, str(job["id"]))
+                self.completed += 1
+            else:
+                run_at = _utc_now() + timedelta(seconds=retry_delay)
+                await dal.reschedule_job(job["id"], job["attempt"] + 1, run_at)
+                self._pending.setdefault(user_id, {})[str(job["id"])] = (job["action"], run_at)
+                self._retries.add(str(job["id"]))
+                self.retried += 1
+        except Exception as e:
+            # The row stays claimed until the next start releases it, so it is not retried before that
+            bot.log.error(f"GW2 session jobs: error updating {job['action']} job for user {user_id}: {e}")
+            self._forget(user_id, str(job["id"]))
+        finally:
+            self._claimed.discard(str(job["id"]))
+
+    def _forget(self, user_id: int, job_id: str) -> None:
+        self._retries.discard(job_id)
+        jobs = self._pending.get(user_id)
+        if jobs is not None:
+            jobs.pop(job_id, None)
+            if not jobs:
+                del self._pending[user_id]
+
+    def stats(self) -> dict[str, int]:
+        """Get the job counters."""
+        return {
+            "pending": sum(len(jobs) for jobs in self._pending.values()),
+            "retries": len(self._retries),
+            "running": len(self._running),
+            "probing": int(self._probing),
+            "scheduled": self.scheduled,
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+            "drained": self.drained,
+        }
@@ -0,0 +1,101 @@
+import time
+from collections import Counter
+from src.gw2.tools.gw2_metrics import LatencyHistogram
+
+# Upper bounds of the wait histogram buckets, in milliseconds: waits span the session end delay
+WAIT_BUCKETS_MS = (1000, 5000, 15000, 30000, 60000, 120000, 180000, 300000, 600000, 1800000)
+
+# Latency histograms of the session pipeline and their buckets
+SESSION_HISTOGRAMS = {
+    "snapshot": None,  # GW2 API stats snapshot of a session start or end
+    "db_write": None,  # session start insert or end update
+    "job_lag": None,  # session job started after its due time
+    "end_delay": WAIT_BUCKETS_MS,  # GW2 closed until the end snapshot is taken
+    "presence_to_db": WAIT_BUCKETS_MS,  # GW2 opened or closed until the session row is written
+}
+
+# Users whose last activity change is remembered until their session row is written
+MAX_TRACKED_USERS = 10000
+
+
+def _new_histograms() -> dict[str, LatencyHistogram]:
+    return {
+        name: LatencyHistogram(bounds) if bounds else LatencyHistogram() for name, bounds in SESSION_HISTOGRAMS.items()
+    }
+
+
+class Gw2SessionMetrics:
+    """Outcome counters and latency histograms of the GW2 session pipeline.
+
+    The counters cover what happens to an activity change after the presence prefilter:
+    intents dropped for lack of a session config or API key, actions coalesced with one
+    already scheduled, sessions started and ended, failed snapshots, database errors and
+    background retries. The time of a user's last activity change is kept until its
+    session row is written, which gives the presence-to-database latency, end delay
+    included for ends. Users whose changes never reach the database are forgotten oldest
+    first past max_tracked.
+
+    Args:
+        max_tracked: Users whose last activity change time is kept at most
+    """
+
+    def __init__(self, max_tracked: int = MAX_TRACKED_USERS):
+        self.max_tracked = max_tracked
+        self.counters: Counter[str] = Counter()
+        self.histograms = _new_histograms()
+        # user_id -> monotonic time of the last activity change, oldest first
+        self._changed_at: dict[int, float] = {}
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a pipeline counter."""
+        if amount:
+            self.counters[name] += amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a latency of one of the SESSION_HISTOGRAMS, in seconds."""
+        self.histograms[name].observe(max(0.0, seconds) * 1000)
+
+    def activity_changed(self, user_id: int) -> None:
+        """Record a GW2 activity change of a user handed to the session actors."""
+        self.count("activity_changes")
+        self._changed_at.pop(user_id, None)
+        self._changed_at[user_id] = time.monotonic()
+        if len(self._changed_at) > self.max_tracked:
+            del self._changed_at[next(iter(self._changed_at))]
+
+    def end_job_started(self, user_id: int) -> None:
+        """Record the wait of a delayed session end, from the activity change to its snapshot."""
+        changed_at = self._changed_at.get(user_id)
+        if changed_at is not None:
+            self.observe("end_delay", time.monotonic() - changed_at)
+
+    def session_written(self, user_id: int, action: str) -> None:
+        """Record a session start or end written to the database."""
+        self.count("started" if action == "start" else "ended")
+        changed_at = self._changed_at.pop(user_id, None)
+        if changed_at is not None:
+            self.observe("presence_to_db", time.monotonic() - changed_at)
+
+    def clear(self) -> None:
+        """Forget all counters and latencies."""
+        self.counters.clear()
+        self._changed_at.clear()
+        self.histograms = _new_histograms()
+
+    def stats(self) -> dict:
+        """Get the pipeline counters and, per histogram, the latency percentiles in milliseconds."""
+        return {
+            "tracked_users": len(self._changed_at),
+            "counters": dict(sorted(self.counters.items())),
+            "latency": {
+                name: {
+                    "count": histogram.count,
+                    "p50_ms": histogram.percentile(50),
+                    "p95_ms": histogram.percentile(95),
+                    "p99_ms": histogram.percentile(99),
+                    "avg_ms": round(histogram.total_ms / histogram.count, 1) if histogram.count else 0.0,
+                    "max_ms": round(histogram.max_ms, 1),
+                }
+                for name, histogram in self.histograms.items()
+            },
+        }
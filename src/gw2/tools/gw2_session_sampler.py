@@ -0,0 +1,120 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from src.database.dal.gw2.gw2_key_dal import Gw2KeyDal
+from src.database.dal.gw2.gw2_session_samples_dal import Gw2SessionSamplesDal
+from src.database.dal.gw2.gw2_session_snapshots import pack_start
+
+# Takes the stats snapshot of an API key; None when the GW2 API could not be reached
+StatsSnapshot = Callable[[object, str], Awaitable[dict | None]]
+
+
+def _utc_now() -> datetime:
+    # Sample times are naive UTC, like the timestamps the database writes
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class Gw2SessionSampler:
+    """Periodic stats snapshots of the users playing, stored in gw2.gw2_session_samples.
+
+    Every interval seconds the members with a started session are snapshotted, at most
+    concurrency at a time, and each stat whose value changed since the user's previous
+    sample is written as one narrow (user_id, metric_id, ts, value) row, metric_id being the
+    index of the stat in the packed snapshot layout. Most stats don't move between two
+    samples, so a session's curve costs a few rows per sample instead of a full snapshot.
+    The first sample of a user after a restart or a new session writes all its stats.
+
+    Args:
+        interval: Seconds between two sampling rounds
+        concurrency: Snapshots taken at the same time
+    """
+
+    def __init__(self, interval: float = 900.0, concurrency: int = 2):
+        self.interval = interval
+        self.concurrency = concurrency
+        # user_id -> packed stats of the last stored sample
+        self._last: dict[int, list[int | None]] = {}
+        self._task: asyncio.Task | None = None
+        self.rounds = 0
+        self.sampled = 0
+        self.failed = 0
+        self.rows = 0
+        self.last_round_seconds = 0.0
+
+    def start(self, bot, members: Callable[[], list], snapshot: StatsSnapshot) -> asyncio.Task:
+        """Start sampling the members returned by members() in the background."""
+        self._task = asyncio.create_task(self._run(bot, members, snapshot))
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the sampling loop."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self, bot, members: Callable[[], list], snapshot: StatsSnapshot) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.sample(bot, members(), snapshot)
+            except Exception as e:
+                bot.log.error(f"GW2 session sampling failed: {e}")
+
+    async def sample(self, bot, members: list, snapshot: StatsSnapshot) -> int:
+        """Snapshot each member and store the stats that changed; returns the rows written."""
+        started = time.monotonic()
+        user_ids = {member.id for member in members}
+        # Users who stopped playing get a full sample when they start again
+        for user_id in self._last.keys() - user_ids:
+            del self._last[user_id]
+        if not user_ids:
+            return 0
+
+        gw2_key_dal = Gw2KeyDal(bot.db_session, bot.log)
+        api_keys = {row["user_id"]: row["key"] for row in await gw2_key_dal.get_api_keys_by_users(list(user_ids))}
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def _snapshot(user_id: int) -> tuple[int, dict | None]:
+            async with semaphore:
+                return user_id, await snapshot(bot, api_keys[user_id])
+
+        results = await asyncio.gather(*(_snapshot(user_id) for user_id in user_ids if user_id in api_keys))
+
+        ts = _utc_now()
+        rows = []
+        sampled = {}
+        for user_id, stats in results:
+            if not stats:
+                self.failed += 1
+                continue
+            values = pack_start(stats)
+            previous = self._last.get(user_id)
+            rows.extend(
+                {"user_id": user_id, "metric_id": metric_id, "ts": ts, "value": value}
+                for metric_id, value in enumerate(values)
+                if value is not None and (previous is None or previous[metric_id] != value)
+            )
+            sampled[user_id] = values
+
+        if rows:
+            await Gw2SessionSamplesDal(bot.db_session, bot.log).insert_samples(rows)
+        # Only once stored, so a failed insert writes the same changes again next round
+        self._last.update(sampled)
+        self.sampled += len(sampled)
+        self.rows += len(rows)
+        self.rounds += 1
+        self.last_round_seconds = round(time.monotonic() - started, 3)
+        return len(rows)
+
+    def stats(self) -> dict[str, int | float]:
+        """Get the sampling counters."""
+        return {
+            "users": len(self._last),
+            "rounds": self.rounds,
+            "sampled": self.sampled,
+            "failed": self.failed,
+            "rows": self.rows,
+            "last_round_seconds": self.last_round_seconds,
+        }
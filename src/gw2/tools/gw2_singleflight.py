@@ -0,0 +1,48 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class Gw2SingleFlight:
+    """Coalesce concurrent identical GW2 API requests into a single in-flight call.
+
+    The first caller for a key starts the request; callers arriving while it is
+    still running await the same task and receive the same decoded JSON (or exception).
+    The shared task is shielded, so a cancelled caller never cancels it for the others.
+    Calls made with a priority (lower is more urgent) only join a request of the same or a
+    more urgent priority: a more urgent caller starts its own request, which later callers join.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, tuple[asyncio.Task, int | None]] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]], priority: int | None = None) -> Any:
+        """Run func once per key at a time, sharing its result with concurrent callers."""
+        self.calls += 1
+        inflight = self._inflight.get(key)
+        if inflight is not None and (priority is None or inflight[1] is None or inflight[1] <= priority):
+            task = inflight[0]
+            self.deduplicated += 1
+        else:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = (task, priority)
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished task and mark its exception as retrieved."""
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        """Get in-flight and deduplication counters."""
+        return {
+            "in_flight": len(self._inflight),
+            "calls": self.calls,
+            "deduplicated": self.deduplicated,
+        }
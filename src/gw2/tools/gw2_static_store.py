@@ -0,0 +1,217 @@
+import asyncio
+import time
+from collections import OrderedDict
+from src.database.dal.gw2.gw2_static_data_dal import Gw2StaticDataDal
+from src.gw2.tools.gw2_scheduler import RequestPriority
+
+# Kinds of static data kept in the store, named after their API endpoint
+STATIC_KINDS = ("achievements", "worlds", "currencies", "guild")
+# Endpoints that accept ?ids=; the others are fetched one id at a time
+_BULK_KINDS = ("achievements", "worlds", "currencies")
+# Only the public fields are stored, so data fetched with a user's key never leaks into the shared table
+_PUBLIC_FIELDS = {"guild": ("id", "name", "tag")}
+_GUILD_CONCURRENCY = 3
+
+
+class Gw2StaticStore:
+    """Static GW2 game data persisted in gw2.gw2_static_data, with a bounded in-memory LRU in front.
+
+    Lookups go memory -> database -> API, and whatever the API returns is written back
+    to the database, so restarts reload from Postgres instead of hitting the API again.
+    Rows are tagged with the API build id; when a new game build is detected the rows
+    of older builds are deleted and refetched on demand.
+
+    Args:
+        max_entries: Maximum objects kept in memory
+        build_check_interval: Seconds between checks of the API build id
+    """
+
+    def __init__(self, max_entries: int = 10000, build_check_interval: float = 3600.0):
+        self.max_entries = max_entries
+        self.build_check_interval = build_check_interval
+        self.build_id: int | None = None
+        self._build_checked_at: float | None = None
+        self._build_lock = asyncio.Lock()
+        self._entries: OrderedDict[tuple[str, str], dict] = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.api_fetches = 0
+
+    def _remember(self, kind: str, object_id: str, data: dict) -> None:
+        self._entries[(kind, object_id)] = data
+        self._entries.move_to_end((kind, object_id))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_many(self, bot, kind: str, ids, priority: RequestPriority = RequestPriority.INTERACTIVE) -> dict:
+        """Get static objects by id, keyed by the ids given, in request order.
+
+        Ids the API doesn't know about are left out of the result.
+        priority is the scheduling class of the API requests made for missing objects.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return {}
+
+        if self._build_check_due():
+            await self.refresh_build(bot, priority)
+
+        found: dict[str, dict] = {}
+        for object_id in map(str, unique_ids):
+            data = self._entries.get((kind, object_id))
+            if data is not None:
+                self._entries.move_to_end((kind, object_id))
+                found[object_id] = data
+        self.memory_hits += len(found)
+
+        needed = [str(i) for i in unique_ids if str(i) not in found]
+        if needed:
+            from_db = await self._load_from_db(bot, kind, needed)
+            self.db_hits += len(from_db)
+            found.update(from_db)
+            needed = [i for i in needed if i not in from_db]
+
+        if needed:
+            needed_set = set(needed)
+            from_api = await self._fetch_from_api(bot, kind, [i for i in unique_ids if str(i) in needed_set], priority)
+            self.api_fetches += len(from_api)
+            for object_id, data in from_api.items():
+                self._remember(kind, object_id, data)
+            found.update(from_api)
+            await self._save_to_db(bot, kind, from_api)
+
+        return {i: found[str(i)] for i in unique_ids if str(i) in found}
+
+    async def put_many(
+        self, bot, kind: str, objects: dict, priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> None:
+        """Store objects that were fetched elsewhere, e.g. from an ?ids=all listing."""
+        if self._build_check_due():
+            await self.refresh_build(bot, priority)
+
+        objects = self._public_objects(kind, objects)
+        for object_id, data in objects.items():
+            self._remember(kind, object_id, data)
+        await self._save_to_db(bot, kind, objects)
+
+    async def _load_from_db(self, bot, kind: str, object_ids: list[str]) -> dict[str, dict]:
+        try:
+            rows = await Gw2StaticDataDal(bot.db_session, bot.log).get_static_data(kind, object_ids)
+        except Exception as e:
+            bot.log.warning(f"Could not load GW2 static {kind} from database: {e}")
+            return {}
+
+        loaded = {}
+        for row in rows:
+            if self.build_id is not None and row["build_id"] != self.build_id:
+                continue
+            self._remember(kind, row["object_id"], row["data"])
+            loaded[row["object_id"]] = row["data"]
+        return loaded
+
+    async def _fetch_from_api(self, bot, kind: str, ids: list, priority: RequestPriority) -> dict[str, dict]:
+        gw2_api = bot.gw2_client
+        if kind in _BULK_KINDS:
+            objects, _ = await gw2_api.fetch_many(kind, ids, priority=priority)
+        else:
+            semaphore = asyncio.Semaphore(_GUILD_CONCURRENCY)
+
+            async def _fetch_one(object_id):
+                async with semaphore:
+                    try:
+                        return object_id, await gw2_api.call_api(f"{kind}/{object_id}", priority=priority)
+                    except Exception as e:
+                        bot.log.warning(f"Could not fetch GW2 {kind} {object_id}: {e}")
+                        return object_id, None
+
+            results = await asyncio.gather(*(_fetch_one(object_id) for object_id in ids))
+            objects = {object_id: data for object_id, data in results if data}
+
+        return self._public_objects(kind, objects)
+
+    @staticmethod
+    def _public_objects(kind: str, objects: dict) -> dict[str, dict]:
+        fields = _PUBLIC_FIELDS.get(kind)
+        if fields:
+            objects = {object_id: {f: data[f] for f in fields if f in data} for object_id, data in objects.items()}
+        return {str(object_id): data for object_id, data in objects.items()}
+
+    async def _save_to_db(self, bot, kind: str, objects: dict[str, dict]) -> None:
+        if not objects:
+            return
+        try:
+            await Gw2StaticDataDal(bot.db_session, bot.log).upsert_static_data(kind, objects, self.build_id)
+        except Exception as e:
+            bot.log.warning(f"Could not save GW2 static {kind} to database: {e}")
+
+    def _build_check_due(self) -> bool:
+        return self._build_checked_at is None or time.monotonic() - self._build_checked_at >= self.build_check_interval
+
+    async def refresh_build(self, bot, priority: RequestPriority = RequestPriority.INTERACTIVE) -> int | None:
+        """Check the API build id when due, dropping data of older builds when the game was updated."""
+        async with self._build_lock:
+            if not self._build_check_due():
+                return self.build_id  # another caller just checked
+            self._build_checked_at = time.monotonic()
+
+            try:
+                build = await bot.gw2_client.call_api("build", priority=priority)
+                build_id = int(build["id"])
+            except Exception as e:
+                bot.log.warning(f"Could not get GW2 API build id, keeping current static data: {e}")
+                return self.build_id
+
+            if build_id == self.build_id:
+                return build_id
+
+            bot.log.info(f"GW2 API build changed from {self.build_id} to {build_id}, refreshing static data")
+            self.build_id = build_id
+            self._entries.clear()
+            try:
+                await Gw2StaticDataDal(bot.db_session, bot.log).delete_outdated_static_data(build_id)
+            except Exception as e:
+                bot.log.warning(f"Could not delete outdated GW2 static data: {e}")
+            return build_id
+
+    async def warm_up(self, bot, kinds=_BULK_KINDS) -> int:
+        """Check the build and load stored static data into memory, up to max_entries.
+
+        Returns:
+            Number of objects loaded
+        """
+        await self.refresh_build(bot, RequestPriority.PREFETCH)
+        loaded = 0
+        for kind in kinds:
+            limit = self.max_entries - len(self._entries)
+            if limit <= 0:
+                break
+            try:
+                rows = await Gw2StaticDataDal(bot.db_session, bot.log).get_static_data_by_kind(kind, limit)
+            except Exception as e:
+                bot.log.warning(f"Could not load GW2 static {kind} from database: {e}")
+                continue
+            for row in rows:
+                if self.build_id is None or row["build_id"] == self.build_id:
+                    self._remember(kind, row["object_id"], row["data"])
+                    loaded += 1
+        return loaded
+
+    def clear(self) -> None:
+        """Forget everything held in memory (the database is left untouched)."""
+        self._entries.clear()
+        self.build_id = None
+        self._build_checked_at = None
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.api_fetches = 0
+
+    def stats(self) -> dict[str, int | None]:
+        """Get store counters."""
+        return {
+            "build_id": self.build_id,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "api_fetches": self.api_fetches,
+        }
@@ -1,6 +1,8 @@
 import asyncio
 import discord
-from datetime import datetime, timedelta
+import json
+import time
+from datetime import date, datetime, timedelta
 from discord.ext import commands
 from enum import Enum
 from src.bot.discord_bot import Bot
@@ -21,17 +23,47 @@ def __init__(self):
 from src.database.dal.gw2.gw2_configs_dal import Gw2ConfigsDal
 from src.database.dal.gw2.gw2_key_dal import Gw2KeyDal
 from src.database.dal.gw2.gw2_session_chars_dal import Gw2SessionCharDeathsDal
+from src.database.dal.gw2.gw2_session_samples_dal import Gw2SessionSamplesDal
 from src.database.dal.gw2.gw2_sessions_dal import Gw2SessionsDal
 from src.gw2.constants import gw2_messages
 from src.gw2.constants.gw2_currencies import ACHIEVEMENT_MAPPING, WALLET_MAPPING
 from src.gw2.constants.gw2_settings import get_gw2_settings
 from src.gw2.constants.gw2_teams import get_team_name, is_wr_team_id
-from src.gw2.tools.gw2_client import Gw2Client
+from src.gw2.tools.gw2_presence_filter import Gw2PresenceFilter, is_gw2_activity
+from src.gw2.tools.gw2_retry import RetryPolicy
+from src.gw2.tools.gw2_scheduler import RequestPriority
+from src.gw2.tools.gw2_session_actors import Gw2SessionActors, SessionState
+from src.gw2.tools.gw2_session_batch import Gw2SessionBatcher
+from src.gw2.tools.gw2_session_jobs import Gw2SessionJobScheduler
+from src.gw2.tools.gw2_session_metrics import Gw2SessionMetrics
+from src.gw2.tools.gw2_session_sampler import Gw2SessionSampler
+from src.gw2.tools.gw2_static_store import Gw2StaticStore
 
 _gw2_settings = get_gw2_settings()
 _background_tasks: set[asyncio.Task] = set()
-_processing_sessions: dict[int, dict[str, str | None]] = {}
-_achievement_cache: dict[int, dict] = {}
+_static_store = Gw2StaticStore(
+    max_entries=_gw2_settings.api_static_store_max_entries,
+    build_check_interval=_gw2_settings.api_static_store_build_check_interval,
+)
+_session_jobs = Gw2SessionJobScheduler(
+    concurrency=_gw2_settings.api_session_jobs_concurrency,
+    poll_interval=_gw2_settings.api_session_jobs_poll_interval,
+)
+_session_batcher = Gw2SessionBatcher(
+    lambda bot, intents: _process_session_batch(bot, intents),
+    window=_gw2_settings.api_session_batch_window,
+    max_batch=_gw2_settings.api_session_batch_max_size,
+)
+_session_actors = Gw2SessionActors(
+    lambda bot, member, action: _execute_session_action(bot, member, action),
+    workers=_gw2_settings.api_session_actor_workers,
+)
+_presence_filter = Gw2PresenceFilter()
+_session_metrics = Gw2SessionMetrics()
+_session_sampler = Gw2SessionSampler(
+    interval=_gw2_settings.api_session_sample_interval,
+    concurrency=_gw2_settings.api_session_sample_concurrency,
+)
 
 
 class Gw2Servers(Enum):
@@ -113,11 +145,10 @@ async def insert_gw2_server_configs(bot: Bot, server: discord.Guild) -> None:
 
 async def calculate_user_achiev_points(ctx: commands.Context, api_req_acc_achiev: list[dict], api_req_acc: dict) -> int:
     """Calculate total achievement points for a user."""
-    gw2_api = Gw2Client(ctx.bot)
     total = api_req_acc["daily_ap"] + api_req_acc["monthly_ap"]
 
-    # Fetch achievement data in batches
-    achievement_data = await _fetch_achievement_data_in_batches(gw2_api, api_req_acc_achiev)
+    achievements = await get_static_data(ctx.bot, "achievements", [ach["id"] for ach in api_req_acc_achiev])
+    achievement_data = list(achievements.values())
 
     # Calculate earned points
     total += _calculate_earned_points(api_req_acc_achiev, achievement_data)
@@ -125,37 +156,211 @@ async def calculate_user_achiev_points(ctx: commands.Context, api_req_acc_achiev
     return total
 
 
-async def _fetch_achievement_data_in_batches(gw2_api: Gw2Client, user_achievements: list[dict]) -> list[dict]:
-    """Fetch achievement data from API in parallel batches of 200, with in-memory cache.
+async def get_static_data(bot: Bot, kind: str, ids) -> dict:
+    """Get static game data (achievements, worlds, currencies or guild) by id from the persistent store.
 
-    Achievement definitions (tiers, points) are static game data that rarely change,
-    so caching them avoids 18+ API calls on every `gw2 account` invocation.
+    Static definitions rarely change, so they are kept in Postgres across restarts and
+    only refetched from the API when the game build changes.
     """
-    needed_ids = [ach["id"] for ach in user_achievements if ach["id"] not in _achievement_cache]
+    return await _static_store.get_many(bot, kind, ids)
 
-    if needed_ids:
-        batch_size = 200
-        sem = asyncio.Semaphore(5)
 
-        async def _fetch_batch(batch_ids):
-            async with sem:
-                ids_string = ",".join(str(aid) for aid in batch_ids)
-                return await gw2_api.call_api(f"achievements?ids={ids_string}")
+async def _warm_up_worlds(bot: Bot) -> int:
+    # get_world_id and the worlds commands read the full listing, so it is kept in the response cache too
+    worlds = await bot.gw2_client.call_api("worlds?ids=all", priority=RequestPriority.PREFETCH)
+    await _static_store.put_many(bot, "worlds", {world["id"]: world for world in worlds}, RequestPriority.PREFETCH)
+    return len(worlds)
 
-        batch_tasks = []
-        for i in range(0, len(needed_ids), batch_size):
-            batch = needed_ids[i : i + batch_size]
-            batch_tasks.append(_fetch_batch(batch))
 
-        results = await asyncio.gather(*batch_tasks, return_exceptions=True)
+async def _warm_up_achievements(bot: Bot) -> int:
+    # Only the achievements the sessions track: the full listing is about 8k definitions, the ones
+    # of a user's achievement points are fetched on demand and kept in the store across restarts
+    achievements = await _static_store.get_many(
+        bot, "achievements", list(ACHIEVEMENT_MAPPING), RequestPriority.PREFETCH
+    )
+    return len(achievements)
+
+
+async def _warm_up_static_kind(bot: Bot, kind: str) -> int:
+    ids = await bot.gw2_client.call_api(kind, priority=RequestPriority.PREFETCH)
+    return len(await _static_store.get_many(bot, kind, ids, RequestPriority.PREFETCH))
+
+
+async def warm_up_gw2_data(bot: Bot) -> None:
+    """Prefetch static GW2 data so the first commands after a restart don't pay the cold-cache cost.
+
+    Stored objects are loaded from the database first, then worlds, the definitions of the
+    achievements sessions track and currencies are prefetched, at most api_warm_up_concurrency
+    stages at a time. Objects already stored for the current build need no API request.
+    WvW team names are hardcoded (gw2_teams), so they need no prefetch.
+    """
+    started = time.perf_counter()
+    try:
+        loaded = await _static_store.warm_up(bot)
+        bot.log.info(f"GW2 warm-up: loaded {loaded} stored objects (build {_static_store.build_id})")
+    except Exception as e:
+        bot.log.error(f"GW2 warm-up: error loading stored static data: {e}")
+
+    stages = {
+        "worlds": _warm_up_worlds,
+        "achievements": _warm_up_achievements,
+        "currencies": lambda b: _warm_up_static_kind(b, "currencies"),
+    }
+    semaphore = asyncio.Semaphore(max(1, _gw2_settings.api_warm_up_concurrency))
+    done = 0
+
+    async def _run_stage(name, stage) -> bool:
+        nonlocal done
+        async with semaphore:
+            stage_started = time.perf_counter()
+            try:
+                count = await stage(bot)
+            except Exception as e:
+                done += 1
+                elapsed = time.perf_counter() - stage_started
+                bot.log.warning(f"GW2 warm-up: {name} failed after {elapsed:.2f}s [{done}/{len(stages)}]: {e}")
+                return False
+            done += 1
+            elapsed = time.perf_counter() - stage_started
+            bot.log.info(f"GW2 warm-up: {name} ready, {count} objects in {elapsed:.2f}s [{done}/{len(stages)}]")
+            return True
+
+    results = await asyncio.gather(*(_run_stage(name, stage) for name, stage in stages.items()))
+    elapsed = time.perf_counter() - started
+    bot.log.info(f"GW2 warm-up finished in {elapsed:.2f}s ({sum(results)}/{len(stages)} stages ok)")
+
+
+def start_warm_up(bot: Bot) -> asyncio.Task | None:
+    """Start the GW2 warm-up in the background, without delaying login."""
+    if not _gw2_settings.api_warm_up_enabled:
+        return None
+    task = asyncio.create_task(warm_up_gw2_data(bot))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def load_presence_filter(bot: Bot) -> None:
+    """Load the presence prefilter; until it is loaded every presence event goes through."""
+    try:
+        await _presence_filter.load(bot)
+        stats = _presence_filter.stats()
+        bot.log.info(
+            f"GW2 presence filter: {stats['session_guilds']} guilds with sessions on, "
+            f"{stats['key_users']} users with an API key"
+        )
+    except Exception as e:
+        bot.log.error(f"GW2 presence filter: error loading, presence events are not filtered: {e}")
+
+
+def start_presence_filter(bot: Bot) -> asyncio.Task:
+    """Load the presence prefilter in the background."""
+    task = asyncio.create_task(load_presence_filter(bot))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def set_guild_session_enabled(guild_id: int, enabled: bool) -> None:
+    """Keep the presence prefilter current after gw2 config session changed for a guild."""
+    _presence_filter.set_session_enabled(guild_id, enabled)
+
+
+def add_key_user(user_id: int) -> None:
+    """Keep the presence prefilter current after a user added an API key."""
+    _presence_filter.add_key_user(user_id)
+
+
+def remove_key_user(user_id: int) -> None:
+    """Keep the presence prefilter current after a user removed their API key."""
+    _presence_filter.remove_key_user(user_id)
+
+
+def start_session_jobs(bot: Bot) -> asyncio.Task:
+    """Resume the stored session jobs and start running them in the background."""
+    return _session_jobs.start(bot, _run_actor_session_job)
+
+
+def start_session_sampler(bot: Bot) -> asyncio.Task | None:
+    """Start sampling the stats of the users playing in the background, when sampling is enabled."""
+    if not _gw2_settings.api_session_sampling_enabled:
+        return None
+    return _session_sampler.start(bot, _session_actors.playing_members, _sample_user_stats)
+
 
-        for result in results:
-            if isinstance(result, Exception):
-                continue
-            for ach in result:
-                _achievement_cache[ach["id"]] = ach
+async def _sample_user_stats(bot: Bot, api_key: str) -> dict | None:
+    # Nobody waits on a sample: it yields the API rate limit to commands and session snapshots
+    return await get_user_stats(bot, api_key, RequestPriority.PREFETCH)
 
-    return [_achievement_cache[ach["id"]] for ach in user_achievements if ach["id"] in _achievement_cache]
+
+async def maintain_session_partitions(bot: Bot) -> None:
+    """Create the session partitions of this month and the next one, and drop the expired ones and samples."""
+    this_month = bot_utils.get_current_date_time().date().replace(day=1)
+    next_month = (this_month + timedelta(days=32)).replace(day=1)
+    gw2_session_dal = Gw2SessionsDal(bot.db_session, bot.log)
+    for month in (this_month, next_month):
+        await gw2_session_dal.create_partition(month)
+
+    retention_months = _gw2_settings.api_session_retention_months
+    if not retention_months:
+        return
+    year, month_index = divmod(this_month.year * 12 + this_month.month - 1 - retention_months, 12)
+    cutoff = date(year, month_index + 1, 1)
+    dropped = await gw2_session_dal.drop_partitions_before(cutoff)
+    if dropped:
+        bot.log.info(f"GW2 session history: dropped expired partitions {', '.join(dropped)}")
+    gw2_session_samples_dal = Gw2SessionSamplesDal(bot.db_session, bot.log)
+    deleted = await gw2_session_samples_dal.delete_samples_before(datetime(cutoff.year, cutoff.month, 1))
+    if deleted:
+        bot.log.info(f"GW2 session history: deleted {deleted} expired session samples")
+
+
+async def _maintain_session_partitions_daily(bot: Bot) -> None:
+    while True:
+        try:
+            await maintain_session_partitions(bot)
+        except Exception as e:
+            bot.log.error(f"GW2 session history: partition maintenance failed: {e}")
+        await asyncio.sleep(24 * 60 * 60)
+
+
+def start_session_partitions(bot: Bot) -> asyncio.Task:
+    """Keep the monthly session partitions ready and pruned, now and once a day, in the background."""
+    task = asyncio.create_task(_maintain_session_partitions_daily(bot))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def get_session_pipeline_stats() -> dict:
+    """Get the counters and latencies of every stage of the session pipeline, presence event to database."""
+    return {
+        "presence": _presence_filter.stats(),
+        "actors": _session_actors.stats(),
+        "states": _session_actors.state_stats(),
+        "batches": _session_batcher.stats(),
+        "jobs": _session_jobs.stats(),
+        "sampler": _session_sampler.stats(),
+        "pipeline": _session_metrics.stats(),
+    }
+
+
+async def _log_session_metrics(bot: Bot, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        # One JSON line per interval, for log shippers to turn into time series
+        bot.log.info(f"GW2 session metrics: {json.dumps(get_session_pipeline_stats(), separators=(',', ':'))}")
+
+
+def start_session_metrics_log(bot: Bot) -> asyncio.Task | None:
+    """Log the session pipeline stats as JSON every interval in the background, when an interval is set."""
+    interval = _gw2_settings.api_session_metrics_log_interval
+    if not interval or interval <= 0:
+        return None
+    task = asyncio.create_task(_log_session_metrics(bot, interval))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 
 def _calculate_earned_points(user_achievements: list[dict], achievement_data: list[dict]) -> int:
@@ -211,7 +416,7 @@ async def get_world_id(bot: Bot, world: str | None) -> int | None:
         return None
 
     try:
-        gw2_api = Gw2Client(bot)
+        gw2_api = bot.gw2_client
         results = await gw2_api.call_api("worlds?ids=all")
 
         # Create a dictionary for O(1) lookup instead of O(n) linear search
@@ -251,12 +456,8 @@ async def get_world_name_population(ctx: commands.Context, world_ids: str) -> li
         # Build name lookup from API for legacy IDs
         legacy_names: dict[int, str] = {}
         if legacy_ids:
-            gw2_api = Gw2Client(ctx.bot)
-            legacy_ids_str = ",".join(str(wid) for wid in legacy_ids)
-            results = await gw2_api.call_api(f"worlds?ids={legacy_ids_str}")
-            if results:
-                for world in results:
-                    legacy_names[world["id"]] = world["name"]
+            worlds = await get_static_data(ctx.bot, "worlds", legacy_ids)
+            legacy_names = {wid: world["name"] for wid, world in worlds.items()}
 
         # Resolve all IDs in original order
         names: list[str] = []
@@ -277,7 +478,7 @@ async def get_world_name_population(ctx: commands.Context, world_ids: str) -> li
 async def get_world_name(bot: Bot, world_ids: str) -> str | None:
     """Get world name by world ID."""
     try:
-        gw2_api = Gw2Client(bot)
+        gw2_api = bot.gw2_client
         result = await gw2_api.call_api(f"worlds?ids={world_ids}")
         return result.get("name") if result else None
 
@@ -303,18 +504,22 @@ def is_private_message(ctx: commands.Context) -> bool:
 
 
 async def check_gw2_game_activity(bot: Bot, before: discord.Member, after: discord.Member) -> None:
-    """Check for GW2 game activity changes and manage sessions accordingly."""
+    """Check for GW2 game activity changes and manage sessions accordingly.
+
+    Members outside the guilds with session tracking on, or without an API key, are dropped
+    first by the presence prefilter, before their activities are looked at.
+    """
+    if not _presence_filter.is_tracked(after.guild.id, after.id):
+        return
+
     before_activity = _get_non_custom_activity(before.activities)
     after_activity = _get_non_custom_activity(after.activities)
+    before_is_gw2 = is_gw2_activity(before_activity)
+    after_is_gw2 = is_gw2_activity(after_activity)
 
-    if not _is_gw2_activity_detected(before_activity, after_activity):
+    if not before_is_gw2 and not after_is_gw2:
         return
 
-    before_is_gw2 = (
-        before_activity is not None and gw2_messages.GW2_FULL_NAME.lower() in str(before_activity.name).lower()
-    )
-    after_is_gw2 = after_activity is not None and gw2_messages.GW2_FULL_NAME.lower() in str(after_activity.name).lower()
-
     bot.log.debug(
         f"GW2 activity detected for {after.id}: "
         f"before={before_activity.name if before_activity else None}, "
@@ -326,7 +531,8 @@ async def check_gw2_game_activity(bot: Bot, before: discord.Member, after: disco
         return
 
     action = "start" if after_is_gw2 else "end"
-    await _handle_gw2_activity_change(bot, after, action)
+    _session_metrics.activity_changed(after.id)
+    _handle_gw2_activity_change(bot, after, action)
 
 
 def _get_non_custom_activity(activities) -> discord.Activity | None:
@@ -339,105 +545,174 @@ def _get_non_custom_activity(activities) -> discord.Activity | None:
 
 def _is_gw2_activity_detected(before_activity, after_activity) -> bool:
     """Check if Guild Wars 2 activity is detected in before or after states."""
-    return (after_activity is not None and gw2_messages.GW2_FULL_NAME.lower() in str(after_activity.name).lower()) or (
-        before_activity is not None and gw2_messages.GW2_FULL_NAME.lower() in str(before_activity.name).lower()
-    )
+    return is_gw2_activity(after_activity) or is_gw2_activity(before_activity)
 
 
 def is_session_ending(user_id: int) -> bool:
-    """Check if a session end is currently being processed for this user."""
-    if user_id not in _processing_sessions:
-        return False
-    state = _processing_sessions[user_id]
-    return state["current"] == "end" or state.get("pending") == "end"
+    """Check if a session end is being processed or scheduled for this user."""
+    return "end" in _session_jobs.get_pending_actions(user_id) or _session_actors.is_ending(user_id)
 
 
 def get_session_end_remaining_seconds(user_id: int) -> int | None:
-    """Get remaining seconds until end session delay completes, or None if not waiting."""
-    if user_id not in _processing_sessions:
+    """Get remaining seconds until the scheduled session end runs, or None if none is scheduled."""
+    run_at = _session_jobs.get_run_at(user_id, "end")
+    if run_at is None:
         return None
-    state = _processing_sessions[user_id]
-    started_at = state.get("delay_started_at")
-    if started_at is None or state["current"] != "end":
-        return None
-    end_delay = _gw2_settings.api_session_end_delay or 0
-    elapsed = (datetime.now() - started_at).total_seconds()
-    remaining = max(0, int(end_delay - elapsed))
-    return remaining
+    now = bot_utils.get_current_date_time().replace(tzinfo=None)
+    return max(0, int((run_at - now).total_seconds()))
 
 
-async def _handle_gw2_activity_change(
-    bot: Bot,
-    member: discord.Member,
-    action: str,
-) -> None:
-    """Handle GW2 activity changes and manage session tracking.
+def _handle_gw2_activity_change(bot: Bot, member: discord.Member, action: str) -> None:
+    """Hand a GW2 activity change to the session actor of the member.
 
-    Uses a per-user pending-action queue so that end events arriving while
-    a start is in progress are never silently dropped.  Duplicate events
-    (same action as current or already-pending) are dropped.
+    This only queues the action: the session actors run it in the background, one action
+    at a time per user, dropping duplicates and cancelling a queued action that is undone.
     """
-    if member.id in _processing_sessions:
-        state = _processing_sessions[member.id]
-        if action == state["current"] or action == state["pending"]:
-            bot.log.debug(f"Duplicate '{action}' event for user {member.id}, ignoring")
-            return
-        state["pending"] = action
-        bot.log.debug(f"Session operation in progress for user {member.id}, queuing '{action}' as pending")
-        return
+    _session_actors.post(bot, member, action)
 
-    _processing_sessions[member.id] = {"current": action, "pending": None}
-    try:
-        while action is not None:
-            _processing_sessions[member.id]["current"] = action
-            await _execute_session_action(bot, member, action)
-            action = _processing_sessions[member.id]["pending"]
-            _processing_sessions[member.id]["pending"] = None
-            if action is not None:
-                bot.log.debug(f"Processing pending '{action}' action for user {member.id}")
-    finally:
-        _processing_sessions.pop(member.id, None)
 
+async def _execute_session_action(bot: Bot, member: discord.Member, action: str) -> SessionState:
+    """Execute a single session action (start or end) as part of the next session batch.
 
-async def _execute_session_action(bot: Bot, member: discord.Member, action: str) -> None:
-    """Execute a single session action (start or end)."""
-    gw2_configs = Gw2ConfigsDal(bot.db_session, bot.log)
-    server_configs = await gw2_configs.get_gw2_server_configs(member.guild.id)
+    Returns:
+        The session state of the member once the action has run
+    """
+    state = await _session_batcher.submit(bot, member, action)
+    # Not tracked (no session config or API key), or the batch failed: no session to follow
+    return state or SessionState.IDLE
 
-    if not server_configs or not server_configs[0]["session"]:
-        bot.log.debug(f"Session tracking not enabled for guild {member.guild.id}, skipping")
-        return
+
+async def _process_session_batch(bot: Bot, intents: list[tuple[discord.Member, str]]) -> dict[int, SessionState]:
+    """Process a batch of session intents, at most one per user.
+
+    Server configs and API keys are read with one query each for the whole batch,
+    session ends and starts waiting behind scheduled jobs are stored with one insert,
+    and the remaining starts are snapshotted concurrently and written together.
+
+    Returns:
+        The session state of each tracked user once its intent has run; untracked users are left out
+    """
+    gw2_configs = Gw2ConfigsDal(bot.db_session, bot.log)
+    server_configs = await gw2_configs.get_gw2_servers_configs(list({member.guild.id for member, _ in intents}))
+    enabled_servers = {config["server_id"] for config in server_configs if config["session"]}
+
+    tracked = []
+    for member, action in intents:
+        if member.guild.id not in enabled_servers:
+            bot.log.debug(f"Session tracking not enabled for guild {member.guild.id}, skipping")
+        else:
+            tracked.append((member, action))
+    _session_metrics.count("untracked", len(intents) - len(tracked))
+    if not tracked:
+        return {}
 
     gw2_key_dal = Gw2KeyDal(bot.db_session, bot.log)
-    api_key_result = await gw2_key_dal.get_api_key_by_user(member.id)
+    api_keys = await gw2_key_dal.get_api_keys_by_users([member.id for member, _ in tracked])
+    api_keys = {row["user_id"]: row["key"] for row in api_keys}
 
-    if not api_key_result:
-        bot.log.debug(f"No GW2 API key found for user {member.id}, skipping session")
-        return
+    end_delay = _gw2_settings.api_session_end_delay or 0
+    jobs, starts, states = [], [], {}
+    for member, action in tracked:
+        api_key = api_keys.get(member.id)
+        if not api_key:
+            bot.log.debug(f"No GW2 API key found for user {member.id}, skipping session")
+            _session_metrics.count("untracked")
+            continue
+        pending_actions = _session_jobs.get_pending_actions(member.id)
+        if pending_actions and pending_actions[-1] == action:
+            bot.log.debug(f"Session {action} already scheduled for user {member.id}, ignoring")
+            _session_metrics.count("coalesced")
+        elif action == "end":
+            # End stats are fetched once the GW2 API cache has refreshed
+            bot.log.debug(f"Scheduling session end for user {member.id} in {end_delay}s")
+            jobs.append((member.id, "end", end_delay, 0))
+        elif pending_actions:
+            # A scheduled end (or its retry) must run first, so the start waits behind it
+            bot.log.debug(f"Scheduling GW2 session start for user {member.id} after its pending session jobs")
+            jobs.append((member.id, "start", 0.0, 0))
+        else:
+            starts.append((member, api_key))
+            continue
+        # Stored as a session job: the end waits for the GW2 API cache, the start for a pending end
+        states[member.id] = SessionState.ENDING_DELAY if action == "end" else SessionState.STARTING
+
+    await _session_jobs.schedule_many(bot, jobs)
+    if starts:
+        states.update(await _start_sessions(bot, starts))
+    return states
+
+
+async def _start_sessions(bot: Bot, starts: list[tuple[discord.Member, str]]) -> dict[int, SessionState]:
+    """Take the start snapshots of several members and insert their sessions together.
 
-    api_key = api_key_result[0]["key"]
+    Returns:
+        The session state of each member: playing once inserted, starting when its snapshot
+        is retried in a session job, idle when the insert failed
+    """
+    semaphore = asyncio.Semaphore(max(1, _gw2_settings.api_session_batch_concurrency))
 
-    if action == "start":
-        bot.log.debug(f"Starting GW2 session for user {member.id}")
-        await start_session(bot, member, api_key)
-    else:
-        bot.log.debug(f"Ending GW2 session for user {member.id}")
-        await end_session(bot, member, api_key)
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
+
+    snapshots = await asyncio.gather(*(_bounded(_take_session_snapshot(bot, api_key)) for _, api_key in starts))
+
+    policy = get_session_retry_policy()
+    sessions, started, retries, states = [], [], [], {}
+    for (member, api_key), session in zip(starts, snapshots, strict=True):
+        if session:
+            sessions.append(_stamp_session(member, session))
+            started.append((member, api_key))
+        else:
+            bot.log.warning(f"Failed to start session for user {member.id}: unable to fetch stats from GW2 API")
+            retries.append((member.id, "start", policy.compute_delay(1), 1))
+            states[member.id] = SessionState.STARTING
+    _session_metrics.count("retries_scheduled", len(retries))
+    if retries:
+        bot.log.warning(
+            f"Scheduling background retry for {len(retries)} start sessions "
+            f"({policy.max_attempts} attempts, {policy.base_delay}s base delay)"
+        )
+        await _session_jobs.schedule_many(bot, retries)
+    if not sessions:
+        return states
+
+    bot.log.debug(f"Attempting to insert {len(sessions)} start sessions into DB")
+    started_at = time.monotonic()
+    try:
+        gw2_session_dal = Gw2SessionsDal(bot.db_session, bot.log)
+        session_ids = await gw2_session_dal.insert_start_sessions(sessions, _gw2_settings.api_session_history)
+    except Exception as e:
+        bot.log.error(f"Failed to insert {len(sessions)} start sessions into DB: {e}")
+        _session_metrics.count("db_errors")
+        states.update(dict.fromkeys((member.id for member, _ in started), SessionState.IDLE))
+        return states
+    _session_metrics.observe("db_write", time.monotonic() - started_at)
+    for member, _ in started:
+        _session_metrics.session_written(member.id, "start")
+        states[member.id] = SessionState.PLAYING
+    await asyncio.gather(*(_bounded(insert_start_char_deaths(bot, m, key, session_ids[m.id])) for m, key in started))
+    return states
 
 
 async def start_session(bot: Bot, member: discord.Member, api_key: str) -> None:
     """Start a new GW2 session for a member."""
-    session = await get_user_stats(bot, api_key)
+    session = await _take_session_snapshot(bot, api_key)
     if not session:
         bot.log.warning(f"Failed to start session for user {member.id}: unable to fetch stats from GW2 API")
-        task = asyncio.create_task(_retry_session_later(bot, member, api_key, "start"))
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
+        await _schedule_session_retry(bot, member, "start")
         return
 
     await _do_start_session(bot, member, api_key, session)
 
 
+def _stamp_session(member: discord.Member, session: dict) -> dict:
+    """Add the user id and snapshot date to a session snapshot, keys sorted."""
+    session["user_id"] = member.id
+    session["date"] = bot_utils.convert_datetime_to_str_short(bot_utils.get_current_date_time())
+    return _sort_session_dict(session)
+
+
 def _sort_session_dict(session: dict) -> dict:
     """Sort session dict keys alphabetically with 'date' first."""
     date_value = session.pop("date", None)
@@ -449,41 +724,46 @@ def _sort_session_dict(session: dict) -> dict:
 
 async def _do_start_session(bot: Bot, member: discord.Member, api_key: str, session: dict) -> None:
     """Execute start session DB operations."""
-    session["user_id"] = member.id
-    session["date"] = bot_utils.convert_datetime_to_str_short(bot_utils.get_current_date_time())
-    session = _sort_session_dict(session)
+    session = _stamp_session(member, session)
 
     bot.log.debug(f"Attempting to insert start session into DB for user {member.id}")
+    started_at = time.monotonic()
     try:
         gw2_session_dal = Gw2SessionsDal(bot.db_session, bot.log)
-        session_id = await gw2_session_dal.insert_start_session(session)
+        session_id = await gw2_session_dal.insert_start_session(session, _gw2_settings.api_session_history)
         bot.log.debug(f"Successfully inserted start session {session_id} for user {member.id}")
     except Exception as e:
         bot.log.error(f"Failed to insert start session into DB for user {member.id}: {e}")
+        _session_metrics.count("db_errors")
         return
+    _session_metrics.observe("db_write", time.monotonic() - started_at)
+    _session_metrics.session_written(member.id, "start")
     await insert_start_char_deaths(bot, member, api_key, session_id)
 
 
 async def end_session(bot: Bot, member: discord.Member, api_key: str, *, skip_delay: bool = False) -> None:
     """End a GW2 session for a member.
 
-    Waits for the GW2 API cache to refresh before fetching end stats,
-    so that wallet/achievement values reflect in-game changes.
+    The end stats are fetched once the GW2 API cache has refreshed, so that wallet/achievement
+    values reflect in-game changes: the end is stored as a session job due after
+    api_session_end_delay and this returns right away.
     Set skip_delay=True for user-facing commands where the user is actively waiting.
     """
     end_delay = _gw2_settings.api_session_end_delay
     if not skip_delay and end_delay and end_delay > 0:
-        bot.log.debug(f"Waiting {end_delay}s for GW2 API cache to refresh before ending session for user {member.id}")
-        if member.id in _processing_sessions:
-            _processing_sessions[member.id]["delay_started_at"] = datetime.now()
-        await asyncio.sleep(end_delay)
+        pending_actions = _session_jobs.get_pending_actions(member.id)
+        if pending_actions and pending_actions[-1] == "end":
+            bot.log.debug(f"Session end already scheduled for user {member.id}, ignoring")
+            _session_metrics.count("coalesced")
+            return
+        bot.log.debug(f"Scheduling session end for user {member.id} in {end_delay}s, after the GW2 API cache refresh")
+        await _session_jobs.schedule(bot, member.id, "end", end_delay)
+        return
 
-    session = await get_user_stats(bot, api_key)
+    session = await _take_session_snapshot(bot, api_key)
     if not session:
         bot.log.warning(f"Failed to end session for user {member.id}: unable to fetch stats from GW2 API")
-        task = asyncio.create_task(_retry_session_later(bot, member, api_key, "end"))
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
+        await _schedule_session_retry(bot, member, "end")
         return
 
     await _do_end_session(bot, member, api_key, session)
@@ -491,71 +771,158 @@ async def end_session(bot: Bot, member: discord.Member, api_key: str, *, skip_de
 
 async def _do_end_session(bot: Bot, member: discord.Member, api_key: str, session: dict) -> None:
     """Execute end session DB operations."""
-    session["user_id"] = member.id
-    session["date"] = bot_utils.convert_datetime_to_str_short(bot_utils.get_current_date_time())
-    session = _sort_session_dict(session)
+    session = _stamp_session(member, session)
 
     bot.log.debug(f"Attempting to update end session in DB for user {member.id}")
+    started_at = time.monotonic()
     try:
         gw2_session_dal = Gw2SessionsDal(bot.db_session, bot.log)
         session_id = await gw2_session_dal.update_end_session(session)
     except Exception as e:
         bot.log.error(f"Failed to update end session in DB for user {member.id}: {e}")
+        _session_metrics.count("db_errors")
         return
+    _session_metrics.observe("db_write", time.monotonic() - started_at)
     if session_id is None:
         bot.log.warning(f"No active session found for user {member.id}, skipping end session chars")
+        _session_metrics.count("no_active_session")
         return
+    _session_metrics.session_written(member.id, "end")
     bot.log.debug(f"Successfully updated end session {session_id} for user {member.id}")
     await update_end_char_deaths(bot, member, api_key, session_id)
 
 
-async def _retry_session_later(bot: Bot, member: discord.Member, api_key: str, session_type: str) -> None:
-    """Background task: wait and retry session, DM user on final failure."""
-    bg_delay = _gw2_settings.api_session_retry_bg_delay
-    max_attempts = _gw2_settings.api_retry_max_attempts
+def get_session_retry_policy() -> RetryPolicy:
+    """Build the retry policy for background session snapshot retries."""
+    return RetryPolicy(
+        max_attempts=_gw2_settings.api_retry_max_attempts,
+        base_delay=_gw2_settings.api_session_retry_bg_delay,
+        max_delay=_gw2_settings.api_session_retry_bg_max_delay,
+        max_elapsed=None,
+    )
+
+
+async def _take_session_snapshot(bot: Bot, api_key: str) -> dict | None:
+    """Take a session snapshot, telling the session jobs whether the GW2 API answered it."""
+    started_at = time.monotonic()
+    session = await get_user_stats(bot, api_key)
+    _session_metrics.observe("snapshot", time.monotonic() - started_at)
+    if session:
+        _session_jobs.api_answered()
+    else:
+        _session_jobs.api_failed()
+        _session_metrics.count("snapshot_failures")
+    return session
 
+
+async def _schedule_session_retry(bot: Bot, member: discord.Member, session_type: str) -> None:
+    """Store a background retry of a session snapshot as a session job, one per user and action."""
+    pending_actions = _session_jobs.get_pending_actions(member.id)
+    if pending_actions and pending_actions[-1] == session_type:
+        bot.log.debug(f"Session {session_type} already scheduled for user {member.id}, not adding a retry")
+        _session_metrics.count("coalesced")
+        return
+    _session_metrics.count("retries_scheduled")
+    policy = get_session_retry_policy()
     bot.log.warning(
         f"Scheduling background retry for {session_type} session "
-        f"for user {member.id} ({max_attempts} attempts, {bg_delay}s delay)"
+        f"for user {member.id} ({policy.max_attempts} attempts, {policy.base_delay}s base delay)"
     )
+    await _session_jobs.schedule(bot, member.id, session_type, policy.compute_delay(1), attempt=1)
+
+
+async def _run_actor_session_job(bot: Bot, job: dict) -> float | None:
+    """Run a stored session job, moving the session actor of its user through the job states."""
+    user_id, action = job["user_id"], job["action"]
+    now = bot_utils.get_current_date_time().replace(tzinfo=None)
+    _session_metrics.observe("job_lag", (now - job["run_at"]).total_seconds())
+    if action == "end" and not job["attempt"]:
+        _session_metrics.end_job_started(user_id)
+    _session_actors.job_started(user_id, action)
+    retry_delay = None
+    try:
+        retry_delay = await _run_session_job(bot, job)
+    finally:
+        _session_actors.job_finished(user_id, action, retrying=retry_delay is not None)
+    return retry_delay
 
-    for attempt in range(1, max_attempts + 1):
-        await asyncio.sleep(bg_delay)
 
-        session = await get_user_stats(bot, api_key)
-        if session:
+async def _run_session_job(bot: Bot, job: dict) -> float | None:
+    """Run a stored session job: take the start or end snapshot of a user's session.
+
+    Returns:
+        None when the job is done, or the seconds to wait before retrying it
+    """
+    user_id, session_type, attempt = job["user_id"], job["action"], job["attempt"]
+    gw2_key_dal = Gw2KeyDal(bot.db_session, bot.log)
+    api_key_result = await gw2_key_dal.get_api_key_by_user(user_id)
+    if not api_key_result:
+        bot.log.debug(f"No GW2 API key found for user {user_id}, dropping {session_type} session job")
+        return None
+    api_key = api_key_result[0]["key"]
+
+    user = bot.get_user(user_id)
+    if user is None:
+        try:
+            user = await bot.fetch_user(user_id)
+        except discord.HTTPException:
+            bot.log.warning(f"Could not find user {user_id}, dropping {session_type} session job")
+            return None
+
+    policy = get_session_retry_policy()
+    session = await _take_session_snapshot(bot, api_key)
+    if session:
+        if attempt:
             bot.log.info(
                 f"Background retry succeeded for {session_type} session "
-                f"for user {member.id} on attempt {attempt}/{max_attempts}"
+                f"for user {user_id} on attempt {attempt}/{policy.max_attempts}"
             )
-            if session_type == "start":
-                await _do_start_session(bot, member, api_key, session)
-            else:
-                await _do_end_session(bot, member, api_key, session)
-            return
+        if session_type == "start":
+            await _do_start_session(bot, user, api_key, session)
+        else:
+            await _do_end_session(bot, user, api_key, session)
+        return None
 
+    if attempt == 0:
+        bot.log.warning(
+            f"Failed to {session_type} session for user {user_id}: unable to fetch stats from GW2 API, "
+            f"scheduling background retry ({policy.max_attempts} attempts, {policy.base_delay}s base delay)"
+        )
+        _session_metrics.count("retries_scheduled")
+        return policy.compute_delay(1)
+    if attempt < policy.max_attempts:
         bot.log.warning(
-            f"Background retry {attempt}/{max_attempts} failed for {session_type} session for user {member.id}"
+            f"Background retry {attempt}/{policy.max_attempts} failed for {session_type} session for user {user_id}"
         )
+        _session_metrics.count("retries_scheduled")
+        return policy.compute_delay(attempt + 1)
 
-    bot.log.error(f"All background retries exhausted for {session_type} session for user {member.id}")
+    bot.log.error(f"All background retries exhausted for {session_type} session for user {user_id}")
+    _session_metrics.count("retries_exhausted")
     try:
-        await member.send(gw2_messages.SESSION_API_DOWN_DM)
+        await user.send(gw2_messages.SESSION_API_DOWN_DM)
     except discord.HTTPException:
-        bot.log.warning(f"Could not DM user {member.id} about GW2 API failure")
+        bot.log.warning(f"Could not DM user {user_id} about GW2 API failure")
+    return None
+
 
+async def get_user_stats(bot: Bot, api_key: str, priority: RequestPriority = RequestPriority.BACKGROUND) -> dict | None:
+    """Get comprehensive user statistics from GW2 API.
 
-async def get_user_stats(bot: Bot, api_key: str) -> dict | None:
-    """Get comprehensive user statistics from GW2 API."""
-    gw2_api = Gw2Client(bot)
+    Session snapshots run in the background, so they yield API capacity to user commands
+    unless a command asks for them with RequestPriority.INTERACTIVE.
+    """
+    gw2_api = bot.gw2_client
 
     try:
-        achievement_ids = ",".join(str(k) for k in ACHIEVEMENT_MAPPING)
-        account_data, wallet_data, achievements_data = await asyncio.gather(
-            gw2_api.call_api("account", api_key),
-            gw2_api.call_api("account/wallet", api_key),
-            gw2_api.call_api(f"account/achievements?ids={achievement_ids}", api_key),
+        account_data, wallet_data, (achievements, _) = await asyncio.gather(
+            gw2_api.call_api("account", api_key, priority=priority),
+            gw2_api.call_api("account/wallet", api_key, priority=priority),
+            gw2_api.fetch_many(
+                "account/achievements", list(ACHIEVEMENT_MAPPING), api_key, priority=priority, strict=True
+            ),
         )
+        achievements_data = list(achievements.values())
 
     except Exception as e:
         bot.log.error(f"Error fetching user stats: {e}")
@@ -609,8 +976,8 @@ async def insert_start_char_deaths(bot: Bot, member: discord.Member, api_key: st
     """Insert start session character death data."""
     bot.log.debug(f"Attempting to insert start char deaths for session {session_id}, user {member.id}")
     try:
-        gw2_api = Gw2Client(bot)
-        characters_data = await gw2_api.call_api("characters?ids=all", api_key)
+        gw2_api = bot.gw2_client
+        characters_data = await gw2_api.call_api("characters?ids=all", api_key, priority=RequestPriority.BACKGROUND)
 
         gw2_session_chars_dal = Gw2SessionCharDeathsDal(bot.db_session, bot.log)
         await gw2_session_chars_dal.insert_start_char_deaths(session_id, member.id, characters_data)
@@ -624,8 +991,8 @@ async def update_end_char_deaths(bot: Bot, member: discord.Member, api_key: str,
     """Update end session character death data."""
     bot.log.debug(f"Attempting to update end char deaths for session {session_id}, user {member.id}")
     try:
-        gw2_api = Gw2Client(bot)
-        characters_data = await gw2_api.call_api("characters?ids=all", api_key)
+        gw2_api = bot.gw2_client
+        characters_data = await gw2_api.call_api("characters?ids=all", api_key, priority=RequestPriority.BACKGROUND)
 
         gw2_session_chars_dal = Gw2SessionCharDeathsDal(bot.db_session, bot.log)
         await gw2_session_chars_dal.update_end_char_deaths(session_id, member.id, characters_data)
@@ -821,7 +1188,7 @@ async def get_worlds_ids(ctx: commands.Context) -> tuple[bool, list[dict] | None
     """
     try:
         await ctx.message.channel.typing()
-        gw2_api = Gw2Client(ctx.bot)
+        gw2_api = ctx.bot.gw2_client
         results = await gw2_api.call_api("worlds?ids=all")
         return True, results
     except Exception as e:
@@ -85,8 +85,8 @@ def db_url():
 }
 
 _TRUNCATE_ALL = sa.text(
-    "TRUNCATE gw2.gw2_session_char_deaths, gw2.gw2_sessions, gw2.gw2_keys, gw2.gw2_configs, "
-    "dice_rolls, profanity_filters, custom_commands, servers, bot_configs "
+    "TRUNCATE gw2.gw2_session_char_deaths, gw2.gw2_sessions, gw2.gw2_keys, gw2.gw2_configs, gw2.gw2_static_data, "
+    "gw2.gw2_session_jobs, gw2.gw2_session_samples, dice_rolls, profanity_filters, custom_commands, servers, bot_configs "
     "RESTART IDENTITY CASCADE"
 )
 
@@ -1,4 +1,5 @@
 import pytest
+from datetime import UTC, datetime, timedelta
 from sqlalchemy import text
 
 pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
@@ -21,6 +22,9 @@
     "gw2_configs",
     "gw2_sessions",
     "gw2_session_char_deaths",
+    "gw2_static_data",
+    "gw2_session_jobs",
+    "gw2_session_samples",
 ]
 
 EXPECTED_PUBLIC_TRIGGERS = [
@@ -37,6 +41,8 @@
     "before_update_gw2_configs_tr",
     "before_update_gw2_sessions_tr",
     "before_update_gw2_session_char_deaths_tr",
+    "before_update_gw2_static_data_tr",
+    "before_update_gw2_session_jobs_tr",
 ]
 
 
@@ -137,7 +143,7 @@ async def test_alembic_version_at_head(db_session):
         text("SELECT version_num FROM alembic_version"),
     )
     assert len(rows) == 1
-    assert rows[0]["version_num"] == "0011"
+    assert rows[0]["version_num"] == "0018"
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -491,33 +497,38 @@ async def test_gw2_configs_cascade_delete(db_session):
 
 
 # ──────────────────────────────────────────────────────────────────────
-# 0009 — gw2_sessions JSONB columns (gw2 schema)
+# 0009 — gw2_sessions snapshot columns (gw2 schema), packed by 0016
 # ──────────────────────────────────────────────────────────────────────
 
 
-async def test_gw2_sessions_jsonb_columns(db_session):
+async def test_gw2_sessions_snapshot_columns(db_session):
     rows = await _fetch_rows(
         db_session,
         text(
-            "SELECT column_name, data_type, is_nullable "
+            "SELECT column_name, data_type, udt_name, is_nullable "
             "FROM information_schema.columns "
             "WHERE table_schema = 'gw2' AND table_name = 'gw2_sessions' "
-            "AND column_name IN ('start', 'end')"
+            "AND column_name IN ('layout', 'start', 'end', 'start_date', 'end_date')"
         ),
     )
     cols = {r["column_name"]: r for r in rows}
-    assert cols["start"]["data_type"] == "jsonb"
+    assert cols["layout"]["data_type"] == "smallint"
+    assert cols["layout"]["is_nullable"] == "NO"
+    assert cols["start"]["data_type"] == "ARRAY"
+    assert cols["start"]["udt_name"] == "_int8"
     assert cols["start"]["is_nullable"] == "NO"
     assert cols["end"]["data_type"] == "jsonb"
     assert cols["end"]["is_nullable"] == "YES"
+    assert cols["start_date"]["is_nullable"] == "NO"
+    assert cols["end_date"]["is_nullable"] == "YES"
 
 
-async def test_gw2_sessions_insert_and_read_jsonb(db_session):
+async def test_gw2_sessions_insert_and_read_packed(db_session):
     await _execute(
         db_session,
         text(
-            "INSERT INTO gw2.gw2_sessions (user_id, acc_name, start) "
-            """VALUES (8001, 'TestAcc.9999', '{"gold": 100, "karma": 5000}'::jsonb)"""
+            "INSERT INTO gw2.gw2_sessions (user_id, acc_name, layout, start, start_date) "
+            "VALUES (8001, 'TestAcc.9999', 1, ARRAY[100, 5000], '2026-10-18 12:00:00')"
         ),
     )
     rows = await _fetch_rows(
@@ -525,8 +536,7 @@ async def test_gw2_sessions_insert_and_read_jsonb(db_session):
         text("SELECT * FROM gw2.gw2_sessions WHERE user_id = 8001"),
     )
     assert len(rows) == 1
-    assert rows[0]["start"]["gold"] == 100
-    assert rows[0]["start"]["karma"] == 5000
+    assert rows[0]["start"] == [100, 5000]
     assert rows[0]["end"] is None
     assert rows[0]["id"] is not None
 
@@ -536,19 +546,18 @@ async def test_gw2_sessions_insert_and_read_jsonb(db_session):
 # ──────────────────────────────────────────────────────────────────────
 
 
-async def test_gw2_session_char_deaths_fk_to_sessions(db_session):
+async def test_gw2_session_char_deaths_no_fk_to_partitioned_sessions(db_session):
+    # 0015 dropped the FK: a partitioned gw2_sessions can't be referenced by id alone
     rows = await _fetch_rows(
         db_session,
         text(
-            "SELECT ccu.table_name AS foreign_table "
+            "SELECT tc.constraint_name "
             "FROM information_schema.table_constraints tc "
-            "JOIN information_schema.constraint_column_usage ccu "
-            "  ON tc.constraint_name = ccu.constraint_name "
             "WHERE tc.table_schema = 'gw2' AND tc.table_name = 'gw2_session_char_deaths' "
             "AND tc.constraint_type = 'FOREIGN KEY'"
         ),
     )
-    assert any(r["foreign_table"] == "gw2_sessions" for r in rows)
+    assert rows == []
 
 
 async def test_gw2_session_char_deaths_columns(db_session):
@@ -578,8 +587,8 @@ async def test_gw2_session_char_deaths_insert_and_read(db_session):
     await _execute(
         db_session,
         text(
-            "INSERT INTO gw2.gw2_sessions (user_id, acc_name, start) "
-            """VALUES (8002, 'Char.1111', '{}'::jsonb)"""
+            "INSERT INTO gw2.gw2_sessions (user_id, acc_name, layout, start, start_date) "
+            "VALUES (8002, 'Char.1111', 1, '{}', '2026-10-18 12:00:00')"
         ),
     )
     session_rows = await _fetch_rows(
@@ -606,6 +615,119 @@ async def test_gw2_session_char_deaths_insert_and_read(db_session):
     assert rows[0]["end"] is None
 
 
+async def test_gw2_session_char_deaths_session_id_name_index(db_session):
+    rows = await _fetch_rows(
+        db_session,
+        text(
+            "SELECT indexdef FROM pg_indexes "
+            "WHERE schemaname = 'gw2' AND indexname = 'ix_gw2_session_char_deaths_session_id_name'"
+        ),
+    )
+    assert len(rows) == 1
+    assert "(session_id, name)" in rows[0]["indexdef"]
+
+
+# ──────────────────────────────────────────────────────────────────────
+# 0015 — gw2_sessions partitioned by month
+# ──────────────────────────────────────────────────────────────────────
+
+
+async def test_gw2_sessions_is_range_partitioned(db_session):
+    rows = await _fetch_rows(
+        db_session,
+        text(
+            "SELECT pg_get_partkeydef('gw2.gw2_sessions'::regclass) AS partkey, "
+            "pg_get_indexdef('gw2.ix_gw2_sessions_user_id_created_at'::regclass) AS indexdef"
+        ),
+    )
+    assert rows[0]["partkey"] == "RANGE (created_at)"
+    assert "(user_id, created_at DESC)" in rows[0]["indexdef"]
+
+
+async def test_gw2_sessions_current_and_next_month_partitions(db_session):
+    rows = await _fetch_rows(
+        db_session,
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'gw2.gw2_sessions'::regclass"
+        ),
+    )
+    partitions = {r["relname"] for r in rows}
+    now = datetime.now(UTC)
+    next_month = (now.replace(day=1) + timedelta(days=32)).replace(day=1)
+    assert f"gw2_sessions_p{now:%Y%m}" in partitions
+    assert f"gw2_sessions_p{next_month:%Y%m}" in partitions
+
+
+async def test_gw2_sessions_partition_functions(db_session):
+    created = await _fetch_rows(db_session, text("SELECT gw2.create_gw2_sessions_partition('2001-02-15') AS name"))
+    assert created[0]["name"] == "gw2_sessions_p200102"
+    dropped = await _fetch_rows(db_session, text("SELECT gw2.drop_gw2_sessions_partitions('2001-03-01') AS name"))
+    assert [r["name"] for r in dropped] == ["gw2_sessions_p200102"]
+
+
+# ──────────────────────────────────────────────────────────────────────
+# 0017 — gw2_session_samples time series
+# ──────────────────────────────────────────────────────────────────────
+
+
+async def test_gw2_session_samples_primary_key_and_brin_index(db_session):
+    rows = await _fetch_rows(
+        db_session,
+        text(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = 'gw2' AND tablename = 'gw2_session_samples'"
+        ),
+    )
+    indexes = {r["indexname"]: r["indexdef"] for r in rows}
+    assert "USING brin (ts)" in indexes["ix_gw2_session_samples_ts"]
+    assert "(user_id, metric_id, ts)" in indexes["gw2_session_samples_pkey"]
+
+
+# ──────────────────────────────────────────────────────────────────────
+# 0018 — gw2_sessions default partition
+# ──────────────────────────────────────────────────────────────────────
+
+
+async def _insert_session_at(db_session, user_id: int, created_at: datetime):
+    await _execute(
+        db_session,
+        text(
+            "INSERT INTO gw2.gw2_sessions (user_id, acc_name, layout, start, start_date, created_at) "
+            "VALUES (:user_id, 'Default.1818', 1, ARRAY[1]::bigint[], :start_date, :created_at)"
+        ).bindparams(user_id=user_id, start_date=str(created_at), created_at=created_at),
+    )
+
+
+async def _session_partition(db_session, user_id: int):
+    rows = await _fetch_rows(
+        db_session,
+        text("SELECT tableoid::regclass::text AS partition FROM gw2.gw2_sessions WHERE user_id = :user_id").bindparams(
+            user_id=user_id
+        ),
+    )
+    return [r["partition"] for r in rows]
+
+
+async def test_gw2_sessions_without_month_partition_go_to_default(db_session):
+    await _insert_session_at(db_session, 18001, datetime(2001, 4, 10, 12, 0, 0))
+    assert await _session_partition(db_session, 18001) == ["gw2.gw2_sessions_default"]
+
+    # Creating the month partition moves its sessions out of the default partition
+    created = await _fetch_rows(db_session, text("SELECT gw2.create_gw2_sessions_partition('2001-04-01') AS name"))
+    assert created[0]["name"] == "gw2_sessions_p200104"
+    assert await _session_partition(db_session, 18001) == ["gw2.gw2_sessions_p200104"]
+
+    dropped = await _fetch_rows(db_session, text("SELECT gw2.drop_gw2_sessions_partitions('2001-05-01') AS name"))
+    assert [r["name"] for r in dropped] == ["gw2_sessions_p200104"]
+    assert await _session_partition(db_session, 18001) == []
+
+
+async def test_gw2_sessions_expired_default_rows_deleted(db_session):
+    await _insert_session_at(db_session, 18002, datetime(2001, 7, 10, 12, 0, 0))
+    await _fetch_rows(db_session, text("SELECT gw2.drop_gw2_sessions_partitions('2001-08-01') AS name"))
+    assert await _session_partition(db_session, 18002) == []
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Trigger functionality — updated_at auto-updates
 # ──────────────────────────────────────────────────────────────────────
@@ -44,3 +44,11 @@ async def test_unique_server_id_constraint(db_session, log, server):
     await dal.insert_gw2_server_configs(SERVER_ID)
     with pytest.raises(IntegrityError):
         await dal.insert_gw2_server_configs(SERVER_ID)
+
+
+async def test_get_session_server_ids(db_session, log, server):
+    dal = Gw2ConfigsDal(db_session, log)
+    await dal.insert_gw2_server_configs(SERVER_ID)
+    assert await dal.get_session_server_ids() == []
+    await dal.update_gw2_session_config(SERVER_ID, True, 42)
+    assert await dal.get_session_server_ids() == [{"server_id": SERVER_ID}]
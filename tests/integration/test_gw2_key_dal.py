@@ -74,3 +74,22 @@ async def test_get_api_key_returns_empty_for_missing(db_session, log):
     dal = Gw2KeyDal(db_session, log)
     results = await dal.get_api_key("NONEXISTENT")
     assert len(results) == 0
+
+
+async def test_get_api_keys_by_users(db_session, log):
+    dal = Gw2KeyDal(db_session, log)
+    await dal.insert_api_key(_make_key_args())
+    await dal.insert_api_key(_make_key_args(user_id=USER_ID + 1, api_key="DDDD-EEEE-FFFF"))
+    results = await dal.get_api_keys_by_users([USER_ID, USER_ID + 1, 999999])
+    assert sorted((r["user_id"], r["key"]) for r in results) == [
+        (USER_ID, "AAAA-BBBB-CCCC"),
+        (USER_ID + 1, "DDDD-EEEE-FFFF"),
+    ]
+
+
+async def test_get_user_ids(db_session, log):
+    dal = Gw2KeyDal(db_session, log)
+    await dal.insert_api_key(_make_key_args())
+    await dal.insert_api_key(_make_key_args(user_id=401, api_key="DDDD-EEEE-FFFF"))
+    results = await dal.get_user_ids()
+    assert sorted(r["user_id"] for r in results) == [USER_ID, 401]
@@ -1,6 +1,7 @@
 import pytest
+import time
+from datetime import date
 from ddcdatabases import DBUtilsAsync
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
 from src.database.dal.gw2.gw2_session_chars_dal import Gw2SessionCharDeathsDal
 from src.database.dal.gw2.gw2_sessions_dal import Gw2SessionsDal
@@ -9,6 +10,7 @@
 
 pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
 
+SESSION_DATE = "2026-10-18 12:00:00"
 USER_ID = 600
 API_KEY = "TEST-API-KEY-1234"
 
@@ -20,6 +22,7 @@ async def test_insert_start_char_deaths(db_session, log):
 
     session_id = await sessions_dal.insert_start_session(
         {
+            "date": SESSION_DATE,
             "user_id": USER_ID,
             "acc_name": "CharTest.1111",
         }
@@ -48,6 +51,7 @@ async def test_update_end_char_deaths(db_session, log):
 
     session_id = await sessions_dal.insert_start_session(
         {
+            "date": SESSION_DATE,
             "user_id": USER_ID,
             "acc_name": "EndTest.2222",
         }
@@ -76,6 +80,7 @@ async def test_get_char_deaths(db_session, log):
 
     session_id = await sessions_dal.insert_start_session(
         {
+            "date": SESSION_DATE,
             "user_id": USER_ID,
             "acc_name": "GetChars.3333",
         }
@@ -97,6 +102,7 @@ async def test_insert_char_stores_correct_data(db_session, log):
 
     session_id = await sessions_dal.insert_start_session(
         {
+            "date": SESSION_DATE,
             "user_id": USER_ID,
             "acc_name": "DataCheck.4444",
         }
@@ -121,16 +127,102 @@ async def test_insert_char_stores_correct_data(db_session, log):
     assert results[0]["start"] == 42
 
 
-async def test_fk_constraint_requires_session(db_session, log):
-    """Inserting a char with a non-existent session_id should fail with FK violation."""
+def _make_characters(count: int, deaths: int = 0) -> list[dict]:
+    return [{"name": f"Char {i}", "profession": "Warrior", "deaths": deaths + i} for i in range(count)]
+
+
+async def test_insert_start_char_deaths_large_account(db_session, log):
+    """All characters of a large account are written by the single bulk insert."""
+    sessions_dal = Gw2SessionsDal(db_session, log)
+    session_id = await sessions_dal.insert_start_session(
+        {"date": SESSION_DATE, "user_id": USER_ID, "acc_name": "Bulk.5555"}
+    )
+
+    chars_dal = Gw2SessionCharDeathsDal(db_session, log)
+    await chars_dal.insert_start_char_deaths(session_id, USER_ID, _make_characters(70))
+
+    results = await chars_dal.get_char_deaths(USER_ID)
+    assert len(results) == 70
+    assert {r["name"]: r["start"] for r in results}["Char 69"] == 69
+
+
+async def test_update_end_char_deaths_large_account(db_session, log):
+    """The set-based update sets the end deaths of every character and leaves other sessions alone."""
+    sessions_dal = Gw2SessionsDal(db_session, log)
+    chars_dal = Gw2SessionCharDeathsDal(db_session, log)
+    other_session_id = await sessions_dal.insert_start_session(
+        {"date": SESSION_DATE, "user_id": USER_ID + 1, "acc_name": "Other.7777"}
+    )
+    await chars_dal.insert_start_char_deaths(other_session_id, USER_ID + 1, _make_characters(3))
+    session_id = await sessions_dal.insert_start_session(
+        {"date": SESSION_DATE, "user_id": USER_ID, "acc_name": "Bulk.7777"}
+    )
+    await chars_dal.insert_start_char_deaths(session_id, USER_ID, _make_characters(70))
+
+    await chars_dal.update_end_char_deaths(session_id, USER_ID, _make_characters(70, deaths=100))
+
+    results = await chars_dal.get_char_deaths(USER_ID)
+    assert all(r["end"] == r["start"] + 100 for r in results)
+    assert all(r["end"] is None for r in await chars_dal.get_char_deaths(USER_ID + 1))
+
+
+async def test_benchmark_bulk_vs_per_row_insert(db_session, log):
+    """Compare the bulk insert with the previous one-insert-per-character path.
+
+    Run with -s to see the timings: uv run pytest tests/integration -k benchmark -s
+    """
+    sessions_dal = Gw2SessionsDal(db_session, log)
+    chars_dal = Gw2SessionCharDeathsDal(db_session, log)
     db_utils = DBUtilsAsync(db_session)
-    with pytest.raises(IntegrityError):
-        stmt = Gw2SessionCharDeaths(
-            session_id=uuid4(),
-            user_id=USER_ID,
-            name="Orphan",
-            profession="Mesmer",
-            start=0,
-            end=None,
+    timings = {}
+
+    for count in (10, 70, 200):
+        characters = _make_characters(count)
+
+        session_id = await sessions_dal.insert_start_session(
+            {"date": SESSION_DATE, "user_id": USER_ID, "acc_name": "PerRow.6666"}
         )
-        await db_utils.insert(stmt)
+        started = time.perf_counter()
+        for char in characters:
+            await db_utils.insert(
+                Gw2SessionCharDeaths(
+                    session_id=session_id,
+                    user_id=USER_ID,
+                    name=char["name"],
+                    profession=char["profession"],
+                    start=char["deaths"],
+                    end=None,
+                )
+            )
+        per_row = time.perf_counter() - started
+
+        session_id = await sessions_dal.insert_start_session(
+            {"date": SESSION_DATE, "user_id": USER_ID, "acc_name": "Bulk.6666"}
+        )
+        started = time.perf_counter()
+        await chars_dal.insert_start_char_deaths(session_id, USER_ID, characters)
+        bulk = time.perf_counter() - started
+
+        assert len(await chars_dal.get_char_deaths(USER_ID)) == count
+        timings[count] = (per_row, bulk)
+
+    for count, (per_row, bulk) in timings.items():
+        print(f"{count:>4} characters: per-row {per_row * 1000:8.2f} ms, bulk {bulk * 1000:8.2f} ms")
+    per_row, bulk = timings[200]
+    assert bulk < per_row
+
+
+async def test_orphaned_char_deaths_removed_with_expired_partitions(db_session, log):
+    """Character rows whose session was in a dropped partition are deleted with it."""
+    sessions_dal = Gw2SessionsDal(db_session, log)
+    chars_dal = Gw2SessionCharDeathsDal(db_session, log)
+    session_id = await sessions_dal.insert_start_session(
+        {"date": SESSION_DATE, "user_id": USER_ID, "acc_name": "Live.8888"}
+    )
+    await chars_dal.insert_start_char_deaths(session_id, USER_ID, _make_characters(2))
+    await chars_dal.insert_start_char_deaths(uuid4(), USER_ID + 1, _make_characters(2))
+
+    await sessions_dal.drop_partitions_before(date(2001, 1, 1))
+
+    assert len(await chars_dal.get_char_deaths(USER_ID)) == 2
+    assert await chars_dal.get_char_deaths(USER_ID + 1) == []
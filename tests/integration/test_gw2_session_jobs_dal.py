@@ -0,0 +1,84 @@
+import pytest
+from datetime import datetime, timedelta
+from src.database.dal.gw2.gw2_session_jobs_dal import Gw2SessionJobsDal
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+async def test_insert_and_get_jobs(db_session, log):
+    dal = Gw2SessionJobsDal(db_session, log)
+    job_id = await dal.insert_job(1, "end", NOW)
+    results = await dal.get_jobs()
+    assert len(results) == 1
+    assert str(results[0]["id"]) == str(job_id)
+    assert results[0]["action"] == "end"
+    assert results[0]["attempt"] == 0
+    assert results[0]["claimed_at"] is None
+
+
+async def test_claim_due_jobs_skips_future_jobs(db_session, log):
+    dal = Gw2SessionJobsDal(db_session, log)
+    await dal.insert_job(1, "end", NOW - timedelta(seconds=1))
+    await dal.insert_job(2, "end", NOW + timedelta(seconds=60))
+    results = await dal.claim_due_jobs(NOW, 10)
+    assert [r["user_id"] for r in results] == [1]
+    assert results[0]["claimed_at"] == NOW
+    assert await dal.claim_due_jobs(NOW, 10) == []
+
+
+async def test_claim_due_jobs_runs_user_jobs_in_order(db_session, log):
+    dal = Gw2SessionJobsDal(db_session, log)
+    end_id = await dal.insert_job(1, "end", NOW)
+    await dal.insert_job(1, "start", NOW - timedelta(seconds=5))
+    results = await dal.claim_due_jobs(NOW, 10)
+    assert [r["action"] for r in results] == ["end"]
+    # The start waits until the end is done
+    assert await dal.claim_due_jobs(NOW, 10) == []
+    await dal.delete_job(end_id)
+    results = await dal.claim_due_jobs(NOW, 10)
+    assert [r["action"] for r in results] == ["start"]
+
+
+async def test_claim_due_jobs_respects_limit(db_session, log):
+    dal = Gw2SessionJobsDal(db_session, log)
+    for user_id in range(5):
+        await dal.insert_job(user_id, "end", NOW)
+    assert len(await dal.claim_due_jobs(NOW, 3)) == 3
+    assert len(await dal.claim_due_jobs(NOW, 3)) == 2
+
+
+async def test_reschedule_job_releases_claim(db_session, log):
+    dal = Gw2SessionJobsDal(db_session, log)
+    job_id = await dal.insert_job(1, "end", NOW)
+    await dal.claim_due_jobs(NOW, 10)
+    await dal.reschedule_job(job_id, 1, NOW + timedelta(seconds=30))
+    results = await dal.get_jobs()
+    assert results[0]["attempt"] == 1
+    assert results[0]["claimed_at"] is None
+    assert results[0]["run_at"] == NOW + timedelta(seconds=30)
+
+
+async def test_release_claimed_jobs(db_session, log):
+    dal = Gw2SessionJobsDal(db_session, log)
+    await dal.insert_job(1, "end", NOW)
+    await dal.claim_due_jobs(NOW, 10)
+    await dal.release_claimed_jobs()
+    assert len(await dal.claim_due_jobs(NOW, 10)) == 1
+
+
+async def test_expedite_retries(db_session, log):
+    dal = Gw2SessionJobsDal(db_session, log)
+    await dal.insert_job(1, "end", NOW + timedelta(seconds=180))
+    await dal.insert_job(2, "start", NOW + timedelta(seconds=300), attempt=2)
+    assert await dal.expedite_retries(NOW) == 1
+    run_ats = {r["user_id"]: r["run_at"] for r in await dal.get_jobs()}
+    assert run_ats == {1: NOW + timedelta(seconds=180), 2: NOW}
+
+
+async def test_delete_job(db_session, log):
+    dal = Gw2SessionJobsDal(db_session, log)
+    job_id = await dal.insert_job(1, "end", NOW)
+    await dal.delete_job(job_id)
+    assert await dal.get_jobs() == []
@@ -0,0 +1,44 @@
+import pytest
+from datetime import datetime, timedelta
+from src.database.dal.gw2.gw2_session_samples_dal import Gw2SessionSamplesDal
+from src.database.dal.gw2.gw2_session_snapshots import metric_ids
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+def _sample(user_id: int, field: str, ts: datetime, value: int) -> dict:
+    return {"user_id": user_id, "metric_id": metric_ids([field])[0], "ts": ts, "value": value}
+
+
+async def test_insert_and_get_user_samples(db_session, log):
+    dal = Gw2SessionSamplesDal(db_session, log)
+    await dal.insert_samples(
+        [
+            _sample(1, "karma", NOW + timedelta(minutes=15), 120),
+            _sample(1, "gold", NOW, 100),
+            _sample(1, "laurels", NOW, 5),
+            _sample(2, "gold", NOW, 999),
+        ]
+    )
+    results = await dal.get_user_samples(1, NOW, NOW + timedelta(hours=1), ["gold", "karma"])
+    assert results == [
+        {"ts": NOW, "field": "gold", "value": 100},
+        {"ts": NOW + timedelta(minutes=15), "field": "karma", "value": 120},
+    ]
+
+
+async def test_get_user_samples_within_range(db_session, log):
+    dal = Gw2SessionSamplesDal(db_session, log)
+    await dal.insert_samples([_sample(1, "gold", NOW - timedelta(hours=2), 50), _sample(1, "gold", NOW, 100)])
+    results = await dal.get_user_samples(1, NOW - timedelta(hours=1), NOW, ["gold"])
+    assert [r["value"] for r in results] == [100]
+
+
+async def test_delete_samples_before(db_session, log):
+    dal = Gw2SessionSamplesDal(db_session, log)
+    await dal.insert_samples([_sample(1, "gold", NOW - timedelta(days=400), 50), _sample(1, "gold", NOW, 100)])
+    assert await dal.delete_samples_before(NOW - timedelta(days=365)) == 1
+    results = await dal.get_user_samples(1, NOW - timedelta(days=500), NOW, ["gold"])
+    assert [r["value"] for r in results] == [100]
@@ -1,4 +1,7 @@
 import pytest
+from datetime import date
+from sqlalchemy import text
+from src.database.dal.gw2.gw2_session_snapshots import SNAPSHOT_LAYOUT, SNAPSHOT_LAYOUTS
 from src.database.dal.gw2.gw2_sessions_dal import Gw2SessionsDal
 from uuid import UUID
 
@@ -9,6 +12,7 @@
 
 def _make_session(user_id=USER_ID):
     return {
+        "date": "2026-10-18 12:00:00",
         "user_id": user_id,
         "acc_name": "TestGw2.5678",
         "gold": 100,
@@ -23,7 +27,7 @@ async def test_insert_start_session_returns_id(db_session, log):
     assert isinstance(session_id, UUID)
 
 
-async def test_insert_start_session_stores_jsonb(db_session, log):
+async def test_insert_start_session_stores_snapshot(db_session, log):
     dal = Gw2SessionsDal(db_session, log)
     session_data = _make_session()
     await dal.insert_start_session(session_data)
@@ -38,7 +42,7 @@ async def test_insert_start_session_stores_jsonb(db_session, log):
 async def test_update_end_session(db_session, log):
     dal = Gw2SessionsDal(db_session, log)
     start_id = await dal.insert_start_session(_make_session())
-    end_data = {"user_id": USER_ID, "gold": 200, "karma": 6000}
+    end_data = {"date": "2026-10-18 13:00:00", "user_id": USER_ID, "gold": 200, "karma": 6000}
     end_id = await dal.update_end_session(end_data)
     assert end_id == start_id
     results = await dal.get_user_last_session(USER_ID)
@@ -48,11 +52,22 @@ async def test_update_end_session(db_session, log):
 
 async def test_update_end_session_no_session(db_session, log):
     dal = Gw2SessionsDal(db_session, log)
-    end_data = {"user_id": 999999, "gold": 200}
+    end_data = {"date": "2026-10-18 13:00:00", "user_id": 999999, "gold": 200}
     result = await dal.update_end_session(end_data)
     assert result is None
 
 
+async def test_update_end_session_keeps_finished_session(db_session, log):
+    dal = Gw2SessionsDal(db_session, log)
+    await dal.insert_start_session(_make_session(), keep_history=True)
+    await dal.update_end_session({"date": "2026-10-18 13:00:00", "user_id": USER_ID, "gold": 200})
+    result = await dal.update_end_session({"date": "2026-10-18 14:00:00", "user_id": USER_ID, "gold": 300})
+    assert result is None
+    results = await dal.get_user_last_session(USER_ID)
+    assert results[0]["end"]["gold"] == 200
+    assert results[0]["end"]["date"] == "2026-10-18 13:00:00"
+
+
 async def test_insert_start_session_cleans_old_data(db_session, log):
     dal = Gw2SessionsDal(db_session, log)
     first_session = _make_session()
@@ -66,24 +81,81 @@ async def test_insert_start_session_cleans_old_data(db_session, log):
     assert results[0]["start"]["gold"] == 999
 
 
+async def test_insert_start_sessions_replaces_each_user_session(db_session, log):
+    dal = Gw2SessionsDal(db_session, log)
+    await dal.insert_start_session(_make_session())
+    second_user = _make_session(user_id=USER_ID + 1)
+    second_user["gold"] = 7
+    session_ids = await dal.insert_start_sessions([_make_session(), second_user])
+    assert set(session_ids) == {USER_ID, USER_ID + 1}
+    results = await dal.get_user_last_session(USER_ID)
+    assert len(results) == 1
+    assert str(results[0]["id"]) == str(session_ids[USER_ID])
+    results = await dal.get_user_last_session(USER_ID + 1)
+    assert results[0]["start"]["gold"] == 7
+
+
+async def test_keep_history_keeps_finished_sessions(db_session, log):
+    dal = Gw2SessionsDal(db_session, log)
+    for gold in (10, 20, 30):
+        session = _make_session()
+        session["gold"] = gold
+        await dal.insert_start_session(session, keep_history=True)
+        await dal.update_end_session({"date": "2026-10-18 13:00:00", "user_id": USER_ID, "gold": gold + 5})
+    history = await dal.get_user_sessions(USER_ID, 10)
+    assert [s["start"]["gold"] for s in history] == [30, 20, 10]
+    last = await dal.get_user_last_session(USER_ID)
+    assert last[0]["start"]["gold"] == 30
+    assert last[0]["end"]["gold"] == 35
+
+
+async def test_keep_history_replaces_unfinished_session(db_session, log):
+    dal = Gw2SessionsDal(db_session, log)
+    await dal.insert_start_session(_make_session(), keep_history=True)
+    await dal.update_end_session({"date": "2026-10-18 13:00:00", "user_id": USER_ID, "gold": 150})
+    await dal.insert_start_session(_make_session(), keep_history=True)
+    await dal.insert_start_sessions([_make_session()], keep_history=True)
+    last = await dal.get_user_last_session(USER_ID)
+    assert last[0]["end"] is None
+    assert len(await dal.get_user_sessions(USER_ID, 10)) == 1
+
+
+async def test_create_partition_is_idempotent(db_session, log):
+    dal = Gw2SessionsDal(db_session, log)
+    assert await dal.create_partition(date(2001, 5, 20)) == "gw2_sessions_p200105"
+    assert await dal.create_partition(date(2001, 5, 1)) == "gw2_sessions_p200105"
+    assert await dal.drop_partitions_before(date(2001, 6, 1)) == ["gw2_sessions_p200105"]
+
+
 async def test_get_user_last_session_empty(db_session, log):
     dal = Gw2SessionsDal(db_session, log)
     results = await dal.get_user_last_session(999999)
     assert len(results) == 0
 
 
-async def test_jsonb_round_trip_complex_data(db_session, log):
+async def test_snapshots_are_stored_packed(db_session, log):
     dal = Gw2SessionsDal(db_session, log)
-    complex_session = {
-        "user_id": USER_ID,
-        "acc_name": "Complex.1111",
-        "characters": ["Warrior", "Thief"],
-        "nested": {"pvp_rank": 50, "wvw_rank": 100},
-        "achievements": [1, 2, 3],
-    }
-    await dal.insert_start_session(complex_session)
+    await dal.insert_start_session(_make_session())
+    await dal.update_end_session({"date": "2026-10-18 13:00:00", "user_id": USER_ID, "gold": 200, "karma": 5000})
+    stmt = text('SELECT layout, start, "end", start_date, end_date FROM gw2.gw2_sessions WHERE user_id = :user_id')
+    rows = await dal.db_utils.fetchall(stmt.bindparams(user_id=USER_ID), True)
+    row = rows[0]
+    fields = SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT]
+    assert row["layout"] == SNAPSHOT_LAYOUT
+    assert len(row["start"]) == len(fields)
+    assert row["start"][fields.index("gold")] == 100
+    assert row["end"] == {"gold": 200}
+    assert row["start_date"] == "2026-10-18 12:00:00"
+    assert row["end_date"] == "2026-10-18 13:00:00"
+
+
+async def test_snapshot_round_trip(db_session, log):
+    dal = Gw2SessionsDal(db_session, log)
+    start = {"date": "2026-10-18 12:00:00", "acc_name": "TestGw2.5678", "user_id": USER_ID}
+    start.update({field: index for index, field in enumerate(SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT])})
+    end = {**start, "date": "2026-10-18 13:00:00", "gold": 10**12, "wvw_rank": 2000}
+    await dal.insert_start_session(dict(start))
+    await dal.update_end_session(dict(end))
     results = await dal.get_user_last_session(USER_ID)
-    start = results[0]["start"]
-    assert start["characters"] == ["Warrior", "Thief"]
-    assert start["nested"]["pvp_rank"] == 50
-    assert start["achievements"] == [1, 2, 3]
+    assert results[0]["start"] == start
+    assert results[0]["end"] == end
@@ -0,0 +1,58 @@
+import pytest
+from src.database.dal.gw2.gw2_static_data_dal import Gw2StaticDataDal
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+
+
+async def test_upsert_and_get_static_data(db_session, log):
+    dal = Gw2StaticDataDal(db_session, log)
+    await dal.upsert_static_data("worlds", {"1001": {"id": 1001, "name": "Anvil Rock"}}, 100)
+    results = await dal.get_static_data("worlds", ["1001", "1002"])
+    assert len(results) == 1
+    assert results[0]["object_id"] == "1001"
+    assert results[0]["build_id"] == 100
+    assert results[0]["data"]["name"] == "Anvil Rock"
+
+
+async def test_upsert_replaces_existing_object(db_session, log):
+    dal = Gw2StaticDataDal(db_session, log)
+    await dal.upsert_static_data("worlds", {"1001": {"id": 1001, "name": "Old"}}, 100)
+    await dal.upsert_static_data("worlds", {"1001": {"id": 1001, "name": "New"}}, 101)
+    results = await dal.get_static_data("worlds", ["1001"])
+    assert len(results) == 1
+    assert results[0]["build_id"] == 101
+    assert results[0]["data"]["name"] == "New"
+
+
+async def test_upsert_more_objects_than_one_statement_takes(db_session, log):
+    # 8000 objects at 5 bind parameters each are over the 32767 parameters of one statement
+    dal = Gw2StaticDataDal(db_session, log)
+    objects = {str(i): {"id": i} for i in range(8000)}
+    await dal.upsert_static_data("achievements", objects, 100)
+    results = await dal.get_static_data_by_kind("achievements", 10000)
+    assert len(results) == 8000
+
+
+async def test_same_object_id_in_different_kinds(db_session, log):
+    dal = Gw2StaticDataDal(db_session, log)
+    await dal.upsert_static_data("worlds", {"1": {"id": 1}}, 100)
+    await dal.upsert_static_data("currencies", {"1": {"id": 1, "name": "Coin"}}, 100)
+    assert len(await dal.get_static_data("worlds", ["1"])) == 1
+    assert len(await dal.get_static_data("currencies", ["1"])) == 1
+
+
+async def test_get_static_data_by_kind_respects_limit(db_session, log):
+    dal = Gw2StaticDataDal(db_session, log)
+    await dal.upsert_static_data("achievements", {str(i): {"id": i} for i in range(5)}, 100)
+    results = await dal.get_static_data_by_kind("achievements", 3)
+    assert len(results) == 3
+
+
+async def test_delete_outdated_static_data(db_session, log):
+    dal = Gw2StaticDataDal(db_session, log)
+    await dal.upsert_static_data("achievements", {"1": {"id": 1}}, 100)
+    await dal.upsert_static_data("achievements", {"2": {"id": 2}}, 101)
+    await dal.upsert_static_data("achievements", {"3": {"id": 3}}, None)
+    await dal.delete_outdated_static_data(101)
+    results = await dal.get_static_data_by_kind("achievements", 10)
+    assert [r["object_id"] for r in results] == ["2"]
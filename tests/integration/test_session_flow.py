@@ -121,7 +121,7 @@ async def test_session_start_end_lifecycle(db_session, log):
     mock_gw2_api_start = AsyncMock()
     mock_gw2_api_start.call_api = AsyncMock(side_effect=_mock_call_api_start)
 
-    with patch("src.gw2.tools.gw2_utils.Gw2Client", return_value=mock_gw2_api_start):
+    with patch.object(mock_bot, "gw2_client", mock_gw2_api_start):
         await gw2_utils.start_session(mock_bot, mock_member, API_KEY)
 
     # Verify session record was inserted
@@ -150,7 +150,7 @@ async def test_session_start_end_lifecycle(db_session, log):
     mock_gw2_api_end = AsyncMock()
     mock_gw2_api_end.call_api = AsyncMock(side_effect=_mock_call_api_end)
 
-    with patch("src.gw2.tools.gw2_utils.Gw2Client", return_value=mock_gw2_api_end):
+    with patch.object(mock_bot, "gw2_client", mock_gw2_api_end):
         await gw2_utils.end_session(mock_bot, mock_member, API_KEY, skip_delay=True)
 
     # Verify session end JSONB was populated
@@ -185,7 +185,7 @@ async def test_end_session_without_start_is_noop(db_session, log):
     mock_gw2_api = AsyncMock()
     mock_gw2_api.call_api = AsyncMock(side_effect=_mock_call_api_end)
 
-    with patch("src.gw2.tools.gw2_utils.Gw2Client", return_value=mock_gw2_api):
+    with patch.object(mock_bot, "gw2_client", mock_gw2_api):
         await gw2_utils.end_session(mock_bot, mock_member, API_KEY, skip_delay=True)
 
     mock_log.warning.assert_called_once()
@@ -209,6 +209,138 @@ async def test_owner_description_success(
         assert messages.BOT_DESCRIPTION_CHANGED in embed.description
         assert new_desc in embed.description
 
+    # Test GW2 API circuit breaker command
+    @pytest.mark.asyncio
+    @patch("src.bot.cogs.owner.bot_utils.send_embed")
+    async def test_owner_gw2api_shows_circuits(self, mock_send_embed, owner_cog, mock_ctx):
+        """Test that every endpoint family gets a field and open circuits are counted."""
+        owner_cog.bot.gw2_client = MagicMock()
+        owner_cog.bot.gw2_client.circuit_breaker.stats.return_value = {
+            "account": {"state": "closed", "failures": 0, "times_opened": 0, "rejected": 0, "retry_in": 0.0},
+            "wvw": {"state": "open", "failures": 5, "times_opened": 1, "rejected": 12, "retry_in": 17.5},
+        }
+
+        await owner_cog.owner_gw2api.callback(owner_cog, mock_ctx)
+
+        mock_ctx.message.channel.typing.assert_called_once()
+        embed = mock_send_embed.call_args[0][1]
+        assert [field.name for field in embed.fields] == ["account", "wvw"]
+        assert "`open`" in embed.fields[1].value
+        assert "Probe in: 17.5s" in embed.fields[1].value
+        assert "Probe in" not in embed.fields[0].value
+        assert embed.footer.text == "Endpoint families: 2 | Not closed: 1"
+        assert mock_send_embed.call_args[0][2] is True
+
+    @pytest.mark.asyncio
+    @patch("src.bot.cogs.owner.bot_utils.send_embed")
+    async def test_owner_gw2api_no_requests(self, mock_send_embed, owner_cog, mock_ctx):
+        """Test the message shown before any GW2 API request was made."""
+        owner_cog.bot.gw2_client = MagicMock()
+        owner_cog.bot.gw2_client.circuit_breaker.stats.return_value = {}
+
+        result = await owner_cog.owner_gw2api.callback(owner_cog, mock_ctx)
+
+        embed = mock_send_embed.call_args[0][1]
+        assert "No GW2 API requests" in embed.description
+        assert result == mock_send_embed.return_value
+
+    # Test GW2 API metrics command
+    @pytest.mark.asyncio
+    @patch("src.bot.cogs.owner.bot_utils.send_embed")
+    async def test_owner_gw2metrics_shows_endpoints(self, mock_send_embed, owner_cog, mock_ctx):
+        """Test that every endpoint gets a field with latency, statuses and totals in the footer."""
+        owner_cog.bot.gw2_client = MagicMock()
+        owner_cog.bot.gw2_client.metrics.stats.return_value = {
+            "account/achievements": {
+                "requests": 4,
+                "retries": 1,
+                "cache_hits": 2,
+                "bytes": 2048,
+                "statuses": {"200": 3, "503": 1},
+                "errors": 1,
+                "p50_ms": 250.0,
+                "p95_ms": 1000.0,
+                "p99_ms": 1234.5,
+                "avg_ms": 400.0,
+            },
+            "worlds": {
+                "requests": 0,
+                "retries": 0,
+                "cache_hits": 3,
+                "bytes": 0,
+                "statuses": {},
+                "errors": 0,
+                "p50_ms": 0.0,
+                "p95_ms": 0.0,
+                "p99_ms": 0.0,
+                "avg_ms": 0.0,
+            },
+        }
+
+        await owner_cog.owner_gw2metrics.callback(owner_cog, mock_ctx)
+
+        mock_ctx.message.channel.typing.assert_called_once()
+        embed = mock_send_embed.call_args[0][1]
+        assert [field.name for field in embed.fields] == ["account/achievements", "worlds"]
+        assert "p50/p95/p99: 250/1000/1234.5 ms" in embed.fields[0].value
+        assert "Statuses: 200: 3, 503: 1" in embed.fields[0].value
+        assert "Received: 2.0 KiB" in embed.fields[0].value
+        assert "Statuses: -" in embed.fields[1].value
+        assert embed.footer.text == "Endpoints: 2 | Requests: 4 | Errors: 1"
+        assert mock_send_embed.call_args[0][2] is True
+
+    @pytest.mark.asyncio
+    @patch("src.bot.cogs.owner.bot_utils.send_embed")
+    async def test_owner_gw2metrics_no_requests(self, mock_send_embed, owner_cog, mock_ctx):
+        """Test the message shown before any GW2 API request was made."""
+        owner_cog.bot.gw2_client = MagicMock()
+        owner_cog.bot.gw2_client.metrics.stats.return_value = {}
+
+        result = await owner_cog.owner_gw2metrics.callback(owner_cog, mock_ctx)
+
+        embed = mock_send_embed.call_args[0][1]
+        assert "No GW2 API requests" in embed.description
+        assert result == mock_send_embed.return_value
+
+    @pytest.mark.asyncio
+    @patch("src.bot.cogs.owner.bot_utils.send_embed")
+    async def test_owner_gw2sessions_shows_pipeline(self, mock_send_embed, owner_cog, mock_ctx):
+        """Test that every pipeline stage and latency histogram gets a field."""
+        latency = {"count": 2, "p50_ms": 250.0, "p95_ms": 500.0, "p99_ms": 500.0, "avg_ms": 300.0, "max_ms": 420.5}
+        stats = {
+            "presence": {"loaded": 1, "session_guilds": 1, "key_users": 2, "seen": 10, "dropped": 7},
+            "actors": {"posted": 3, "duplicates": 1, "cancelled": 0, "mailbox_depth": 0, "running": 1},
+            "states": {},
+            "batches": {"waiting": 0, "batches": 1, "intents": 2, "deduplicated": 0, "largest_batch": 2},
+            "jobs": {"pending": 1, "retries": 1, "probing": 1, "drained": 0},
+            "sampler": {"users": 0},
+            "pipeline": {
+                "tracked_users": 1,
+                "counters": {"activity_changes": 3, "started": 1, "snapshot_failures": 1, "retries_scheduled": 1},
+                "latency": {"snapshot": latency, "db_write": latency},
+            },
+        }
+        with patch("src.gw2.tools.gw2_utils.get_session_pipeline_stats", return_value=stats):
+            await owner_cog.owner_gw2sessions.callback(owner_cog, mock_ctx)
+
+        mock_ctx.message.channel.typing.assert_called_once()
+        embed = mock_send_embed.call_args[0][1]
+        assert [field.name for field in embed.fields] == [
+            "Presence",
+            "Actors",
+            "Batches",
+            "Outcomes",
+            "Retries",
+            "Latency: snapshot",
+            "Latency: db_write",
+        ]
+        assert "Filtered: 7" in embed.fields[0].value
+        assert "Started: 1 | Ended: 0" in embed.fields[3].value
+        assert "Probing: yes" in embed.fields[4].value
+        assert "p50/p95/p99: 250/500/500 ms" in embed.fields[5].value
+        assert embed.footer.text == "Session jobs pending: 1 | Sampled users: 0"
+        assert mock_send_embed.call_args[0][2] is True
+
     # Test servers list command
     @pytest.mark.asyncio
     @patch("src.bot.cogs.owner.ServersDal")
@@ -56,6 +56,14 @@ def test_bot_init_stores_aiosession(self):
         bot, *_ = self._create_bot(aiosession=aiosession)
         assert bot.aiosession is aiosession
 
+    def test_bot_init_creates_shared_gw2_client(self):
+        """Verify the bot owns one GW2 API client."""
+        from src.gw2.tools.gw2_client import Gw2Client
+
+        bot, *_ = self._create_bot()
+        assert isinstance(bot.gw2_client, Gw2Client)
+        assert bot.gw2_client.bot is bot
+
     def test_bot_init_stores_db_session(self):
         """Verify db_session is stored on the bot instance."""
         db_session = MagicMock(name="db_session")
@@ -366,3 +374,33 @@ async def test_setup_hook_failure_logs_and_raises(self, mock_bot_utils, mock_get
         log.error.assert_called()
         error_msg = log.error.call_args[0][0]
         assert messages.BOT_LOAD_COGS_FAILED in error_msg
+
+
+class TestClose:
+    """Test cases for Bot.close."""
+
+    @pytest.mark.asyncio
+    @patch("src.bot.discord_bot.profanity")
+    @patch("src.bot.discord_bot.get_gw2_settings")
+    @patch("src.bot.discord_bot.get_bot_settings")
+    @patch("src.bot.discord_bot.bot_utils")
+    async def test_close_closes_gw2_client(self, mock_bot_utils, mock_get_bot, mock_get_gw2, mock_profanity):
+        """Verify close shuts down the GW2 API connection pool before the bot."""
+        mock_bot_utils.get_current_date_time.return_value = MagicMock()
+        mock_bot_utils.get_color_settings.return_value = discord.Color.green()
+
+        bot = Bot(
+            command_prefix="!",
+            intents=discord.Intents.default(),
+            aiosession=MagicMock(),
+            db_session=MagicMock(),
+            log=MagicMock(),
+        )
+        bot.gw2_client = MagicMock()
+        bot.gw2_client.close = AsyncMock()
+
+        with patch("discord.ext.commands.Bot.close", new_callable=AsyncMock) as mock_super_close:
+            await bot.close()
+
+        bot.gw2_client.close.assert_awaited_once()
+        mock_super_close.assert_awaited_once()
@@ -110,6 +110,48 @@ def test_init_background_tasks_enabled(self, mock_bg_tasks_class, mock_bot):
         # Verify task was created
         mock_bot.loop.create_task.assert_called_once()
 
+    @patch("src.gw2.tools.gw2_utils.start_warm_up")
+    def test_init_gw2_warm_up(self, mock_start_warm_up, mock_bot):
+        """Test that the GW2 warm-up is started in the background."""
+        bot_utils.init_gw2_warm_up(mock_bot)
+
+        mock_start_warm_up.assert_called_once_with(mock_bot)
+
+    @patch("src.gw2.tools.gw2_utils.start_presence_filter")
+    def test_init_gw2_presence_filter(self, mock_start_presence_filter, mock_bot):
+        """Test that the GW2 presence prefilter is loaded in the background."""
+        bot_utils.init_gw2_presence_filter(mock_bot)
+
+        mock_start_presence_filter.assert_called_once_with(mock_bot)
+
+    @patch("src.gw2.tools.gw2_utils.start_session_jobs")
+    def test_init_gw2_session_jobs(self, mock_start_session_jobs, mock_bot):
+        """Test that the GW2 session jobs are resumed in the background."""
+        bot_utils.init_gw2_session_jobs(mock_bot)
+
+        mock_start_session_jobs.assert_called_once_with(mock_bot)
+
+    @patch("src.gw2.tools.gw2_utils.start_session_sampler")
+    def test_init_gw2_session_sampler(self, mock_start_session_sampler, mock_bot):
+        """Test that the GW2 session sampler is started in the background."""
+        bot_utils.init_gw2_session_sampler(mock_bot)
+
+        mock_start_session_sampler.assert_called_once_with(mock_bot)
+
+    @patch("src.gw2.tools.gw2_utils.start_session_metrics_log")
+    def test_init_gw2_session_metrics_log(self, mock_start_session_metrics_log, mock_bot):
+        """Test that the GW2 session metrics log is started in the background."""
+        bot_utils.init_gw2_session_metrics_log(mock_bot)
+
+        mock_start_session_metrics_log.assert_called_once_with(mock_bot)
+
+    @patch("src.gw2.tools.gw2_utils.start_session_partitions")
+    def test_init_gw2_session_partitions(self, mock_start_session_partitions, mock_bot):
+        """Test that the GW2 session partition maintenance is started in the background."""
+        bot_utils.init_gw2_session_partitions(mock_bot)
+
+        mock_start_session_partitions.assert_called_once_with(mock_bot)
+
     def test_init_background_tasks_disabled(self, mock_bot):
         """Test background task initialization when disabled."""
         test_cases = [
@@ -2,6 +2,8 @@
 
 import pytest
 import sys
+from datetime import date, datetime
+from sqlalchemy.dialects import postgresql
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 sys.modules["ddcDatabases"] = Mock()
@@ -14,7 +16,11 @@
 from src.database.dal.gw2.gw2_configs_dal import Gw2ConfigsDal
 from src.database.dal.gw2.gw2_key_dal import Gw2KeyDal
 from src.database.dal.gw2.gw2_session_chars_dal import Gw2SessionCharDeathsDal
+from src.database.dal.gw2.gw2_session_jobs_dal import Gw2SessionJobsDal
+from src.database.dal.gw2.gw2_session_samples_dal import Gw2SessionSamplesDal
+from src.database.dal.gw2.gw2_session_snapshots import SNAPSHOT_LAYOUT, SNAPSHOT_LAYOUTS, pack_start
 from src.database.dal.gw2.gw2_sessions_dal import Gw2SessionsDal
+from src.database.dal.gw2.gw2_static_data_dal import Gw2StaticDataDal
 
 # =============================================================================
 # BotConfigsDal Tests
@@ -766,10 +772,27 @@ async def test_get_gw2_server_configs_empty(self, mock_dal):
         results = await mock_dal.get_gw2_server_configs(server_id=99999)
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_get_gw2_servers_configs(self, mock_dal):
+        """Test get_gw2_servers_configs reads the configs of several servers with one query."""
+        expected = [{"server_id": 1, "session": True}, {"server_id": 2, "session": False}]
+        mock_dal.db_utils.fetchall.return_value = expected
+        results = await mock_dal.get_gw2_servers_configs([1, 2])
+        mock_dal.db_utils.fetchall.assert_called_once()
+        assert mock_dal.db_utils.fetchall.call_args[0][1] is True
+        assert results == expected
 
-# =============================================================================
-# Gw2KeyDal Tests
-# =============================================================================
+    # =============================================================================
+    # Gw2KeyDal Tests
+    # =============================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_session_server_ids(self, mock_dal):
+        """Test get_session_server_ids returns the guilds with session tracking on."""
+        mock_dal.db_utils.fetchall.return_value = [{"server_id": 100}]
+        results = await mock_dal.get_session_server_ids()
+        assert results == [{"server_id": 100}]
+        assert mock_dal.db_utils.fetchall.call_args[0][1] is True
 
 
 class TestGw2KeyDal:
@@ -900,10 +923,26 @@ async def test_get_api_key_by_user_not_found(self, mock_dal):
         results = await mock_dal.get_api_key_by_user(user_id=99999)
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_get_api_keys_by_users(self, mock_dal):
+        """Test get_api_keys_by_users reads the keys of several users with one query."""
+        expected = [{"user_id": 1, "key": "key-1"}, {"user_id": 2, "key": "key-2"}]
+        mock_dal.db_utils.fetchall.return_value = expected
+        results = await mock_dal.get_api_keys_by_users([1, 2])
+        mock_dal.db_utils.fetchall.assert_called_once()
+        assert mock_dal.db_utils.fetchall.call_args[0][1] is True
+        assert results == expected
 
-# =============================================================================
-# Gw2SessionCharDeathsDal Tests
-# =============================================================================
+    # =============================================================================
+    # Gw2SessionCharDeathsDal Tests
+    # =============================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_user_ids(self, mock_dal):
+        """Test get_user_ids returns the users with an API key."""
+        mock_dal.db_utils.fetchall.return_value = [{"user_id": 1}, {"user_id": 2}]
+        results = await mock_dal.get_user_ids()
+        assert results == [{"user_id": 1}, {"user_id": 2}]
 
 
 class TestGw2SessionCharDeathsDal:
@@ -934,7 +973,7 @@ def test_init(self):
 
     @pytest.mark.asyncio
     async def test_insert_start_char_deaths(self, mock_dal):
-        """Test insert_start_char_deaths calls insert for each character."""
+        """Test insert_start_char_deaths writes all characters with one multi-row insert."""
         characters_data = [
             {"name": "CharOne", "profession": "Warrior", "deaths": 5},
             {"name": "CharTwo", "profession": "Elementalist", "deaths": 10},
@@ -942,7 +981,12 @@ async def test_insert_start_char_deaths(self, mock_dal):
 
         await mock_dal.insert_start_char_deaths(session_id=1, user_id=67890, characters_data=characters_data)
 
-        assert mock_dal.db_utils.insert.call_count == 2
+        mock_dal.db_utils.insert.assert_not_called()
+        mock_dal.db_utils.execute.assert_called_once()
+        params = mock_dal.db_utils.execute.call_args[0][0].compile().params
+        assert [params["name_m0"], params["name_m1"]] == ["CharOne", "CharTwo"]
+        assert [params["start_m0"], params["start_m1"]] == [5, 10]
+        assert params["user_id_m1"] == 67890
 
     @pytest.mark.asyncio
     async def test_insert_start_char_deaths_single_character(self, mock_dal):
@@ -953,7 +997,7 @@ async def test_insert_start_char_deaths_single_character(self, mock_dal):
 
         await mock_dal.insert_start_char_deaths(session_id=2, user_id=11111, characters_data=characters_data)
 
-        mock_dal.db_utils.insert.assert_called_once()
+        mock_dal.db_utils.execute.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_insert_start_char_deaths_empty_characters(self, mock_dal):
@@ -961,17 +1005,27 @@ async def test_insert_start_char_deaths_empty_characters(self, mock_dal):
         await mock_dal.insert_start_char_deaths(session_id=3, user_id=22222, characters_data=[])
 
         mock_dal.db_utils.insert.assert_not_called()
+        mock_dal.db_utils.execute.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_end_char_deaths(self, mock_dal):
-        """Test update_end_char_deaths executes an update for each character."""
+        """Test update_end_char_deaths updates all characters with one statement joined to a VALUES list."""
         mock_dal.db_utils.execute = AsyncMock()
         characters_data = [
             {"name": "CharOne", "deaths": 8},
             {"name": "CharTwo", "deaths": 12},
         ]
         await mock_dal.update_end_char_deaths(session_id=42, user_id=67890, characters_data=characters_data)
-        assert mock_dal.db_utils.execute.call_count == 2
+        mock_dal.db_utils.execute.assert_called_once()
+        sql = str(mock_dal.db_utils.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "FROM (VALUES" in sql
+        assert "end_deaths.name" in sql
+
+    @pytest.mark.asyncio
+    async def test_update_end_char_deaths_empty_characters(self, mock_dal):
+        """Test update_end_char_deaths with an empty characters list."""
+        await mock_dal.update_end_char_deaths(session_id=42, user_id=67890, characters_data=[])
+        mock_dal.db_utils.execute.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_char_deaths(self, mock_dal):
@@ -1000,6 +1054,29 @@ async def test_get_char_deaths_empty(self, mock_dal):
 # =============================================================================
 
 
+def _last_session_row(session_id) -> dict:
+    """Row read by update_end_session for the last session of a user."""
+    return {
+        "id": session_id,
+        "created_at": datetime(2026, 10, 18, 12, 0, 0),
+        "layout": SNAPSHOT_LAYOUT,
+        "start": pack_start({"gold": 100, "karma": 5000}),
+    }
+
+
+def _stored_session_row(end: dict | None = None, end_date: str | None = None) -> dict:
+    """gw2_sessions row as stored, with a packed start snapshot."""
+    return {
+        "user_id": 67890,
+        "acc_name": "TestAccount.1234",
+        "layout": SNAPSHOT_LAYOUT,
+        "start": pack_start({"gold": 100, "karma": 5000}),
+        "end": end,
+        "start_date": "2026-10-18 12:00:00",
+        "end_date": end_date,
+    }
+
+
 class TestGw2SessionsDal:
     """Test cases for Gw2SessionsDal."""
 
@@ -1030,19 +1107,74 @@ def test_init(self):
     async def test_insert_start_session(self, mock_dal):
         """Test insert_start_session deletes old data and inserts new session."""
         session = {
+            "date": "2026-10-18 12:00:00",
             "user_id": 67890,
             "acc_name": "TestAccount.1234",
             "gold": 100,
         }
         await mock_dal.insert_start_session(session)
-        # Should call execute twice (delete sessions, delete chars) then insert once
-        assert mock_dal.db_utils.execute.call_count == 2
+        # Two deletes left uncommitted (delete chars, delete sessions), then the insert commits them
+        assert mock_dal.db_utils.fetchall.call_count == 2
+        mock_dal.db_utils.execute.assert_not_called()
+        mock_dal.db_utils.insert.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_insert_start_sessions(self, mock_dal):
+        """Test insert_start_sessions replaces the sessions of several users in one transaction."""
+        sessions = [
+            {"date": "2026-10-18 12:00:00", "user_id": 1, "acc_name": "A.1"},
+            {"date": "2026-10-18 12:00:00", "user_id": 2, "acc_name": "B.2"},
+        ]
+        result = await mock_dal.insert_start_sessions(sessions)
+        # Two deletes through fetchall, which doesn't commit, then one multi-row insert that commits them all
+        assert mock_dal.db_utils.fetchall.call_count == 2
+        for delete_call in mock_dal.db_utils.fetchall.call_args_list:
+            assert delete_call[0][0].is_delete
+        mock_dal.db_utils.execute.assert_called_once()
+        assert mock_dal.db_utils.execute.call_args.kwargs == {}
+        assert list(result) == [1, 2]
+        assert result[1] != result[2]
+
+    @pytest.mark.asyncio
+    async def test_insert_start_sessions_empty(self, mock_dal):
+        """Test insert_start_sessions without sessions does nothing."""
+        assert await mock_dal.insert_start_sessions([]) == {}
+        mock_dal.db_utils.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_insert_start_session_keep_history(self, mock_dal):
+        """Test insert_start_session only replaces unfinished sessions when history is kept."""
+        await mock_dal.insert_start_session(
+            {"date": "2026-10-18 12:00:00", "user_id": 67890, "acc_name": "TestAccount.1234"}, keep_history=True
+        )
+        delete = str(mock_dal.db_utils.fetchall.call_args_list[1][0][0].compile(dialect=postgresql.dialect()))
+        assert '"end" IS NULL' in delete
         mock_dal.db_utils.insert.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_insert_start_session_without_history(self, mock_dal):
+        """Test insert_start_session replaces every previous session when history is not kept."""
+        await mock_dal.insert_start_session(
+            {"date": "2026-10-18 12:00:00", "user_id": 67890, "acc_name": "TestAccount.1234"}
+        )
+        delete = str(mock_dal.db_utils.fetchall.call_args_list[1][0][0].compile(dialect=postgresql.dialect()))
+        assert '"end" IS NULL' not in delete
+
+    @pytest.mark.asyncio
+    async def test_insert_start_session_packs_snapshot(self, mock_dal):
+        """Test insert_start_session stores the start stats packed in layout order and the date in its column."""
+        session = {"date": "2026-10-18 12:00:00", "user_id": 67890, "acc_name": "TestAccount.1234", "gold": 100}
+        await mock_dal.insert_start_session(session)
+        stmt = mock_dal.db_utils.insert.call_args[0][0]
+        assert stmt.layout == SNAPSHOT_LAYOUT
+        assert stmt.start == pack_start(session)
+        assert stmt.start_date == "2026-10-18 12:00:00"
+
     @pytest.mark.asyncio
     async def test_insert_start_session_returns_id(self, mock_dal):
         """Test insert_start_session returns the session id attribute from the model instance."""
         session = {
+            "date": "2026-10-18 12:00:00",
             "user_id": 67890,
             "acc_name": "TestAccount.1234",
             "gold": 200,
@@ -1052,25 +1184,27 @@ async def test_insert_start_session_returns_id(self, mock_dal):
         # Since Gw2Sessions is a real SQLAlchemy model, the id will be None
         # until flushed/committed by the database. The method still returns it.
         assert mock_dal.db_utils.insert.call_count == 1
-        assert mock_dal.db_utils.execute.call_count == 2
+        assert mock_dal.db_utils.fetchall.call_count == 2
 
     @pytest.mark.asyncio
     async def test_insert_start_session_different_user(self, mock_dal):
         """Test insert_start_session with different user data."""
         session = {
+            "date": "2026-10-18 12:00:00",
             "user_id": 11111,
             "acc_name": "AnotherAcc.5678",
             "gold": 50,
         }
         await mock_dal.insert_start_session(session)
-        assert mock_dal.db_utils.execute.call_count == 2
+        assert mock_dal.db_utils.fetchall.call_count == 2
         mock_dal.db_utils.insert.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_update_end_session(self, mock_dal):
-        """Test update_end_session fetches session id then calls execute."""
-        mock_dal.db_utils.fetchall.return_value = [{"id": 42}]
+        """Test update_end_session fetches the last session of the user then updates it."""
+        mock_dal.db_utils.fetchall.return_value = [_last_session_row(42)]
         session = {
+            "date": "2026-10-18 13:00:00",
             "user_id": 67890,
             "gold": 150,
         }
@@ -1082,8 +1216,9 @@ async def test_update_end_session(self, mock_dal):
     @pytest.mark.asyncio
     async def test_update_end_session_different_user(self, mock_dal):
         """Test update_end_session with different user."""
-        mock_dal.db_utils.fetchall.return_value = [{"id": 99}]
+        mock_dal.db_utils.fetchall.return_value = [_last_session_row(99)]
         session = {
+            "date": "2026-10-18 13:00:00",
             "user_id": 11111,
             "gold": 75,
         }
@@ -1092,11 +1227,42 @@ async def test_update_end_session_different_user(self, mock_dal):
         mock_dal.db_utils.execute.assert_called_once()
         assert result == 99
 
+    @pytest.mark.asyncio
+    async def test_update_end_session_targets_one_partition(self, mock_dal):
+        """Test update_end_session updates the last session by id and created_at, the partition key."""
+        mock_dal.db_utils.fetchall.return_value = [_last_session_row(42)]
+        await mock_dal.update_end_session({"date": "2026-10-18 13:00:00", "user_id": 67890, "gold": 150})
+        query = str(mock_dal.db_utils.fetchall.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "ORDER BY gw2.gw2_sessions.created_at DESC" in query
+        assert "LIMIT" in query
+        update = str(mock_dal.db_utils.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "gw2.gw2_sessions.created_at = " in update
+
+    @pytest.mark.asyncio
+    async def test_update_end_session_only_open_sessions(self, mock_dal):
+        """Test update_end_session only looks for and updates a session without an end."""
+        mock_dal.db_utils.fetchall.return_value = [_last_session_row(42)]
+        await mock_dal.update_end_session({"date": "2026-10-18 13:00:00", "user_id": 67890, "gold": 150})
+        query = str(mock_dal.db_utils.fetchall.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert 'gw2.gw2_sessions."end" IS NULL' in query
+        update = str(mock_dal.db_utils.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert 'gw2.gw2_sessions."end" IS NULL' in update
+
+    @pytest.mark.asyncio
+    async def test_update_end_session_stores_changed_fields(self, mock_dal):
+        """Test update_end_session stores only the stats that changed since the start snapshot."""
+        mock_dal.db_utils.fetchall.return_value = [_last_session_row(42)]
+        await mock_dal.update_end_session({"date": "2026-10-18 13:00:00", "user_id": 67890, "gold": 150, "karma": 5000})
+        params = mock_dal.db_utils.execute.call_args[0][0].compile(dialect=postgresql.dialect()).params
+        assert params["end"] == {"gold": 150}
+        assert params["end_date"] == "2026-10-18 13:00:00"
+
     @pytest.mark.asyncio
     async def test_update_end_session_no_session_found(self, mock_dal):
         """Test update_end_session returns None when no session exists."""
         mock_dal.db_utils.fetchall.return_value = []
         session = {
+            "date": "2026-10-18 13:00:00",
             "user_id": 67890,
             "gold": 150,
         }
@@ -1107,21 +1273,40 @@ async def test_update_end_session_no_session_found(self, mock_dal):
 
     @pytest.mark.asyncio
     async def test_get_user_last_session(self, mock_dal):
-        """Test get_user_last_session calls fetchall and returns results."""
-        expected = [
+        """Test get_user_last_session calls fetchall and returns the unpacked snapshots."""
+        mock_dal.db_utils.fetchall.return_value = [_stored_session_row({"gold": 150}, "2026-10-18 13:00:00")]
+        results = await mock_dal.get_user_last_session(user_id=67890)
+        mock_dal.db_utils.fetchall.assert_called_once()
+        call_args = mock_dal.db_utils.fetchall.call_args
+        assert call_args[0][1] is True
+        assert results == [
             {
                 "user_id": 67890,
                 "acc_name": "TestAccount.1234",
-                "start": {"gold": 100},
-                "end": {"gold": 150},
+                "start": {
+                    "date": "2026-10-18 12:00:00",
+                    "acc_name": "TestAccount.1234",
+                    "gold": 100,
+                    "karma": 5000,
+                    "user_id": 67890,
+                },
+                "end": {
+                    "date": "2026-10-18 13:00:00",
+                    "acc_name": "TestAccount.1234",
+                    "gold": 150,
+                    "karma": 5000,
+                    "user_id": 67890,
+                },
             }
         ]
-        mock_dal.db_utils.fetchall.return_value = expected
+
+    @pytest.mark.asyncio
+    async def test_get_user_last_session_unfinished(self, mock_dal):
+        """Test get_user_last_session returns no end snapshot for a session without end."""
+        mock_dal.db_utils.fetchall.return_value = [_stored_session_row()]
         results = await mock_dal.get_user_last_session(user_id=67890)
-        mock_dal.db_utils.fetchall.assert_called_once()
-        call_args = mock_dal.db_utils.fetchall.call_args
-        assert call_args[0][1] is True
-        assert results == expected
+        assert results[0]["start"]["gold"] == 100
+        assert results[0]["end"] is None
 
     @pytest.mark.asyncio
     async def test_get_user_last_session_no_session(self, mock_dal):
@@ -1129,3 +1314,312 @@ async def test_get_user_last_session_no_session(self, mock_dal):
         mock_dal.db_utils.fetchall.return_value = []
         results = await mock_dal.get_user_last_session(user_id=99999)
         assert results == []
+
+    @pytest.mark.asyncio
+    async def test_get_user_last_session_is_latest(self, mock_dal):
+        """Test get_user_last_session reads only the newest session of the user."""
+        await mock_dal.get_user_last_session(user_id=67890)
+        query = str(mock_dal.db_utils.fetchall.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "ORDER BY gw2.gw2_sessions.created_at DESC" in query
+        assert "LIMIT" in query
+
+    @pytest.mark.asyncio
+    async def test_get_user_sessions(self, mock_dal):
+        """Test get_user_sessions reads the finished sessions of the user, newest first."""
+        mock_dal.db_utils.fetchall.return_value = [_stored_session_row({"gold": 150}, "2026-10-18 13:00:00")]
+        results = await mock_dal.get_user_sessions(user_id=67890, limit=10)
+        query = str(mock_dal.db_utils.fetchall.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert '"end" IS NOT NULL' in query
+        assert "ORDER BY gw2.gw2_sessions.created_at DESC" in query
+        assert results[0]["start"]["gold"] == 100
+        assert results[0]["end"]["gold"] == 150
+        assert results[0]["end"]["date"] == "2026-10-18 13:00:00"
+
+    @pytest.mark.asyncio
+    async def test_create_partition(self, mock_dal):
+        """Test create_partition calls the partition function and returns the partition name."""
+        result = await mock_dal.create_partition(date(2026, 10, 1))
+        query = str(mock_dal.db_utils.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "gw2.create_gw2_sessions_partition(" in query
+        assert mock_dal.db_utils.execute.call_args.kwargs == {}
+        assert result == "gw2_sessions_p202610"
+
+    @pytest.mark.asyncio
+    async def test_drop_partitions_before(self, mock_dal):
+        """Test drop_partitions_before drops expired partitions and their orphaned character deaths together."""
+        mock_dal.db_utils.fetchall.return_value = [{"partition_name": "gw2_sessions_p202509"}]
+        result = await mock_dal.drop_partitions_before(date(2025, 10, 1))
+        drop_stmt = mock_dal.db_utils.fetchall.call_args[0][0]
+        assert "gw2.drop_gw2_sessions_partitions(" in str(drop_stmt.compile(dialect=postgresql.dialect()))
+        # The delete commits the dropped partitions with it
+        delete_call = mock_dal.db_utils.execute.call_args
+        assert "NOT (EXISTS" in str(delete_call[0][0].compile(dialect=postgresql.dialect()))
+        assert delete_call.kwargs == {}
+        assert result == ["gw2_sessions_p202509"]
+
+
+# =============================================================================
+# Gw2StaticDataDal Tests
+# =============================================================================
+
+
+class TestGw2StaticDataDal:
+    """Test cases for Gw2StaticDataDal."""
+
+    @pytest.fixture
+    def mock_dal(self):
+        db_session = MagicMock()
+        log = MagicMock()
+        with patch("src.database.dal.gw2.gw2_static_data_dal.DBUtilsAsync") as mock_db_utils_class:
+            mock_db_utils = AsyncMock()
+            mock_db_utils_class.return_value = mock_db_utils
+            dal = Gw2StaticDataDal(db_session, log)
+            dal.db_utils = mock_db_utils
+            yield dal
+
+    def test_init(self):
+        """Test Gw2StaticDataDal initialization."""
+        db_session = MagicMock()
+        log = MagicMock()
+        with patch("src.database.dal.gw2.gw2_static_data_dal.DBUtilsAsync") as mock_db_utils_class:
+            dal = Gw2StaticDataDal(db_session, log)
+            mock_db_utils_class.assert_called_once_with(db_session)
+            assert dal.log == log
+
+    @pytest.mark.asyncio
+    async def test_upsert_static_data(self, mock_dal):
+        """Test upsert_static_data writes a few objects in one statement."""
+        await mock_dal.upsert_static_data("worlds", {"1001": {"id": 1001}, "1002": {"id": 1002}}, 100)
+        mock_dal.db_utils.execute.assert_called_once()
+        assert mock_dal.db_utils.execute.call_args[1] == {}
+
+    @pytest.mark.asyncio
+    async def test_upsert_static_data_in_chunks(self, mock_dal):
+        """Test upsert_static_data splits large upserts into one statement per chunk."""
+        objects = {str(object_id): {"id": object_id} for object_id in range(5001)}
+        with patch("src.database.dal.gw2.gw2_static_data_dal.UPSERT_CHUNK_SIZE", 2000):
+            await mock_dal.upsert_static_data("achievements", objects, 100)
+        assert mock_dal.db_utils.execute.call_count == 3
+        assert all(call[1] == {} for call in mock_dal.db_utils.execute.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_upsert_static_data_empty(self, mock_dal):
+        """Test upsert_static_data does nothing without objects."""
+        await mock_dal.upsert_static_data("worlds", {}, 100)
+        mock_dal.db_utils.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_static_data(self, mock_dal):
+        """Test get_static_data returns the stored rows."""
+        expected = [{"object_id": "1001", "build_id": 100, "data": {"id": 1001}}]
+        mock_dal.db_utils.fetchall.return_value = expected
+        results = await mock_dal.get_static_data("worlds", ["1001"])
+        call_args = mock_dal.db_utils.fetchall.call_args
+        assert call_args[0][1] is True
+        assert results == expected
+
+    @pytest.mark.asyncio
+    async def test_get_static_data_by_kind(self, mock_dal):
+        """Test get_static_data_by_kind returns the stored rows."""
+        mock_dal.db_utils.fetchall.return_value = []
+        results = await mock_dal.get_static_data_by_kind("achievements", 500)
+        mock_dal.db_utils.fetchall.assert_called_once()
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_delete_outdated_static_data(self, mock_dal):
+        """Test delete_outdated_static_data executes a delete."""
+        await mock_dal.delete_outdated_static_data(100)
+        mock_dal.db_utils.execute.assert_called_once()
+
+
+# =============================================================================
+# Gw2SessionJobsDal Tests
+# =============================================================================
+
+
+class TestGw2SessionJobsDal:
+    """Test cases for Gw2SessionJobsDal."""
+
+    @pytest.fixture
+    def mock_dal(self):
+        db_session = MagicMock()
+        log = MagicMock()
+        with patch("src.database.dal.gw2.gw2_session_jobs_dal.DBUtilsAsync") as mock_db_utils_class:
+            mock_db_utils = AsyncMock()
+            mock_db_utils_class.return_value = mock_db_utils
+            dal = Gw2SessionJobsDal(db_session, log)
+            dal.db_utils = mock_db_utils
+            yield dal
+
+    def test_init(self):
+        """Test Gw2SessionJobsDal initialization."""
+        db_session = MagicMock()
+        log = MagicMock()
+        with patch("src.database.dal.gw2.gw2_session_jobs_dal.DBUtilsAsync") as mock_db_utils_class:
+            dal = Gw2SessionJobsDal(db_session, log)
+            mock_db_utils_class.assert_called_once_with(db_session)
+            assert dal.log == log
+
+    @pytest.mark.asyncio
+    async def test_insert_job(self, mock_dal):
+        """Test insert_job stores the job and returns its id."""
+        run_at = datetime(2026, 10, 18, 12, 0, 0)
+        job_id = await mock_dal.insert_job(1, "end", run_at)
+        inserted = mock_dal.db_utils.insert.call_args[0][0]
+        assert inserted.user_id == 1
+        assert inserted.action == "end"
+        assert inserted.run_at == run_at
+        assert inserted.attempt == 0
+        assert job_id == inserted.id
+
+    @pytest.mark.asyncio
+    async def test_insert_jobs(self, mock_dal):
+        """Test insert_jobs stores several jobs with one insert and returns their ids."""
+        run_at = datetime(2026, 10, 18, 12, 0, 0)
+        job_ids = await mock_dal.insert_jobs(
+            [
+                {"user_id": 1, "action": "end", "run_at": run_at, "attempt": 0},
+                {"user_id": 2, "action": "start", "run_at": run_at, "attempt": 0},
+            ]
+        )
+        mock_dal.db_utils.execute.assert_called_once()
+        assert len(job_ids) == 2
+        assert job_ids[0] < job_ids[1]
+
+    @pytest.mark.asyncio
+    async def test_insert_jobs_empty(self, mock_dal):
+        """Test insert_jobs without jobs does nothing."""
+        assert await mock_dal.insert_jobs([]) == []
+        mock_dal.db_utils.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_jobs(self, mock_dal):
+        """Test get_jobs returns the stored rows."""
+        mock_dal.db_utils.fetchall.return_value = [{"id": "job-1"}]
+        results = await mock_dal.get_jobs()
+        assert mock_dal.db_utils.fetchall.call_args[0][1] is True
+        assert results == [{"id": "job-1"}]
+
+    @pytest.mark.asyncio
+    async def test_claim_due_jobs(self, mock_dal):
+        """Test claim_due_jobs marks the due jobs as claimed and returns them."""
+        claimed = [{"id": "job-1", "user_id": 1, "action": "end"}]
+        mock_dal.db_utils.fetchall.side_effect = [[{"id": "job-1"}], claimed]
+        results = await mock_dal.claim_due_jobs(datetime(2026, 10, 18, 12, 0, 0), 4)
+        mock_dal.db_utils.execute.assert_called_once()
+        assert results == claimed
+
+    @pytest.mark.asyncio
+    async def test_claim_due_jobs_none_due(self, mock_dal):
+        """Test claim_due_jobs claims nothing when no job is due."""
+        mock_dal.db_utils.fetchall.return_value = []
+        results = await mock_dal.claim_due_jobs(datetime(2026, 10, 18, 12, 0, 0), 4)
+        mock_dal.db_utils.execute.assert_not_called()
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_release_claimed_jobs(self, mock_dal):
+        """Test release_claimed_jobs executes an update."""
+        await mock_dal.release_claimed_jobs()
+        mock_dal.db_utils.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reschedule_job(self, mock_dal):
+        """Test reschedule_job executes an update."""
+        await mock_dal.reschedule_job("job-1", 2, datetime(2026, 10, 18, 12, 0, 0))
+        mock_dal.db_utils.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expedite_retries(self, mock_dal):
+        """Test expedite_retries returns the number of retries made due."""
+        mock_dal.db_utils.fetchall.return_value = [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert await mock_dal.expedite_retries(datetime(2026, 10, 18, 12, 0, 0)) == 3
+        mock_dal.db_utils.execute.assert_called_once()
+        assert mock_dal.db_utils.execute.call_args.kwargs == {}
+
+    @pytest.mark.asyncio
+    async def test_expedite_retries_none_waiting(self, mock_dal):
+        """Test expedite_retries skips the update when no retry is waiting."""
+        mock_dal.db_utils.fetchall.return_value = []
+        assert await mock_dal.expedite_retries(datetime(2026, 10, 18, 12, 0, 0)) == 0
+        mock_dal.db_utils.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_job(self, mock_dal):
+        """Test delete_job executes a delete."""
+        await mock_dal.delete_job("job-1")
+        mock_dal.db_utils.execute.assert_called_once()
+
+
+class TestGw2SessionSamplesDal:
+    """Test cases for Gw2SessionSamplesDal."""
+
+    @pytest.fixture
+    def mock_dal(self):
+        db_session = MagicMock()
+        log = MagicMock()
+        with patch("src.database.dal.gw2.gw2_session_samples_dal.DBUtilsAsync") as mock_db_utils_class:
+            mock_db_utils = AsyncMock()
+            mock_db_utils_class.return_value = mock_db_utils
+            dal = Gw2SessionSamplesDal(db_session, log)
+            dal.db_utils = mock_db_utils
+            yield dal
+
+    def test_init(self):
+        """Test Gw2SessionSamplesDal initialization."""
+        db_session = MagicMock()
+        log = MagicMock()
+        with patch("src.database.dal.gw2.gw2_session_samples_dal.DBUtilsAsync") as mock_db_utils_class:
+            dal = Gw2SessionSamplesDal(db_session, log)
+            mock_db_utils_class.assert_called_once_with(db_session)
+            assert dal.log == log
+
+    @pytest.mark.asyncio
+    async def test_insert_samples(self, mock_dal):
+        """Test insert_samples writes the rows with one statement."""
+        ts = datetime(2026, 10, 18, 12, 0, 0)
+        await mock_dal.insert_samples([{"user_id": 1, "metric_id": 3, "ts": ts, "value": 100}])
+        mock_dal.db_utils.execute.assert_called_once()
+        assert mock_dal.db_utils.execute.call_args[1] == {}
+
+    @pytest.mark.asyncio
+    async def test_insert_samples_in_chunks(self, mock_dal):
+        """Test insert_samples splits large inserts into one statement per chunk."""
+        ts = datetime(2026, 10, 18, 12, 0, 0)
+        samples = [{"user_id": user_id, "metric_id": 0, "ts": ts, "value": 1} for user_id in range(5001)]
+        with patch("src.database.dal.gw2.gw2_session_samples_dal.INSERT_CHUNK_SIZE", 2000):
+            await mock_dal.insert_samples(samples)
+        assert mock_dal.db_utils.execute.call_count == 3
+        assert all(call[1] == {} for call in mock_dal.db_utils.execute.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_insert_samples_empty(self, mock_dal):
+        """Test insert_samples without samples does nothing."""
+        await mock_dal.insert_samples([])
+        mock_dal.db_utils.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_user_samples(self, mock_dal):
+        """Test get_user_samples names the metrics of the rows by their stat."""
+        ts = datetime(2026, 10, 18, 12, 0, 0)
+        gold_id = SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT].index("gold")
+        mock_dal.db_utils.fetchall.return_value = [{"ts": ts, "metric_id": gold_id, "value": 150}]
+        results = await mock_dal.get_user_samples(1, ts, ts, ["gold"])
+        assert results == [{"ts": ts, "field": "gold", "value": 150}]
+        assert mock_dal.db_utils.fetchall.call_args[0][1] is True
+
+    @pytest.mark.asyncio
+    async def test_delete_samples_before(self, mock_dal):
+        """Test delete_samples_before returns the number of rows deleted."""
+        mock_dal.db_utils.fetchvalue.return_value = "42"
+        assert await mock_dal.delete_samples_before(datetime(2025, 10, 1)) == 42
+        delete = str(mock_dal.db_utils.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "DELETE FROM gw2.gw2_session_samples" in delete
+
+    @pytest.mark.asyncio
+    async def test_delete_samples_before_nothing_expired(self, mock_dal):
+        """Test delete_samples_before skips the delete when no sample is expired."""
+        mock_dal.db_utils.fetchvalue.return_value = "0"
+        assert await mock_dal.delete_samples_before(datetime(2025, 10, 1)) == 0
+        mock_dal.db_utils.execute.assert_not_called()
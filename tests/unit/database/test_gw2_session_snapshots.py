@@ -0,0 +1,131 @@
+"""Tests for the packed GW2 session snapshot format."""
+
+from src.database.dal.gw2.gw2_session_snapshots import (
+    SNAPSHOT_LAYOUT,
+    SNAPSHOT_LAYOUTS,
+    metric_ids,
+    pack_end,
+    pack_start,
+    unpack_session,
+)
+from src.gw2.constants.gw2_currencies import ACHIEVEMENT_MAPPING, WALLET_MAPPING
+
+
+def _snapshot(date: str, **stats) -> dict:
+    """Session snapshot as built by the session start/end, keys sorted with date first."""
+    snapshot = dict.fromkeys(SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT], 0)
+    snapshot.update(stats, acc_name="TestAccount.1234", user_id=67890)
+    return {"date": date, **dict(sorted(snapshot.items()))}
+
+
+def _row(start: dict, end: dict | None) -> dict:
+    """gw2_sessions row holding the packed start and end snapshots."""
+    packed_start = pack_start(start)
+    return {
+        "id": 42,
+        "user_id": 67890,
+        "acc_name": "TestAccount.1234",
+        "layout": SNAPSHOT_LAYOUT,
+        "start": packed_start,
+        "end": pack_end(end, SNAPSHOT_LAYOUT, packed_start) if end else None,
+        "start_date": start["date"],
+        "end_date": end["date"] if end else None,
+    }
+
+
+class TestSnapshotLayouts:
+    """Test cases for the packed field order."""
+
+    def test_current_layout_covers_every_stat(self):
+        """Test that every wallet and achievement stat has a place in the current layout."""
+        fields = SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT]
+        assert fields[0] == "wvw_rank"
+        assert set(WALLET_MAPPING.values()) <= set(fields)
+        assert set(ACHIEVEMENT_MAPPING.values()) <= set(fields)
+
+    def test_layout_fields_are_unique(self):
+        """Test that no field is packed twice."""
+        for fields in SNAPSHOT_LAYOUTS.values():
+            assert len(fields) == len(set(fields))
+
+
+class TestMetricIds:
+    """Test cases for the session sample metric ids."""
+
+    def test_metric_ids_are_layout_positions(self):
+        """Test that a stat's metric id is its position in the current layout."""
+        fields = SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT]
+        assert metric_ids(["wvw_rank", "gold"]) == [0, fields.index("gold")]
+
+    def test_metric_ids_match_packed_start(self):
+        """Test that metric ids index the packed stats, so samples can be written from them."""
+        packed = pack_start(_snapshot("2026-10-18 12:00:00", karma=5000))
+        assert packed[metric_ids(["karma"])[0]] == 5000
+
+
+class TestPack:
+    """Test cases for packing snapshots."""
+
+    def test_pack_start_follows_layout(self):
+        """Test that the start stats are packed in layout order without the row columns."""
+        packed = pack_start(_snapshot("2026-10-18 12:00:00", wvw_rank=300, gold=100))
+        fields = SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT]
+        assert len(packed) == len(fields)
+        assert packed[fields.index("wvw_rank")] == 300
+        assert packed[fields.index("gold")] == 100
+
+    def test_pack_start_missing_stat(self):
+        """Test that a stat missing from the snapshot is packed as None."""
+        packed = pack_start({"gold": 100})
+        assert packed[SNAPSHOT_LAYOUTS[SNAPSHOT_LAYOUT].index("karma")] is None
+
+    def test_pack_end_keeps_changed_stats(self):
+        """Test that the end keeps only the stats that changed since start."""
+        start = pack_start(_snapshot("2026-10-18 12:00:00", gold=100, karma=5000))
+        end = _snapshot("2026-10-18 13:00:00", gold=150, karma=5000, players=3)
+        assert pack_end(end, SNAPSHOT_LAYOUT, start) == {"gold": 150, "players": 3}
+
+    def test_pack_end_unchanged(self):
+        """Test that an end identical to the start packs to an empty dict."""
+        start = _snapshot("2026-10-18 12:00:00", gold=100)
+        assert pack_end(start, SNAPSHOT_LAYOUT, pack_start(start)) == {}
+
+    def test_pack_end_missing_stat(self):
+        """Test that a stat missing from the end is stored as None."""
+        start = pack_start({"gold": 100})
+        assert pack_end({}, SNAPSHOT_LAYOUT, start) == {"gold": None}
+
+
+class TestUnpackSession:
+    """Test cases for rebuilding snapshots."""
+
+    def test_round_trip(self):
+        """Test that unpacking gives back the snapshots that were packed, key order included."""
+        start = _snapshot("2026-10-18 12:00:00", wvw_rank=300, gold=100, karma=5000)
+        end = _snapshot("2026-10-18 13:00:00", wvw_rank=301, gold=150, karma=5000, players=3)
+        session = unpack_session(_row(start, end))
+        assert list(session["start"].items()) == list(start.items())
+        assert list(session["end"].items()) == list(end.items())
+        assert set(session) == {"id", "user_id", "acc_name", "start", "end"}
+
+    def test_unfinished_session(self):
+        """Test that a session without end date has no end snapshot."""
+        start = _snapshot("2026-10-18 12:00:00", gold=100)
+        session = unpack_session(_row(start, None))
+        assert session["start"] == start
+        assert session["end"] is None
+
+    def test_missing_stats_stay_missing(self):
+        """Test that stats missing from a snapshot are not added back as None."""
+        start = {"date": "2026-10-18 12:00:00", "acc_name": "TestAccount.1234", "gold": 100, "user_id": 67890}
+        end = {"date": "2026-10-18 13:00:00", "acc_name": "TestAccount.1234", "karma": 10, "user_id": 67890}
+        session = unpack_session(_row(start, end))
+        assert session["start"] == start
+        assert session["end"] == end
+
+    def test_does_not_change_row(self):
+        """Test that the row read from the database is left as it was."""
+        row = _row(_snapshot("2026-10-18 12:00:00"), None)
+        unpack_session(row)
+        assert row["layout"] == SNAPSHOT_LAYOUT
+        assert isinstance(row["start"], list)
@@ -9,6 +9,13 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def mock_static_data():
+    """Keep the static data store (database and API) out of the account command tests."""
+    with patch("src.gw2.cogs.account.gw2_utils.get_static_data", new_callable=AsyncMock, return_value={}) as mock:
+        yield mock
+
+
 class TestGW2Account:
     """Test cases for the GW2Account cog class."""
 
@@ -120,8 +127,7 @@ async def test_account_command_invalid_api_key(self, mock_ctx, sample_api_key_da
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 invalid_key_error = APIInvalidKey(mock_ctx.bot, f"(400) {gw2_messages.INVALID_APIKEY_MSG}")
                 mock_client_instance.check_api_key = AsyncMock(return_value=invalid_key_error)
 
@@ -143,8 +149,7 @@ async def test_account_command_insufficient_permissions(self, mock_ctx, sample_a
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=insufficient_permissions_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(return_value=sample_account_data)
 
                 with patch("src.gw2.cogs.account.bot_utils.send_error_msg") as mock_error:
@@ -163,8 +168,7 @@ async def test_account_command_successful_basic(
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(return_value=sample_account_data)
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
@@ -191,8 +195,7 @@ async def test_account_command_with_characters_permission(self, mock_ctx, sample
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=characters_api_key_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(return_value=sample_account_data)
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
@@ -220,8 +223,7 @@ async def test_account_command_with_progression_permission(self, mock_ctx, sampl
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=progression_api_key_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(return_value=sample_account_data)
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
@@ -255,8 +257,7 @@ async def test_account_command_with_pvp_permission(self, mock_ctx, sample_accoun
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=pvp_api_key_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(return_value=sample_account_data)
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
@@ -277,27 +278,28 @@ async def test_account_command_with_pvp_permission(self, mock_ctx, sample_accoun
                         # Verify the function completed without error
 
     @pytest.mark.asyncio
-    async def test_account_command_with_guilds(self, mock_ctx, sample_account_data, sample_world_data):
+    async def test_account_command_with_guilds(
+        self, mock_ctx, sample_account_data, sample_world_data, mock_static_data
+    ):
         """Test account command with guild information."""
         full_permissions_data = [{"key": "test-api-key-12345", "permissions": "account,guilds"}]
 
-        guild_data_1 = {"id": "guild-id-1", "name": "Test Guild One", "tag": "TG1"}
-
-        guild_data_2 = {"id": "guild-id-2", "name": "Test Guild Two", "tag": "TG2"}
+        mock_static_data.return_value = {
+            "guild-id-1": {"id": "guild-id-1", "name": "Test Guild One", "tag": "TG1"},
+            "guild-id-2": {"id": "guild-id-2", "name": "Test Guild Two", "tag": "TG2"},
+        }
+        mock_ctx.send = AsyncMock(return_value=MagicMock(edit=AsyncMock(), delete=AsyncMock()))
 
         with patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=full_permissions_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(return_value=sample_account_data)
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_account_data,  # account call
                         sample_world_data,  # world call
-                        guild_data_1,  # first guild call
-                        guild_data_2,  # second guild call
                     ]
                 )
 
@@ -305,8 +307,10 @@ async def test_account_command_with_guilds(self, mock_ctx, sample_account_data,
                     await account(mock_ctx)
 
                     mock_send.assert_called_once()
-                    mock_send.assert_called_once()
-                    # Verify the function completed without error
+                    mock_static_data.assert_awaited_once_with(mock_ctx.bot, "guild", ["guild-id-1", "guild-id-2"])
+                    embed = mock_send.call_args[0][1]
+                    guilds_field = next(f for f in embed.fields if f.name == "Guilds")
+                    assert guilds_field.value == "`[TG1] Test Guild One\n[TG2] Test Guild Two`"
 
     @pytest.mark.asyncio
     async def test_account_command_api_error_during_execution(self, mock_ctx, sample_api_key_data, sample_account_data):
@@ -315,8 +319,7 @@ async def test_account_command_api_error_during_execution(self, mock_ctx, sample
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(return_value=sample_account_data)
                 mock_client_instance.call_api = AsyncMock(side_effect=Exception("API Error"))
 
@@ -327,22 +330,23 @@ async def test_account_command_api_error_during_execution(self, mock_ctx, sample
                     mock_ctx.bot.log.error.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_account_command_guild_api_error(self, mock_ctx, sample_account_data, sample_world_data):
-        """Test account command when guild API call fails."""
+    async def test_account_command_guild_api_error(
+        self, mock_ctx, sample_account_data, sample_world_data, mock_static_data
+    ):
+        """Test account command when the guild lookup fails."""
         full_permissions_data = [{"key": "test-api-key-12345", "permissions": "account,guilds"}]
+        mock_static_data.side_effect = Exception("Guild API Error")
 
         with patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=full_permissions_data)
 
-            with patch("src.gw2.cogs.account.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(return_value=sample_account_data)
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_account_data,  # account call
                         sample_world_data,  # world call
-                        Exception("Guild API Error"),  # guild call fails
                     ]
                 )
 
@@ -502,45 +506,6 @@ async def test_keep_typing_forbidden_breaks_loop(self, mock_ctx):
         mock_ctx.message.channel.typing.assert_called_once()
 
 
-class TestFetchGuildInfoStandalone:
-    """Test cases for the _fetch_guild_info_standalone helper function."""
-
-    @pytest.mark.asyncio
-    async def test_fetch_guild_info_success(self):
-        """Test successful guild info fetch returns formatted name and id."""
-        from src.gw2.cogs.account import _fetch_guild_info_standalone
-
-        mock_gw2_api = MagicMock()
-        mock_gw2_api.call_api = AsyncMock(return_value={"name": "Test Guild", "tag": "TG"})
-        mock_ctx = MagicMock()
-        guild_id = "guild-abc-123"
-
-        result = await _fetch_guild_info_standalone(mock_gw2_api, guild_id, "api-key", mock_ctx)
-
-        assert result == ("[TG] Test Guild", guild_id)
-        mock_gw2_api.call_api.assert_called_once_with(f"guild/{guild_id}", "api-key")
-
-    @pytest.mark.asyncio
-    async def test_fetch_guild_info_exception_returns_none(self):
-        """Test that an exception returns (None, guild_id) and logs the error."""
-        from src.gw2.cogs.account import _fetch_guild_info_standalone
-
-        mock_gw2_api = MagicMock()
-        mock_gw2_api.call_api = AsyncMock(side_effect=Exception("API failure"))
-        mock_ctx = MagicMock()
-        mock_ctx.bot = MagicMock()
-        mock_ctx.bot.log = MagicMock()
-        guild_id = "guild-abc-123"
-
-        result = await _fetch_guild_info_standalone(mock_gw2_api, guild_id, "api-key", mock_ctx)
-
-        assert result == (None, guild_id)
-        mock_ctx.bot.log.error.assert_called_once()
-        error_msg = mock_ctx.bot.log.error.call_args[0][0]
-        assert "guild-abc-123" in error_msg
-        assert "API failure" in error_msg
-
-
 class TestAccountCommandFullPaths:
     """Test cases covering the main account command body (lines 86-259)."""
 
@@ -603,7 +568,7 @@ async def test_account_command_full_success_path(self, mock_ctx, sample_account_
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_embed") as mock_send_embed,
             patch("src.gw2.cogs.account.bot_utils.get_current_date_time_str_long", return_value="2024-01-01 12:00:00"),
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
@@ -612,7 +577,7 @@ async def test_account_command_full_success_path(self, mock_ctx, sample_account_
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             mock_client_instance.call_api = AsyncMock(
                 side_effect=[
@@ -657,12 +622,12 @@ async def test_account_command_exception_handler(self, mock_ctx):
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_error_msg") as mock_error_msg,
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
 
             await account(mock_ctx)
@@ -685,7 +650,7 @@ async def test_account_command_exception_handler_with_active_typing_task(self, m
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_error_msg") as mock_error_msg,
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
             patch("src.gw2.cogs.account.asyncio.create_task") as mock_create_task,
@@ -693,7 +658,7 @@ async def test_account_command_exception_handler_with_active_typing_task(self, m
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             # First call_api (account) raises, after progress msg and typing task created
             mock_client_instance.call_api = AsyncMock(side_effect=RuntimeError("API exploded"))
@@ -725,7 +690,7 @@ async def test_account_command_all_permissions(self, mock_ctx, sample_account_da
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_embed") as mock_send_embed,
             patch("src.gw2.cogs.account.bot_utils.get_current_date_time_str_long", return_value="2024-01-01 12:00:00"),
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
@@ -741,7 +706,7 @@ async def test_account_command_all_permissions(self, mock_ctx, sample_account_da
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             mock_client_instance.call_api = AsyncMock(
                 side_effect=[
@@ -792,7 +757,7 @@ async def test_account_command_optional_task_failure_is_skipped(
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_embed") as mock_send_embed,
             patch("src.gw2.cogs.account.bot_utils.get_current_date_time_str_long", return_value="2024-01-01 12:00:00"),
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
@@ -801,7 +766,7 @@ async def test_account_command_optional_task_failure_is_skipped(
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             mock_client_instance.call_api = AsyncMock(
                 side_effect=[
@@ -833,7 +798,7 @@ async def test_account_command_optional_task_failure_is_skipped(
             assert "Characters" not in field_names
 
     @pytest.mark.asyncio
-    async def test_account_command_guild_handling(self, mock_ctx, sample_world_data):
+    async def test_account_command_guild_handling(self, mock_ctx, sample_world_data, mock_static_data):
         """Test account command with guilds in account data (lines 187-228)."""
         api_key_data = [{"key": "test-api-key-12345", "permissions": "account"}]
         account_data_with_guilds = {
@@ -851,15 +816,17 @@ async def test_account_command_guild_handling(self, mock_ctx, sample_world_data)
             "age": 525600,
             "created": "2021-06-15T00:00:00.000Z",
         }
-        guild_data_1 = {"name": "Test Guild One", "tag": "TG1"}
-        guild_data_2 = {"name": "Test Guild Two", "tag": "TG2"}
+        mock_static_data.return_value = {
+            "guild-id-1": {"id": "guild-id-1", "name": "Test Guild One", "tag": "TG1"},
+            "guild-id-2": {"id": "guild-id-2", "name": "Test Guild Two", "tag": "TG2"},
+        }
 
         progress_msg = AsyncMock()
         mock_ctx.send.return_value = progress_msg
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_embed") as mock_send_embed,
             patch("src.gw2.cogs.account.bot_utils.get_current_date_time_str_long", return_value="2024-01-01 12:00:00"),
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
@@ -868,14 +835,12 @@ async def test_account_command_guild_handling(self, mock_ctx, sample_world_data)
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             mock_client_instance.call_api = AsyncMock(
                 side_effect=[
                     account_data_with_guilds,  # account
                     sample_world_data,  # worlds/{server_id}
-                    guild_data_1,  # guild/{guild-id-1}
-                    guild_data_2,  # guild/{guild-id-2}
                 ]
             )
 
@@ -910,7 +875,7 @@ async def test_account_command_guild_handling(self, mock_ctx, sample_world_data)
 
     @pytest.mark.asyncio
     async def test_account_command_guild_fetch_exception_skipped(self, mock_ctx, sample_world_data):
-        """Test that guild fetch exceptions are skipped gracefully."""
+        """Test that guilds the store couldn't resolve are skipped gracefully."""
         api_key_data = [{"key": "test-api-key-12345", "permissions": "account"}]
         account_data_with_guilds = {
             "id": "account-id-123",
@@ -933,21 +898,16 @@ async def test_account_command_guild_fetch_exception_skipped(self, mock_ctx, sam
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_embed") as mock_send_embed,
             patch("src.gw2.cogs.account.bot_utils.get_current_date_time_str_long", return_value="2024-01-01 12:00:00"),
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
             patch("src.gw2.cogs.account.asyncio.create_task") as mock_create_task,
             patch("src.gw2.cogs.account.asyncio.Event") as mock_event_cls,
-            patch(
-                "src.gw2.cogs.account._fetch_guild_info_standalone",
-                new_callable=AsyncMock,
-                return_value=(None, "guild-id-1"),
-            ),
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             mock_client_instance.call_api = AsyncMock(
                 side_effect=[
@@ -965,7 +925,7 @@ async def test_account_command_guild_fetch_exception_skipped(self, mock_ctx, sam
 
             mock_send_embed.assert_called_once()
 
-            # Guild returned None for name, so Guilds field should not appear
+            # Guild was not resolved, so Guilds field should not appear
             embed = mock_send_embed.call_args[0][1]
             field_names = [f.name for f in embed.fields]
             assert "Guilds" not in field_names
@@ -994,7 +954,7 @@ async def test_account_command_commander_no(self, mock_ctx, sample_world_data):
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_embed") as mock_send_embed,
             patch("src.gw2.cogs.account.bot_utils.get_current_date_time_str_long", return_value="2024-01-01 12:00:00"),
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
@@ -1003,7 +963,7 @@ async def test_account_command_commander_no(self, mock_ctx, sample_world_data):
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             mock_client_instance.call_api = AsyncMock(
                 side_effect=[
@@ -1046,7 +1006,7 @@ async def test_account_command_access_normalization(self, mock_ctx, sample_world
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_embed") as mock_send_embed,
             patch("src.gw2.cogs.account.bot_utils.get_current_date_time_str_long", return_value="2024-01-01 12:00:00"),
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
@@ -1055,7 +1015,7 @@ async def test_account_command_access_normalization(self, mock_ctx, sample_world
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             mock_client_instance.call_api = AsyncMock(
                 side_effect=[
@@ -1108,7 +1068,7 @@ async def test_account_author_no_avatar(self, mock_ctx, sample_world_data):
 
         with (
             patch("src.gw2.cogs.account.Gw2KeyDal") as mock_dal,
-            patch("src.gw2.cogs.account.Gw2Client") as mock_client,
+            patch.object(mock_ctx.bot, "gw2_client") as mock_client,
             patch("src.gw2.cogs.account.bot_utils.send_embed") as mock_send_embed,
             patch("src.gw2.cogs.account.bot_utils.get_current_date_time_str_long", return_value="2024-01-01 12:00:00"),
             patch("src.gw2.cogs.account._keep_typing_alive", new=MagicMock()),
@@ -1117,7 +1077,7 @@ async def test_account_author_no_avatar(self, mock_ctx, sample_world_data):
         ):
             mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            mock_client_instance = mock_client.return_value
+            mock_client_instance = mock_client
             mock_client_instance.check_api_key = AsyncMock(return_value={"valid": True})
             mock_client_instance.call_api = AsyncMock(
                 side_effect=[
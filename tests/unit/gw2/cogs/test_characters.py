@@ -110,8 +110,7 @@ async def test_characters_invalid_api_key_sends_error_with_help(self, mock_ctx,
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 invalid_error = APIInvalidKey(mock_ctx.bot, f"(400) {gw2_messages.INVALID_APIKEY_MSG}")
                 mock_client_instance.check_api_key = AsyncMock(return_value=invalid_error)
                 with patch("src.gw2.cogs.characters.bot_utils.send_error_msg") as mock_error:
@@ -131,8 +130,7 @@ async def test_characters_missing_characters_permission_sends_error(self, mock_c
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=no_chars_permission_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "progression"]}
                 )
@@ -152,8 +150,7 @@ async def test_characters_missing_account_permission_sends_error(self, mock_ctx)
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=no_account_permission_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["characters", "progression"]}
                 )
@@ -172,8 +169,7 @@ async def test_characters_successful_with_character_data(
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters", "progression"]}
                 )
@@ -238,8 +234,7 @@ async def test_characters_successful_character_age_calculation(
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -281,8 +276,7 @@ async def test_characters_successful_created_date_parsed(self, mock_ctx, sample_
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -323,8 +317,7 @@ async def test_characters_api_exception_during_execution(self, mock_ctx, sample_
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -355,8 +348,7 @@ async def test_characters_embed_has_thumbnail_and_author(self, mock_ctx, sample_
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -405,8 +397,7 @@ async def test_characters_author_no_avatar(self, mock_ctx, sample_api_key_data,
         with patch("src.gw2.cogs.characters.Gw2KeyDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=sample_api_key_data)
-            with patch("src.gw2.cogs.characters.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -232,6 +232,19 @@ async def test_config_session_on_activates(self, mock_ctx):
                 assert embed.color == discord.Color.green()
                 assert "ACTIVATED" in embed.description
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("subcommand", "enabled"), [("on", True), ("off", False)])
+    async def test_config_session_updates_presence_filter(self, mock_ctx, subcommand, enabled):
+        """Test config session keeps the presence prefilter of the guild current."""
+        with patch("src.gw2.cogs.config.Gw2ConfigsDal") as mock_dal:
+            mock_dal.return_value.update_gw2_session_config = AsyncMock()
+            with (
+                patch("src.gw2.cogs.config.bot_utils.send_embed"),
+                patch("src.gw2.cogs.config.gw2_utils.set_guild_session_enabled") as mock_set_enabled,
+            ):
+                await config_session(mock_ctx, subcommand)
+                mock_set_enabled.assert_called_once_with(99999, enabled)
+
     @pytest.mark.asyncio
     async def test_config_session_ON_uppercase_activates(self, mock_ctx):
         """Test config session 'ON' (uppercase) activates session with green color."""
@@ -403,24 +416,28 @@ async def test_handle_update_successful_update(self, config_view, mock_ctx, serv
         with patch("src.gw2.cogs.config.Gw2ConfigsDal") as mock_dal:
             mock_instance = mock_dal.return_value
             mock_instance.update_gw2_session_config = AsyncMock()
-            with patch("src.gw2.cogs.config.chat_formatting.green_text", return_value="ON"):
-                with patch("src.gw2.cogs.config.chat_formatting.red_text", return_value="OFF"):
-                    await config_view._handle_update(interaction, button, "session", "Session Tracking")
-
-                    # Verify defer was called
-                    interaction.response.defer.assert_called_once()
-                    # Verify database update
-                    mock_instance.update_gw2_session_config.assert_called_once_with(
-                        99999,
-                        False,
-                        12345,  # Toggle from True to False
-                    )
-                    # Verify config was toggled
-                    assert config_view.server_config["session"] is False
-                    # Verify _updating was reset
-                    assert config_view._updating is False
-                    # Verify success message was sent
-                    assert interaction.edit_original_response.call_count == 2
+            with (
+                patch("src.gw2.cogs.config.chat_formatting.green_text", return_value="ON"),
+                patch("src.gw2.cogs.config.chat_formatting.red_text", return_value="OFF"),
+                patch("src.gw2.cogs.config.gw2_utils.set_guild_session_enabled") as mock_set_enabled,
+            ):
+                await config_view._handle_update(interaction, button, "session", "Session Tracking")
+
+                # Verify defer was called
+                interaction.response.defer.assert_called_once()
+                # Verify database update
+                mock_instance.update_gw2_session_config.assert_called_once_with(
+                    99999,
+                    False,
+                    12345,  # Toggle from True to False
+                )
+                # Verify config was toggled, in the presence prefilter too
+                assert config_view.server_config["session"] is False
+                mock_set_enabled.assert_called_once_with(99999, False)
+                # Verify _updating was reset
+                assert config_view._updating is False
+                # Verify success message was sent
+                assert interaction.edit_original_response.call_count == 2
 
     @pytest.mark.asyncio
     async def test_handle_update_discord_http_error(self, config_view, mock_ctx):
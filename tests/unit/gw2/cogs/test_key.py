@@ -103,8 +103,7 @@ async def test_add_deletes_message_for_privacy(self, mock_ctx):
         """Test that add command deletes the user's message for privacy."""
         api_key = "test-api-key-12345"
         with patch("src.gw2.cogs.key.bot_utils.delete_message") as mock_delete:
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 invalid_error = APIInvalidKey(mock_ctx.bot, f"(400) {gw2_messages.INVALID_APIKEY_MSG}")
                 mock_client_instance.check_api_key = AsyncMock(return_value=invalid_error)
                 with patch("src.gw2.cogs.key.bot_utils.send_error_msg") as mock_error:
@@ -117,8 +116,7 @@ async def test_add_invalid_api_key_sends_error(self, mock_ctx):
         """Test add command with invalid API key sends error message."""
         api_key = "invalid-key"
         with patch("src.gw2.cogs.key.bot_utils.delete_message"):
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 invalid_error = APIInvalidKey(mock_ctx.bot, f"(400) {gw2_messages.INVALID_APIKEY_MSG}")
                 mock_client_instance.check_api_key = AsyncMock(return_value=invalid_error)
                 with patch("src.gw2.cogs.key.bot_utils.send_error_msg") as mock_error:
@@ -134,8 +132,7 @@ async def test_add_account_info_api_fails(self, mock_ctx):
         """Test add command when account info API call fails."""
         api_key = "valid-api-key-12345"
         with patch("src.gw2.cogs.key.bot_utils.delete_message"):
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -150,8 +147,7 @@ async def test_add_server_name_api_fails(self, mock_ctx):
         """Test add command when server name API call fails."""
         api_key = "valid-api-key-12345"
         with patch("src.gw2.cogs.key.bot_utils.delete_message"):
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -172,8 +168,7 @@ async def test_add_user_already_has_key_shows_error_with_options(self, mock_ctx)
         """Test add command when user already has a key registered."""
         api_key = "valid-api-key-12345"
         with patch("src.gw2.cogs.key.bot_utils.delete_message"):
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -203,8 +198,7 @@ async def test_add_key_already_in_use_by_someone_else(self, mock_ctx):
         """Test add command when the API key is already in use by another user."""
         api_key = "valid-api-key-12345"
         with patch("src.gw2.cogs.key.bot_utils.delete_message"):
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -230,8 +224,7 @@ async def test_add_successful_insert(self, mock_ctx):
         """Test add command with successful key insertion."""
         api_key = "valid-api-key-12345"
         with patch("src.gw2.cogs.key.bot_utils.delete_message"):
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -246,9 +239,13 @@ async def test_add_successful_insert(self, mock_ctx):
                     mock_instance.get_api_key_by_user = AsyncMock(return_value=None)
                     mock_instance.get_api_key = AsyncMock(return_value=None)
                     mock_instance.insert_api_key = AsyncMock()
-                    with patch("src.gw2.cogs.key.bot_utils.send_msg") as mock_send:
+                    with (
+                        patch("src.gw2.cogs.key.bot_utils.send_msg") as mock_send,
+                        patch("src.gw2.cogs.key.gw2_utils.add_key_user") as mock_add_key_user,
+                    ):
                         result = await add(mock_ctx, api_key)
                         mock_instance.insert_api_key.assert_called_once()
+                        mock_add_key_user.assert_called_once_with(12345)
                         insert_args = mock_instance.insert_api_key.call_args[0][0]
                         assert insert_args["user_id"] == 12345
                         assert insert_args["key_name"] == "TestKey"
@@ -267,8 +264,7 @@ async def test_add_insert_raises_exception(self, mock_ctx):
         """Test add command when database insert raises an exception."""
         api_key = "valid-api-key-12345"
         with patch("src.gw2.cogs.key.bot_utils.delete_message"):
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters"]}
                 )
@@ -360,8 +356,7 @@ async def test_update_invalid_api_key_sends_error(self, mock_ctx):
             with patch("src.gw2.cogs.key.Gw2KeyDal") as mock_dal:
                 mock_instance = mock_dal.return_value
                 mock_instance.get_api_key_by_user = AsyncMock(return_value=[{"name": "OldKey", "key": "old-key-12345"}])
-                with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                    mock_client_instance = mock_client.return_value
+                with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                     invalid_error = APIInvalidKey(mock_ctx.bot, f"(400) {gw2_messages.INVALID_APIKEY_MSG}")
                     mock_client_instance.check_api_key = AsyncMock(return_value=invalid_error)
                     with patch("src.gw2.cogs.key.bot_utils.send_error_msg") as mock_error:
@@ -379,8 +374,7 @@ async def test_update_account_info_api_fails(self, mock_ctx):
             with patch("src.gw2.cogs.key.Gw2KeyDal") as mock_dal:
                 mock_instance = mock_dal.return_value
                 mock_instance.get_api_key_by_user = AsyncMock(return_value=[{"name": "OldKey", "key": "old-key-12345"}])
-                with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                    mock_client_instance = mock_client.return_value
+                with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                     mock_client_instance.check_api_key = AsyncMock(
                         return_value={"name": "NewKey", "permissions": ["account", "characters"]}
                     )
@@ -398,8 +392,7 @@ async def test_update_server_name_api_fails(self, mock_ctx):
             with patch("src.gw2.cogs.key.Gw2KeyDal") as mock_dal:
                 mock_instance = mock_dal.return_value
                 mock_instance.get_api_key_by_user = AsyncMock(return_value=[{"name": "OldKey", "key": "old-key-12345"}])
-                with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                    mock_client_instance = mock_client.return_value
+                with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                     mock_client_instance.check_api_key = AsyncMock(
                         return_value={"name": "NewKey", "permissions": ["account", "characters"]}
                     )
@@ -426,8 +419,7 @@ async def test_update_key_in_use_by_different_user(self, mock_ctx):
                 mock_instance.get_api_key = AsyncMock(
                     return_value=[{"user_id": 99999, "key": api_key}]  # different user
                 )
-                with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                    mock_client_instance = mock_client.return_value
+                with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                     mock_client_instance.check_api_key = AsyncMock(
                         return_value={"name": "NewKey", "permissions": ["account", "characters"]}
                     )
@@ -454,8 +446,7 @@ async def test_update_successful(self, mock_ctx):
                 mock_instance.get_api_key_by_user = AsyncMock(return_value=[{"name": "OldKey", "key": "old-key-12345"}])
                 mock_instance.get_api_key = AsyncMock(return_value=None)
                 mock_instance.update_api_key = AsyncMock()
-                with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                    mock_client_instance = mock_client.return_value
+                with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                     mock_client_instance.check_api_key = AsyncMock(
                         return_value={"name": "NewKey", "permissions": ["account", "characters"]}
                     )
@@ -493,8 +484,7 @@ async def test_update_same_user_key_allowed(self, mock_ctx):
                 # Key is found but belongs to same user
                 mock_instance.get_api_key = AsyncMock(return_value=[{"user_id": 12345, "key": api_key}])  # same user
                 mock_instance.update_api_key = AsyncMock()
-                with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                    mock_client_instance = mock_client.return_value
+                with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                     mock_client_instance.check_api_key = AsyncMock(
                         return_value={"name": "NewKey", "permissions": ["account"]}
                     )
@@ -520,8 +510,7 @@ async def test_update_raises_exception_on_db_update(self, mock_ctx):
                 mock_instance.get_api_key_by_user = AsyncMock(return_value=[{"name": "OldKey", "key": "old-key-12345"}])
                 mock_instance.get_api_key = AsyncMock(return_value=None)
                 mock_instance.update_api_key = AsyncMock(side_effect=Exception("DB update error"))
-                with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                    mock_client_instance = mock_client.return_value
+                with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                     mock_client_instance.check_api_key = AsyncMock(
                         return_value={"name": "NewKey", "permissions": ["account"]}
                     )
@@ -578,9 +567,13 @@ async def test_remove_has_api_key_deletes_and_confirms(self, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=[{"key": "test-api-key", "name": "TestKey"}])
             mock_instance.delete_user_api_key = AsyncMock()
-            with patch("src.gw2.cogs.key.bot_utils.send_msg") as mock_send:
+            with (
+                patch("src.gw2.cogs.key.bot_utils.send_msg") as mock_send,
+                patch("src.gw2.cogs.key.gw2_utils.remove_key_user") as mock_remove_key_user,
+            ):
                 result = await remove(mock_ctx)
                 mock_instance.delete_user_api_key.assert_called_once_with(12345)
+                mock_remove_key_user.assert_called_once_with(12345)
                 mock_send.assert_called_once()
                 msg = mock_send.call_args[0][1]
                 assert "deleted successfully" in msg
@@ -644,8 +637,7 @@ async def test_info_valid_api_key_shows_embed(self, mock_ctx):
                     }
                 ]
             )
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters", "progression"]}
                 )
@@ -676,8 +668,7 @@ async def test_info_invalid_api_key_on_check_shows_no_valid(self, mock_ctx):
                     }
                 ]
             )
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 invalid_error = APIInvalidKey(mock_ctx.bot, f"(400) {gw2_messages.INVALID_APIKEY_MSG}")
                 mock_client_instance.check_api_key = AsyncMock(return_value=invalid_error)
                 with patch("src.gw2.cogs.key.bot_utils.send_embed") as mock_send:
@@ -711,8 +702,7 @@ async def test_info_exception_during_check(self, mock_ctx):
                     }
                 ]
             )
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(side_effect=Exception("Connection error"))
                 with patch("src.gw2.cogs.key.bot_utils.send_error_msg") as mock_error:
                     await info(mock_ctx)
@@ -762,8 +752,7 @@ async def test_key_info_author_no_avatar(self, mock_ctx):
                     }
                 ]
             )
-            with patch("src.gw2.cogs.key.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.check_api_key = AsyncMock(
                     return_value={"name": "TestKey", "permissions": ["account", "characters", "progression"]}
                 )
@@ -4,12 +4,17 @@
 import pytest
 from datetime import datetime, timedelta
 from src.gw2.cogs.sessions import (
+    HOURLY_GAINS_LIMIT,
+    HOURLY_STATS,
+    SESSION_HISTORY_LIMIT,
     GW2Session,
     _add_deaths_field,
     _add_gold_field,
+    _add_hourly_gains_field,
     _add_wallet_currency_fields,
     _add_wvw_stats,
     session,
+    sessions,
     setup,
 )
 from src.gw2.constants import gw2_messages
@@ -96,6 +101,13 @@ def _make_session_data(start_overrides=None, end_overrides=None):
 class TestSessionCommand:
     """Test cases for the session command."""
 
+    @pytest.fixture(autouse=True)
+    def mock_samples_dal(self):
+        """Sessions are not sampled unless a test returns samples."""
+        with patch("src.gw2.cogs.sessions.Gw2SessionSamplesDal") as mock_samples_dal_class:
+            mock_samples_dal_class.return_value.get_user_samples = AsyncMock(return_value=[])
+            yield mock_samples_dal_class.return_value
+
     @pytest.fixture
     def mock_ctx(self):
         """Create a mock command context."""
@@ -471,6 +483,37 @@ async def test_session_gold_gained(self, mock_ctx, sample_api_key_data, sample_t
                 assert gold_field is not None
                 assert "+" in gold_field.value
 
+    @pytest.mark.asyncio
+    async def test_session_without_samples_has_no_hourly_gains(
+        self, mock_ctx, sample_api_key_data, sample_time_passed, mock_samples_dal
+    ):
+        """Test that a session that was not sampled shows no hourly gains."""
+        session_data = _make_session_data(end_overrides={"gold": 150000})
+        runner = self._run_session(mock_ctx, sample_api_key_data, session_data, sample_time_passed)
+        async with runner.run() as r:
+            await session(mock_ctx)
+            mock_samples_dal.get_user_samples.assert_awaited_once_with(
+                12345, "2024-01-15 10:00:00", "2024-01-15 12:30:00", list(HOURLY_STATS)
+            )
+            embed = r.mock_send.call_args[0][1]
+            assert all(f.name != gw2_messages.HOURLY_GAINS for f in embed.fields)
+
+    @pytest.mark.asyncio
+    async def test_session_with_samples_adds_hourly_gains(
+        self, mock_ctx, sample_api_key_data, sample_time_passed, mock_samples_dal
+    ):
+        """Test that the samples of a session are rendered as hourly gains."""
+        samples = [{"ts": datetime(2024, 1, 15, 10, 30), "field": "gold", "value": 120000}]
+        mock_samples_dal.get_user_samples.return_value = samples
+        session_data = _make_session_data(end_overrides={"gold": 150000})
+        runner = self._run_session(mock_ctx, sample_api_key_data, session_data, sample_time_passed)
+        async with runner.run() as r:
+            with patch("src.gw2.cogs.sessions._add_hourly_gains_field") as mock_hourly:
+                await session(mock_ctx)
+                mock_hourly.assert_called_once()
+                assert mock_hourly.call_args[0][5] == samples
+            r.mock_send.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_session_gold_lost(self, mock_ctx, sample_api_key_data, sample_time_passed):
         """Test session command when gold is lost (negative)."""
@@ -939,6 +982,57 @@ def test_gold_missing_from_both(self):
         assert len(embed.fields) == 0
 
 
+class TestAddHourlyGainsField:
+    """Test the _add_hourly_gains_field helper function."""
+
+    START_TIME = datetime(2024, 1, 15, 10, 0)
+
+    def _field_value(self, rs_start, rs_end, end_time, samples) -> str:
+        embed = discord.Embed()
+        _add_hourly_gains_field(embed, rs_start, rs_end, self.START_TIME, end_time, samples)
+        assert len(embed.fields) == 1
+        assert embed.fields[0].name == gw2_messages.HOURLY_GAINS
+        return embed.fields[0].value.strip("`")
+
+    def test_gains_per_hour(self):
+        """Test that each hour shows the change between the samples around it."""
+        samples = [
+            {"ts": datetime(2024, 1, 15, 10, 45), "field": "karma", "value": 51500},
+            {"ts": datetime(2024, 1, 15, 11, 15), "field": "players", "value": 23},
+            {"ts": datetime(2024, 1, 15, 11, 45), "field": "karma", "value": 52000},
+        ]
+        value = self._field_value(
+            {"gold": 100000, "karma": 50000, "players": 20},
+            {"gold": 100000, "karma": 52000, "players": 25},
+            datetime(2024, 1, 15, 12, 30),
+            samples,
+        )
+        assert value.split("\n") == [
+            f"1h: +1500 {WALLET_DISPLAY_NAMES['karma']}",
+            f"2h: +500 {WALLET_DISPLAY_NAMES['karma']}, +3 {gw2_messages.PLAYERS_KILLED}",
+            f"3h: +2 {gw2_messages.PLAYERS_KILLED}",
+        ]
+
+    def test_gold_formatting_and_losses(self):
+        """Test that gold is formatted as gold and losses are signed."""
+        samples = [{"ts": datetime(2024, 1, 15, 10, 30), "field": "gold", "value": 90000}]
+        value = self._field_value({"gold": 100000}, {"gold": 90000}, datetime(2024, 1, 15, 10, 50), samples)
+        assert value == "1h: -1 Gold 00 Silver"
+
+    def test_hour_without_change(self):
+        """Test that an hour without changes is shown with a dash."""
+        samples = [{"ts": datetime(2024, 1, 15, 11, 30), "field": "karma", "value": 50100}]
+        value = self._field_value({"karma": 50000}, {"karma": 50100}, datetime(2024, 1, 15, 11, 40), samples)
+        assert value.split("\n") == ["1h: -", f"2h: +100 {WALLET_DISPLAY_NAMES['karma']}"]
+
+    def test_hours_are_limited(self):
+        """Test that a long session shows only its first hours."""
+        samples = [{"ts": datetime(2024, 1, 15, 10, 30), "field": "karma", "value": 50100}]
+        end_time = self.START_TIME + timedelta(hours=HOURLY_GAINS_LIMIT + 5)
+        value = self._field_value({"karma": 50000}, {"karma": 50100}, end_time, samples)
+        assert len(value.split("\n")) == HOURLY_GAINS_LIMIT
+
+
 class TestAddDeathsField:
     """Test the _add_deaths_field helper function."""
 
@@ -1108,6 +1202,53 @@ def test_inline_fields(self):
             assert embed.fields[0].inline is True
 
 
+class TestSessionsCommand:
+    """Test cases for the sessions (history) command."""
+
+    @pytest.fixture
+    def mock_ctx(self):
+        ctx = MagicMock()
+        ctx.bot = MagicMock()
+        ctx.bot.db_session = MagicMock()
+        ctx.bot.log = MagicMock()
+        ctx.bot.settings = {"gw2": {"EmbedColor": 0x00FF00}}
+        ctx.message.author.id = 12345
+        ctx.message.author.display_name = "TestUser"
+        ctx.message.author.display_avatar.url = "https://example.com/avatar.png"
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_sessions_none_found(self, mock_ctx):
+        """Test sessions command when the user has no finished session."""
+        with (
+            patch("src.gw2.cogs.sessions.Gw2SessionsDal") as mock_sessions_dal,
+            patch("src.gw2.cogs.sessions.bot_utils.send_error_msg") as mock_error,
+        ):
+            mock_sessions_dal.return_value.get_user_sessions = AsyncMock(return_value=[])
+            await sessions(mock_ctx)
+            mock_error.assert_called_once_with(mock_ctx, gw2_messages.USER_NO_SESSION_FOUND)
+
+    @pytest.mark.asyncio
+    async def test_sessions_lists_play_time_and_gold(self, mock_ctx):
+        """Test that each finished session is listed with its play time and gold, newest first."""
+        won = _make_session_data(end_overrides={"gold": 150000})[0]
+        lost = _make_session_data(start_overrides={"date": "2024-01-14 10:00:00"}, end_overrides={"gold": 90000})[0]
+        with (
+            patch("src.gw2.cogs.sessions.Gw2SessionsDal") as mock_sessions_dal,
+            patch("src.gw2.cogs.sessions.bot_utils.send_paginated_embed") as mock_send,
+            patch("src.gw2.cogs.sessions.bot_utils.convert_str_to_datetime_short", side_effect=datetime.fromisoformat),
+        ):
+            mock_sessions_dal.return_value.get_user_sessions = AsyncMock(return_value=[won, lost])
+            await sessions(mock_ctx)
+
+            mock_sessions_dal.return_value.get_user_sessions.assert_awaited_once_with(12345, SESSION_HISTORY_LIMIT)
+            embed = mock_send.call_args[0][1]
+            assert [field.name for field in embed.fields] == ["2024-01-15 10:00:00", "2024-01-14 10:00:00"]
+            assert "Gold: +5 Gold" in embed.fields[0].value
+            assert "Gold: -1 Gold" in embed.fields[1].value
+            assert gw2_messages.PLAY_TIME in embed.fields[0].value
+
+
 class TestSessionSetup:
     """Test cases for session cog setup."""
 
@@ -124,8 +124,7 @@ async def test_worlds_na_successful_with_na_worlds(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=matches_data)
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_na(mock_ctx)
@@ -149,8 +148,7 @@ async def test_worlds_na_skips_eu_worlds(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=[matches_data_na, matches_data_eu])
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_na(mock_ctx)
@@ -171,8 +169,7 @@ async def test_worlds_na_exception_on_world_logs_warning(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=[Exception("API timeout"), matches_data])
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_na(mock_ctx)
@@ -196,8 +193,7 @@ async def test_worlds_na_failed_worlds_adds_footer(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=[Exception("Error1"), Exception("Error2")])
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_na(mock_ctx)
@@ -219,8 +215,7 @@ async def test_worlds_na_failed_worlds_footer_truncates_at_3(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=Exception("Error"))
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_na(mock_ctx)
@@ -236,8 +231,7 @@ async def test_worlds_na_calls_send_paginated(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=matches_data)
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_na(mock_ctx)
@@ -252,8 +246,7 @@ async def test_worlds_na_no_failed_worlds_no_footer(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=matches_data)
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_na(mock_ctx)
@@ -312,8 +305,7 @@ async def test_worlds_eu_successful_with_eu_worlds(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=matches_data)
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_eu(mock_ctx)
@@ -337,8 +329,7 @@ async def test_worlds_eu_skips_na_worlds(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=[matches_data_na, matches_data_eu])
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_eu(mock_ctx)
@@ -359,8 +350,7 @@ async def test_worlds_eu_exception_on_world_logs_warning(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=[Exception("API timeout"), matches_data])
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_eu(mock_ctx)
@@ -383,8 +373,7 @@ async def test_worlds_eu_failed_worlds_adds_footer(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=Exception("Error"))
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_eu(mock_ctx)
@@ -406,8 +395,7 @@ async def test_worlds_eu_failed_worlds_footer_truncates_at_3(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=Exception("Error"))
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_eu(mock_ctx)
@@ -423,8 +411,7 @@ async def test_worlds_eu_tier_number_replaces_2_prefix(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=matches_data)
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_eu(mock_ctx)
@@ -489,7 +476,7 @@ async def test_next_button_advances_page(self):
         interaction.user.id = 42
         interaction.response = AsyncMock()
 
-        with patch.object(view, '_save_current_page', new_callable=AsyncMock):
+        with patch.object(view, "_save_current_page", new_callable=AsyncMock):
             await view.next_button.callback(interaction)
 
         assert view.current_page == 1
@@ -508,7 +495,7 @@ async def test_previous_button_goes_back(self):
         interaction.user.id = 42
         interaction.response = AsyncMock()
 
-        with patch.object(view, '_save_current_page', new_callable=AsyncMock):
+        with patch.object(view, "_save_current_page", new_callable=AsyncMock):
             await view.previous_button.callback(interaction)
 
         assert view.current_page == 1
@@ -842,8 +829,7 @@ async def test_worlds_na_exact_2001_boundary(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=matches_data)
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_na(mock_ctx)
@@ -863,8 +849,7 @@ async def test_worlds_eu_exact_2001_boundary(self, mock_ctx):
         with patch("src.gw2.cogs.worlds.gw2_utils") as mock_utils:
             mock_utils.send_progress_embed = AsyncMock(return_value=AsyncMock())
             mock_utils.get_worlds_ids = AsyncMock(return_value=(True, worlds_ids))
-            with patch("src.gw2.cogs.worlds.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=matches_data)
                 with patch("src.gw2.cogs.worlds._send_paginated_worlds_embed", new_callable=AsyncMock) as mock_send:
                     await worlds_eu(mock_ctx)
@@ -159,7 +159,7 @@ async def test_info_no_world_no_api_key(self, mock_bot, mock_ctx):
             mock_instance.get_api_key_by_user = AsyncMock(return_value=None)
 
             with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
-                with patch("src.gw2.cogs.wvw.Gw2Client"):
+                with patch.object(mock_ctx.bot, "gw2_client"):
                     await info(mock_ctx, world=None)
 
                     mock_error.assert_called_once()
@@ -176,8 +176,7 @@ async def test_info_no_world_api_key_exists(self, mock_bot, mock_ctx, sample_mat
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         {"world": 1001},  # account call
@@ -200,8 +199,7 @@ async def test_info_no_world_api_key_error(self, mock_bot, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=APIKeyError(mock_ctx.bot, "Invalid key"))
 
                 with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
@@ -221,8 +219,7 @@ async def test_info_no_world_generic_exception(self, mock_bot, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 error = Exception("Something went wrong")
                 mock_client_instance.call_api = AsyncMock(side_effect=error)
 
@@ -241,8 +238,7 @@ async def test_info_world_given_calls_get_world_id(
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_matches_data,
@@ -263,7 +259,7 @@ async def test_info_wid_is_none(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = None
 
-            with patch("src.gw2.cogs.wvw.Gw2Client"):
+            with patch.object(mock_ctx.bot, "gw2_client"):
                 with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
                     await info(mock_ctx, world="InvalidWorld")
 
@@ -279,8 +275,7 @@ async def test_info_api_call_fails(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 error = Exception("API failure")
                 mock_client_instance.call_api = AsyncMock(side_effect=error)
 
@@ -306,8 +301,7 @@ async def test_info_world_color_not_found(self, mock_bot, mock_ctx, sample_world
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001  # Not in any of the all_worlds lists
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         matches_data,
@@ -329,8 +323,7 @@ async def test_info_na_tier(self, mock_bot, mock_ctx, sample_matches_data, sampl
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001  # NA world
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_matches_data,
@@ -377,8 +370,7 @@ async def test_info_eu_tier(self, mock_bot, mock_ctx, sample_worldinfo_data):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 2001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         eu_matches_data,
@@ -399,8 +391,7 @@ async def test_info_red_world_color(self, mock_bot, mock_ctx, sample_matches_dat
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001  # In red all_worlds
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_matches_data,
@@ -421,8 +412,7 @@ async def test_info_green_world_color(self, mock_bot, mock_ctx, sample_matches_d
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1003  # In green all_worlds
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_matches_data,
@@ -443,8 +433,7 @@ async def test_info_blue_world_color(self, mock_bot, mock_ctx, sample_matches_da
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1005  # In blue all_worlds
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_matches_data,
@@ -471,8 +460,7 @@ async def test_info_population_veryhigh(self, mock_bot, mock_ctx, sample_matches
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_matches_data,
@@ -515,8 +503,7 @@ async def test_info_kills_zero_kd(self, mock_bot, mock_ctx, sample_worldinfo_dat
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         matches_zero_kills,
@@ -558,8 +545,7 @@ async def test_info_deaths_zero_kd(self, mock_bot, mock_ctx, sample_worldinfo_da
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         matches_zero_deaths,
@@ -582,8 +568,7 @@ async def test_info_normal_kd_calculation(self, mock_bot, mock_ctx, sample_match
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001  # red world
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_matches_data,
@@ -607,8 +592,7 @@ async def test_info_successful_embed_sent(self, mock_bot, mock_ctx, sample_match
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(
                     side_effect=[
                         sample_matches_data,
@@ -731,7 +715,7 @@ async def test_match_no_world_no_api_key(self, mock_bot, mock_ctx):
             mock_instance.get_api_key_by_user = AsyncMock(return_value=None)
 
             with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
-                with patch("src.gw2.cogs.wvw.Gw2Client"):
+                with patch.object(mock_ctx.bot, "gw2_client"):
                     await match(mock_ctx, world=None)
 
                     mock_error.assert_called_once()
@@ -748,8 +732,7 @@ async def test_match_no_world_api_key_error(self, mock_bot, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=APIKeyError(mock_ctx.bot, "Invalid key"))
 
                 with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
@@ -769,8 +752,7 @@ async def test_match_no_world_generic_exception(self, mock_bot, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 error = Exception("Something went wrong")
                 mock_client_instance.call_api = AsyncMock(side_effect=error)
 
@@ -787,8 +769,7 @@ async def test_match_world_given_uses_get_world_id(self, mock_bot, mock_ctx, sam
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=sample_matches_data)
 
                 with patch("src.gw2.cogs.wvw.gw2_utils.get_world_name_population", new_callable=AsyncMock) as mock_pop:
@@ -806,7 +787,7 @@ async def test_match_wid_none(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = None
 
-            with patch("src.gw2.cogs.wvw.Gw2Client"):
+            with patch.object(mock_ctx.bot, "gw2_client"):
                 with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
                     await match(mock_ctx, world="InvalidWorld")
 
@@ -822,8 +803,7 @@ async def test_match_na_tier(self, mock_bot, mock_ctx, sample_matches_data):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=sample_matches_data)
 
                 with patch("src.gw2.cogs.wvw.gw2_utils.get_world_name_population", new_callable=AsyncMock) as mock_pop:
@@ -881,8 +861,7 @@ async def test_match_eu_tier(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 2001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=eu_matches)
 
                 with patch("src.gw2.cogs.wvw.gw2_utils.get_world_name_population", new_callable=AsyncMock) as mock_pop:
@@ -901,8 +880,7 @@ async def test_match_exception_during_fetch(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 error = Exception("API Error")
                 mock_client_instance.call_api = AsyncMock(side_effect=error)
 
@@ -919,8 +897,7 @@ async def test_match_successful_embed(self, mock_bot, mock_ctx, sample_matches_d
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=sample_matches_data)
 
                 with patch("src.gw2.cogs.wvw.gw2_utils.get_world_name_population", new_callable=AsyncMock) as mock_pop:
@@ -1025,7 +1002,7 @@ async def test_kdr_no_world_no_api_key(self, mock_bot, mock_ctx):
             mock_instance.get_api_key_by_user = AsyncMock(return_value=None)
 
             with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
-                with patch("src.gw2.cogs.wvw.Gw2Client"):
+                with patch.object(mock_ctx.bot, "gw2_client"):
                     await kdr(mock_ctx, world=None)
 
                     mock_error.assert_called_once()
@@ -1042,8 +1019,7 @@ async def test_kdr_no_world_api_key_error(self, mock_bot, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=APIKeyError(mock_ctx.bot, "Invalid key"))
 
                 with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
@@ -1063,8 +1039,7 @@ async def test_kdr_no_world_generic_exception(self, mock_bot, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 error = Exception("Something went wrong")
                 mock_client_instance.call_api = AsyncMock(side_effect=error)
 
@@ -1081,8 +1056,7 @@ async def test_kdr_world_given(self, mock_bot, mock_ctx, sample_matches_data):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=sample_matches_data)
 
                 with patch("src.gw2.cogs.wvw.gw2_utils.get_world_name_population", new_callable=AsyncMock) as mock_pop:
@@ -1100,7 +1074,7 @@ async def test_kdr_wid_none(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = None
 
-            with patch("src.gw2.cogs.wvw.Gw2Client"):
+            with patch.object(mock_ctx.bot, "gw2_client"):
                 with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
                     await kdr(mock_ctx, world="InvalidWorld")
 
@@ -1116,8 +1090,7 @@ async def test_kdr_na_tier_title(self, mock_bot, mock_ctx, sample_matches_data):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=sample_matches_data)
 
                 with patch("src.gw2.cogs.wvw.gw2_utils.get_world_name_population", new_callable=AsyncMock) as mock_pop:
@@ -1175,8 +1148,7 @@ async def test_kdr_eu_tier_title(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 2001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=eu_matches)
 
                 with patch("src.gw2.cogs.wvw.gw2_utils.get_world_name_population", new_callable=AsyncMock) as mock_pop:
@@ -1196,8 +1168,7 @@ async def test_kdr_exception_during_fetch(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 error = Exception("API Error")
                 mock_client_instance.call_api = AsyncMock(side_effect=error)
 
@@ -1214,8 +1185,7 @@ async def test_kdr_successful_embed(self, mock_bot, mock_ctx, sample_matches_dat
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(return_value=sample_matches_data)
 
                 with patch("src.gw2.cogs.wvw.gw2_utils.get_world_name_population", new_callable=AsyncMock) as mock_pop:
@@ -1780,8 +1750,7 @@ async def test_info_unknown_world_color_uses_default(self, mock_bot, mock_ctx):
         with patch("src.gw2.cogs.wvw.gw2_utils.get_world_id", new_callable=AsyncMock) as mock_get_wid:
             mock_get_wid.return_value = 1001
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=[matches_data, sample_worldinfo])
 
                 with patch("src.gw2.cogs.wvw.bot_utils.send_embed") as mock_send:
@@ -1834,8 +1803,7 @@ async def test_match_api_key_error_on_account_call(self, mock_bot, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 # Raise APIKeyError on the account call (results = await gw2_api.call_api("account", api_key))
                 mock_client_instance.call_api = AsyncMock(side_effect=APIKeyError(mock_ctx.bot, "Invalid key"))
 
@@ -1889,8 +1857,7 @@ async def test_kdr_api_key_error_on_account_call(self, mock_bot, mock_ctx):
             mock_instance = mock_dal.return_value
             mock_instance.get_api_key_by_user = AsyncMock(return_value=api_key_data)
 
-            with patch("src.gw2.cogs.wvw.Gw2Client") as mock_client:
-                mock_client_instance = mock_client.return_value
+            with patch.object(mock_ctx.bot, "gw2_client") as mock_client_instance:
                 mock_client_instance.call_api = AsyncMock(side_effect=APIKeyError(mock_ctx.bot, "Invalid key"))
 
                 with patch("src.gw2.cogs.wvw.bot_utils.send_error_msg") as mock_error:
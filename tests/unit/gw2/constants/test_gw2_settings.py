@@ -17,6 +17,7 @@ def test_default_values_without_env_vars(self):
             # GW2 configuration
             assert settings.embed_color == "green"
             assert settings.api_version == 2
+            assert settings.api_base_url == "https://api.guildwars2.com"
 
             # GW2 cooldowns
             assert settings.account_cooldown == 20
@@ -29,6 +30,70 @@ def test_default_values_without_env_vars(self):
             assert settings.worlds_cooldown == 20
             assert settings.wvw_cooldown == 20
 
+            # GW2 API retry
+            assert settings.api_retry_max_attempts == 5
+            assert settings.api_retry_delay == 3.0
+            assert settings.api_retry_max_delay == 30.0
+            assert settings.api_retry_max_elapsed == 60.0
+            assert settings.api_session_retry_bg_delay == 30.0
+            assert settings.api_session_retry_bg_max_delay == 300.0
+
+            # GW2 API bulk fetch
+            assert settings.api_connection_limit == 100
+            assert settings.api_connection_limit_per_host == 30
+            assert settings.api_dns_cache_ttl == 300
+            assert settings.api_keepalive_timeout == 30.0
+            assert settings.api_request_timeout == 30.0
+            assert settings.api_connect_timeout == 10.0
+            assert settings.api_scheduler_enabled is True
+            assert settings.api_scheduler_max_concurrency == 10
+            assert settings.api_scheduler_interactive_limit == 10
+            assert settings.api_scheduler_background_limit == 4
+            assert settings.api_scheduler_prefetch_limit == 2
+            assert settings.api_scheduler_max_wait == 10.0
+            assert settings.api_fetch_many_concurrency == 5
+
+            # GW2 session jobs
+            assert settings.api_session_jobs_concurrency == 4
+            assert settings.api_session_jobs_poll_interval == 5.0
+            assert settings.api_session_batch_window == 1.0
+            assert settings.api_session_batch_max_size == 200
+            assert settings.api_session_batch_concurrency == 10
+            assert settings.api_session_actor_workers == 200
+            assert settings.api_session_sampling_enabled is False
+            assert settings.api_session_sample_interval == 900.0
+            assert settings.api_session_sample_concurrency == 2
+            assert settings.api_session_metrics_log_interval == 0.0
+            assert settings.api_session_history is True
+            assert settings.api_session_retention_months == 12
+
+            # GW2 static data store
+            assert settings.api_static_store_max_entries == 10000
+            assert settings.api_static_store_build_check_interval == 3600.0
+            assert settings.api_warm_up_enabled is True
+            assert settings.api_warm_up_concurrency == 2
+
+            # GW2 API response cache
+            assert settings.api_cache_enabled is True
+            assert settings.api_cache_max_entries == 2048
+            # GW2 API conditional requests
+            assert settings.api_revalidation_enabled is True
+            assert settings.api_revalidation_max_entries == 256
+            # GW2 API response decoding
+            assert settings.api_decode_thread_threshold == 65536
+
+            # GW2 API rate limit
+            assert settings.api_rate_limit_enabled is True
+            assert settings.api_rate_limit_global_rate == 5.0
+            assert settings.api_rate_limit_global_burst == 100
+            assert settings.api_rate_limit_key_rate == 2.0
+            assert settings.api_rate_limit_key_burst == 20
+
+            # GW2 API circuit breaker
+            assert settings.api_circuit_breaker_enabled is True
+            assert settings.api_circuit_breaker_failure_threshold == 5
+            assert settings.api_circuit_breaker_recovery_timeout == 30.0
+
     def test_env_var_overrides(self):
         """Test that environment variables override default values."""
         env_vars = {
@@ -266,3 +331,18 @@ def test_api_version_affects_api_uri(self):
         expected_version = get_gw2_settings().api_version
         expected_uri = f"https://api.guildwars2.com/v{expected_version}"
         assert gw2_variables.API_URI == expected_uri
+
+    def test_api_base_url_can_point_at_emulator(self):
+        """Test that GW2_API_BASE_URL replaces the host of the API URI."""
+        import importlib
+        from src.gw2.constants import gw2_variables
+
+        with patch.dict(os.environ, {"GW2_API_BASE_URL": "http://127.0.0.1:8800/"}, clear=True):
+            settings = Gw2Settings()
+        try:
+            with patch("src.gw2.constants.gw2_settings.get_gw2_settings", return_value=settings):
+                importlib.reload(gw2_variables)
+            assert gw2_variables.API_URI == "http://127.0.0.1:8800/v2"
+        finally:
+            importlib.reload(gw2_variables)
+        assert gw2_variables.API_URI.startswith("https://api.guildwars2.com/")
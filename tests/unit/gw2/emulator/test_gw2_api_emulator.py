@@ -0,0 +1,160 @@
+"""Tests for the local GW2 API emulator."""
+
+import pytest
+import pytest_asyncio
+from aiohttp.test_utils import TestServer
+from src.gw2.constants import gw2_variables
+from src.gw2.emulator.gw2_api_emulator import Gw2ApiEmulator
+from src.gw2.tools.gw2_client import Gw2Client
+from src.gw2.tools.gw2_exceptions import APIInvalidKey, APINotFound
+from src.gw2.tools.gw2_retry import RetryPolicy
+from unittest.mock import MagicMock
+
+
+@pytest_asyncio.fixture
+async def emulator_client(monkeypatch):
+    """Start an emulator on demand, with a Gw2Client pointed at it; returns (emulator, client)."""
+    started = []
+
+    async def _start(**kwargs):
+        emulator = Gw2ApiEmulator(**kwargs)
+        server = TestServer(emulator.make_app())
+        await server.start_server()
+        monkeypatch.setattr(gw2_variables, "API_URI", str(server.make_url("/v2")))
+        client = Gw2Client(MagicMock(description="Emulator Test"))
+        started.append((server, client))
+        return emulator, client
+
+    yield _start
+
+    for server, client in started:
+        await client.close()
+        await server.close()
+
+
+class TestResolve:
+    """Test cases for Gw2ApiEmulator.resolve (no server needed)."""
+
+    @pytest.fixture
+    def emulator(self):
+        return Gw2ApiEmulator()
+
+    def test_object_endpoint(self, emulator):
+        """Test that object endpoints return their fixture."""
+        status, payload = emulator.resolve("account", {}, "key")
+        assert status == 200
+        assert payload["name"] == "Emulator.1234"
+
+    def test_authenticated_endpoint_needs_key(self, emulator):
+        """Test that authenticated endpoints answer invalid key without one."""
+        assert emulator.resolve("account/wallet", {}, None) == (400, "invalid key")
+
+    def test_bulk_endpoint_lists_ids(self, emulator):
+        """Test that a bulk endpoint without parameters lists its ids."""
+        status, payload = emulator.resolve("currencies", {}, None)
+        assert status == 200
+        assert 1 in payload
+
+    def test_bulk_ids_all(self, emulator):
+        """Test ?ids=all."""
+        status, payload = emulator.resolve("worlds", {"ids": "all"}, None)
+        assert status == 200
+        assert {"id": 1001, "name": "Anvil Rock"}.items() <= payload[0].items()
+
+    def test_partial_ids_answer_206(self, emulator):
+        """Test that unknown ids are left out with a 206 Partial Content."""
+        status, payload = emulator.resolve("worlds", {"ids": "1001,9999"}, None)
+        assert status == 206
+        assert [world["id"] for world in payload] == [1001]
+
+    def test_all_unknown_ids_answer_404(self, emulator):
+        """Test the API error when no id is known."""
+        assert emulator.resolve("achievements", {"ids": "999999"}, None) == (404, "all ids provided are invalid")
+
+    def test_single_object_by_path_and_query(self, emulator):
+        """Test /<id> and ?id= lookups."""
+        assert emulator.resolve("guild/4BBB52AA-D768-4FC6-8EDE-C299F2822F0F", {}, None)[1]["tag"] == "EMU"
+        assert emulator.resolve("worlds", {"id": "1002"}, None)[1]["name"] == "Borlis Pass"
+        assert emulator.resolve("worlds/1", {}, None)[0] == 404
+
+    def test_wvw_match_by_world_and_team(self, emulator):
+        """Test that matches are found by legacy world id and by team id."""
+        assert emulator.resolve("wvw/matches", {"world": "1001"}, None)[1]["id"] == "1-1"
+        assert emulator.resolve("wvw/matches", {"world": "12004"}, None)[1]["id"] == "2-2"
+        assert emulator.resolve("wvw/matches", {"world": "5"}, None)[0] == 404
+
+    def test_unknown_endpoint(self, emulator):
+        """Test that endpoints without a fixture answer 404."""
+        assert emulator.resolve("items", {}, None) == (404, "not found")
+
+    def test_character_count(self):
+        """Test that big accounts can be emulated by repeating the fixture characters."""
+        emulator = Gw2ApiEmulator(character_count=20)
+
+        status, names = emulator.resolve("characters", {}, "key")
+
+        assert status == 200
+        assert len(names) == len(set(names)) == 20
+
+
+class TestEmulatorServer:
+    """Test cases for the emulator served over HTTP to a real Gw2Client."""
+
+    @pytest.mark.asyncio
+    async def test_client_reads_fixtures(self, emulator_client):
+        """Test that the client can use the emulator as the GW2 API."""
+        _, client = await emulator_client()
+
+        account = await client.call_api("account", "emulator-key")
+        characters = await client.call_api("characters?ids=all", "emulator-key")
+        achievements, missing = await client.fetch_many("account/achievements", [283, 285, 999999], "emulator-key")
+
+        assert account["world"] == 1001
+        assert len(characters) == 9
+        assert list(achievements) == [283, 285]
+        assert missing == [999999]
+
+    @pytest.mark.asyncio
+    async def test_errors_map_to_client_exceptions(self, emulator_client):
+        """Test that emulated API errors raise the client's exceptions."""
+        _, client = await emulator_client()
+
+        with pytest.raises(APIInvalidKey):
+            await client.call_api("account")
+        with pytest.raises(APINotFound):
+            await client.call_api("worlds?id=1")
+
+    @pytest.mark.asyncio
+    async def test_conditional_request_answers_304(self, emulator_client):
+        """Test that a revalidated response is answered 304 and served from the client's stored body."""
+        emulator, client = await emulator_client()
+
+        first = await client.call_api("worlds?ids=all")
+        client.cache.clear()
+        second = await client.call_api("worlds?ids=all")
+
+        assert first == second
+        assert emulator.stats()["not_modified"] == 1
+        assert client.revalidation.stats()["bytes_saved"] > 0
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_are_retried(self, emulator_client):
+        """Test that error injection produces retryable failures."""
+        emulator, client = await emulator_client(error_rate=1.0, error_statuses=(503,))
+
+        with pytest.raises(Exception, match="emulated error"):
+            await client.call_api("build", retry_policy=RetryPolicy(max_attempts=2, base_delay=0.01))
+
+        assert emulator.stats()["injected_errors"] == 2
+        assert client.metrics.stats()["build"]["statuses"] == {"503": 2}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit(self, emulator_client):
+        """Test that requests over the per-key rate limit answer 429."""
+        emulator, client = await emulator_client(rate_limit=0.001, rate_burst=1)
+
+        await client.call_api("tokeninfo", "emulator-key")
+        with pytest.raises(Exception, match="429"):
+            await client.call_api("tokeninfo", "emulator-key", retry_policy=RetryPolicy(max_attempts=1))
+
+        assert emulator.stats()["rate_limited"] == 1
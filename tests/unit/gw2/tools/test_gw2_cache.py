@@ -0,0 +1,127 @@
+"""Tests for GW2 API response cache module."""
+
+from src.gw2.tools.gw2_cache import DEFAULT_CACHE_POLICIES, MISSING, CachePolicy, Gw2ResponseCache
+from unittest.mock import patch
+
+
+class TestCachePolicy:
+    """Test cases for CachePolicy."""
+
+    def test_matches_exact_path(self):
+        """Test that a policy matches its own prefix."""
+        assert CachePolicy("worlds", ttl=60).matches("worlds")
+
+    def test_matches_sub_path(self):
+        """Test that a policy matches sub paths of its prefix."""
+        assert CachePolicy("guild", ttl=60).matches("guild/ABC-123")
+
+    def test_does_not_match_similar_prefix(self):
+        """Test that a policy does not match paths that only share leading characters."""
+        assert not CachePolicy("account", ttl=60).matches("accounts")
+
+    def test_cache_key_without_scope(self):
+        """Test that shared policies ignore the API key."""
+        policy = CachePolicy("worlds", ttl=60)
+        assert policy.cache_key("worlds?ids=all", "secret") == ("worlds?ids=all", None)
+
+    def test_cache_key_scoped_by_hashed_key(self):
+        """Test that per-key policies scope by a hash, never the raw key."""
+        policy = CachePolicy("account", ttl=60, per_key=True)
+        uri, scope = policy.cache_key("account", "secret")
+        assert uri == "account"
+        assert scope is not None
+        assert "secret" not in scope
+        assert policy.cache_key("account", "other")[1] != scope
+
+    def test_cache_key_scoped_without_key(self):
+        """Test that per-key policies without a key fall back to an unscoped key."""
+        policy = CachePolicy("account", ttl=60, per_key=True)
+        assert policy.cache_key("account") == ("account", None)
+
+
+class TestGw2ResponseCache:
+    """Test cases for Gw2ResponseCache."""
+
+    def test_get_policy_longest_prefix(self):
+        """Test that wvw/matches gets its own short TTL policy."""
+        cache = Gw2ResponseCache()
+        policy = cache.get_policy("wvw/matches?world=1001")
+        assert policy.prefix == "wvw/matches"
+        assert policy.ttl < cache.get_policy("worlds?ids=all").ttl
+
+    def test_get_policy_uncached_endpoint(self):
+        """Test that endpoints without a policy return None."""
+        assert Gw2ResponseCache().get_policy("tokeninfo") is None
+
+    def test_get_policy_disabled(self):
+        """Test that a disabled cache never returns a policy."""
+        assert Gw2ResponseCache(enabled=False).get_policy("worlds") is None
+
+    def test_default_policies_scope_authenticated_endpoints(self):
+        """Test that account endpoints are scoped per key and static data is shared."""
+        policies = {p.prefix: p for p in DEFAULT_CACHE_POLICIES}
+        assert policies["account"].per_key is True
+        assert policies["characters"].per_key is True
+        assert policies["achievements"].per_key is False
+        assert policies["worlds"].per_key is False
+
+    def test_get_miss_then_hit(self):
+        """Test miss and hit counters."""
+        cache = Gw2ResponseCache()
+        key = ("worlds", None)
+
+        assert cache.get(key) is MISSING
+        cache.set(key, [1, 2], ttl=60)
+        assert cache.get(key) == [1, 2]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_expired_entry_is_a_miss(self):
+        """Test that entries past their TTL are dropped."""
+        cache = Gw2ResponseCache()
+        key = ("worlds", None)
+
+        with patch("src.gw2.tools.gw2_cache.time.monotonic", return_value=100.0):
+            cache.set(key, "data", ttl=10)
+        with patch("src.gw2.tools.gw2_cache.time.monotonic", return_value=111.0):
+            assert cache.get(key) is MISSING
+
+        assert cache.stats()["size"] == 0
+
+    def test_zero_ttl_is_not_stored(self):
+        """Test that a non-positive TTL skips storage."""
+        cache = Gw2ResponseCache()
+        cache.set(("worlds", None), "data", ttl=0)
+        assert cache.stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = Gw2ResponseCache(max_entries=2)
+        cache.set(("a", None), 1, ttl=60)
+        cache.set(("b", None), 2, ttl=60)
+        cache.get(("a", None))
+        cache.set(("c", None), 3, ttl=60)
+
+        assert cache.get(("b", None)) is MISSING
+        assert cache.get(("a", None)) == 1
+        assert cache.get(("c", None)) == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_clear_resets_entries_and_counters(self):
+        """Test that clear drops entries and counters."""
+        cache = Gw2ResponseCache()
+        cache.set(("a", None), 1, ttl=60)
+        cache.get(("a", None))
+        cache.clear()
+
+        assert cache.stats() == {
+            "size": 0,
+            "max_entries": 2048,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "hit_ratio": 0.0,
+        }
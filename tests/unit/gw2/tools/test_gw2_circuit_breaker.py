@@ -0,0 +1,151 @@
+"""Tests for GW2 API circuit breaker."""
+
+import pytest
+from src.gw2.tools.gw2_circuit_breaker import CircuitBreaker, CircuitState, Gw2CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_starts_closed(self):
+        """Test that a new breaker lets requests through."""
+        breaker = CircuitBreaker()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.times_opened == 1
+
+    def test_success_resets_failure_count(self):
+        """Test that a success in between keeps the circuit closed."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_open_circuit_rejects_until_timeout(self):
+        """Test that an open circuit rejects requests and counts them."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+        breaker.record_failure()
+        assert breaker.allow_request() is False
+        assert breaker.rejected == 1
+        assert 0 < breaker.retry_in() <= 30.0
+
+    def test_half_open_allows_single_probe(self):
+        """Test that only one probe is let through after the timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+        breaker.record_failure()
+        breaker.opened_at -= 30.0
+
+        assert breaker.allow_request() is True
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is False
+
+    def test_successful_probe_closes(self):
+        """Test that a successful probe closes the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+        breaker.record_failure()
+        breaker.opened_at -= 30.0
+        breaker.allow_request()
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.failures == 0
+        assert breaker.allow_request() is True
+
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe opens the circuit again with a fresh timer."""
+        breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
+        for _ in range(5):
+            breaker.record_failure()
+        breaker.opened_at -= 30.0
+        breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.times_opened == 2
+        assert breaker.allow_request() is False
+
+    def test_stale_probe_is_replaced(self):
+        """Test that a probe that never reported back doesn't block the circuit forever."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+        breaker.record_failure()
+        breaker.opened_at -= 30.0
+        breaker.allow_request()
+        breaker.probe_started_at -= 30.0
+
+        assert breaker.allow_request() is True
+
+    def test_retry_in_is_zero_when_closed(self):
+        """Test that only open circuits report a wait time."""
+        assert CircuitBreaker().retry_in() == 0.0
+
+
+class TestGw2CircuitBreaker:
+    """Test cases for Gw2CircuitBreaker."""
+
+    @pytest.mark.parametrize(
+        ("uri", "family"),
+        [
+            ("account", "account"),
+            ("account/achievements", "account"),
+            ("wvw/matches?world=1001", "wvw"),
+            ("/worlds?ids=all", "worlds"),
+        ],
+    )
+    def test_get_family(self, uri, family):
+        """Test that the family is the first path segment."""
+        assert Gw2CircuitBreaker.get_family(uri) == family
+
+    def test_families_are_independent(self):
+        """Test that failures in one family don't affect another."""
+        circuits = Gw2CircuitBreaker(failure_threshold=1)
+        circuits.record_failure("wvw/matches")
+
+        assert circuits.allow_request("wvw/matches") is False
+        assert circuits.allow_request("account") is True
+
+    @pytest.mark.parametrize("status", [500, 502, 503, 504])
+    def test_outage_statuses_count_as_failures(self, status):
+        """Test that server errors are counted as failures."""
+        circuits = Gw2CircuitBreaker(failure_threshold=1)
+        circuits.record_status("account", status)
+        assert circuits.stats()["account"]["state"] == "open"
+
+    @pytest.mark.parametrize("status", [200, 400, 403, 404, 429])
+    def test_other_statuses_count_as_success(self, status):
+        """Test that healthy responses and client errors keep the circuit closed."""
+        circuits = Gw2CircuitBreaker(failure_threshold=1)
+        circuits.record_status("account", status)
+        assert circuits.stats()["account"]["state"] == "closed"
+
+    def test_disabled_breaker_always_allows(self):
+        """Test that a disabled breaker records nothing and never rejects."""
+        circuits = Gw2CircuitBreaker(failure_threshold=1, enabled=False)
+        circuits.record_failure("account")
+        circuits.record_status("account", 503)
+
+        assert circuits.allow_request("account") is True
+        assert circuits.stats() == {}
+
+    def test_stats_and_reset(self):
+        """Test the reported state and that reset forgets every family."""
+        circuits = Gw2CircuitBreaker(failure_threshold=2, recovery_timeout=30.0)
+        circuits.record_failure("wvw")
+        circuits.record_status("account", 200)
+
+        assert circuits.stats() == {
+            "account": {"state": "closed", "failures": 0, "times_opened": 0, "rejected": 0, "retry_in": 0.0},
+            "wvw": {"state": "closed", "failures": 1, "times_opened": 0, "rejected": 0, "retry_in": 0.0},
+        }
+
+        circuits.reset()
+        assert circuits.stats() == {}
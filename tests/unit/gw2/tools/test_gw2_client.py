@@ -1,5 +1,7 @@
 """Comprehensive tests for GW2 client module."""
 
+import asyncio
+import json
 import pytest
 from src.gw2.constants import gw2_messages
 from src.gw2.tools.gw2_client import Gw2Client
@@ -11,9 +13,26 @@
     APIInvalidKey,
     APINotFound,
 )
+from src.gw2.tools.gw2_retry import RetryPolicy
+from src.gw2.tools.gw2_scheduler import RequestPriority
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 
+@pytest.fixture(autouse=True)
+def no_retry_wait():
+    """Skip real backoff sleeps and make full jitter deterministic (always the ceiling)."""
+    with (
+        patch("src.gw2.tools.gw2_client.asyncio.sleep", new_callable=AsyncMock),
+        patch("src.gw2.tools.gw2_retry._random.uniform", side_effect=lambda low, high: high),
+    ):
+        yield
+
+
+def _json_body(data):
+    """Encode data as the raw body of a JSON response."""
+    return json.dumps(data).encode()
+
+
 class AsyncContextManager:
     """Helper to simulate async context manager for aiohttp responses."""
 
@@ -62,6 +81,91 @@ def test_init_with_different_bots(self):
         assert client1.bot is not client2.bot
 
 
+class TestGw2ClientDecoding:
+    """Test cases for response body decoding in call_api."""
+
+    @pytest.mark.asyncio
+    async def test_custom_decoder_and_stats(self):
+        """Test that the decoder hook decodes the raw body and the endpoint is recorded."""
+        decoder = MagicMock(return_value={"id": "1-1"})
+        client = Gw2Client(MagicMock(), session=MagicMock(), decoder=decoder)
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=b'{"id": "1-1"}')
+        client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        result = await client.call_api("tokeninfo", "my-key")
+
+        assert result == {"id": "1-1"}
+        decoder.assert_called_once_with(b'{"id": "1-1"}')
+        assert client.stats()["decoder"]["tokeninfo"]["max_bytes"] == len(b'{"id": "1-1"}')
+
+
+class TestGw2ClientSession:
+    """Test cases for the client's own pooled HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_session_created_once_with_tuned_connector(self):
+        """Test that the session is created lazily, once, with the configured pool limits."""
+        client = Gw2Client(MagicMock())
+        try:
+            session = client.session
+            assert client.session is session
+            assert session.connector.limit == 100
+            assert session.connector.limit_per_host == 30
+            assert session.timeout.total == 30.0
+            assert session.timeout.connect == 10.0
+        finally:
+            await client.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_session_recreated_after_close(self):
+        """Test that a closed own session is replaced on next use."""
+        client = Gw2Client(MagicMock())
+        first = client.session
+        await client.close()
+        second = client.session
+        try:
+            assert second is not first
+            assert not second.closed
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_given_session_is_not_closed(self):
+        """Test that a session passed in by the caller is used as-is and left open."""
+        session = MagicMock()
+        session.close = AsyncMock()
+        client = Gw2Client(MagicMock(), session=session)
+
+        assert client.session is session
+        await client.close()
+        session.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_without_session(self):
+        """Test that closing a client that never sent a request is a no-op."""
+        await Gw2Client(MagicMock()).close()
+
+    def test_stats(self):
+        """Test that stats groups the counters of every shared component."""
+        stats = Gw2Client(MagicMock()).stats()
+        assert set(stats) == {
+            "cache",
+            "revalidation",
+            "singleflight",
+            "scheduler",
+            "rate_limiter",
+            "circuit_breaker",
+            "decoder",
+            "metrics",
+        }
+        assert stats["cache"]["hits"] == 0
+        assert stats["circuit_breaker"] == {}
+
+
 class TestCheckApiKey:
     """Test cases for check_api_key method."""
 
@@ -76,7 +180,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     @pytest.mark.asyncio
     async def test_successful_with_permissions(self, gw2_client):
@@ -89,10 +193,10 @@ async def test_successful_with_permissions(self, gw2_client):
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=token_info)
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body(token_info))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("test-api-key")
 
@@ -105,10 +209,10 @@ async def test_successful_without_permissions_key(self, gw2_client):
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=token_info)
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body(token_info))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("test-api-key")
 
@@ -121,8 +225,7 @@ async def test_api_bad_request_returns_error(self, gw2_client):
         mock_response.status = 400
         mock_response.json = AsyncMock(return_value={"text": "bad request"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("bad-key")
 
@@ -135,8 +238,7 @@ async def test_api_connection_error_returns_error(self, gw2_client):
         mock_response.status = 429
         mock_response.json = AsyncMock(return_value={"text": "rate limited"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("test-key")
 
@@ -149,8 +251,7 @@ async def test_api_forbidden_returns_error(self, gw2_client):
         mock_response.status = 403
         mock_response.json = AsyncMock(return_value={"text": "access denied"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("test-key")
 
@@ -163,8 +264,7 @@ async def test_api_inactive_error_returns_error(self, gw2_client):
         mock_response.status = 502
         mock_response.json = AsyncMock(return_value={"text": "bad gateway"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("test-key")
 
@@ -177,8 +277,7 @@ async def test_api_invalid_key_returns_error(self, gw2_client):
         mock_response.status = 400
         mock_response.json = AsyncMock(return_value={"text": "invalid key"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("invalid-key")
 
@@ -191,8 +290,7 @@ async def test_api_not_found_returns_error(self, gw2_client):
         mock_response.status = 404
         mock_response.json = AsyncMock(return_value={"text": "not found"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("test-key")
 
@@ -205,8 +303,7 @@ async def test_api_504_inactive_error_returns_error(self, gw2_client):
         mock_response.status = 504
         mock_response.json = AsyncMock(return_value={"text": "gateway timeout"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("test-key")
 
@@ -219,8 +316,7 @@ async def test_api_503_inactive_error_returns_error(self, gw2_client):
         mock_response.status = 503
         mock_response.json = AsyncMock(return_value={"text": "service unavailable"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.check_api_key("test-key")
 
@@ -241,7 +337,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     @pytest.mark.asyncio
     async def test_status_200_returns_json(self, gw2_client):
@@ -250,10 +346,10 @@ async def test_status_200_returns_json(self, gw2_client):
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=expected_data)
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body(expected_data))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.call_api("account")
 
@@ -266,10 +362,10 @@ async def test_status_206_returns_json(self, gw2_client):
 
         mock_response = AsyncMock()
         mock_response.status = 206
-        mock_response.json = AsyncMock(return_value=expected_data)
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body(expected_data))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.call_api("achievements?ids=1,2,3")
 
@@ -283,8 +379,7 @@ async def test_other_status_calls_handle_api_error(self, gw2_client):
         mock_response.json = AsyncMock(return_value={"text": "internal error"})
         mock_response.reason = "Internal Server Error"
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         with pytest.raises(APIConnectionError):
             await gw2_client.call_api("account")
@@ -296,16 +391,16 @@ async def test_call_api_with_key(self, gw2_client):
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=expected_data)
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body(expected_data))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.call_api("account", "my-api-key")
 
         assert result == expected_data
         # Verify headers were built with key
-        call_kwargs = gw2_client.bot.aiosession.get.call_args
+        call_kwargs = gw2_client.session.get.call_args
         headers = (
             call_kwargs[1]["headers"]
             if "headers" in call_kwargs[1]
@@ -322,14 +417,14 @@ async def test_call_api_builds_correct_endpoint(self, gw2_client):
         """Test that call_api builds the correct endpoint URL."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={})
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({}))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         await gw2_client.call_api("account/wallet")
 
-        call_args = gw2_client.bot.aiosession.get.call_args
+        call_args = gw2_client.session.get.call_args
         endpoint = call_args[0][0]
         assert "account/wallet" in endpoint
         assert endpoint.startswith("https://api.guildwars2.com/")
@@ -349,7 +444,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     def test_build_headers_without_key(self, gw2_client):
         """Test headers without API key (lines 52-55)."""
@@ -395,7 +490,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     @pytest.mark.asyncio
     async def test_status_400_calls_handle_400(self, gw2_client):
@@ -533,7 +628,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     def test_invalid_key_raises_api_invalid_key(self, gw2_client):
         """Test 'invalid key' message raises APIInvalidKey (line 88-89)."""
@@ -568,7 +663,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     def test_invalid_key_raises_api_invalid_key(self, gw2_client):
         """Test 'invalid key' message raises APIInvalidKey (line 94-95)."""
@@ -603,7 +698,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     def test_raises_api_not_found(self, gw2_client):
         """Test that 404 raises APINotFound (line 99-100)."""
@@ -635,7 +730,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     def test_raises_api_connection_error(self, gw2_client):
         """Test that 429 raises APIConnectionError (line 103-104)."""
@@ -658,7 +753,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     def test_raises_api_inactive_error(self, gw2_client):
         """Test that 502/504 raises APIInactiveError (line 107-108)."""
@@ -681,7 +776,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     def test_raises_api_inactive_error_with_message(self, gw2_client):
         """Test that 503 raises APIInactiveError with error message (line 111-112)."""
@@ -711,7 +806,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     def test_empty_err_msg_uses_response_reason(self, gw2_client):
         """Test that empty err_msg falls back to response.reason (line 116-117)."""
@@ -768,7 +863,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     @pytest.mark.asyncio
     async def test_400_invalid_key_flow(self, gw2_client):
@@ -777,8 +872,7 @@ async def test_400_invalid_key_flow(self, gw2_client):
         mock_response.status = 400
         mock_response.json = AsyncMock(return_value={"text": "invalid key"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         with pytest.raises(APIInvalidKey):
             await gw2_client.call_api("tokeninfo", "bad-key")
@@ -790,8 +884,7 @@ async def test_403_invalid_key_flow(self, gw2_client):
         mock_response.status = 403
         mock_response.json = AsyncMock(return_value={"text": "invalid key"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         with pytest.raises(APIInvalidKey):
             await gw2_client.call_api("account", "expired-key")
@@ -803,8 +896,7 @@ async def test_403_forbidden_flow(self, gw2_client):
         mock_response.status = 403
         mock_response.json = AsyncMock(return_value={"text": "requires scope account"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         with pytest.raises(APIForbidden):
             await gw2_client.call_api("account/wallet", "limited-key")
@@ -816,8 +908,7 @@ async def test_429_rate_limit_flow(self, gw2_client):
         mock_response.status = 429
         mock_response.json = AsyncMock(return_value={"text": "too many requests"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         with pytest.raises(APIConnectionError):
             await gw2_client.call_api("achievements?ids=all")
@@ -829,8 +920,7 @@ async def test_502_bad_gateway_flow(self, gw2_client):
         mock_response.status = 502
         mock_response.json = AsyncMock(return_value={"text": "bad gateway"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         with pytest.raises(APIInactiveError):
             await gw2_client.call_api("account")
@@ -843,8 +933,7 @@ async def test_unknown_error_with_reason_fallback(self, gw2_client):
         mock_response.json = AsyncMock(side_effect=ValueError("not json"))
         mock_response.reason = "I'm a teapot"
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         with pytest.raises(APIConnectionError) as exc_info:
             await gw2_client.call_api("account")
@@ -856,16 +945,16 @@ async def test_call_api_without_key(self, gw2_client):
         """Test call_api without providing an API key."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={"worlds": [1001, 1002]})
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"worlds": [1001, 1002]}))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         result = await gw2_client.call_api("worlds?ids=all")
 
         assert result == {"worlds": [1001, 1002]}
         # Verify no Authorization header
-        call_kwargs = gw2_client.bot.aiosession.get.call_args
+        call_kwargs = gw2_client.session.get.call_args
         headers = call_kwargs[1].get("headers", {})
         assert "Authorization" not in headers
 
@@ -881,8 +970,7 @@ async def test_call_api_non_200_206_returns_none_after_error_handler(self, gw2_c
         mock_response.json = AsyncMock(return_value={"text": "error"})
         mock_response.reason = "Internal Server Error"
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
         # Patch _handle_api_error to NOT raise, so execution falls through to return None
         with patch.object(gw2_client, "_handle_api_error", new_callable=AsyncMock) as mock_handler:
@@ -906,7 +994,7 @@ def mock_bot(self):
     @pytest.fixture
     def gw2_client(self, mock_bot):
         """Create a Gw2Client instance."""
-        return Gw2Client(mock_bot)
+        return Gw2Client(mock_bot, session=MagicMock())
 
     @pytest.mark.asyncio
     @patch("src.gw2.tools.gw2_client._gw2_settings")
@@ -915,6 +1003,8 @@ async def test_retry_succeeds_after_transient_504(self, mock_sleep, mock_setting
         """Test successful retry after a transient 504 then 200."""
         mock_settings.api_retry_max_attempts = 5
         mock_settings.api_retry_delay = 3.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
 
         mock_504 = AsyncMock()
         mock_504.status = 504
@@ -922,17 +1012,15 @@ async def test_retry_succeeds_after_transient_504(self, mock_sleep, mock_setting
 
         mock_200 = AsyncMock()
         mock_200.status = 200
-        mock_200.json = AsyncMock(return_value={"name": "TestAccount"})
+        mock_200.headers = {}
+        mock_200.read = AsyncMock(return_value=_json_body({"name": "TestAccount"}))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(
-            side_effect=[AsyncContextManager(mock_504), AsyncContextManager(mock_200)]
-        )
+        gw2_client.session.get = MagicMock(side_effect=[AsyncContextManager(mock_504), AsyncContextManager(mock_200)])
 
         result = await gw2_client.call_api("account")
 
         assert result == {"name": "TestAccount"}
-        assert gw2_client.bot.aiosession.get.call_count == 2
+        assert gw2_client.session.get.call_count == 2
         mock_sleep.assert_called_once_with(3.0)
 
     @pytest.mark.asyncio
@@ -942,18 +1030,19 @@ async def test_exhausts_retries_on_persistent_504(self, mock_sleep, mock_setting
         """Test that persistent 504 exhausts all retries then raises APIInactiveError."""
         mock_settings.api_retry_max_attempts = 3
         mock_settings.api_retry_delay = 1.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
 
         mock_504 = AsyncMock()
         mock_504.status = 504
         mock_504.json = AsyncMock(return_value={"text": "gateway timeout"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(side_effect=[AsyncContextManager(mock_504) for _ in range(3)])
+        gw2_client.session.get = MagicMock(side_effect=[AsyncContextManager(mock_504) for _ in range(3)])
 
         with pytest.raises(APIInactiveError):
             await gw2_client.call_api("account")
 
-        assert gw2_client.bot.aiosession.get.call_count == 3
+        assert gw2_client.session.get.call_count == 3
         # Sleep is called between retries, not after the last attempt
         assert mock_sleep.call_count == 2
 
@@ -964,29 +1053,32 @@ async def test_no_retry_on_4xx_errors(self, mock_sleep, mock_settings, gw2_clien
         """Test that 4xx errors are not retried."""
         mock_settings.api_retry_max_attempts = 5
         mock_settings.api_retry_delay = 3.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
 
         for status, exception_class in [(400, APIBadRequest), (403, APIForbidden), (404, APINotFound)]:
             mock_response = AsyncMock()
             mock_response.status = status
             mock_response.json = AsyncMock(return_value={"text": "error"})
 
-            gw2_client.bot.aiosession = MagicMock()
-            gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+            gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
 
             with pytest.raises(exception_class):
                 await gw2_client.call_api("account")
 
-            assert gw2_client.bot.aiosession.get.call_count == 1
+            assert gw2_client.session.get.call_count == 1
 
         mock_sleep.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("src.gw2.tools.gw2_client._gw2_settings")
     @patch("src.gw2.tools.gw2_client.asyncio.sleep", new_callable=AsyncMock)
-    async def test_retry_delay_uses_configured_value(self, mock_sleep, mock_settings, gw2_client):
-        """Test that retry delay is called with the configured value."""
+    async def test_retry_delay_backs_off_exponentially(self, mock_sleep, mock_settings, gw2_client):
+        """Test that the retry delay doubles from the configured base delay."""
         mock_settings.api_retry_max_attempts = 3
         mock_settings.api_retry_delay = 7.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
 
         mock_503 = AsyncMock()
         mock_503.status = 503
@@ -994,10 +1086,10 @@ async def test_retry_delay_uses_configured_value(self, mock_sleep, mock_settings
 
         mock_200 = AsyncMock()
         mock_200.status = 200
-        mock_200.json = AsyncMock(return_value={"ok": True})
+        mock_200.headers = {}
+        mock_200.read = AsyncMock(return_value=_json_body({"ok": True}))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(
+        gw2_client.session.get = MagicMock(
             side_effect=[
                 AsyncContextManager(mock_503),
                 AsyncContextManager(mock_503),
@@ -1008,7 +1100,7 @@ async def test_retry_delay_uses_configured_value(self, mock_sleep, mock_settings
         result = await gw2_client.call_api("account")
 
         assert result == {"ok": True}
-        assert mock_sleep.call_args_list == [call(7), call(7)]
+        assert mock_sleep.call_args_list == [call(7.0), call(14.0)]
 
     @pytest.mark.asyncio
     @patch("src.gw2.tools.gw2_client._gw2_settings")
@@ -1017,13 +1109,15 @@ async def test_retry_on_connection_error_then_success(self, mock_sleep, mock_set
         """Test retry on aiohttp connection error then success."""
         mock_settings.api_retry_max_attempts = 5
         mock_settings.api_retry_delay = 3.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
 
         mock_200 = AsyncMock()
         mock_200.status = 200
-        mock_200.json = AsyncMock(return_value={"name": "TestAccount"})
+        mock_200.headers = {}
+        mock_200.read = AsyncMock(return_value=_json_body({"name": "TestAccount"}))
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(
+        gw2_client.session.get = MagicMock(
             side_effect=[
                 AsyncContextManagerError(OSError("Connection refused")),
                 AsyncContextManager(mock_200),
@@ -1033,7 +1127,7 @@ async def test_retry_on_connection_error_then_success(self, mock_sleep, mock_set
         result = await gw2_client.call_api("account")
 
         assert result == {"name": "TestAccount"}
-        assert gw2_client.bot.aiosession.get.call_count == 2
+        assert gw2_client.session.get.call_count == 2
         mock_sleep.assert_called_once_with(3.0)
 
     @pytest.mark.asyncio
@@ -1043,9 +1137,10 @@ async def test_connection_error_exhausts_retries(self, mock_sleep, mock_settings
         """Test that persistent connection errors exhaust retries and re-raise."""
         mock_settings.api_retry_max_attempts = 2
         mock_settings.api_retry_delay = 1.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(
+        gw2_client.session.get = MagicMock(
             side_effect=[
                 AsyncContextManagerError(OSError("Connection refused")),
                 AsyncContextManagerError(OSError("Connection refused")),
@@ -1055,25 +1150,849 @@ async def test_connection_error_exhausts_retries(self, mock_sleep, mock_settings
         with pytest.raises(OSError, match="Connection refused"):
             await gw2_client.call_api("account")
 
-        assert gw2_client.bot.aiosession.get.call_count == 2
+        assert gw2_client.session.get.call_count == 2
 
     @pytest.mark.asyncio
     @patch("src.gw2.tools.gw2_client._gw2_settings")
     @patch("src.gw2.tools.gw2_client.asyncio.sleep", new_callable=AsyncMock)
     async def test_api_error_not_retried(self, mock_sleep, mock_settings, gw2_client):
-        """Test that APIError exceptions from _handle_api_error are not caught by retry."""
+        """Test that APIError exceptions for non-retryable statuses are not caught by retry."""
         mock_settings.api_retry_max_attempts = 5
         mock_settings.api_retry_delay = 3.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
 
         mock_response = AsyncMock()
-        mock_response.status = 429
-        mock_response.json = AsyncMock(return_value={"text": "rate limited"})
+        mock_response.status = 500
+        mock_response.json = AsyncMock(return_value={"text": "internal error"})
+
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        with pytest.raises(APIConnectionError):
+            await gw2_client.call_api("account")
+
+        assert gw2_client.session.get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("src.gw2.tools.gw2_client._gw2_settings")
+    @patch("src.gw2.tools.gw2_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_429_is_retried(self, mock_sleep, mock_settings, gw2_client):
+        """Test that 429 responses are retried before raising APIConnectionError."""
+        mock_settings.api_retry_max_attempts = 3
+        mock_settings.api_retry_delay = 1.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
+
+        mock_429 = AsyncMock()
+        mock_429.status = 429
+        mock_429.json = AsyncMock(return_value={"text": "too many requests"})
 
-        gw2_client.bot.aiosession = MagicMock()
-        gw2_client.bot.aiosession.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_429))
 
         with pytest.raises(APIConnectionError):
             await gw2_client.call_api("account")
 
-        assert gw2_client.bot.aiosession.get.call_count == 1
+        assert gw2_client.session.get.call_count == 3
+        assert mock_sleep.call_args_list == [call(1.0), call(2.0)]
+
+    @pytest.mark.asyncio
+    @patch("src.gw2.tools.gw2_client._gw2_settings")
+    @patch("src.gw2.tools.gw2_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_after_header_is_honored(self, mock_sleep, mock_settings, gw2_client):
+        """Test that a Retry-After header overrides the computed backoff."""
+        mock_settings.api_retry_max_attempts = 3
+        mock_settings.api_retry_delay = 1.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
+
+        mock_429 = AsyncMock()
+        mock_429.status = 429
+        mock_429.headers = {"Retry-After": "12"}
+        mock_200 = AsyncMock()
+        mock_200.status = 200
+        mock_200.headers = {}
+        mock_200.read = AsyncMock(return_value=_json_body({"ok": True}))
+
+        gw2_client.session.get = MagicMock(side_effect=[AsyncContextManager(mock_429), AsyncContextManager(mock_200)])
+
+        result = await gw2_client.call_api("account")
+
+        assert result == {"ok": True}
+        mock_sleep.assert_called_once_with(12.0)
+
+    @pytest.mark.asyncio
+    @patch("src.gw2.tools.gw2_client._gw2_settings")
+    @patch("src.gw2.tools.gw2_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_after_beyond_max_elapsed_gives_up(self, mock_sleep, mock_settings, gw2_client):
+        """Test that retries stop when the next wait would exceed the max elapsed time."""
+        mock_settings.api_retry_max_attempts = 5
+        mock_settings.api_retry_delay = 1.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
+
+        mock_503 = AsyncMock()
+        mock_503.status = 503
+        mock_503.headers = {"Retry-After": "120"}
+        mock_503.json = AsyncMock(return_value={"text": "maintenance"})
+
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_503))
+
+        with pytest.raises(APIInactiveError):
+            await gw2_client.call_api("account")
+
+        assert gw2_client.session.get.call_count == 1
         mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("src.gw2.tools.gw2_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_call_site_retry_policy_overrides_default(self, mock_sleep, gw2_client):
+        """Test that a retry policy passed by the call site replaces the default one."""
+        mock_502 = AsyncMock()
+        mock_502.status = 502
+        mock_502.json = AsyncMock(return_value={"text": "bad gateway"})
+
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_502))
+
+        with pytest.raises(APIInactiveError):
+            await gw2_client.call_api("account", retry_policy=RetryPolicy(max_attempts=2, base_delay=0.5))
+
+        assert gw2_client.session.get.call_count == 2
+        mock_sleep.assert_called_once_with(0.5)
+
+
+class TestCallApiCache:
+    """Test cases for the response cache in call_api."""
+
+    @pytest.fixture
+    def mock_bot(self):
+        """Create a mock bot."""
+        bot = MagicMock()
+        bot.log = MagicMock()
+        bot.description = "Test Bot"
+        return bot
+
+    @pytest.fixture
+    def gw2_client(self, mock_bot):
+        """Create a Gw2Client instance."""
+        return Gw2Client(mock_bot, session=MagicMock())
+
+    def _mock_session(self, gw2_client, data):
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body(data))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+    def test_clients_do_not_share_cache(self, mock_bot):
+        """Test that each client owns its cache (the bot shares one client instead)."""
+        assert Gw2Client(mock_bot).cache is not Gw2Client(mock_bot).cache
+
+    @pytest.mark.asyncio
+    async def test_cacheable_endpoint_served_from_cache(self, gw2_client):
+        """Test that a repeated call to a cacheable endpoint skips the network."""
+        self._mock_session(gw2_client, [{"id": 1001, "name": "Anvil Rock"}])
+
+        first = await gw2_client.call_api("worlds?ids=all")
+        second = await gw2_client.call_api("worlds?ids=all")
+
+        assert first == second
+        assert gw2_client.session.get.call_count == 1
+        assert gw2_client.cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_public_endpoint_shared_across_keys(self, gw2_client):
+        """Test that public endpoints are not scoped by API key."""
+        self._mock_session(gw2_client, {"id": 1001, "name": "Anvil Rock"})
+
+        await gw2_client.call_api("worlds/1001", "key-one")
+        await gw2_client.call_api("worlds/1001", "key-two")
+
+        assert gw2_client.session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_authenticated_endpoint_scoped_by_key(self, gw2_client):
+        """Test that authenticated endpoints are cached per API key."""
+        self._mock_session(gw2_client, {"name": "Account.1234"})
+
+        await gw2_client.call_api("account", "key-one")
+        await gw2_client.call_api("account", "key-two")
+        await gw2_client.call_api("account", "key-one")
+
+        assert gw2_client.session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_uncached_endpoint_always_fetched(self, gw2_client):
+        """Test that endpoints without a policy are never cached."""
+        self._mock_session(gw2_client, {"id": "key-id", "permissions": ["account"]})
+
+        await gw2_client.call_api("tokeninfo", "key-one")
+        await gw2_client.call_api("tokeninfo", "key-one")
+
+        assert gw2_client.session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, gw2_client):
+        """Test that failed requests are not stored in the cache."""
+        mock_404 = AsyncMock()
+        mock_404.status = 404
+        mock_404.json = AsyncMock(return_value={"text": "not found"})
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_404))
+
+        with pytest.raises(APINotFound):
+            await gw2_client.call_api("worlds/9999")
+
+        assert gw2_client.cache.stats()["size"] == 0
+
+
+class TestCallApiSingleFlight:
+    """Test cases for request coalescing in call_api."""
+
+    @pytest.fixture
+    def mock_bot(self):
+        """Create a mock bot."""
+        bot = MagicMock()
+        bot.log = MagicMock()
+        bot.description = "Test Bot"
+        return bot
+
+    @pytest.fixture
+    def gw2_client(self, mock_bot):
+        """Create a Gw2Client instance."""
+        return Gw2Client(mock_bot, session=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_request(self, gw2_client):
+        """Test that concurrent identical calls send a single HTTP request."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"id": "1-1"}))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        deduplicated_before = gw2_client.singleflight.deduplicated
+
+        results = await asyncio.gather(*[gw2_client.call_api("tokeninfo", "same-key") for _ in range(4)])
+
+        assert results == [{"id": "1-1"}] * 4
+        assert gw2_client.session.get.call_count == 1
+        assert gw2_client.singleflight.deduplicated - deduplicated_before == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_with_different_keys_not_shared(self, gw2_client):
+        """Test that uncached authenticated calls are coalesced per key only."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"id": "1-1"}))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        await asyncio.gather(gw2_client.call_api("tokeninfo", "key-one"), gw2_client.call_api("tokeninfo", "key-two"))
+
+        assert gw2_client.session.get.call_count == 2
+
+
+class TestCallApiRevalidation:
+    """Test cases for conditional requests (ETag / Last-Modified) in call_api."""
+
+    @pytest.fixture
+    def mock_bot(self):
+        """Create a mock bot."""
+        bot = MagicMock()
+        bot.log = MagicMock()
+        bot.description = "Test Bot"
+        return bot
+
+    @pytest.fixture
+    def gw2_client(self, mock_bot):
+        """Create a Gw2Client instance."""
+        return Gw2Client(mock_bot, session=MagicMock())
+
+    @staticmethod
+    def _response(status, data=None, headers=None):
+        mock_response = AsyncMock()
+        mock_response.status = status
+        mock_response.headers = headers or {}
+        mock_response.read = AsyncMock(return_value=_json_body(data))
+        return AsyncContextManager(mock_response)
+
+    @pytest.mark.asyncio
+    async def test_refresh_sends_validators_and_uses_stored_body_on_304(self, gw2_client):
+        """Test that a stale response is revalidated and a 304 is served from the stored body."""
+        characters = [{"name": "Char"}]
+        gw2_client.session.get = MagicMock(
+            side_effect=[
+                self._response(
+                    200,
+                    characters,
+                    {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+                ),
+                self._response(304),
+            ]
+        )
+
+        first = await gw2_client.call_api("characters?ids=all", "my-key")
+        gw2_client.cache.clear()  # the TTL expired
+        second = await gw2_client.call_api("characters?ids=all", "my-key")
+
+        assert first == second == characters
+        refresh_headers = gw2_client.session.get.call_args_list[1][1]["headers"]
+        assert refresh_headers["If-None-Match"] == '"v1"'
+        assert refresh_headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+        assert gw2_client.revalidation.stats()["not_modified"] == 1
+        assert gw2_client.revalidation.stats()["bytes_saved"] == len(_json_body(characters))
+
+    @pytest.mark.asyncio
+    async def test_changed_response_replaces_stored_body(self, gw2_client):
+        """Test that a 200 to a conditional request returns and stores the new body."""
+        gw2_client.session.get = MagicMock(
+            side_effect=[
+                self._response(200, [{"id": 1}], {"ETag": '"v1"'}),
+                self._response(200, [{"id": 2}], {"ETag": '"v2"'}),
+            ]
+        )
+
+        await gw2_client.call_api("worlds?ids=all")
+        gw2_client.cache.clear()
+        result = await gw2_client.call_api("worlds?ids=all")
+
+        assert result == [{"id": 2}]
+        assert gw2_client.revalidation.get("worlds?ids=all").etag == '"v2"'
+        assert gw2_client.revalidation.stats()["modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_first_request_is_unconditional(self, gw2_client):
+        """Test that nothing is sent without a stored response."""
+        gw2_client.session.get = MagicMock(return_value=self._response(200, {"id": "1-1"}))
+
+        await gw2_client.call_api("tokeninfo", "my-key")
+
+        headers = gw2_client.session.get.call_args[1]["headers"]
+        assert "If-None-Match" not in headers
+        assert "If-Modified-Since" not in headers
+        assert gw2_client.revalidation.stats()["size"] == 0
+
+
+class TestCallApiRateLimit:
+    """Test cases for the client-side rate limiter in call_api."""
+
+    @pytest.fixture
+    def mock_bot(self):
+        """Create a mock bot."""
+        bot = MagicMock()
+        bot.log = MagicMock()
+        bot.description = "Test Bot"
+        return bot
+
+    @pytest.fixture
+    def gw2_client(self, mock_bot):
+        """Create a Gw2Client instance."""
+        return Gw2Client(mock_bot, session=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_each_request_acquires_rate_limit_with_key(self, gw2_client):
+        """Test that every HTTP request waits on the rate limiter for its key."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"id": "1-1"}))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        with patch.object(gw2_client.rate_limiter, "acquire", new_callable=AsyncMock) as mock_acquire:
+            await gw2_client.call_api("tokeninfo", "my-key")
+
+        mock_acquire.assert_awaited_once_with("my-key")
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_consume_rate_limit(self, gw2_client):
+        """Test that cached responses skip the rate limiter."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body([{"id": 1001}]))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        await gw2_client.call_api("worlds?ids=all")
+        await gw2_client.call_api("worlds?ids=all")
+
+        assert gw2_client.rate_limiter.stats()["acquired"] == 1
+
+    @pytest.mark.asyncio
+    @patch("src.gw2.tools.gw2_client._gw2_settings")
+    @patch("src.gw2.tools.gw2_client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_acquire_rate_limit_again(self, mock_sleep, mock_settings, gw2_client):
+        """Test that each retry attempt consumes its own token."""
+        mock_settings.api_retry_max_attempts = 3
+        mock_settings.api_retry_delay = 1.0
+        mock_settings.api_retry_max_delay = 30.0
+        mock_settings.api_retry_max_elapsed = 60.0
+
+        mock_503 = AsyncMock()
+        mock_503.status = 503
+        mock_503.json = AsyncMock(return_value={"text": "service unavailable"})
+        mock_200 = AsyncMock()
+        mock_200.status = 200
+        mock_200.headers = {}
+        mock_200.read = AsyncMock(return_value=_json_body({"ok": True}))
+        gw2_client.session.get = MagicMock(side_effect=[AsyncContextManager(mock_503), AsyncContextManager(mock_200)])
+
+        await gw2_client.call_api("tokeninfo", "my-key")
+
+        assert gw2_client.rate_limiter.stats()["acquired"] == 2
+
+
+class TestCallApiScheduler:
+    """Test cases for the priority scheduler in call_api."""
+
+    @pytest.fixture
+    def mock_bot(self):
+        """Create a mock bot."""
+        bot = MagicMock()
+        bot.log = MagicMock()
+        bot.description = "Test Bot"
+        return bot
+
+    @pytest.fixture
+    def gw2_client(self, mock_bot):
+        """Create a Gw2Client instance."""
+        return Gw2Client(mock_bot, session=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_request_takes_slot_of_its_priority(self, gw2_client):
+        """Test that the HTTP request is made inside a slot of the caller's class."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"id": "1-1"}))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        await gw2_client.call_api("tokeninfo", "my-key", priority=RequestPriority.BACKGROUND)
+
+        stats = gw2_client.scheduler.stats()
+        assert stats["background"]["granted"] == 1
+        assert stats["background"]["in_flight"] == 0
+        assert stats["interactive"]["granted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_default_priority_is_interactive(self, gw2_client):
+        """Test that callers without a priority are scheduled as interactive."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"id": "1-1"}))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        await gw2_client.call_api("tokeninfo", "my-key")
+
+        assert gw2_client.scheduler.stats()["interactive"]["granted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_passes_priority(self, gw2_client):
+        """Test that bulk lookups schedule their chunks with the given priority."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body([{"id": 1}]))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        await gw2_client.fetch_many("achievements", [1], priority=RequestPriority.PREFETCH)
+
+        assert gw2_client.scheduler.stats()["prefetch"]["granted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_does_not_hold_slot(self, gw2_client):
+        """Test that a key waiting on its rate limit doesn't keep other keys from the free slots."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"id": "1-1"}))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+        gw2_client.scheduler.max_concurrency = 1
+        waiting_on_limit = asyncio.Event()
+        limited = asyncio.Event()
+
+        async def acquire(key):
+            if key == "limited-key":
+                waiting_on_limit.set()
+                await limited.wait()
+
+        with patch.object(gw2_client.rate_limiter, "acquire", side_effect=acquire):
+            waiting = asyncio.create_task(gw2_client.call_api("tokeninfo", "limited-key"))
+            await waiting_on_limit.wait()
+            result = await asyncio.wait_for(gw2_client.call_api("tokeninfo", "other-key"), timeout=1)
+            assert result == {"id": "1-1"}
+            assert not waiting.done()
+            limited.set()
+            assert await waiting == {"id": "1-1"}
+
+    @pytest.mark.asyncio
+    async def test_interactive_call_does_not_join_background_request(self, gw2_client):
+        """Test that an interactive caller sends its own request instead of waiting on a background one."""
+        release = asyncio.Event()
+        priorities = []
+
+        async def request(uri, key, retry_policy=None, priority=RequestPriority.INTERACTIVE):
+            priorities.append(priority)
+            await release.wait()
+            return {"priority": priority.name}
+
+        with patch.object(gw2_client, "_request", side_effect=request):
+            background = asyncio.create_task(
+                gw2_client.call_api("account", "my-key", priority=RequestPriority.BACKGROUND)
+            )
+            await asyncio.sleep(0)
+            interactive = asyncio.create_task(gw2_client.call_api("account", "my-key"))
+            await asyncio.sleep(0)
+            # Later callers of any class join the interactive request
+            late_background = asyncio.create_task(
+                gw2_client.call_api("account", "my-key", priority=RequestPriority.BACKGROUND)
+            )
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(background, interactive, late_background)
+
+        assert priorities == [RequestPriority.BACKGROUND, RequestPriority.INTERACTIVE]
+        assert results == [{"priority": "BACKGROUND"}, {"priority": "INTERACTIVE"}, {"priority": "INTERACTIVE"}]
+
+
+class TestCallApiMetrics:
+    """Test cases for the per-endpoint metrics recorded by call_api."""
+
+    @pytest.fixture
+    def gw2_client(self):
+        """Create a Gw2Client instance."""
+        bot = MagicMock()
+        bot.description = "Test Bot"
+        return Gw2Client(bot, session=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_retried_request_records_each_attempt(self, gw2_client):
+        """Test that every attempt records its status and the retry is counted."""
+        mock_503 = AsyncMock()
+        mock_503.status = 503
+        mock_503.json = AsyncMock(return_value={"text": "service unavailable"})
+        mock_200 = AsyncMock()
+        mock_200.status = 200
+        mock_200.headers = {}
+        mock_200.read = AsyncMock(return_value=b'{"name": "Test"}')
+        gw2_client.session.get = MagicMock(side_effect=[AsyncContextManager(mock_503), AsyncContextManager(mock_200)])
+
+        await gw2_client.call_api("account", "my-key")
+
+        metrics = gw2_client.metrics.stats()["account"]
+        assert metrics["requests"] == 2
+        assert metrics["retries"] == 1
+        assert metrics["statuses"] == {"503": 1, "200": 1}
+        assert metrics["bytes"] == len(b'{"name": "Test"}')
+
+    @pytest.mark.asyncio
+    async def test_connection_error_is_recorded(self, gw2_client):
+        """Test that attempts without a response are recorded as errors."""
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManagerError(ConnectionError("refused")))
+
+        with pytest.raises(ConnectionError):
+            await gw2_client.call_api("account", retry_policy=RetryPolicy(max_attempts=1))
+
+        assert gw2_client.metrics.stats()["account"]["statuses"] == {"error": 1}
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_recorded(self, gw2_client):
+        """Test that responses served from the cache are counted per endpoint."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=b'[{"id": 1001}]')
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        await gw2_client.call_api("worlds?ids=all")
+        await gw2_client.call_api("worlds?ids=all")
+
+        metrics = gw2_client.metrics.stats()["worlds"]
+        assert metrics["requests"] == 1
+        assert metrics["cache_hits"] == 1
+
+
+class TestCallApiCircuitBreaker:
+    """Test cases for the circuit breaker in call_api."""
+
+    @pytest.fixture
+    def mock_bot(self):
+        """Create a mock bot."""
+        bot = MagicMock()
+        bot.log = MagicMock()
+        bot.description = "Test Bot"
+        return bot
+
+    @pytest.fixture
+    def gw2_client(self, mock_bot):
+        """Create a Gw2Client instance."""
+        return Gw2Client(mock_bot, session=MagicMock())
+
+    @staticmethod
+    def _trip(gw2_client, family):
+        breaker = gw2_client.circuit_breaker.get_breaker(family)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        return breaker
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, gw2_client):
+        """Test that an open circuit raises APIInactiveError without sending a request."""
+        self._trip(gw2_client, "account")
+
+        with pytest.raises(APIInactiveError) as exc_info:
+            await gw2_client.call_api("account/achievements", "key")
+
+        assert gw2_messages.API_CIRCUIT_OPEN in str(exc_info.value)
+        gw2_client.session.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_only_affects_its_family(self, gw2_client):
+        """Test that other endpoint families keep working while one circuit is open."""
+        self._trip(gw2_client, "wvw")
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"id": 1001}))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        assert await gw2_client.call_api("account", "key") == {"id": 1001}
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_stops_retry_loop(self, gw2_client):
+        """Test that a circuit opening mid-retry aborts the remaining attempts."""
+        mock_502 = AsyncMock()
+        mock_502.status = 502
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_502))
+
+        with (
+            patch.object(gw2_client.circuit_breaker, "failure_threshold", 2),
+            pytest.raises(APIInactiveError),
+        ):
+            await gw2_client.call_api("account")
+
+        assert gw2_client.session.get.call_count == 2
+        assert gw2_client.circuit_breaker.stats()["account"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_successful_probe_closes_circuit(self, gw2_client):
+        """Test that a successful request after the recovery timeout closes the circuit."""
+        breaker = self._trip(gw2_client, "account")
+        breaker.opened_at -= breaker.recovery_timeout
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=_json_body({"ok": True}))
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        assert await gw2_client.call_api("account", "key") == {"ok": True}
+        assert gw2_client.circuit_breaker.stats()["account"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip_circuit(self, gw2_client):
+        """Test that 4xx responses count as a healthy API."""
+        mock_response = AsyncMock()
+        mock_response.status = 400
+        mock_response.json = AsyncMock(return_value={"text": "invalid key"})
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_response))
+
+        for _ in range(10):
+            with pytest.raises(APIInvalidKey):
+                await gw2_client.call_api("tokeninfo", "bad-key")
+
+        assert gw2_client.circuit_breaker.stats()["tokeninfo"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_trip_circuit(self, gw2_client):
+        """Test that connection errors are counted as outage failures."""
+        gw2_client.session.get = MagicMock(side_effect=ConnectionError("refused"))
+
+        with pytest.raises(ConnectionError):
+            await gw2_client.call_api("account")
+
+        assert gw2_client.circuit_breaker.stats()["account"]["state"] == "open"
+
+
+class TestFetchMany:
+    """Test cases for Gw2Client.fetch_many."""
+
+    @pytest.fixture
+    def mock_bot(self):
+        """Create a mock bot."""
+        bot = MagicMock()
+        bot.log = MagicMock()
+        bot.description = "Test Bot"
+        return bot
+
+    @pytest.fixture
+    def gw2_client(self, mock_bot):
+        """Create a Gw2Client instance."""
+        return Gw2Client(mock_bot, session=MagicMock())
+
+    @staticmethod
+    def _echo_ids(gw2_client, skip=()):
+        """Make the session answer ?ids= requests with one object per requested id."""
+
+        def get(endpoint, headers):
+            ids = [int(i) for i in endpoint.split("?ids=")[1].split(",")]
+            response = AsyncMock()
+            response.status = 200
+            response.headers = {}
+            response.read = AsyncMock(
+                return_value=_json_body([{"id": i, "name": f"obj_{i}"} for i in ids if i not in skip])
+            )
+            return AsyncContextManager(response)
+
+        gw2_client.session.get = MagicMock(side_effect=get)
+
+    @pytest.mark.asyncio
+    async def test_splits_requests_at_id_limit(self, gw2_client):
+        """Test that ids are requested in chunks of at most 200."""
+        self._echo_ids(gw2_client)
+
+        found, missing = await gw2_client.fetch_many("achievements", list(range(450)))
+
+        assert list(found) == list(range(450))
+        assert missing == []
+        requested = [c.args[0].split("?ids=")[1].split(",") for c in gw2_client.session.get.call_args_list]
+        assert sorted(len(ids) for ids in requested) == [50, 200, 200]
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_ids_and_keeps_order(self, gw2_client):
+        """Test that duplicate ids are requested once and results follow request order."""
+        self._echo_ids(gw2_client)
+
+        found, _ = await gw2_client.fetch_many("worlds", [1002, 1001, 1002])
+
+        assert list(found) == [1002, 1001]
+        assert gw2_client.session.get.call_args.args[0].endswith("worlds?ids=1002,1001")
+
+    @pytest.mark.asyncio
+    async def test_reports_missing_ids(self, gw2_client):
+        """Test that ids the API didn't return are reported as missing."""
+        self._echo_ids(gw2_client, skip={3})
+
+        found, missing = await gw2_client.fetch_many("items", [1, 2, 3])
+
+        assert list(found) == [1, 2]
+        assert missing == [3]
+
+    @pytest.mark.asyncio
+    async def test_uses_cache_per_id(self, gw2_client):
+        """Test that cached ids are served locally and only the rest are requested."""
+        self._echo_ids(gw2_client)
+        await gw2_client.fetch_many("currencies", [1, 2])
+
+        found, _ = await gw2_client.fetch_many("currencies", [1, 2, 3])
+
+        assert list(found) == [1, 2, 3]
+        assert gw2_client.session.get.call_count == 2
+        assert gw2_client.session.get.call_args.args[0].endswith("currencies?ids=3")
+
+    @pytest.mark.asyncio
+    async def test_per_id_cache_serves_single_object_calls(self, gw2_client):
+        """Test that objects cached by fetch_many also answer call_api for the single object."""
+        self._echo_ids(gw2_client)
+        await gw2_client.fetch_many("worlds", [1001])
+
+        result = await gw2_client.call_api("worlds/1001")
+
+        assert result == {"id": 1001, "name": "obj_1001"}
+        assert gw2_client.session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_not_found_chunk_ids_are_missing(self, gw2_client):
+        """Test that a chunk the API answered with 404 only marks its ids missing, even when strict."""
+        mock_404 = AsyncMock()
+        mock_404.status = 404
+        mock_404.json = AsyncMock(return_value={"text": "all ids provided are invalid"})
+        gw2_client.session.get = MagicMock(return_value=AsyncContextManager(mock_404))
+
+        found, missing = await gw2_client.fetch_many("worlds", [1, 2], strict=True)
+
+        assert found == {}
+        assert missing == [1, 2]
+        gw2_client.bot.log.warning.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_ids_are_missing(self, gw2_client):
+        """Test that a failing chunk doesn't fail the whole fetch."""
+        chunk_results = {
+            "achievements?ids=1": APIConnectionError(gw2_client.bot, "timeout"),
+            "achievements?ids=2": [{"id": 2}],
+        }
+
+        async def _request(uri, key=None, retry_policy=None, priority=None):
+            result = chunk_results[uri]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with (
+            patch("src.gw2.tools.gw2_client.gw2_variables.API_MAX_IDS_PER_REQUEST", 1),
+            patch.object(gw2_client, "_request", side_effect=_request),
+        ):
+            found, missing = await gw2_client.fetch_many("achievements", [1, 2])
+
+        assert found == {2: {"id": 2}}
+        assert missing == [1]
+        gw2_client.bot.log.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_strict_failed_chunk_raises(self, gw2_client):
+        """Test that a failing chunk raises when strict, after the other chunks are cached."""
+        chunk_results = {
+            "achievements?ids=1": APIConnectionError(gw2_client.bot, "timeout"),
+            "achievements?ids=2": [{"id": 2}],
+        }
+
+        async def _request(uri, key=None, retry_policy=None, priority=None):
+            result = chunk_results[uri]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with (
+            patch("src.gw2.tools.gw2_client.gw2_variables.API_MAX_IDS_PER_REQUEST", 1),
+            patch.object(gw2_client, "_request", side_effect=_request) as mock_request,
+        ):
+            with pytest.raises(APIConnectionError, match="timeout"):
+                await gw2_client.fetch_many("achievements", [1, 2], strict=True)
+            mock_request.reset_mock()
+            chunk_results["achievements?ids=1"] = [{"id": 1}]
+
+            found, missing = await gw2_client.fetch_many("achievements", [1, 2], strict=True)
+
+        assert found == {1: {"id": 1}, 2: {"id": 2}}
+        assert missing == []
+        mock_request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_chunk_concurrency_is_bounded(self, gw2_client):
+        """Test that no more than fetch_many_concurrency chunks run at once."""
+        gw2_client.fetch_many_concurrency = 2
+        running = 0
+        peak = 0
+
+        async def fake_request(uri, key=None, retry_policy=None, priority=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # asyncio.sleep is patched in this module, so yield to the loop with a future
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            loop.call_soon(future.set_result, None)
+            await future
+            running -= 1
+            return []
+
+        with patch.object(gw2_client, "_request", side_effect=fake_request):
+            await gw2_client.fetch_many("achievements", list(range(1000)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_ids(self, gw2_client):
+        """Test that no request is made without ids."""
+
+        assert await gw2_client.fetch_many("worlds", []) == ({}, [])
+        gw2_client.session.get.assert_not_called()
@@ -0,0 +1,116 @@
+"""Tests for GW2 API response decoding."""
+
+import json
+import pytest
+from src.gw2.tools.gw2_decoder import Gw2ResponseDecoder, get_default_decoder, get_endpoint
+from unittest.mock import MagicMock, patch
+
+
+class TestGetEndpoint:
+    """Test cases for get_endpoint."""
+
+    @pytest.mark.parametrize(
+        ("uri", "expected"),
+        [
+            ("worlds?ids=all", "worlds"),
+            ("account/achievements", "account/achievements"),
+            ("characters?ids=all", "characters"),
+            ("guild/4BBB52AA-D768-4FC6-8EDE-C299F2822F0F", "guild/:id"),
+            ("characters/My%20Char/core", "characters/:id/core"),
+            ("achievements?ids=1,2,3", "achievements"),
+            ("/wvw/matches/", "wvw/matches"),
+        ],
+    )
+    def test_endpoint(self, uri, expected):
+        """Test that query strings are dropped and id segments folded."""
+        assert get_endpoint(uri) == expected
+
+
+class TestGetDefaultDecoder:
+    """Test cases for get_default_decoder."""
+
+    def test_falls_back_to_stdlib(self):
+        """Test that the stdlib decoder is used when orjson isn't installed."""
+        with patch("src.gw2.tools.gw2_decoder.importlib.import_module", side_effect=ImportError):
+            assert get_default_decoder() is json.loads
+
+    def test_uses_orjson_when_installed(self):
+        """Test that orjson is preferred when it can be imported."""
+        orjson = MagicMock()
+        with patch("src.gw2.tools.gw2_decoder.importlib.import_module", return_value=orjson):
+            assert get_default_decoder() is orjson.loads
+
+
+class TestGw2ResponseDecoder:
+    """Test cases for Gw2ResponseDecoder."""
+
+    @pytest.mark.asyncio
+    async def test_small_body_is_decoded_inline(self):
+        """Test that bodies under the threshold don't use a worker thread."""
+        decoder = Gw2ResponseDecoder(json.loads, thread_threshold=1024)
+
+        with patch("src.gw2.tools.gw2_decoder.asyncio.to_thread") as mock_to_thread:
+            result = await decoder.decode("account", b'{"name": "Test"}')
+
+        assert result == {"name": "Test"}
+        mock_to_thread.assert_not_called()
+        assert decoder.stats()["account"]["threaded"] == 0
+
+    @pytest.mark.asyncio
+    async def test_large_body_is_decoded_in_thread(self):
+        """Test that bodies over the threshold are decoded off the event loop."""
+        decoder = Gw2ResponseDecoder(json.loads, thread_threshold=10)
+        body = json.dumps([{"name": f"char_{i}"} for i in range(10)]).encode()
+
+        result = await decoder.decode("characters?ids=all", body)
+
+        assert len(result) == 10
+        stats = decoder.stats()["characters"]
+        assert stats["threaded"] == 1
+        assert stats["max_bytes"] == len(body)
+
+    @pytest.mark.asyncio
+    async def test_zero_threshold_disables_threading(self):
+        """Test that a threshold of 0 always decodes inline."""
+        decoder = Gw2ResponseDecoder(json.loads, thread_threshold=0)
+
+        await decoder.decode("worlds?ids=all", b"[1, 2, 3]")
+
+        assert decoder.stats()["worlds"]["threaded"] == 0
+
+    @pytest.mark.asyncio
+    async def test_custom_decoder_is_used(self):
+        """Test that the decoder hook receives the raw body."""
+        custom = MagicMock(return_value={"decoded": True})
+        decoder = Gw2ResponseDecoder(custom, thread_threshold=0)
+
+        assert await decoder.decode("build", b'{"id": 1}') == {"decoded": True}
+        custom.assert_called_once_with(b'{"id": 1}')
+
+    def test_stats_per_endpoint_biggest_first(self):
+        """Test that counters are aggregated per endpoint and ordered by response size."""
+        decoder = Gw2ResponseDecoder(json.loads)
+        decoder.record("account", 100, 0.001)
+        decoder.record("account/achievements", 300000, 0.020, threaded=True)
+        decoder.record("account/achievements", 100000, 0.010, threaded=True)
+
+        stats = decoder.stats()
+
+        assert list(stats) == ["account/achievements", "account"]
+        assert stats["account/achievements"] == {
+            "responses": 2,
+            "threaded": 2,
+            "avg_bytes": 200000,
+            "max_bytes": 300000,
+            "avg_decode_ms": 15.0,
+            "max_decode_ms": 20.0,
+        }
+
+    def test_clear(self):
+        """Test that clear forgets all endpoints."""
+        decoder = Gw2ResponseDecoder(json.loads)
+        decoder.record("account", 100, 0.001)
+
+        decoder.clear()
+
+        assert decoder.stats() == {}
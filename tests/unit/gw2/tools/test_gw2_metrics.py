@@ -0,0 +1,111 @@
+"""Tests for the GW2 API client metrics."""
+
+from src.gw2.tools.gw2_metrics import Gw2ApiMetrics, LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_empty_histogram(self):
+        """Test that percentiles of an empty histogram are 0."""
+        assert LatencyHistogram().percentile(99) == 0.0
+
+    def test_percentiles_use_bucket_upper_bounds(self):
+        """Test that percentiles are estimated from the bucket they fall in."""
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.observe(40)
+        for _ in range(9):
+            histogram.observe(400)
+        histogram.observe(3000)
+
+        assert histogram.percentile(50) == 50.0
+        assert histogram.percentile(95) == 500.0
+        assert histogram.percentile(99) == 500.0
+        assert histogram.percentile(100) == 3000.0
+
+    def test_percentile_capped_by_max(self):
+        """Test that a bucket bound above the slowest request is not reported."""
+        histogram = LatencyHistogram()
+        histogram.observe(120)
+
+        assert histogram.percentile(50) == 120.0
+
+    def test_unbounded_bucket_reports_max(self):
+        """Test that requests slower than the last bound report the max latency."""
+        histogram = LatencyHistogram()
+        histogram.observe(45000.04)
+
+        assert histogram.percentile(99) == 45000.0
+
+    def test_custom_bounds(self):
+        """Test that a histogram with its own bounds estimates percentiles from them."""
+        histogram = LatencyHistogram((1000, 60000))
+        histogram.observe(30000)
+        histogram.observe(90000)
+
+        assert histogram.percentile(50) == 60000.0
+        assert histogram.percentile(100) == 90000.0
+
+
+class TestGw2ApiMetrics:
+    """Test cases for Gw2ApiMetrics."""
+
+    def test_requests_are_grouped_by_endpoint(self):
+        """Test that ids and query strings are folded into one endpoint."""
+        metrics = Gw2ApiMetrics()
+        metrics.record_request("guild/4BBB52AA-D768-4FC6-8EDE-C299F2822F0F", 200, 0.1, 300)
+        metrics.record_request("guild/116E0C0E-0035-44A9-BB22-4AE3E23127E5", 200, 0.2, 200)
+
+        stats = metrics.stats()
+
+        assert list(stats) == ["guild/:id"]
+        assert stats["guild/:id"]["requests"] == 2
+        assert stats["guild/:id"]["bytes"] == 500
+        assert stats["guild/:id"]["avg_ms"] == 150.0
+
+    def test_statuses_errors_and_retries(self):
+        """Test the status breakdown, error count and retries."""
+        metrics = Gw2ApiMetrics()
+        metrics.record_request("account", 503, 0.05)
+        metrics.record_retry("account")
+        metrics.record_request("account", "error", 10.0)
+        metrics.record_retry("account")
+        metrics.record_request("account", 200, 0.08, 100)
+        metrics.record_request("account", 304, 0.02)
+
+        stats = metrics.stats()["account"]
+
+        assert stats["statuses"] == {"503": 1, "error": 1, "200": 1, "304": 1}
+        assert stats["errors"] == 2
+        assert stats["retries"] == 2
+        assert stats["requests"] == 4
+
+    def test_cache_hits(self):
+        """Test that cache hits are counted without requests."""
+        metrics = Gw2ApiMetrics()
+        metrics.record_cache_hit("worlds?ids=all")
+        metrics.record_cache_hit("achievements", 0)
+
+        stats = metrics.stats()
+
+        assert list(stats) == ["worlds"]
+        assert stats["worlds"]["cache_hits"] == 1
+        assert stats["worlds"]["requests"] == 0
+
+    def test_most_requested_first(self):
+        """Test that endpoints are ordered by traffic."""
+        metrics = Gw2ApiMetrics()
+        metrics.record_request("account", 200, 0.1)
+        metrics.record_cache_hit("worlds?ids=all", 5)
+
+        assert list(metrics.stats()) == ["worlds", "account"]
+
+    def test_clear(self):
+        """Test that clear forgets all endpoints."""
+        metrics = Gw2ApiMetrics()
+        metrics.record_request("account", 200, 0.1)
+
+        metrics.clear()
+
+        assert metrics.stats() == {}
@@ -0,0 +1,138 @@
+"""Tests for the GW2 presence event prefilter."""
+
+import pytest
+from src.gw2.constants.gw2_messages import GW2_FULL_NAME
+from src.gw2.tools.gw2_presence_filter import Gw2PresenceFilter, is_gw2_activity
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.db_session = MagicMock()
+    bot.log = MagicMock()
+    return bot
+
+
+@pytest.fixture
+def mock_dals():
+    with (
+        patch("src.gw2.tools.gw2_presence_filter.Gw2ConfigsDal") as mock_configs_dal_class,
+        patch("src.gw2.tools.gw2_presence_filter.Gw2KeyDal") as mock_key_dal_class,
+    ):
+        configs_dal = mock_configs_dal_class.return_value
+        configs_dal.get_session_server_ids = AsyncMock(return_value=[{"server_id": 100}])
+        key_dal = mock_key_dal_class.return_value
+        key_dal.get_user_ids = AsyncMock(return_value=[{"user_id": 1}, {"user_id": 2}])
+        yield configs_dal, key_dal
+
+
+def _activity(name) -> MagicMock:
+    activity = MagicMock()
+    activity.name = name
+    return activity
+
+
+class TestIsGw2Activity:
+    """Test cases for the activity name matcher."""
+
+    def test_matches_gw2_in_any_case(self):
+        """Test that the GW2 name is matched whatever its case and surrounding text."""
+        assert is_gw2_activity(_activity(GW2_FULL_NAME)) is True
+        assert is_gw2_activity(_activity(f"Playing {GW2_FULL_NAME.upper()}")) is True
+
+    def test_other_activities(self):
+        """Test that other activities and missing activities don't match."""
+        assert is_gw2_activity(_activity("Some Other Game")) is False
+        assert is_gw2_activity(_activity(None)) is False
+        assert is_gw2_activity(None) is False
+
+
+class TestIsTracked:
+    """Test cases for filtering presence events."""
+
+    def test_everything_goes_through_until_loaded(self):
+        """Test that events are not dropped before the sets are loaded."""
+        presence_filter = Gw2PresenceFilter()
+
+        assert presence_filter.is_tracked(100, 1) is True
+        assert presence_filter.stats()["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_only_tracked_members_go_through(self, mock_bot, mock_dals):
+        """Test that members need both a session-enabled guild and an API key."""
+        presence_filter = Gw2PresenceFilter()
+        await presence_filter.load(mock_bot)
+
+        assert presence_filter.is_tracked(100, 1) is True
+        assert presence_filter.is_tracked(200, 1) is False
+        assert presence_filter.is_tracked(100, 3) is False
+        assert presence_filter.stats() == {
+            "loaded": 1,
+            "session_guilds": 1,
+            "key_users": 2,
+            "seen": 3,
+            "dropped": 2,
+        }
+
+
+class TestInvalidation:
+    """Test cases for keeping the sets current."""
+
+    @pytest.mark.asyncio
+    async def test_session_config_changes(self, mock_bot, mock_dals):
+        """Test that turning sessions on or off for a guild is followed."""
+        presence_filter = Gw2PresenceFilter()
+        await presence_filter.load(mock_bot)
+
+        presence_filter.set_session_enabled(200, True)
+        presence_filter.set_session_enabled(100, False)
+
+        assert presence_filter.is_tracked(200, 1) is True
+        assert presence_filter.is_tracked(100, 1) is False
+
+    @pytest.mark.asyncio
+    async def test_key_changes(self, mock_bot, mock_dals):
+        """Test that API keys added and removed are followed."""
+        presence_filter = Gw2PresenceFilter()
+        await presence_filter.load(mock_bot)
+
+        presence_filter.add_key_user(3)
+        presence_filter.remove_key_user(1)
+        presence_filter.remove_key_user(4)
+
+        assert presence_filter.is_tracked(100, 3) is True
+        assert presence_filter.is_tracked(100, 1) is False
+
+    @pytest.mark.asyncio
+    async def test_changes_during_load_are_kept(self, mock_bot, mock_dals):
+        """Test that changes made while the sets load are applied on top of the loaded sets."""
+        _, key_dal = mock_dals
+        presence_filter = Gw2PresenceFilter()
+
+        async def _user_ids():
+            # Read before these changes reached the database
+            presence_filter.add_key_user(3)
+            presence_filter.remove_key_user(1)
+            presence_filter.set_session_enabled(200, True)
+            return [{"user_id": 1}, {"user_id": 2}]
+
+        key_dal.get_user_ids = AsyncMock(side_effect=_user_ids)
+        await presence_filter.load(mock_bot)
+
+        assert presence_filter.is_tracked(200, 3) is True
+        assert presence_filter.is_tracked(100, 1) is False
+        assert presence_filter.is_tracked(100, 2) is True
+
+    @pytest.mark.asyncio
+    async def test_later_changes_are_not_recorded(self, mock_bot, mock_dals):
+        """Test that changes stop being recorded once the load is done, even when it failed."""
+        configs_dal, _ = mock_dals
+        configs_dal.get_session_server_ids = AsyncMock(side_effect=RuntimeError("db down"))
+        presence_filter = Gw2PresenceFilter()
+
+        with pytest.raises(RuntimeError):
+            await presence_filter.load(mock_bot)
+        presence_filter.add_key_user(3)
+
+        assert presence_filter._changes is None
@@ -0,0 +1,127 @@
+"""Tests for GW2 API client-side rate limiter."""
+
+import asyncio
+import pytest
+from src.gw2.tools.gw2_rate_limiter import Gw2RateLimiter, TokenBucket
+from unittest.mock import AsyncMock, patch
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_burst_does_not_wait(self):
+        """Test that tokens within the burst are granted immediately."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        with patch("src.gw2.tools.gw2_rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            waits = [await bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_empty_bucket_waits_for_refill(self):
+        """Test that an empty bucket sleeps for the refill time of one token."""
+        bucket = TokenBucket(rate=2.0, capacity=1)
+
+        with (
+            patch("src.gw2.tools.gw2_rate_limiter.time.monotonic", return_value=10.0),
+            patch("src.gw2.tools.gw2_rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            bucket.updated_at = 10.0
+            await bucket.acquire()
+            waited = await bucket.acquire()
+
+        assert waited == 0.5
+        mock_sleep.assert_awaited_once_with(0.5)
+
+    def test_refill_caps_at_capacity(self):
+        """Test that refilling never exceeds the bucket capacity."""
+        bucket = TokenBucket(rate=100.0, capacity=5)
+        bucket.tokens = 0
+        bucket.updated_at -= 60
+        bucket._refill()
+        assert bucket.tokens == 5
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_arrival_order(self):
+        """Test fair FIFO queuing of waiting callers."""
+        bucket = TokenBucket(rate=1000.0, capacity=1)
+        bucket.tokens = 0
+        order = []
+
+        async def take(n):
+            await bucket.acquire()
+            order.append(n)
+
+        await asyncio.gather(*[take(n) for n in range(5)])
+
+        assert order == [0, 1, 2, 3, 4]
+
+
+class TestGw2RateLimiter:
+    """Test cases for Gw2RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_limiter_never_waits(self):
+        """Test that a disabled limiter returns immediately and counts nothing."""
+        limiter = Gw2RateLimiter(enabled=False)
+        await limiter.acquire("key")
+        assert limiter.stats()["acquired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_without_key_uses_global_bucket_only(self):
+        """Test that keyless requests do not create key buckets."""
+        limiter = Gw2RateLimiter()
+        await limiter.acquire()
+        stats = limiter.stats()
+        assert stats["acquired"] == 1
+        assert stats["key_buckets"] == 0
+        assert stats["global_tokens"] < 100
+
+    @pytest.mark.asyncio
+    async def test_acquire_with_key_creates_hashed_bucket(self):
+        """Test that keyed requests get their own bucket, stored by hash."""
+        limiter = Gw2RateLimiter()
+        await limiter.acquire("secret-key")
+        await limiter.acquire("secret-key")
+        await limiter.acquire("other-key")
+
+        assert limiter.stats()["key_buckets"] == 2
+        assert "secret-key" not in limiter._key_buckets
+
+    @pytest.mark.asyncio
+    async def test_key_buckets_are_bounded(self):
+        """Test that the least recently used key bucket is dropped when full."""
+        limiter = Gw2RateLimiter(max_keys=2)
+        for key in ("a", "b", "c"):
+            await limiter.acquire(key)
+        assert limiter.stats()["key_buckets"] == 2
+
+    @pytest.mark.asyncio
+    async def test_throttled_requests_are_counted(self):
+        """Test that waiting requests update the throttle counters."""
+        limiter = Gw2RateLimiter(key_rate=1000.0, key_burst=1)
+        await limiter.acquire("key")
+        await limiter.acquire("key")
+
+        stats = limiter.stats()
+        assert stats["acquired"] == 2
+        assert stats["throttled"] == 1
+        assert stats["total_wait"] > 0
+
+    @pytest.mark.asyncio
+    async def test_reset(self):
+        """Test that reset refills buckets and clears counters."""
+        limiter = Gw2RateLimiter(global_burst=10)
+        await limiter.acquire("key")
+        limiter.reset()
+
+        assert limiter.stats() == {
+            "acquired": 0,
+            "throttled": 0,
+            "total_wait": 0.0,
+            "global_tokens": 10,
+            "key_buckets": 0,
+        }
@@ -0,0 +1,98 @@
+"""Tests for GW2 API retry policy."""
+
+import pytest
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from src.gw2.tools.gw2_retry import RETRYABLE_STATUSES, RetryPolicy, parse_retry_after
+from unittest.mock import patch
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+
+    def test_defaults(self):
+        """Test default policy values."""
+        policy = RetryPolicy()
+        assert policy.max_attempts == 5
+        assert policy.base_delay == 1.0
+        assert policy.max_delay == 30.0
+        assert policy.max_elapsed == 60.0
+        assert policy.retry_statuses == RETRYABLE_STATUSES
+
+    @pytest.mark.parametrize("status", [429, 502, 503, 504])
+    def test_retryable_statuses(self, status):
+        """Test that throttling and gateway errors are retryable."""
+        assert RetryPolicy().is_retryable_status(status) is True
+
+    @pytest.mark.parametrize("status", [400, 403, 404, 500])
+    def test_non_retryable_statuses(self, status):
+        """Test that client errors are not retryable."""
+        assert RetryPolicy().is_retryable_status(status) is False
+
+    def test_compute_delay_grows_exponentially_up_to_max_delay(self):
+        """Test that the jitter ceiling doubles per attempt and is capped."""
+        policy = RetryPolicy(base_delay=2.0, max_delay=10.0)
+        with patch("src.gw2.tools.gw2_retry._random.uniform", side_effect=lambda low, high: high):
+            delays = [policy.compute_delay(attempt) for attempt in range(1, 6)]
+        assert delays == [2.0, 4.0, 8.0, 10.0, 10.0]
+
+    def test_compute_delay_uses_full_jitter(self):
+        """Test that the delay is drawn from zero up to the ceiling."""
+        policy = RetryPolicy(base_delay=4.0)
+        with patch("src.gw2.tools.gw2_retry._random.uniform", return_value=1.5) as mock_uniform:
+            assert policy.compute_delay(2) == 1.5
+        mock_uniform.assert_called_once_with(0, 8.0)
+
+    def test_compute_delay_prefers_retry_after(self):
+        """Test that a server-provided Retry-After wins over the backoff."""
+        policy = RetryPolicy(max_delay=5.0)
+        assert policy.compute_delay(1, retry_after=42.0) == 42.0
+
+    def test_can_retry_stops_at_max_attempts(self):
+        """Test that no retry is allowed after the last attempt."""
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.can_retry(2, elapsed=0.0, delay=1.0) is True
+        assert policy.can_retry(3, elapsed=0.0, delay=1.0) is False
+
+    def test_can_retry_respects_max_elapsed(self):
+        """Test that a retry starting after the time budget is refused."""
+        policy = RetryPolicy(max_elapsed=10.0)
+        assert policy.can_retry(1, elapsed=4.0, delay=6.0) is True
+        assert policy.can_retry(1, elapsed=4.0, delay=6.5) is False
+
+    def test_can_retry_without_max_elapsed(self):
+        """Test that a None time budget only limits attempts."""
+        policy = RetryPolicy(max_elapsed=None)
+        assert policy.can_retry(1, elapsed=10_000.0, delay=10_000.0) is True
+
+
+class TestParseRetryAfter:
+    """Test cases for parse_retry_after."""
+
+    @pytest.mark.parametrize("value", [None, ""])
+    def test_missing_value(self, value):
+        """Test that a missing header yields None."""
+        assert parse_retry_after(value) is None
+
+    def test_seconds(self):
+        """Test the delta-seconds form."""
+        assert parse_retry_after("30") == 30.0
+
+    def test_negative_seconds_are_clamped(self):
+        """Test that negative values never produce a negative delay."""
+        assert parse_retry_after("-5") == 0.0
+
+    def test_http_date(self):
+        """Test the HTTP-date form."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=120)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 110 <= delay <= 120
+
+    def test_http_date_in_the_past(self):
+        """Test that a date in the past means retry now."""
+        retry_at = datetime.now(UTC) - timedelta(minutes=5)
+        assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == 0.0
+
+    def test_invalid_value(self):
+        """Test that garbage yields None."""
+        assert parse_retry_after("soon") is None
@@ -0,0 +1,107 @@
+"""Tests for the GW2 API conditional request store."""
+
+from src.gw2.tools.gw2_revalidation import Gw2RevalidationStore, StoredResponse
+
+
+class TestStoredResponse:
+    """Test cases for StoredResponse."""
+
+    def test_conditional_headers_with_both_validators(self):
+        """Test that both validators are sent back."""
+        stored = StoredResponse({"id": 1}, '"abc"', "Wed, 21 Oct 2026 07:28:00 GMT")
+
+        assert stored.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+        }
+
+    def test_conditional_headers_with_etag_only(self):
+        """Test that a missing Last-Modified is not sent."""
+        assert StoredResponse({}, '"abc"', None).conditional_headers() == {"If-None-Match": '"abc"'}
+
+
+class TestGw2RevalidationStore:
+    """Test cases for Gw2RevalidationStore."""
+
+    def test_store_and_get(self):
+        """Test that a response with validators can be looked up again."""
+        store = Gw2RevalidationStore()
+        store.store("worlds?ids=all", None, [{"id": 1001}], '"abc"', None, 512)
+
+        stored = store.get("worlds?ids=all")
+
+        assert stored.body == [{"id": 1001}]
+        assert stored.size == 512
+
+    def test_response_without_validators_is_not_stored(self):
+        """Test that responses the API sent without validators are skipped."""
+        store = Gw2RevalidationStore()
+        store.store("tokeninfo", "key", {"id": "1"}, None, None)
+
+        assert store.get("tokeninfo", "key") is None
+        assert store.stats()["size"] == 0
+
+    def test_entries_are_scoped_by_api_key(self):
+        """Test that a response fetched with one key is never revalidated for another."""
+        store = Gw2RevalidationStore()
+        store.store("characters?ids=all", "key-a", [{"name": "A"}], '"a"', None)
+
+        assert store.get("characters?ids=all", "key-b") is None
+        assert store.get("characters?ids=all") is None
+        assert store.get("characters?ids=all", "key-a").body == [{"name": "A"}]
+
+    def test_not_modified_counts_bytes_saved(self):
+        """Test that a 304 returns the stored body and counts its size."""
+        store = Gw2RevalidationStore()
+        store.store("account/achievements", "key", [{"id": 1}], '"abc"', None, 2048)
+
+        body = store.record_not_modified(store.get("account/achievements", "key"))
+
+        assert body == [{"id": 1}]
+        assert store.stats()["not_modified"] == 1
+        assert store.stats()["bytes_saved"] == 2048
+
+    def test_changed_response_replaces_entry(self):
+        """Test that a new 200 for a stored request counts as modified."""
+        store = Gw2RevalidationStore()
+        store.store("worlds?ids=all", None, [{"id": 1}], '"v1"', None)
+        store.store("worlds?ids=all", None, [{"id": 2}], '"v2"', None)
+
+        assert store.get("worlds?ids=all").etag == '"v2"'
+        assert store.stats()["modified"] == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        store = Gw2RevalidationStore(max_entries=2)
+        store.store("a", None, 1, '"a"', None)
+        store.store("b", None, 2, '"b"', None)
+        store.get("a")
+        store.store("c", None, 3, '"c"', None)
+
+        assert store.get("b") is None
+        assert store.get("a") is not None
+        assert store.stats()["evictions"] == 1
+
+    def test_disabled_store(self):
+        """Test that a disabled store keeps nothing."""
+        store = Gw2RevalidationStore(enabled=False)
+        store.store("worlds?ids=all", None, [], '"abc"', None)
+
+        assert store.get("worlds?ids=all") is None
+
+    def test_clear(self):
+        """Test that clear drops entries and resets counters."""
+        store = Gw2RevalidationStore()
+        store.store("a", None, 1, '"a"', None, 10)
+        store.record_not_modified(store.get("a"))
+
+        store.clear()
+
+        assert store.stats() == {
+            "size": 0,
+            "max_entries": 256,
+            "not_modified": 0,
+            "modified": 0,
+            "bytes_saved": 0,
+            "evictions": 0,
+        }
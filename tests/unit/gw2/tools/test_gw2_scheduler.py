@@ -0,0 +1,146 @@
+"""Tests for the GW2 API request priority scheduler."""
+
+import asyncio
+import pytest
+from src.gw2.tools.gw2_scheduler import Gw2RequestScheduler, RequestPriority
+from unittest.mock import patch
+
+
+async def _yield_to_loop():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestGw2RequestScheduler:
+    """Test cases for Gw2RequestScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_free_slot_is_granted_immediately(self):
+        """Test that a request with a free slot doesn't wait."""
+        scheduler = Gw2RequestScheduler(max_concurrency=2)
+
+        await scheduler.acquire(RequestPriority.BACKGROUND)
+
+        stats = scheduler.stats()
+        assert stats["background"]["in_flight"] == 1
+        assert stats["background"]["granted"] == 1
+        assert stats["background"]["waiting"] == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_is_served_before_background(self):
+        """Test that a freed slot goes to the most urgent waiting class."""
+        scheduler = Gw2RequestScheduler(max_concurrency=1)
+        order = []
+        await scheduler.acquire(RequestPriority.BACKGROUND)
+
+        async def _request(priority):
+            async with scheduler.slot(priority):
+                order.append(priority)
+
+        background = asyncio.create_task(_request(RequestPriority.BACKGROUND))
+        prefetch = asyncio.create_task(_request(RequestPriority.PREFETCH))
+        await _yield_to_loop()
+        interactive = asyncio.create_task(_request(RequestPriority.INTERACTIVE))
+        await _yield_to_loop()
+        assert order == []
+
+        scheduler.release(RequestPriority.BACKGROUND)
+        await asyncio.gather(background, prefetch, interactive)
+
+        assert order == [RequestPriority.INTERACTIVE, RequestPriority.BACKGROUND, RequestPriority.PREFETCH]
+        assert scheduler.stats()["interactive"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_class_limit_leaves_slots_for_other_classes(self):
+        """Test that a class at its own cap waits while other classes still get slots."""
+        scheduler = Gw2RequestScheduler(max_concurrency=3, class_limits={RequestPriority.PREFETCH: 1})
+        await scheduler.acquire(RequestPriority.PREFETCH)
+
+        waiting = asyncio.create_task(scheduler.acquire(RequestPriority.PREFETCH))
+        await _yield_to_loop()
+        await asyncio.wait_for(scheduler.acquire(RequestPriority.INTERACTIVE), timeout=1)
+
+        assert not waiting.done()
+        assert scheduler.stats()["prefetch"]["waiting"] == 1
+
+        scheduler.release(RequestPriority.PREFETCH)
+        await asyncio.wait_for(waiting, timeout=1)
+        assert scheduler.stats()["prefetch"]["in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_starved_waiter_is_served_first(self):
+        """Test that a request waiting longer than max_wait jumps ahead of more urgent classes."""
+        clock = [100.0]
+        with patch("src.gw2.tools.gw2_scheduler.time.monotonic", side_effect=lambda: clock[0]):
+            scheduler = Gw2RequestScheduler(max_concurrency=1, max_wait=5.0)
+            order = []
+            await scheduler.acquire(RequestPriority.INTERACTIVE)
+
+            async def _request(priority):
+                async with scheduler.slot(priority):
+                    order.append(priority)
+
+            prefetch = asyncio.create_task(_request(RequestPriority.PREFETCH))
+            await _yield_to_loop()
+            clock[0] += 6.0
+            interactive = asyncio.create_task(_request(RequestPriority.INTERACTIVE))
+            await _yield_to_loop()
+
+            scheduler.release(RequestPriority.INTERACTIVE)
+            await asyncio.gather(prefetch, interactive)
+
+        assert order == [RequestPriority.PREFETCH, RequestPriority.INTERACTIVE]
+        assert scheduler.stats()["aged"] == 1
+        assert scheduler.stats()["prefetch"]["avg_wait"] == 6.0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self):
+        """Test that a request cancelled while waiting doesn't take a slot."""
+        scheduler = Gw2RequestScheduler(max_concurrency=1)
+        await scheduler.acquire(RequestPriority.INTERACTIVE)
+
+        cancelled = asyncio.create_task(scheduler.acquire(RequestPriority.INTERACTIVE))
+        waiting = asyncio.create_task(scheduler.acquire(RequestPriority.BACKGROUND))
+        await _yield_to_loop()
+        cancelled.cancel()
+        await _yield_to_loop()
+
+        scheduler.release(RequestPriority.INTERACTIVE)
+        await asyncio.wait_for(waiting, timeout=1)
+
+        stats = scheduler.stats()
+        assert stats["interactive"]["in_flight"] == 0
+        assert stats["background"]["in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_slot_is_released_on_error(self):
+        """Test that the slot context manager frees the slot when the request fails."""
+        scheduler = Gw2RequestScheduler(max_concurrency=1)
+
+        with pytest.raises(RuntimeError):
+            async with scheduler.slot(RequestPriority.BACKGROUND):
+                raise RuntimeError("boom")
+
+        assert scheduler.stats()["background"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_scheduler_does_not_limit(self):
+        """Test that a disabled scheduler grants every slot without counting."""
+        scheduler = Gw2RequestScheduler(max_concurrency=1, enabled=False)
+
+        await scheduler.acquire(RequestPriority.PREFETCH)
+        await asyncio.wait_for(scheduler.acquire(RequestPriority.PREFETCH), timeout=1)
+        scheduler.release(RequestPriority.PREFETCH)
+
+        assert scheduler.stats()["prefetch"]["in_flight"] == 0
+
+    def test_missing_class_limits_use_max_concurrency(self):
+        """Test that classes without their own limit are capped by max_concurrency."""
+        scheduler = Gw2RequestScheduler(max_concurrency=7, class_limits={RequestPriority.PREFETCH: 2})
+
+        stats = scheduler.stats()
+
+        assert stats["interactive"]["limit"] == 7
+        assert stats["background"]["limit"] == 7
+        assert stats["prefetch"]["limit"] == 2
+        assert stats["aged"] == 0
@@ -0,0 +1,235 @@
+"""Tests for the per-user GW2 session actors."""
+
+import asyncio
+import pytest
+from src.gw2.tools.gw2_session_actors import Gw2SessionActors, SessionState
+from unittest.mock import AsyncMock, MagicMock
+
+_DONE_STATES = {"start": SessionState.PLAYING, "end": SessionState.ENDING_DELAY}
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.log = MagicMock()
+    return bot
+
+
+def _member(user_id: int) -> MagicMock:
+    member = MagicMock()
+    member.id = user_id
+    return member
+
+
+def _handler() -> AsyncMock:
+    """Handler that leaves the session in the state its action leads to."""
+    return AsyncMock(side_effect=lambda bot, member, action: _DONE_STATES[action])
+
+
+async def _drain(actors: Gw2SessionActors) -> None:
+    for _ in range(50):
+        await asyncio.sleep(0)
+        if actors._ready.empty() and not actors.stats()["running"]:
+            return
+
+
+class TestPost:
+    """Test cases for posting actions."""
+
+    @pytest.mark.asyncio
+    async def test_post_returns_before_action_runs(self, mock_bot):
+        """Test that posting queues the action and a worker runs it afterwards."""
+        handler = _handler()
+        actors = Gw2SessionActors(handler, workers=2)
+        member = _member(1)
+
+        actors.post(mock_bot, member, "start")
+
+        handler.assert_not_called()
+        assert actors.stats()["mailbox_depth"] == 1
+        await _drain(actors)
+        handler.assert_awaited_once_with(mock_bot, member, "start")
+        assert actors.get_state(1) is SessionState.PLAYING
+        assert actors.stats()["workers"] == 2
+        await actors.stop()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_of_current_state_is_dropped(self, mock_bot):
+        """Test that a start for a user already playing is dropped."""
+        handler = _handler()
+        actors = Gw2SessionActors(handler)
+        actors.post(mock_bot, _member(1), "start")
+        await _drain(actors)
+
+        actors.post(mock_bot, _member(1), "start")
+
+        assert actors.stats()["duplicates"] == 1
+        assert actors.stats()["mailbox_depth"] == 0
+        await actors.stop()
+
+    @pytest.mark.asyncio
+    async def test_opposite_action_cancels_queued_one(self, mock_bot):
+        """Test that an end undoing a start that has not run yet drops both."""
+        handler = _handler()
+        actors = Gw2SessionActors(handler)
+
+        actors.post(mock_bot, _member(1), "start")
+        actors.post(mock_bot, _member(1), "end")
+        await _drain(actors)
+
+        handler.assert_not_called()
+        assert actors.stats()["cancelled"] == 1
+        assert actors.stats()["actors"] == 0
+        await actors.stop()
+
+    @pytest.mark.asyncio
+    async def test_end_during_start_runs_after_it(self, mock_bot):
+        """Test that an end posted while the start runs is kept and runs once the start is done."""
+        release = asyncio.Event()
+        actions = []
+
+        async def handler(bot, member, action):
+            actions.append(action)
+            if action == "start":
+                await release.wait()
+            return _DONE_STATES[action]
+
+        actors = Gw2SessionActors(handler)
+        actors.post(mock_bot, _member(1), "start")
+        await asyncio.sleep(0)
+        assert actors.get_state(1) is SessionState.STARTING
+
+        actors.post(mock_bot, _member(1), "end")
+        assert actors.is_ending(1) is True
+        release.set()
+        await _drain(actors)
+
+        assert actions == ["start", "end"]
+        assert actors.get_state(1) is SessionState.ENDING_DELAY
+        await actors.stop()
+
+    @pytest.mark.asyncio
+    async def test_workers_bound_running_actions(self, mock_bot):
+        """Test that no more actions run at once than there are workers."""
+        release = asyncio.Event()
+
+        async def handler(bot, member, action):
+            await release.wait()
+            return SessionState.PLAYING
+
+        actors = Gw2SessionActors(handler, workers=2)
+        for user_id in range(5):
+            actors.post(mock_bot, _member(user_id), "start")
+        await asyncio.sleep(0)
+
+        assert actors.stats()["running"] == 2
+        assert actors.stats()["mailbox_depth"] == 3
+        release.set()
+        await _drain(actors)
+        assert actors.stats()["processed"] == 5
+        await actors.stop()
+
+    @pytest.mark.asyncio
+    async def test_failing_action_leaves_actor_idle(self, mock_bot):
+        """Test that a failing action is logged and its actor dropped."""
+        actors = Gw2SessionActors(AsyncMock(side_effect=RuntimeError("db down")))
+
+        actors.post(mock_bot, _member(1), "start")
+        await _drain(actors)
+
+        mock_bot.log.error.assert_called_once()
+        assert actors.stats()["failed"] == 1
+        assert actors.get_state(1) is SessionState.IDLE
+        assert actors.stats()["actors"] == 0
+        await actors.stop()
+
+
+class TestJobStates:
+    """Test cases for the states followed through session jobs."""
+
+    @pytest.mark.asyncio
+    async def test_end_job_finishes_session(self, mock_bot):
+        """Test that an end job moves the actor from ending-delay to ending, then drops it."""
+        actors = Gw2SessionActors(_handler())
+        actors.post(mock_bot, _member(1), "end")
+        await _drain(actors)
+        assert actors.get_state(1) is SessionState.ENDING_DELAY
+
+        actors.job_started(1, "end")
+        assert actors.get_state(1) is SessionState.ENDING
+        actors.job_finished(1, "end")
+
+        assert actors.get_state(1) is SessionState.IDLE
+        assert actors.stats()["actors"] == 0
+        await actors.stop()
+
+    @pytest.mark.asyncio
+    async def test_retried_end_job_waits_again(self, mock_bot):
+        """Test that an end job being retried moves the actor back to ending-delay."""
+        actors = Gw2SessionActors(_handler())
+        actors.post(mock_bot, _member(1), "end")
+        await _drain(actors)
+
+        actors.job_started(1, "end")
+        actors.job_finished(1, "end", retrying=True)
+
+        assert actors.get_state(1) is SessionState.ENDING_DELAY
+        await actors.stop()
+
+    @pytest.mark.asyncio
+    async def test_job_of_a_superseded_action_is_ignored(self, mock_bot):
+        """Test that an end job finishing after the user started playing again leaves the state alone."""
+        actors = Gw2SessionActors(_handler())
+        actors.post(mock_bot, _member(1), "start")
+        await _drain(actors)
+
+        actors.job_started(1, "end")
+        actors.job_finished(1, "end")
+
+        assert actors.get_state(1) is SessionState.PLAYING
+        await actors.stop()
+
+    def test_job_without_actor(self):
+        """Test that jobs resumed after a restart, without actors, are ignored."""
+        actors = Gw2SessionActors(_handler())
+
+        actors.job_started(1, "end")
+        actors.job_finished(1, "end")
+
+        assert actors.stats()["actors"] == 0
+
+
+class TestPlayingMembers:
+    """Test cases for listing the members playing."""
+
+    @pytest.mark.asyncio
+    async def test_only_playing_members(self, mock_bot):
+        """Test that members whose session is ending are not listed."""
+        actors = Gw2SessionActors(_handler())
+        playing = _member(1)
+        actors.post(mock_bot, playing, "start")
+        actors.post(mock_bot, _member(2), "end")
+        await _drain(actors)
+
+        assert actors.playing_members() == [playing]
+        await actors.stop()
+
+
+class TestStats:
+    """Test cases for the actor statistics."""
+
+    @pytest.mark.asyncio
+    async def test_state_stats_track_time_in_states(self, mock_bot):
+        """Test that the states actors left are counted in the state durations."""
+        actors = Gw2SessionActors(_handler())
+        actors.post(mock_bot, _member(1), "start")
+        await _drain(actors)
+
+        state_stats = actors.state_stats()
+
+        assert set(state_stats) == {"starting", "playing", "ending-delay", "ending"}
+        assert state_stats["playing"]["actors"] == 1
+        assert state_stats["starting"]["actors"] == 0
+        assert state_stats["starting"]["avg_seconds"] >= 0.0
+        assert actors.stats()["actors"] == 1
+        await actors.stop()
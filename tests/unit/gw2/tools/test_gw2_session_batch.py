@@ -0,0 +1,95 @@
+"""Tests for the GW2 session intent batcher."""
+
+import asyncio
+import pytest
+from src.gw2.tools.gw2_session_batch import Gw2SessionBatcher
+from unittest.mock import AsyncMock, MagicMock
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.log = MagicMock()
+    return bot
+
+
+def _member(user_id: int) -> MagicMock:
+    member = MagicMock()
+    member.id = user_id
+    return member
+
+
+class TestSubmit:
+    """Test cases for gathering intents into batches."""
+
+    @pytest.mark.asyncio
+    async def test_intents_within_window_share_a_batch(self, mock_bot):
+        """Test that intents submitted within the window are processed together."""
+        handler = AsyncMock(return_value={})
+        batcher = Gw2SessionBatcher(handler, window=0.01)
+        members = [_member(1), _member(2)]
+
+        await asyncio.gather(batcher.submit(mock_bot, members[0], "start"), batcher.submit(mock_bot, members[1], "end"))
+
+        handler.assert_awaited_once_with(mock_bot, [(members[0], "start"), (members[1], "end")])
+        assert batcher.stats() == {"waiting": 0, "batches": 1, "intents": 2, "deduplicated": 0, "largest_batch": 2}
+
+    @pytest.mark.asyncio
+    async def test_newer_intent_replaces_older(self, mock_bot):
+        """Test that a user has one intent per batch, the latest one."""
+        handler = AsyncMock(return_value={})
+        batcher = Gw2SessionBatcher(handler, window=0.01)
+        member = _member(1)
+
+        await asyncio.gather(batcher.submit(mock_bot, member, "start"), batcher.submit(mock_bot, member, "end"))
+
+        handler.assert_awaited_once_with(mock_bot, [(member, "end")])
+        assert batcher.stats()["deduplicated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_submitters_get_their_result(self, mock_bot):
+        """Test that each submitter gets the handler's result for its user, None when it has none."""
+        batcher = Gw2SessionBatcher(AsyncMock(return_value={1: "playing"}), window=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit(mock_bot, _member(1), "start"), batcher.submit(mock_bot, _member(2), "start")
+        )
+
+        assert results == ["playing", None]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_processed_right_away(self, mock_bot):
+        """Test that reaching max_batch processes the batch without waiting for the window."""
+        handler = AsyncMock(return_value={})
+        batcher = Gw2SessionBatcher(handler, window=60.0, max_batch=2)
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit(mock_bot, _member(1), "start"), batcher.submit(mock_bot, _member(2), "start")
+            ),
+            timeout=1.0,
+        )
+
+        handler.assert_awaited_once()
+        assert batcher._timer is None
+
+    @pytest.mark.asyncio
+    async def test_handler_error_releases_submitters(self, mock_bot):
+        """Test that a failing batch is logged and does not block its submitters."""
+        batcher = Gw2SessionBatcher(AsyncMock(side_effect=RuntimeError("db down")), window=0.01)
+
+        assert await batcher.submit(mock_bot, _member(1), "start") is None
+
+        mock_bot.log.error.assert_called_once()
+        assert batcher.stats()["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_without_intents(self, mock_bot):
+        """Test that flushing an empty batch does nothing."""
+        handler = AsyncMock(return_value={})
+        batcher = Gw2SessionBatcher(handler)
+
+        await batcher.flush(mock_bot)
+
+        handler.assert_not_called()
+        assert batcher.stats()["batches"] == 0
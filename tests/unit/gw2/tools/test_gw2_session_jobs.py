@@ -0,0 +1,319 @@
+"""Tests for the persistent GW2 session job scheduler."""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from src.gw2.tools.gw2_session_jobs import Gw2SessionJobScheduler
+from unittest.mock import AsyncMock, MagicMock, patch
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.db_session = MagicMock()
+    bot.log = MagicMock()
+    return bot
+
+
+@pytest.fixture
+def mock_dal():
+    with patch("src.gw2.tools.gw2_session_jobs.Gw2SessionJobsDal") as mock_dal_class:
+        dal = mock_dal_class.return_value
+        dal.insert_job = AsyncMock(side_effect=lambda user_id, *args: f"job-{user_id}-{dal.insert_job.call_count}")
+        dal.get_jobs = AsyncMock(return_value=[])
+        dal.claim_due_jobs = AsyncMock(return_value=[])
+        dal.release_claimed_jobs = AsyncMock()
+        dal.reschedule_job = AsyncMock()
+        dal.delete_job = AsyncMock()
+        dal.expedite_retries = AsyncMock(return_value=0)
+        yield dal
+
+
+@pytest.fixture(autouse=True)
+def fixed_now():
+    with patch("src.gw2.tools.gw2_session_jobs._utc_now", return_value=NOW):
+        yield
+
+
+def _job(job_id: str, user_id: int = 1, action: str = "end", attempt: int = 0) -> dict:
+    return {"id": job_id, "user_id": user_id, "action": action, "attempt": attempt, "run_at": NOW}
+
+
+async def _run_jobs(scheduler: Gw2SessionJobScheduler, mock_bot, limit: int = 4) -> int:
+    started = await scheduler.run_due(mock_bot, limit)
+    await asyncio.gather(*scheduler._running)
+    return started
+
+
+class TestSchedule:
+    """Test cases for scheduling jobs."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_persists_job(self, mock_bot, mock_dal):
+        """Test that a job is stored with its due time and tracked in memory."""
+        scheduler = Gw2SessionJobScheduler()
+
+        run_at = await scheduler.schedule(mock_bot, 1, "end", 180.0)
+
+        assert run_at == NOW + timedelta(seconds=180)
+        mock_dal.insert_job.assert_awaited_once_with(1, "end", run_at, 0)
+        assert scheduler.get_pending_actions(1) == ["end"]
+        assert scheduler.get_run_at(1, "end") == run_at
+        assert scheduler.stats()["pending"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pending_actions_keep_scheduling_order(self, mock_bot, mock_dal):
+        """Test that the pending actions of a user are listed in the order they will run."""
+        scheduler = Gw2SessionJobScheduler()
+
+        await scheduler.schedule(mock_bot, 1, "end", 180.0)
+        await scheduler.schedule(mock_bot, 1, "start")
+
+        assert scheduler.get_pending_actions(1) == ["end", "start"]
+        assert scheduler.get_run_at(1, "start") == NOW
+        assert scheduler.get_pending_actions(2) == []
+        assert scheduler.get_run_at(2, "end") is None
+
+    @pytest.mark.asyncio
+    async def test_schedule_many_uses_one_insert(self, mock_bot, mock_dal):
+        """Test that several jobs are stored with one insert and tracked in memory."""
+        mock_dal.insert_jobs = AsyncMock(return_value=["job-a", "job-b"])
+        scheduler = Gw2SessionJobScheduler()
+
+        await scheduler.schedule_many(mock_bot, [(1, "end", 180.0, 0), (2, "start", 30.0, 1)])
+
+        mock_dal.insert_jobs.assert_awaited_once_with(
+            [
+                {"user_id": 1, "action": "end", "run_at": NOW + timedelta(seconds=180), "attempt": 0},
+                {"user_id": 2, "action": "start", "run_at": NOW + timedelta(seconds=30), "attempt": 1},
+            ]
+        )
+        assert scheduler.get_pending_actions(1) == ["end"]
+        assert scheduler.get_run_at(2, "start") == NOW + timedelta(seconds=30)
+        assert scheduler.stats()["scheduled"] == 2
+
+    @pytest.mark.asyncio
+    async def test_schedule_many_without_jobs(self, mock_bot, mock_dal):
+        """Test that an empty list stores nothing."""
+        mock_dal.insert_jobs = AsyncMock()
+
+        await Gw2SessionJobScheduler().schedule_many(mock_bot, [])
+
+        mock_dal.insert_jobs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_releases_claims_and_reloads_jobs(self, mock_bot, mock_dal):
+        """Test that a restart releases the jobs claimed before it and reloads the pending ones."""
+        mock_dal.get_jobs.return_value = [_job("job-a"), _job("job-b", action="start"), _job("job-c", user_id=2)]
+        scheduler = Gw2SessionJobScheduler()
+
+        assert await scheduler.resume(mock_bot) == 3
+
+        mock_dal.release_claimed_jobs.assert_awaited_once()
+        assert scheduler.get_pending_actions(1) == ["end", "start"]
+        assert scheduler.get_pending_actions(2) == ["end"]
+
+
+class TestRunDue:
+    """Test cases for running due jobs."""
+
+    @pytest.mark.asyncio
+    async def test_done_job_is_deleted(self, mock_bot, mock_dal):
+        """Test that a job whose handler finishes is deleted."""
+        handler = AsyncMock(return_value=None)
+        scheduler = Gw2SessionJobScheduler()
+        scheduler._handler = handler
+        await scheduler.schedule(mock_bot, 1, "end")
+        mock_dal.claim_due_jobs.return_value = [_job("job-1-1")]
+
+        assert await _run_jobs(scheduler, mock_bot) == 1
+
+        handler.assert_awaited_once_with(mock_bot, mock_dal.claim_due_jobs.return_value[0])
+        mock_dal.delete_job.assert_awaited_once_with("job-1-1")
+        assert scheduler.get_pending_actions(1) == []
+        assert scheduler.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retried_job_is_rescheduled(self, mock_bot, mock_dal):
+        """Test that a job whose handler asks for a retry is rescheduled with the next attempt."""
+        scheduler = Gw2SessionJobScheduler()
+        scheduler._handler = AsyncMock(return_value=60.0)
+        await scheduler.schedule(mock_bot, 1, "end")
+        mock_dal.claim_due_jobs.return_value = [_job("job-1-1")]
+
+        await _run_jobs(scheduler, mock_bot)
+
+        mock_dal.reschedule_job.assert_awaited_once_with("job-1-1", 1, NOW + timedelta(seconds=60))
+        mock_dal.delete_job.assert_not_called()
+        assert scheduler.get_run_at(1, "end") == NOW + timedelta(seconds=60)
+        assert scheduler.stats()["retried"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_job_is_dropped(self, mock_bot, mock_dal):
+        """Test that a job whose handler raises is logged and deleted."""
+        scheduler = Gw2SessionJobScheduler()
+        scheduler._handler = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_dal.claim_due_jobs.return_value = [_job("job-1")]
+
+        await _run_jobs(scheduler, mock_bot)
+
+        mock_bot.log.error.assert_called_once()
+        mock_dal.delete_job.assert_awaited_once_with("job-1")
+        assert scheduler.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_claims_at_most_limit(self, mock_bot, mock_dal):
+        """Test that no more jobs are claimed than there are free slots."""
+        scheduler = Gw2SessionJobScheduler()
+
+        assert await scheduler.run_due(mock_bot, 2) == 0
+
+        mock_dal.claim_due_jobs.assert_awaited_once_with(NOW, 2)
+
+
+class TestRetries:
+    """Test cases for the retries of failed snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_retries_are_counted(self, mock_bot, mock_dal):
+        """Test that the queue depth counts retries apart from the other pending jobs."""
+        mock_dal.insert_jobs = AsyncMock(return_value=["job-a", "job-b"])
+        scheduler = Gw2SessionJobScheduler()
+
+        await scheduler.schedule(mock_bot, 1, "end", 180.0)
+        await scheduler.schedule(mock_bot, 2, "start", 30.0, attempt=1)
+        await scheduler.schedule_many(mock_bot, [(3, "start", 30.0, 1), (4, "end", 180.0, 0)])
+
+        assert scheduler.stats()["pending"] == 4
+        assert scheduler.stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_leaves_the_queue_when_done(self, mock_bot, mock_dal):
+        """Test that a rescheduled job counts as a retry until it is done."""
+        scheduler = Gw2SessionJobScheduler()
+        scheduler._handler = AsyncMock(side_effect=[60.0, None])
+        await scheduler.schedule(mock_bot, 1, "end")
+        mock_dal.claim_due_jobs.return_value = [_job("job-1-1")]
+
+        await _run_jobs(scheduler, mock_bot)
+        assert scheduler.stats()["retries"] == 1
+        await _run_jobs(scheduler, mock_bot)
+
+        assert scheduler.stats()["retries"] == 0
+        assert scheduler.stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_resume_reloads_retries(self, mock_bot, mock_dal):
+        """Test that the retries stored before a restart are counted again."""
+        mock_dal.get_jobs.return_value = [_job("job-a", attempt=2), _job("job-b", user_id=2)]
+        scheduler = Gw2SessionJobScheduler()
+
+        await scheduler.resume(mock_bot)
+
+        assert scheduler.stats()["retries"] == 1
+
+    def test_failed_snapshot_runs_one_job_at_a_time(self):
+        """Test that jobs run one at a time while snapshots fail, and at full concurrency once one succeeds."""
+        scheduler = Gw2SessionJobScheduler(concurrency=4)
+
+        scheduler.api_failed()
+        assert scheduler._limit() == 1
+        assert scheduler.stats()["probing"] == 1
+
+        scheduler.api_answered()
+        assert scheduler._limit() == 4
+        assert scheduler.stats()["probing"] == 0
+        assert scheduler._drain is True
+
+    def test_answer_without_failures_does_not_drain(self):
+        """Test that snapshots answered while the API is up don't drain the retries."""
+        scheduler = Gw2SessionJobScheduler()
+
+        scheduler.api_answered()
+
+        assert scheduler._drain is False
+
+    @pytest.mark.asyncio
+    async def test_drain_makes_waiting_retries_due(self, mock_bot, mock_dal):
+        """Test that draining makes the retries due now and leaves the other jobs as they were."""
+        mock_dal.expedite_retries.return_value = 1
+        scheduler = Gw2SessionJobScheduler()
+        await scheduler.schedule(mock_bot, 1, "start", 300.0, attempt=2)
+        await scheduler.schedule(mock_bot, 2, "end", 180.0)
+
+        assert await scheduler.drain_retries(mock_bot) == 1
+
+        mock_dal.expedite_retries.assert_awaited_once_with(NOW)
+        assert scheduler.get_run_at(1, "start") == NOW
+        assert scheduler.get_run_at(2, "end") == NOW + timedelta(seconds=180)
+        assert scheduler.stats()["drained"] == 1
+        mock_bot.log.info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_loop_probes_then_drains(self, mock_bot, mock_dal):
+        """Test that the loop claims one job while snapshots fail and drains the retries once one succeeds."""
+        scheduler = Gw2SessionJobScheduler(concurrency=4, poll_interval=0.01)
+        scheduler.api_failed()
+
+        scheduler.start(mock_bot, AsyncMock(return_value=None))
+        await asyncio.sleep(0.02)
+        mock_dal.claim_due_jobs.assert_awaited_with(NOW, 1)
+
+        scheduler.api_answered()
+        await asyncio.sleep(0.02)
+        await scheduler.stop()
+
+        mock_dal.expedite_retries.assert_awaited_once_with(NOW)
+        mock_dal.claim_due_jobs.assert_awaited_with(NOW, 4)
+
+
+class TestNextWait:
+    """Test cases for the poll loop sleep."""
+
+    @pytest.mark.asyncio
+    async def test_sleeps_until_next_due_job(self, mock_bot, mock_dal):
+        """Test that the loop wakes up when the next job is due."""
+        scheduler = Gw2SessionJobScheduler(poll_interval=5.0)
+        await scheduler.schedule(mock_bot, 1, "end", 2.0)
+
+        assert scheduler._next_wait() == 2.0
+
+    @pytest.mark.asyncio
+    async def test_polls_without_jobs(self):
+        """Test that the loop polls every poll_interval without pending jobs."""
+        assert Gw2SessionJobScheduler(poll_interval=5.0)._next_wait() == 5.0
+
+    @pytest.mark.asyncio
+    async def test_jobs_behind_a_running_job_are_not_awaited(self, mock_bot, mock_dal):
+        """Test that jobs waiting for a running job of the same user don't wake the loop."""
+        scheduler = Gw2SessionJobScheduler(poll_interval=5.0)
+        await scheduler.schedule(mock_bot, 1, "end")
+        await scheduler.schedule(mock_bot, 1, "start")
+        scheduler._claimed.add("job-1-1")
+
+        assert scheduler._next_wait() == 5.0
+
+
+class TestStartStop:
+    """Test cases for the background poll loop."""
+
+    @pytest.mark.asyncio
+    async def test_loop_resumes_and_runs_due_jobs(self, mock_bot, mock_dal):
+        """Test that the started loop resumes stored jobs and runs the due ones."""
+        mock_dal.get_jobs.return_value = [_job("job-1")]
+        mock_dal.claim_due_jobs.side_effect = [[_job("job-1")]] + [[]] * 100
+        handler = AsyncMock(return_value=None)
+        scheduler = Gw2SessionJobScheduler(poll_interval=0.01)
+
+        scheduler.start(mock_bot, handler)
+        for _ in range(50):
+            if scheduler.stats()["completed"]:
+                break
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        handler.assert_awaited_once()
+        mock_dal.delete_job.assert_awaited_once_with("job-1")
+        mock_bot.log.info.assert_called_once()
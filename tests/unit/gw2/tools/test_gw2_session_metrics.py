@@ -0,0 +1,106 @@
+"""Tests for the GW2 session pipeline metrics."""
+
+from src.gw2.tools.gw2_session_metrics import SESSION_HISTOGRAMS, Gw2SessionMetrics
+from unittest.mock import patch
+
+
+def _at(seconds: float):
+    return patch("src.gw2.tools.gw2_session_metrics.time.monotonic", return_value=seconds)
+
+
+class TestCounters:
+    """Test cases for the pipeline counters."""
+
+    def test_count(self):
+        """Test that counters add up and zero amounts don't create them."""
+        metrics = Gw2SessionMetrics()
+        metrics.count("coalesced")
+        metrics.count("coalesced", 2)
+        metrics.count("untracked", 0)
+
+        assert metrics.stats()["counters"] == {"coalesced": 3}
+
+    def test_every_histogram_is_reported(self):
+        """Test that the stats have the percentiles of every histogram, even empty ones."""
+        metrics = Gw2SessionMetrics()
+        metrics.observe("snapshot", 0.2)
+
+        latency = metrics.stats()["latency"]
+        assert set(latency) == set(SESSION_HISTOGRAMS)
+        assert latency["snapshot"] == {
+            "count": 1,
+            "p50_ms": 200.0,
+            "p95_ms": 200.0,
+            "p99_ms": 200.0,
+            "avg_ms": 200.0,
+            "max_ms": 200.0,
+        }
+        assert latency["db_write"]["count"] == 0
+
+
+class TestPresenceToDb:
+    """Test cases for the latency from an activity change to its session row."""
+
+    def test_start_written(self):
+        """Test that a written start records the time since the activity change."""
+        metrics = Gw2SessionMetrics()
+        with _at(100.0):
+            metrics.activity_changed(1)
+        with _at(102.5):
+            metrics.session_written(1, "start")
+
+        stats = metrics.stats()
+        assert stats["counters"] == {"activity_changes": 1, "started": 1}
+        assert stats["latency"]["presence_to_db"]["max_ms"] == 2500.0
+        assert stats["tracked_users"] == 0
+
+    def test_delayed_end(self):
+        """Test that a delayed end records its wait and the latency includes it."""
+        metrics = Gw2SessionMetrics()
+        with _at(100.0):
+            metrics.activity_changed(1)
+        with _at(280.0):
+            metrics.end_job_started(1)
+        with _at(281.0):
+            metrics.session_written(1, "end")
+
+        latency = metrics.stats()["latency"]
+        assert latency["end_delay"]["max_ms"] == 180000.0
+        assert latency["presence_to_db"]["max_ms"] == 181000.0
+
+    def test_write_without_activity_change(self):
+        """Test that a session written after a restart counts but has no latency."""
+        metrics = Gw2SessionMetrics()
+        metrics.end_job_started(1)
+        metrics.session_written(1, "end")
+
+        stats = metrics.stats()
+        assert stats["counters"] == {"ended": 1}
+        assert stats["latency"]["end_delay"]["count"] == 0
+        assert stats["latency"]["presence_to_db"]["count"] == 0
+
+    def test_oldest_users_are_forgotten(self):
+        """Test that past max_tracked the user changed longest ago is forgotten."""
+        metrics = Gw2SessionMetrics(max_tracked=2)
+        metrics.activity_changed(1)
+        metrics.activity_changed(2)
+        metrics.activity_changed(1)
+        metrics.activity_changed(3)
+
+        metrics.session_written(2, "start")
+        assert metrics.stats()["latency"]["presence_to_db"]["count"] == 0
+        metrics.session_written(1, "start")
+        assert metrics.stats()["latency"]["presence_to_db"]["count"] == 1
+
+    def test_clear(self):
+        """Test that clearing forgets counters, latencies and activity changes."""
+        metrics = Gw2SessionMetrics()
+        metrics.activity_changed(1)
+        metrics.observe("snapshot", 0.1)
+
+        metrics.clear()
+
+        stats = metrics.stats()
+        assert stats["counters"] == {}
+        assert stats["tracked_users"] == 0
+        assert stats["latency"]["snapshot"]["count"] == 0
@@ -0,0 +1,186 @@
+"""Tests for the in-session GW2 stats sampler."""
+
+import asyncio
+import pytest
+from src.database.dal.gw2.gw2_session_snapshots import metric_ids
+from src.gw2.tools.gw2_session_sampler import Gw2SessionSampler
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.db_session = MagicMock()
+    bot.log = MagicMock()
+    return bot
+
+
+@pytest.fixture
+def mock_key_dal():
+    with patch("src.gw2.tools.gw2_session_sampler.Gw2KeyDal") as mock_key_dal_class:
+        key_dal = mock_key_dal_class.return_value
+        key_dal.get_api_keys_by_users = AsyncMock(
+            return_value=[{"user_id": 1, "key": "key-1"}, {"user_id": 2, "key": "key-2"}]
+        )
+        yield key_dal
+
+
+@pytest.fixture
+def mock_samples_dal():
+    with patch("src.gw2.tools.gw2_session_sampler.Gw2SessionSamplesDal") as mock_samples_dal_class:
+        samples_dal = mock_samples_dal_class.return_value
+        samples_dal.insert_samples = AsyncMock()
+        yield samples_dal
+
+
+def _member(user_id: int) -> MagicMock:
+    member = MagicMock()
+    member.id = user_id
+    return member
+
+
+def _snapshot(stats_by_key: dict) -> AsyncMock:
+    return AsyncMock(side_effect=lambda bot, api_key: stats_by_key[api_key])
+
+
+def _written(samples_dal) -> dict[int, dict[int, int]]:
+    """user_id -> {metric_id: value} of the rows inserted by the last call."""
+    written = {}
+    for row in samples_dal.insert_samples.call_args[0][0]:
+        written.setdefault(row["user_id"], {})[row["metric_id"]] = row["value"]
+    return written
+
+
+class TestSample:
+    """Test cases for one sampling round."""
+
+    @pytest.mark.asyncio
+    async def test_first_sample_writes_every_stat(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that a user's first sample stores all the stats it has."""
+        sampler = Gw2SessionSampler()
+        snapshot = _snapshot({"key-1": {"gold": 100, "karma": 50}})
+
+        rows = await sampler.sample(mock_bot, [_member(1)], snapshot)
+
+        gold_id, karma_id = metric_ids(["gold", "karma"])
+        assert rows == 2
+        assert _written(mock_samples_dal) == {1: {gold_id: 100, karma_id: 50}}
+        snapshot.assert_awaited_once_with(mock_bot, "key-1")
+
+    @pytest.mark.asyncio
+    async def test_next_sample_writes_changed_stats(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that later samples store only the stats that changed."""
+        sampler = Gw2SessionSampler()
+        await sampler.sample(mock_bot, [_member(1)], _snapshot({"key-1": {"gold": 100, "karma": 50}}))
+
+        rows = await sampler.sample(mock_bot, [_member(1)], _snapshot({"key-1": {"gold": 150, "karma": 50}}))
+
+        assert rows == 1
+        assert _written(mock_samples_dal) == {1: {metric_ids(["gold"])[0]: 150}}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sample_writes_nothing(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that a round without changes inserts no rows."""
+        sampler = Gw2SessionSampler()
+        snapshot = _snapshot({"key-1": {"gold": 100}})
+        await sampler.sample(mock_bot, [_member(1)], snapshot)
+        mock_samples_dal.insert_samples.reset_mock()
+
+        assert await sampler.sample(mock_bot, [_member(1)], snapshot) == 0
+        mock_samples_dal.insert_samples.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_snapshot_is_skipped(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that a user whose snapshot failed is counted and left out of the round."""
+        sampler = Gw2SessionSampler()
+        snapshot = _snapshot({"key-1": None, "key-2": {"gold": 100}})
+
+        await sampler.sample(mock_bot, [_member(1), _member(2)], snapshot)
+
+        assert set(_written(mock_samples_dal)) == {2}
+        assert sampler.stats()["failed"] == 1
+        assert sampler.stats()["sampled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_member_without_key_is_skipped(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that a member without API key is not snapshotted."""
+        sampler = Gw2SessionSampler()
+        snapshot = _snapshot({"key-1": {"gold": 100}})
+
+        await sampler.sample(mock_bot, [_member(1), _member(3)], snapshot)
+
+        snapshot.assert_awaited_once_with(mock_bot, "key-1")
+
+    @pytest.mark.asyncio
+    async def test_no_members(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that a round without playing members does not touch the database."""
+        sampler = Gw2SessionSampler()
+
+        assert await sampler.sample(mock_bot, [], AsyncMock()) == 0
+        mock_key_dal.get_api_keys_by_users.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stopped_players_sample_in_full_again(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that a user who stopped playing gets a full sample in the next session."""
+        sampler = Gw2SessionSampler()
+        snapshot = _snapshot({"key-1": {"gold": 100, "karma": 50}})
+        await sampler.sample(mock_bot, [_member(1)], snapshot)
+        await sampler.sample(mock_bot, [], snapshot)
+        assert sampler.stats()["users"] == 0
+
+        assert await sampler.sample(mock_bot, [_member(1)], snapshot) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_writes_changes_again(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that changes whose insert failed are written by the next round."""
+        sampler = Gw2SessionSampler()
+        snapshot = _snapshot({"key-1": {"gold": 100}})
+        mock_samples_dal.insert_samples.side_effect = RuntimeError("db down")
+        with pytest.raises(RuntimeError):
+            await sampler.sample(mock_bot, [_member(1)], snapshot)
+        mock_samples_dal.insert_samples.side_effect = None
+
+        assert await sampler.sample(mock_bot, [_member(1)], snapshot) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounds_snapshots(self, mock_bot, mock_key_dal, mock_samples_dal):
+        """Test that no more snapshots run at once than the concurrency."""
+        running = 0
+        most_running = 0
+
+        async def snapshot(bot, api_key):
+            nonlocal running, most_running
+            running += 1
+            most_running = max(most_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return {"gold": 100}
+
+        sampler = Gw2SessionSampler(concurrency=1)
+        await sampler.sample(mock_bot, [_member(1), _member(2)], snapshot)
+
+        assert most_running == 1
+        assert sampler.stats()["rounds"] == 1
+
+
+class TestRun:
+    """Test cases for the sampling loop."""
+
+    @pytest.mark.asyncio
+    async def test_loop_logs_failures_and_keeps_running(self, mock_bot):
+        """Test that a failing round is logged and the loop keeps sampling."""
+        sampler = Gw2SessionSampler(interval=0)
+        members = MagicMock(return_value=[_member(1)])
+        with patch.object(sampler, "sample", AsyncMock(side_effect=RuntimeError("db down"))) as mock_sample:
+            sampler.start(mock_bot, members, AsyncMock())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            await sampler.stop()
+
+        assert mock_sample.await_count >= 2
+        mock_bot.log.error.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_stop_without_start(self):
+        """Test that stopping a sampler that never started does nothing."""
+        await Gw2SessionSampler().stop()
@@ -0,0 +1,147 @@
+"""Tests for GW2 API single-flight request coalescing."""
+
+import asyncio
+import pytest
+from src.gw2.tools.gw2_singleflight import Gw2SingleFlight
+from unittest.mock import AsyncMock
+
+
+class TestGw2SingleFlight:
+    """Test cases for Gw2SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_single_call_returns_result(self):
+        """Test that a lone call runs the function and returns its result."""
+        flight = Gw2SingleFlight()
+        func = AsyncMock(return_value={"id": 1})
+
+        result = await flight.do("key", func)
+
+        assert result == {"id": 1}
+        func.assert_awaited_once()
+        assert flight.stats() == {"in_flight": 0, "calls": 1, "deduplicated": 0}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        """Test that concurrent callers with the same key share one execution."""
+        flight = Gw2SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [1, 2, 3]
+
+        tasks = [asyncio.create_task(flight.do("wvw/matches?world=1001", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.stats()["in_flight"] == 1
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert flight.stats() == {"in_flight": 0, "calls": 5, "deduplicated": 4}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_coalesced(self):
+        """Test that different keys run independently."""
+        flight = Gw2SingleFlight()
+        func = AsyncMock(return_value="data")
+
+        await asyncio.gather(flight.do("a", func), flight.do("b", func))
+
+        assert func.await_count == 2
+        assert flight.deduplicated == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_callers(self):
+        """Test that a failure is shared by every waiting caller."""
+        flight = Gw2SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(flight.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        """Test that cancelling one caller leaves the shared request running."""
+        flight = Gw2SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_new_call_after_completion_runs_again(self):
+        """Test that keys are released once the request completes."""
+        flight = Gw2SingleFlight()
+        func = AsyncMock(return_value="data")
+
+        await flight.do("key", func)
+        await flight.do("key", func)
+
+        assert func.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_less_urgent_caller_joins_more_urgent_request(self):
+        """Test that a caller joins an in-flight request of the same or a more urgent priority."""
+        flight = Gw2SingleFlight()
+        release = asyncio.Event()
+        func = AsyncMock(side_effect=release.wait)
+
+        tasks = [asyncio.create_task(flight.do("key", func, priority)) for priority in (0, 0, 1)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert func.await_count == 1
+        assert flight.deduplicated == 2
+
+    @pytest.mark.asyncio
+    async def test_more_urgent_caller_starts_own_request(self):
+        """Test that a more urgent caller doesn't wait on a less urgent request, and later callers join its own."""
+        flight = Gw2SingleFlight()
+        release = asyncio.Event()
+        started = []
+
+        def request(priority):
+            async def run():
+                started.append(priority)
+                await release.wait()
+                return priority
+
+            return run
+
+        background = asyncio.create_task(flight.do("key", request(1), 1))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(flight.do("key", request(0), 0))
+        await asyncio.sleep(0)
+        late = asyncio.create_task(flight.do("key", request(1), 1))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(background, interactive, late) == [1, 0, 0]
+        assert started == [1, 0]
+        assert flight.stats() == {"in_flight": 0, "calls": 3, "deduplicated": 1}
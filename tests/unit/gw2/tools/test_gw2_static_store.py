@@ -0,0 +1,230 @@
+"""Tests for the persistent GW2 static data store."""
+
+import pytest
+from src.gw2.tools.gw2_scheduler import RequestPriority
+from src.gw2.tools.gw2_static_store import Gw2StaticStore
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.db_session = MagicMock()
+    bot.log = MagicMock()
+    bot.gw2_client.call_api = AsyncMock(return_value={"id": 100})
+    bot.gw2_client.fetch_many = AsyncMock(return_value=({}, []))
+    return bot
+
+
+@pytest.fixture
+def mock_client(mock_bot):
+    return mock_bot.gw2_client
+
+
+@pytest.fixture
+def mock_dal():
+    with patch("src.gw2.tools.gw2_static_store.Gw2StaticDataDal") as mock_dal_class:
+        dal = mock_dal_class.return_value
+        dal.get_static_data = AsyncMock(return_value=[])
+        dal.get_static_data_by_kind = AsyncMock(return_value=[])
+        dal.upsert_static_data = AsyncMock()
+        dal.delete_outdated_static_data = AsyncMock()
+        yield dal
+
+
+class TestGw2StaticStore:
+    """Test cases for Gw2StaticStore."""
+
+    @pytest.mark.asyncio
+    async def test_empty_ids_returns_empty(self, mock_bot, mock_client, mock_dal):
+        """Test that no lookup is made for an empty id list."""
+        store = Gw2StaticStore()
+        assert await store.get_many(mock_bot, "worlds", []) == {}
+        mock_client.call_api.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_api_fallback_is_saved_to_database(self, mock_bot, mock_client, mock_dal):
+        """Test that objects missing from memory and database are fetched and persisted."""
+        mock_client.fetch_many.return_value = ({1001: {"id": 1001, "name": "Anvil Rock"}}, [])
+        store = Gw2StaticStore()
+
+        result = await store.get_many(mock_bot, "worlds", [1001])
+
+        assert result == {1001: {"id": 1001, "name": "Anvil Rock"}}
+        mock_client.fetch_many.assert_awaited_once_with("worlds", [1001], priority=RequestPriority.INTERACTIVE)
+        mock_dal.upsert_static_data.assert_awaited_once_with(
+            "worlds", {"1001": {"id": 1001, "name": "Anvil Rock"}}, 100
+        )
+        assert store.stats()["api_fetches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_skips_database_and_api(self, mock_bot, mock_client, mock_dal):
+        """Test that a second lookup is served from memory."""
+        mock_client.fetch_many.return_value = ({1001: {"id": 1001}}, [])
+        store = Gw2StaticStore()
+        await store.get_many(mock_bot, "worlds", [1001])
+        mock_dal.get_static_data.reset_mock()
+        mock_client.fetch_many.reset_mock()
+
+        result = await store.get_many(mock_bot, "worlds", [1001])
+
+        assert result == {1001: {"id": 1001}}
+        mock_dal.get_static_data.assert_not_called()
+        mock_client.fetch_many.assert_not_called()
+        assert store.stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_database_hit_skips_api(self, mock_bot, mock_client, mock_dal):
+        """Test that rows of the current build are loaded from the database."""
+        mock_dal.get_static_data.return_value = [{"object_id": "1", "build_id": 100, "data": {"id": 1}}]
+        store = Gw2StaticStore()
+
+        result = await store.get_many(mock_bot, "achievements", [1])
+
+        assert result == {1: {"id": 1}}
+        mock_dal.get_static_data.assert_awaited_once_with("achievements", ["1"])
+        mock_client.fetch_many.assert_not_called()
+        assert store.stats()["db_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_database_rows_of_other_builds_are_refetched(self, mock_bot, mock_client, mock_dal):
+        """Test that rows tagged with an older build are ignored."""
+        mock_dal.get_static_data.return_value = [{"object_id": "1", "build_id": 99, "data": {"id": 1, "old": True}}]
+        mock_client.fetch_many.return_value = ({1: {"id": 1}}, [])
+        store = Gw2StaticStore()
+
+        result = await store.get_many(mock_bot, "achievements", [1])
+
+        assert result == {1: {"id": 1}}
+        mock_client.fetch_many.assert_awaited_once_with("achievements", [1], priority=RequestPriority.INTERACTIVE)
+
+    @pytest.mark.asyncio
+    async def test_guild_is_trimmed_to_public_fields(self, mock_bot, mock_client, mock_dal):
+        """Test that guilds are fetched one by one and stored with public fields only."""
+        guild = {"id": "g1", "name": "Guild", "tag": "TAG", "influence": 500, "motd": "private"}
+        mock_client.call_api.side_effect = [{"id": 100}, guild]
+        store = Gw2StaticStore()
+
+        result = await store.get_many(mock_bot, "guild", ["g1"])
+
+        assert result == {"g1": {"id": "g1", "name": "Guild", "tag": "TAG"}}
+        mock_client.call_api.assert_awaited_with("guild/g1", priority=RequestPriority.INTERACTIVE)
+        mock_client.fetch_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_guild_fetch_failure_is_skipped(self, mock_bot, mock_client, mock_dal):
+        """Test that a guild the API can't return is left out of the result."""
+        mock_client.call_api.side_effect = [{"id": 100}, Exception("API Error")]
+        store = Gw2StaticStore()
+
+        result = await store.get_many(mock_bot, "guild", ["g1"])
+
+        assert result == {}
+        mock_bot.log.warning.assert_called_once()
+        mock_dal.upsert_static_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_database_errors_fall_back_to_api(self, mock_bot, mock_client, mock_dal):
+        """Test that the store keeps working when the database is unavailable."""
+        mock_dal.get_static_data.side_effect = Exception("DB down")
+        mock_dal.upsert_static_data.side_effect = Exception("DB down")
+        mock_client.fetch_many.return_value = ({1: {"id": 1}}, [])
+        store = Gw2StaticStore()
+
+        result = await store.get_many(mock_bot, "currencies", [1])
+
+        assert result == {1: {"id": 1}}
+        assert mock_bot.log.warning.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_build_change_clears_memory_and_deletes_outdated_rows(self, mock_bot, mock_client, mock_dal):
+        """Test that a new game build invalidates the stored data."""
+        mock_client.fetch_many.return_value = ({1: {"id": 1}}, [])
+        store = Gw2StaticStore(build_check_interval=0)
+        await store.get_many(mock_bot, "achievements", [1])
+        mock_client.call_api.return_value = {"id": 101}
+
+        await store.refresh_build(mock_bot)
+
+        assert store.build_id == 101
+        assert store.stats()["size"] == 0
+        mock_dal.delete_outdated_static_data.assert_awaited_with(101)
+
+    @pytest.mark.asyncio
+    async def test_build_check_is_throttled(self, mock_bot, mock_client, mock_dal):
+        """Test that the build id is not checked on every lookup."""
+        mock_client.fetch_many.return_value = ({1: {"id": 1}}, [])
+        store = Gw2StaticStore(build_check_interval=3600)
+
+        await store.get_many(mock_bot, "achievements", [1])
+        await store.get_many(mock_bot, "achievements", [1])
+
+        mock_client.call_api.assert_awaited_once_with("build", priority=RequestPriority.INTERACTIVE)
+
+    @pytest.mark.asyncio
+    async def test_build_check_failure_keeps_data(self, mock_bot, mock_client, mock_dal):
+        """Test that a failing build check keeps the current data."""
+        mock_client.fetch_many.return_value = ({1: {"id": 1}}, [])
+        store = Gw2StaticStore(build_check_interval=0)
+        await store.get_many(mock_bot, "achievements", [1])
+        mock_client.call_api.side_effect = Exception("API Error")
+
+        assert await store.refresh_build(mock_bot) == 100
+        assert store.stats()["size"] == 1
+        mock_bot.log.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_memory_is_bounded(self, mock_bot, mock_client, mock_dal):
+        """Test that the least recently used objects are evicted from memory."""
+        mock_client.fetch_many.return_value = ({1: {"id": 1}, 2: {"id": 2}, 3: {"id": 3}}, [])
+        store = Gw2StaticStore(max_entries=2)
+
+        result = await store.get_many(mock_bot, "achievements", [1, 2, 3])
+
+        assert len(result) == 3
+        assert store.stats()["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_up_loads_current_build_rows(self, mock_bot, mock_client, mock_dal):
+        """Test that the warm-up loads stored rows of the current build into memory."""
+        mock_dal.get_static_data_by_kind.side_effect = [
+            [{"object_id": "1", "build_id": 100, "data": {"id": 1}}],
+            [{"object_id": "1001", "build_id": 99, "data": {"id": 1001}}],
+            Exception("DB down"),
+        ]
+        store = Gw2StaticStore()
+
+        loaded = await store.warm_up(mock_bot)
+
+        assert loaded == 1
+        assert store.stats()["size"] == 1
+        mock_dal.get_static_data_by_kind.assert_any_await("achievements", 10000)
+        mock_bot.log.warning.assert_called_once()
+
+    def test_clear(self):
+        """Test that clear forgets the build and counters."""
+        store = Gw2StaticStore()
+        store.build_id = 100
+        store.memory_hits = 5
+
+        store.clear()
+
+        assert store.stats() == {
+            "build_id": None,
+            "size": 0,
+            "max_entries": 10000,
+            "memory_hits": 0,
+            "db_hits": 0,
+            "api_fetches": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_put_many_remembers_and_saves(self, mock_bot, mock_client, mock_dal):
+        """Test that objects fetched elsewhere are stored in memory and the database."""
+        store = Gw2StaticStore()
+
+        await store.put_many(mock_bot, "worlds", {1001: {"id": 1001}})
+
+        mock_dal.upsert_static_data.assert_awaited_once_with("worlds", {"1001": {"id": 1001}}, 100)
+        assert await store.get_many(mock_bot, "worlds", [1001]) == {1001: {"id": 1001}}
+        mock_dal.get_static_data.assert_not_called()
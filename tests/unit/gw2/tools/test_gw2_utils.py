@@ -1,25 +1,33 @@
 """Comprehensive tests for GW2 utilities module."""
 
+import asyncio
 import discord
 import pytest
-from datetime import datetime, timedelta
-from src.gw2.constants.gw2_currencies import WALLET_DISPLAY_NAMES, WALLET_MAPPING
+from datetime import UTC, date, datetime, timedelta
+from src.gw2.constants.gw2_currencies import ACHIEVEMENT_MAPPING, WALLET_DISPLAY_NAMES, WALLET_MAPPING
 from src.gw2.constants.gw2_messages import GW2_FULL_NAME
 from src.gw2.tools.gw2_exceptions import APIConnectionError
+from src.gw2.tools.gw2_scheduler import RequestPriority
+from src.gw2.tools.gw2_session_actors import SessionState
 from src.gw2.tools.gw2_utils import (
     TimeObject,
     _calculate_earned_points,
     _create_initial_user_stats,
-    _fetch_achievement_data_in_batches,
+    _execute_session_action,
     _get_non_custom_activity,
     _get_wvw_rank_prefix,
     _handle_gw2_activity_change,
     _is_gw2_activity_detected,
-    _processing_sessions,
-    _retry_session_later,
+    _process_session_batch,
+    _run_actor_session_job,
+    _run_session_job,
+    _sample_user_stats,
     _sort_session_dict,
+    _start_sessions,
+    _take_session_snapshot,
     _update_achievement_stats,
     _update_wallet_stats,
+    add_key_user,
     calculate_user_achiev_points,
     check_gw2_game_activity,
     convert_timedelta_to_obj,
@@ -29,6 +37,10 @@
     format_gold,
     format_seconds_to_time,
     get_pvp_rank_title,
+    get_session_end_remaining_seconds,
+    get_session_pipeline_stats,
+    get_session_retry_policy,
+    get_static_data,
     get_time_passed,
     get_user_stats,
     get_world_id,
@@ -39,10 +51,22 @@
     insert_gw2_server_configs,
     insert_start_char_deaths,
     is_private_message,
+    is_session_ending,
+    load_presence_filter,
+    maintain_session_partitions,
     max_ap,
+    remove_key_user,
     send_msg,
+    set_guild_session_enabled,
+    start_presence_filter,
     start_session,
+    start_session_jobs,
+    start_session_metrics_log,
+    start_session_partitions,
+    start_session_sampler,
+    start_warm_up,
     update_end_char_deaths,
+    warm_up_gw2_data,
 )
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -130,88 +154,141 @@ async def test_skip_insert_when_configs_exist(self, mock_bot, mock_server):
             mock_instance.insert_gw2_server_configs.assert_not_called()
 
 
-class TestFetchAchievementDataInBatches:
-    """Test cases for _fetch_achievement_data_in_batches function."""
+class TestGetStaticData:
+    """Test cases for get_static_data and warm_up_static_data functions."""
 
-    @pytest.fixture(autouse=True)
-    def clear_cache(self):
-        """Clear the module-level achievement cache between tests."""
-        from src.gw2.tools import gw2_utils
+    @pytest.mark.asyncio
+    async def test_get_static_data_uses_store(self):
+        """Test that lookups go through the shared static data store."""
+        mock_bot = MagicMock()
+        with patch("src.gw2.tools.gw2_utils._static_store") as mock_store:
+            mock_store.get_many = AsyncMock(return_value={1: {"id": 1}})
 
-        gw2_utils._achievement_cache.clear()
-        yield
-        gw2_utils._achievement_cache.clear()
+            result = await get_static_data(mock_bot, "achievements", [1])
 
-    @pytest.mark.asyncio
-    async def test_single_batch_under_200(self):
-        """Test fetching with fewer than 200 achievements (single batch)."""
-        mock_gw2_api = MagicMock()
-        user_achievements = [{"id": i} for i in range(50)]
-        expected_response = [{"id": i, "name": f"ach_{i}"} for i in range(50)]
+        assert result == {1: {"id": 1}}
+        mock_store.get_many.assert_awaited_once_with(mock_bot, "achievements", [1])
 
-        mock_gw2_api.call_api = AsyncMock(return_value=expected_response)
 
-        result = await _fetch_achievement_data_in_batches(mock_gw2_api, user_achievements)
+class TestWarmUpGw2Data:
+    """Test cases for the startup warm-up pipeline."""
 
-        assert result == expected_response
-        mock_gw2_api.call_api.assert_called_once()
-        call_args = mock_gw2_api.call_api.call_args[0][0]
-        assert call_args.startswith("achievements?ids=")
+    @pytest.fixture
+    def mock_store(self):
+        with patch("src.gw2.tools.gw2_utils._static_store") as mock_store:
+            mock_store.warm_up = AsyncMock(return_value=42)
+            mock_store.build_id = 123
+            mock_store.put_many = AsyncMock()
+            mock_store.get_many = AsyncMock(side_effect=lambda bot, kind, ids, priority: {i: {"id": i} for i in ids})
+            yield mock_store
 
-    @pytest.mark.asyncio
-    async def test_multiple_batches(self):
-        """Test fetching with more than 200 achievements (multiple batches)."""
-        mock_gw2_api = MagicMock()
-        user_achievements = [{"id": i} for i in range(450)]
+    @pytest.fixture
+    def mock_bot(self):
+        responses = {
+            "worlds?ids=all": [{"id": 1001, "name": "Anvil Rock"}, {"id": 1002, "name": "Borlis Pass"}],
+            "currencies": [1, 2],
+        }
+        bot = MagicMock()
+        bot.gw2_client.call_api = AsyncMock(side_effect=lambda uri, priority: responses[uri])
+        return bot
 
-        batch_1_response = [{"id": i, "name": f"ach_{i}"} for i in range(200)]
-        batch_2_response = [{"id": i, "name": f"ach_{i}"} for i in range(200, 400)]
-        batch_3_response = [{"id": i, "name": f"ach_{i}"} for i in range(400, 450)]
+    @pytest.mark.asyncio
+    async def test_all_stages_run(self, mock_store, mock_bot):
+        """Test that stored data is loaded and every stage is prefetched."""
 
-        mock_gw2_api.call_api = AsyncMock(side_effect=[batch_1_response, batch_2_response, batch_3_response])
+        await warm_up_gw2_data(mock_bot)
 
-        result = await _fetch_achievement_data_in_batches(mock_gw2_api, user_achievements)
+        mock_store.warm_up.assert_awaited_once_with(mock_bot)
+        mock_store.put_many.assert_awaited_once_with(
+            mock_bot,
+            "worlds",
+            {1001: {"id": 1001, "name": "Anvil Rock"}, 1002: {"id": 1002, "name": "Borlis Pass"}},
+            RequestPriority.PREFETCH,
+        )
+        mock_store.get_many.assert_any_await(
+            mock_bot, "achievements", list(ACHIEVEMENT_MAPPING), RequestPriority.PREFETCH
+        )
+        mock_store.get_many.assert_any_await(mock_bot, "currencies", [1, 2], RequestPriority.PREFETCH)
+        mock_bot.gw2_client.call_api.assert_any_await("worlds?ids=all", priority=RequestPriority.PREFETCH)
 
-        assert len(result) == 450
-        assert mock_gw2_api.call_api.call_count == 3
+        messages = [c[0][0] for c in mock_bot.log.info.call_args_list]
+        assert "42 stored objects" in messages[0]
+        assert any("worlds ready, 2 objects" in m for m in messages)
+        assert any(f"achievements ready, {len(ACHIEVEMENT_MAPPING)} objects" in m for m in messages)
+        assert any("currencies ready, 2 objects" in m for m in messages)
+        assert "3/3 stages ok" in messages[-1]
 
     @pytest.mark.asyncio
-    async def test_exactly_200_items(self):
-        """Test fetching with exactly 200 achievements (one full batch)."""
-        mock_gw2_api = MagicMock()
-        user_achievements = [{"id": i} for i in range(200)]
-        expected_response = [{"id": i, "name": f"ach_{i}"} for i in range(200)]
+    async def test_achievements_listing_not_fetched(self, mock_store, mock_bot):
+        """Test that only the tracked achievements are warmed, not every achievement definition."""
+
+        await warm_up_gw2_data(mock_bot)
 
-        mock_gw2_api.call_api = AsyncMock(return_value=expected_response)
+        requested = [c[0][0] for c in mock_bot.gw2_client.call_api.await_args_list]
+        assert "achievements" not in requested
 
-        result = await _fetch_achievement_data_in_batches(mock_gw2_api, user_achievements)
+    @pytest.mark.asyncio
+    async def test_failed_stage_does_not_stop_others(self, mock_store, mock_bot):
+        """Test that one failing stage is logged and the others still run."""
+        mock_store.put_many.side_effect = Exception("DB down")
+
+        await warm_up_gw2_data(mock_bot)
 
-        assert len(result) == 200
-        mock_gw2_api.call_api.assert_called_once()
+        mock_bot.log.warning.assert_called_once()
+        assert "worlds failed" in mock_bot.log.warning.call_args[0][0]
+        assert "2/3 stages ok" in mock_bot.log.info.call_args_list[-1][0][0]
 
     @pytest.mark.asyncio
-    async def test_empty_list(self):
-        """Test fetching with empty achievements list."""
-        mock_gw2_api = MagicMock()
-        mock_gw2_api.call_api = AsyncMock()
+    async def test_stored_data_error_is_logged(self, mock_store, mock_bot):
+        """Test that a failing database load doesn't stop the API prefetch."""
+        mock_store.warm_up.side_effect = RuntimeError("db down")
 
-        result = await _fetch_achievement_data_in_batches(mock_gw2_api, [])
+        await warm_up_gw2_data(mock_bot)
 
-        assert result == []
-        mock_gw2_api.call_api.assert_not_called()
+        mock_bot.log.error.assert_called_once()
+        assert mock_store.get_many.await_count == 2
 
     @pytest.mark.asyncio
-    async def test_ids_joined_correctly(self):
-        """Test that achievement IDs are comma-joined in the API call."""
-        mock_gw2_api = MagicMock()
-        user_achievements = [{"id": 10}, {"id": 20}, {"id": 30}]
+    async def test_concurrency_is_bounded(self, mock_store, mock_bot):
+        """Test that no more than api_warm_up_concurrency stages run at once."""
+        running = 0
+        peak = 0
 
-        mock_gw2_api.call_api = AsyncMock(return_value=[])
+        async def _get_many(bot, kind, ids, priority):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            future = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_soon(future.set_result, None)
+            await future
+            running -= 1
+            return {}
 
-        await _fetch_achievement_data_in_batches(mock_gw2_api, user_achievements)
+        async def _put_many(bot, kind, objects, priority):
+            await _get_many(bot, kind, objects, priority)
 
-        call_args = mock_gw2_api.call_api.call_args[0][0]
-        assert call_args == "achievements?ids=10,20,30"
+        mock_store.get_many.side_effect = _get_many
+        mock_store.put_many.side_effect = _put_many
+        with patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings:
+            mock_settings.api_warm_up_concurrency = 1
+            await warm_up_gw2_data(mock_bot)
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_start_warm_up_runs_in_background(self, mock_bot):
+        """Test that the warm-up task is tracked until it finishes."""
+        with patch("src.gw2.tools.gw2_utils.warm_up_gw2_data", new_callable=AsyncMock) as mock_warm_up:
+            task = start_warm_up(mock_bot)
+            await task
+
+        mock_warm_up.assert_awaited_once_with(mock_bot)
+
+    def test_start_warm_up_disabled(self):
+        """Test that nothing is started when the warm-up is disabled."""
+        with patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings:
+            mock_settings.api_warm_up_enabled = False
+            assert start_warm_up(MagicMock()) is None
 
 
 class TestCalculateEarnedPoints:
@@ -298,12 +375,12 @@ def sample_account_data(self):
     @pytest.mark.asyncio
     async def test_calculate_achievement_points(self, mock_ctx, sample_user_achievements, sample_account_data):
         """Test calculating achievement points."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client"):
-            with patch("src.gw2.tools.gw2_utils._fetch_achievement_data_in_batches") as mock_fetch:
-                mock_fetch.return_value = [
-                    {"id": 1, "tiers": [{"count": 5, "points": 10}, {"count": 10, "points": 20}]},
-                    {"id": 2, "tiers": [{"count": 3, "points": 5}]},
-                ]
+        with patch.object(mock_ctx.bot, "gw2_client"):
+            with patch("src.gw2.tools.gw2_utils.get_static_data", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = {
+                    1: {"id": 1, "tiers": [{"count": 5, "points": 10}, {"count": 10, "points": 20}]},
+                    2: {"id": 2, "tiers": [{"count": 3, "points": 5}]},
+                }
 
                 with patch("src.gw2.tools.gw2_utils._calculate_earned_points") as mock_calc:
                     mock_calc.return_value = 75
@@ -432,8 +509,7 @@ def mock_bot(self):
     @pytest.mark.asyncio
     async def test_get_world_id_exact_match(self, mock_bot):
         """Test successful world ID retrieval with exact match."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(
                 return_value=[{"id": 1001, "name": "Anvil Rock"}, {"id": 1002, "name": "Borlis Pass"}]
             )
@@ -444,8 +520,7 @@ async def test_get_world_id_exact_match(self, mock_bot):
     @pytest.mark.asyncio
     async def test_get_world_id_case_insensitive(self, mock_bot):
         """Test world ID retrieval with case-insensitive match."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(
                 return_value=[
                     {"id": 1001, "name": "Anvil Rock"},
@@ -458,8 +533,7 @@ async def test_get_world_id_case_insensitive(self, mock_bot):
     @pytest.mark.asyncio
     async def test_get_world_id_partial_match(self, mock_bot):
         """Test world ID retrieval with partial match (line 196)."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(
                 return_value=[
                     {"id": 1001, "name": "Anvil Rock"},
@@ -475,8 +549,7 @@ async def test_get_world_id_partial_match(self, mock_bot):
     @pytest.mark.asyncio
     async def test_get_world_id_not_found(self, mock_bot):
         """Test world ID not found."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(return_value=[{"id": 1001, "name": "Anvil Rock"}])
 
             result = await get_world_id(mock_bot, "Non-existent World")
@@ -493,8 +566,7 @@ async def test_get_world_id_api_error(self, mock_bot):
         """Test get_world_id with API error."""
         mock_bot.log.error = MagicMock()
 
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(side_effect=Exception("API Error"))
 
             result = await get_world_id(mock_bot, "Anvil Rock")
@@ -516,38 +588,21 @@ def mock_ctx(self):
     @pytest.mark.asyncio
     async def test_successful_retrieval(self, mock_ctx):
         """Test successful world name population retrieval for legacy IDs."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
-            mock_client.call_api = AsyncMock(
-                return_value=[
-                    {"id": 1001, "name": "Anvil Rock", "population": "High"},
-                    {"id": 1002, "name": "Borlis Pass", "population": "Medium"},
-                ]
-            )
+        with patch("src.gw2.tools.gw2_utils.get_static_data", new_callable=AsyncMock) as mock_static:
+            mock_static.return_value = {
+                1001: {"id": 1001, "name": "Anvil Rock", "population": "High"},
+                1002: {"id": 1002, "name": "Borlis Pass", "population": "Medium"},
+            }
 
             result = await get_world_name_population(mock_ctx, "1001,1002")
 
             assert result == ["Anvil Rock", "Borlis Pass"]
-            mock_client.call_api.assert_called_once_with("worlds?ids=1001,1002")
+            mock_static.assert_called_once_with(mock_ctx.bot, "worlds", [1001, 1002])
 
     @pytest.mark.asyncio
     async def test_empty_results(self, mock_ctx):
-        """Test when API returns empty results (line 211)."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
-            mock_client.call_api = AsyncMock(return_value=[])
-
-            result = await get_world_name_population(mock_ctx, "9999")
-
-            assert result is None
-
-    @pytest.mark.asyncio
-    async def test_none_results(self, mock_ctx):
-        """Test when API returns None."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
-            mock_client.call_api = AsyncMock(return_value=None)
-
+        """Test when the API returns none of the requested worlds."""
+        with patch("src.gw2.tools.gw2_utils.get_static_data", new_callable=AsyncMock, return_value={}):
             result = await get_world_name_population(mock_ctx, "9999")
 
             assert result is None
@@ -555,9 +610,8 @@ async def test_none_results(self, mock_ctx):
     @pytest.mark.asyncio
     async def test_exception_returns_none(self, mock_ctx):
         """Test that exception returns None (lines 215-217)."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
-            mock_client.call_api = AsyncMock(side_effect=Exception("API Error"))
+        with patch("src.gw2.tools.gw2_utils.get_static_data", new_callable=AsyncMock) as mock_static:
+            mock_static.side_effect = Exception("API Error")
 
             result = await get_world_name_population(mock_ctx, "1001")
 
@@ -578,8 +632,7 @@ def mock_bot(self):
     @pytest.mark.asyncio
     async def test_successful_retrieval(self, mock_bot):
         """Test successful world name retrieval (lines 222-225)."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(return_value={"name": "Anvil Rock", "id": 1001})
 
             result = await get_world_name(mock_bot, "1001")
@@ -589,8 +642,7 @@ async def test_successful_retrieval(self, mock_bot):
     @pytest.mark.asyncio
     async def test_no_result_returns_none(self, mock_bot):
         """Test that empty result returns None (line 225)."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(return_value=None)
 
             result = await get_world_name(mock_bot, "9999")
@@ -600,8 +652,7 @@ async def test_no_result_returns_none(self, mock_bot):
     @pytest.mark.asyncio
     async def test_result_without_name_key(self, mock_bot):
         """Test result dict without name key."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(return_value={"id": 1001})
 
             result = await get_world_name(mock_bot, "1001")
@@ -611,8 +662,7 @@ async def test_result_without_name_key(self, mock_bot):
     @pytest.mark.asyncio
     async def test_exception_returns_none(self, mock_bot):
         """Test that exception returns None (lines 227-229)."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(side_effect=Exception("API Error"))
 
             result = await get_world_name(mock_bot, "1001")
@@ -645,10 +695,14 @@ async def test_gw2_activity_detected_triggers_handler(self, mock_bot):
         before.activities = []
         after.activities = [gw2_activity]
 
-        with patch("src.gw2.tools.gw2_utils._handle_gw2_activity_change") as mock_handle:
+        with (
+            patch("src.gw2.tools.gw2_utils._handle_gw2_activity_change") as mock_handle,
+            patch("src.gw2.tools.gw2_utils._session_metrics") as mock_metrics,
+        ):
             mock_handle.return_value = None
             await check_gw2_game_activity(mock_bot, before, after)
             mock_handle.assert_called_once_with(mock_bot, after, "start")
+            mock_metrics.activity_changed.assert_called_once_with(after.id)
 
     @pytest.mark.asyncio
     async def test_gw2_stopped_triggers_end(self, mock_bot):
@@ -720,6 +774,72 @@ async def test_custom_activity_ignored(self, mock_bot):
             mock_handle.assert_not_called()
 
 
+class TestPresenceFilter:
+    """Test cases for the presence prefilter in front of the session pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_untracked_member_is_dropped_before_activities(self):
+        """Test that a member the prefilter drops never has its activities looked at."""
+        before = MagicMock()
+        after = MagicMock()
+        with (
+            patch("src.gw2.tools.gw2_utils._presence_filter") as mock_filter,
+            patch("src.gw2.tools.gw2_utils._get_non_custom_activity") as mock_get_activity,
+            patch("src.gw2.tools.gw2_utils._handle_gw2_activity_change") as mock_handle,
+        ):
+            mock_filter.is_tracked.return_value = False
+
+            await check_gw2_game_activity(MagicMock(), before, after)
+
+            mock_filter.is_tracked.assert_called_once_with(after.guild.id, after.id)
+            mock_get_activity.assert_not_called()
+            mock_handle.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_load_logs_sizes(self):
+        """Test that loading the prefilter logs what it holds."""
+        bot = MagicMock()
+        with patch("src.gw2.tools.gw2_utils._presence_filter") as mock_filter:
+            mock_filter.load = AsyncMock()
+            mock_filter.stats.return_value = {"session_guilds": 2, "key_users": 10}
+
+            await load_presence_filter(bot)
+
+            mock_filter.load.assert_awaited_once_with(bot)
+            bot.log.info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_load_failure_is_logged(self):
+        """Test that a failed load is logged and leaves the presence events unfiltered."""
+        bot = MagicMock()
+        with patch("src.gw2.tools.gw2_utils._presence_filter") as mock_filter:
+            mock_filter.load = AsyncMock(side_effect=RuntimeError("db down"))
+
+            await load_presence_filter(bot)
+
+            bot.log.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_loads_in_background(self):
+        """Test that the prefilter is loaded in a background task."""
+        bot = MagicMock()
+        with patch("src.gw2.tools.gw2_utils.load_presence_filter", AsyncMock()) as mock_load:
+            await start_presence_filter(bot)
+
+            mock_load.assert_awaited_once_with(bot)
+
+    def test_invalidation_helpers(self):
+        """Test that config and key changes are passed on to the prefilter."""
+        with patch("src.gw2.tools.gw2_utils._presence_filter") as mock_filter:
+            set_guild_session_enabled(100, True)
+            add_key_user(1)
+            remove_key_user(2)
+
+            mock_filter.set_session_enabled.assert_called_once_with(100, True)
+            mock_filter.add_key_user.assert_called_once_with(1)
+            mock_filter.remove_key_user.assert_called_once_with(2)
+
+
 class TestHandleGw2ActivityChange:
     """Test cases for _handle_gw2_activity_change function."""
 
@@ -740,175 +860,251 @@ def mock_member(self):
         member.guild.id = 67890
         return member
 
-    @pytest.mark.asyncio
-    async def test_no_server_configs_returns(self, mock_bot, mock_member):
-        """Test that no server configs returns early."""
-        with patch("src.gw2.tools.gw2_utils.Gw2ConfigsDal") as mock_dal:
-            mock_instance = mock_dal.return_value
-            mock_instance.get_gw2_server_configs = AsyncMock(return_value=None)
+    def test_action_is_posted_to_session_actor(self, mock_bot, mock_member):
+        """Test that an activity change is queued on the member's session actor without waiting."""
+        with patch("src.gw2.tools.gw2_utils._session_actors") as mock_actors:
+            _handle_gw2_activity_change(mock_bot, mock_member, "start")
 
-            await _handle_gw2_activity_change(mock_bot, mock_member, "start")
-
-            # Should not proceed to Gw2KeyDal
-            with patch("src.gw2.tools.gw2_utils.Gw2KeyDal") as mock_key_dal:
-                mock_key_dal.assert_not_called()
+            mock_actors.post.assert_called_once_with(mock_bot, mock_member, "start")
 
     @pytest.mark.asyncio
-    async def test_session_not_active_returns(self, mock_bot, mock_member):
-        """Test that inactive session returns early."""
-        with patch("src.gw2.tools.gw2_utils.Gw2ConfigsDal") as mock_dal:
-            mock_instance = mock_dal.return_value
-            mock_instance.get_gw2_server_configs = AsyncMock(return_value=[{"session": False}])
+    async def test_action_is_submitted_to_session_batch(self, mock_bot, mock_member):
+        """Test that an action waits for the session batch and leaves the member in the state it returned."""
+        with patch("src.gw2.tools.gw2_utils._session_batcher") as mock_batcher:
+            mock_batcher.submit = AsyncMock(return_value=SessionState.PLAYING)
 
-            await _handle_gw2_activity_change(mock_bot, mock_member, "start")
+            state = await _execute_session_action(mock_bot, mock_member, "start")
+
+            mock_batcher.submit.assert_awaited_once_with(mock_bot, mock_member, "start")
+            assert state is SessionState.PLAYING
 
     @pytest.mark.asyncio
-    async def test_no_api_key_returns(self, mock_bot, mock_member):
-        """Test that no API key returns early."""
-        with patch("src.gw2.tools.gw2_utils.Gw2ConfigsDal") as mock_dal:
-            mock_configs = mock_dal.return_value
-            mock_configs.get_gw2_server_configs = AsyncMock(return_value=[{"session": True}])
+    async def test_untracked_member_is_idle(self, mock_bot, mock_member):
+        """Test that a start the batch has no state for (untracked, or the batch failed) leaves the member idle."""
+        with patch("src.gw2.tools.gw2_utils._session_batcher") as mock_batcher:
+            mock_batcher.submit = AsyncMock(return_value=None)
 
-            with patch("src.gw2.tools.gw2_utils.Gw2KeyDal") as mock_key_dal:
-                mock_key_instance = mock_key_dal.return_value
-                mock_key_instance.get_api_key_by_user = AsyncMock(return_value=None)
+            assert await _execute_session_action(mock_bot, mock_member, "start") is SessionState.IDLE
 
-                await _handle_gw2_activity_change(mock_bot, mock_member, "start")
 
-    @pytest.mark.asyncio
-    async def test_start_action_starts_session(self, mock_bot, mock_member):
-        """Test that 'start' action starts a session."""
-        with patch("src.gw2.tools.gw2_utils.Gw2ConfigsDal") as mock_dal:
-            mock_configs = mock_dal.return_value
-            mock_configs.get_gw2_server_configs = AsyncMock(return_value=[{"session": True}])
+class TestProcessSessionBatch:
+    """Test cases for _process_session_batch."""
 
-            with patch("src.gw2.tools.gw2_utils.Gw2KeyDal") as mock_key_dal:
-                mock_key_instance = mock_key_dal.return_value
-                mock_key_instance.get_api_key_by_user = AsyncMock(return_value=[{"key": "test-api-key-123"}])
+    @pytest.fixture
+    def mock_bot(self):
+        bot = MagicMock()
+        bot.db_session = MagicMock()
+        bot.log = MagicMock()
+        return bot
 
-                with patch("src.gw2.tools.gw2_utils.start_session") as mock_start:
-                    mock_start.return_value = None
+    @staticmethod
+    def _member(user_id: int, guild_id: int = 67890) -> MagicMock:
+        member = MagicMock()
+        member.id = user_id
+        member.guild.id = guild_id
+        return member
 
-                    await _handle_gw2_activity_change(mock_bot, mock_member, "start")
+    @pytest.fixture
+    def mock_dals(self):
+        with (
+            patch("src.gw2.tools.gw2_utils.Gw2ConfigsDal") as mock_configs_dal,
+            patch("src.gw2.tools.gw2_utils.Gw2KeyDal") as mock_key_dal,
+        ):
+            configs = mock_configs_dal.return_value
+            configs.get_gw2_servers_configs = AsyncMock(
+                return_value=[{"server_id": 67890, "session": True}, {"server_id": 11111, "session": False}]
+            )
+            keys = mock_key_dal.return_value
+            keys.get_api_keys_by_users = AsyncMock(
+                return_value=[{"user_id": 1, "key": "key-1"}, {"user_id": 2, "key": "key-2"}]
+            )
+            yield configs, keys
 
-                    mock_start.assert_called_once_with(mock_bot, mock_member, "test-api-key-123")
+    @pytest.fixture
+    def mock_jobs(self):
+        with patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs:
+            mock_jobs.get_pending_actions.return_value = []
+            mock_jobs.schedule_many = AsyncMock()
+            yield mock_jobs
+
+    @pytest.mark.asyncio
+    async def test_batch_reads_configs_and_keys_once(self, mock_bot, mock_dals, mock_jobs):
+        """Test that configs and keys are read with one query each for the whole batch."""
+        configs, keys = mock_dals
+        members = [self._member(1), self._member(2), self._member(3, guild_id=11111)]
+
+        with patch(
+            "src.gw2.tools.gw2_utils._start_sessions", AsyncMock(return_value={1: SessionState.PLAYING})
+        ) as mock_start:
+            states = await _process_session_batch(
+                mock_bot, [(members[0], "start"), (members[1], "end"), (members[2], "start")]
+            )
+
+        configs.get_gw2_servers_configs.assert_awaited_once()
+        assert sorted(configs.get_gw2_servers_configs.call_args[0][0]) == [11111, 67890]
+        # Guild 11111 doesn't track sessions, so user 3 is not even looked up
+        keys.get_api_keys_by_users.assert_awaited_once_with([1, 2])
+        mock_start.assert_awaited_once_with(mock_bot, [(members[0], "key-1")])
+        mock_jobs.schedule_many.assert_awaited_once_with(mock_bot, [(2, "end", 180.0, 0)])
+        # User 3 is untracked, so it has no state
+        assert states == {1: SessionState.PLAYING, 2: SessionState.ENDING_DELAY}
 
     @pytest.mark.asyncio
-    async def test_end_action_ends_session(self, mock_bot, mock_member):
-        """Test that 'end' action ends a session."""
-        with patch("src.gw2.tools.gw2_utils.Gw2ConfigsDal") as mock_dal:
-            mock_configs = mock_dal.return_value
-            mock_configs.get_gw2_server_configs = AsyncMock(return_value=[{"session": True}])
+    async def test_batch_without_tracked_guilds(self, mock_bot, mock_dals, mock_jobs):
+        """Test that nothing else is queried when no guild of the batch tracks sessions."""
+        _, keys = mock_dals
 
-            with patch("src.gw2.tools.gw2_utils.Gw2KeyDal") as mock_key_dal:
-                mock_key_instance = mock_key_dal.return_value
-                mock_key_instance.get_api_key_by_user = AsyncMock(return_value=[{"key": "test-api-key-123"}])
+        assert await _process_session_batch(mock_bot, [(self._member(3, guild_id=11111), "start")]) == {}
 
-                with patch("src.gw2.tools.gw2_utils.end_session") as mock_end:
-                    mock_end.return_value = None
+        keys.get_api_keys_by_users.assert_not_called()
+        mock_jobs.schedule_many.assert_not_called()
 
-                    await _handle_gw2_activity_change(mock_bot, mock_member, "end")
+    @pytest.mark.asyncio
+    async def test_user_without_key_is_skipped(self, mock_bot, mock_dals, mock_jobs):
+        """Test that users without an API key are skipped."""
+        with patch("src.gw2.tools.gw2_utils._start_sessions") as mock_start:
+            assert await _process_session_batch(mock_bot, [(self._member(4), "start")]) == {}
 
-                    mock_end.assert_called_once_with(mock_bot, mock_member, "test-api-key-123")
+        mock_start.assert_not_called()
+        mock_jobs.schedule_many.assert_awaited_once_with(mock_bot, [])
 
     @pytest.mark.asyncio
-    async def test_pending_end_processed_after_start(self, mock_bot, mock_member):
-        """Test that an end event queued during a start is processed after start finishes."""
-        with patch("src.gw2.tools.gw2_utils._execute_session_action") as mock_execute:
-            call_count = 0
+    async def test_start_waits_behind_scheduled_end(self, mock_bot, mock_dals, mock_jobs):
+        """Test that a start while an end job is scheduled is stored as a job that runs after it."""
+        mock_jobs.get_pending_actions.return_value = ["end"]
 
-            async def side_effect(bot, member, action):
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    # Simulate end event arriving during start processing
-                    _processing_sessions[member.id]["pending"] = "end"
+        with patch("src.gw2.tools.gw2_utils._start_sessions") as mock_start:
+            states = await _process_session_batch(mock_bot, [(self._member(1), "start")])
 
-            mock_execute.side_effect = side_effect
+        assert states == {1: SessionState.STARTING}
+        mock_jobs.schedule_many.assert_awaited_once_with(mock_bot, [(1, "start", 0.0, 0)])
+        mock_start.assert_not_called()
 
-            await _handle_gw2_activity_change(mock_bot, mock_member, "start")
+    @pytest.mark.asyncio
+    async def test_already_scheduled_action_is_dropped(self, mock_bot, mock_dals, mock_jobs):
+        """Test that an action is dropped when the last scheduled job already has it."""
+        mock_jobs.get_pending_actions.side_effect = lambda user_id: ["end", "start"] if user_id == 1 else ["end"]
 
-            assert mock_execute.call_count == 2
-            mock_execute.assert_any_call(mock_bot, mock_member, "start")
-            mock_execute.assert_any_call(mock_bot, mock_member, "end")
-            assert mock_member.id not in _processing_sessions
+        with patch("src.gw2.tools.gw2_utils._start_sessions") as mock_start:
+            states = await _process_session_batch(mock_bot, [(self._member(1), "start"), (self._member(2), "end")])
 
-    @pytest.mark.asyncio
-    async def test_different_pending_overwrites_previous(self, mock_bot, mock_member):
-        """Test that a different pending action overwrites a previous one."""
-        with patch("src.gw2.tools.gw2_utils._execute_session_action") as mock_execute:
-            call_count = 0
+        assert states == {1: SessionState.STARTING, 2: SessionState.ENDING_DELAY}
+        mock_jobs.schedule_many.assert_awaited_once_with(mock_bot, [])
+        mock_start.assert_not_called()
 
-            async def side_effect(bot, member, action):
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    # Simulate: end queued during start processing
-                    _processing_sessions[member.id]["pending"] = "end"
 
-            mock_execute.side_effect = side_effect
+class TestStartSessions:
+    """Test cases for _start_sessions, the batched session start."""
 
-            await _handle_gw2_activity_change(mock_bot, mock_member, "start")
+    @pytest.fixture(autouse=True)
+    def fixed_date(self):
+        with (
+            patch("src.gw2.tools.gw2_utils.bot_utils.convert_datetime_to_str_short", return_value="2023-01-01"),
+            patch("src.gw2.tools.gw2_utils.bot_utils.get_current_date_time"),
+            patch("src.gw2.tools.gw2_retry._random.uniform", side_effect=lambda low, high: high),
+        ):
+            yield
 
-            assert mock_execute.call_count == 2
-            # Second call should be "end" (pending action)
-            mock_execute.assert_any_call(mock_bot, mock_member, "end")
-            assert mock_member.id not in _processing_sessions
+    @pytest.fixture
+    def mock_bot(self):
+        bot = MagicMock()
+        bot.db_session = MagicMock()
+        bot.log = MagicMock()
+        return bot
+
+    @staticmethod
+    def _member(user_id: int) -> MagicMock:
+        member = MagicMock()
+        member.id = user_id
+        return member
 
     @pytest.mark.asyncio
-    async def test_concurrent_call_queues_different_action(self, mock_bot, mock_member):
-        """Test that a concurrent call with a different action queues it."""
-        # Simulate a start session already being processed
-        _processing_sessions[mock_member.id] = {"current": "start", "pending": None}
+    async def test_sessions_are_inserted_together(self, mock_bot):
+        """Test that the start snapshots of a batch are written with one insert."""
+        members = [self._member(1), self._member(2)]
+
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", side_effect=[{"acc_name": "A.1"}, {"acc_name": "B.2"}]),
+            patch("src.gw2.tools.gw2_utils.Gw2SessionsDal") as mock_session_dal,
+            patch("src.gw2.tools.gw2_utils.insert_start_char_deaths") as mock_insert_char,
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+        ):
+            mock_session_dal.return_value.insert_start_sessions = AsyncMock(return_value={1: "s1", 2: "s2"})
+            mock_jobs.schedule_many = AsyncMock()
 
-        try:
-            await _handle_gw2_activity_change(mock_bot, mock_member, "end")
+            await _start_sessions(mock_bot, [(members[0], "key-1"), (members[1], "key-2")])
 
-            # The end action should be queued as pending
-            assert _processing_sessions[mock_member.id]["pending"] == "end"
-        finally:
-            _processing_sessions.pop(mock_member.id, None)
+            sessions = mock_session_dal.return_value.insert_start_sessions.call_args[0][0]
+            assert [(s["user_id"], s["acc_name"], s["date"]) for s in sessions] == [
+                (1, "A.1", "2023-01-01"),
+                (2, "B.2", "2023-01-01"),
+            ]
+            assert mock_insert_char.call_args_list == [
+                ((mock_bot, members[0], "key-1", "s1"),),
+                ((mock_bot, members[1], "key-2", "s2"),),
+            ]
+            mock_jobs.schedule_many.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_duplicate_current_action_is_dropped(self, mock_bot, mock_member):
-        """Test that a duplicate of the currently running action is dropped."""
-        # Simulate a start session already being processed
-        _processing_sessions[mock_member.id] = {"current": "start", "pending": None}
+    async def test_failed_snapshots_are_retried(self, mock_bot):
+        """Test that members whose snapshot failed get a background retry job."""
+        members = [self._member(1), self._member(2)]
 
-        try:
-            await _handle_gw2_activity_change(mock_bot, mock_member, "start")
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", side_effect=[None, {"acc_name": "B.2"}]),
+            patch("src.gw2.tools.gw2_utils.Gw2SessionsDal") as mock_session_dal,
+            patch("src.gw2.tools.gw2_utils.insert_start_char_deaths") as mock_insert_char,
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+            patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+        ):
+            mock_settings.api_session_batch_concurrency = 10
+            mock_settings.api_session_retry_bg_delay = 30.0
+            mock_settings.api_session_retry_bg_max_delay = 300.0
+            mock_settings.api_retry_max_attempts = 5
+            mock_session_dal.return_value.insert_start_sessions = AsyncMock(return_value={2: "s2"})
+            mock_jobs.schedule_many = AsyncMock()
 
-            # Duplicate should be ignored, pending stays None
-            assert _processing_sessions[mock_member.id]["pending"] is None
-            mock_bot.log.debug.assert_called_with(f"Duplicate 'start' event for user {mock_member.id}, ignoring")
-        finally:
-            _processing_sessions.pop(mock_member.id, None)
+            states = await _start_sessions(mock_bot, [(members[0], "key-1"), (members[1], "key-2")])
+
+            mock_jobs.schedule_many.assert_awaited_once_with(mock_bot, [(1, "start", 30.0, 1)])
+            mock_insert_char.assert_called_once_with(mock_bot, members[1], "key-2", "s2")
+            assert states == {1: SessionState.STARTING, 2: SessionState.PLAYING}
 
     @pytest.mark.asyncio
-    async def test_duplicate_pending_action_is_dropped(self, mock_bot, mock_member):
-        """Test that a duplicate of an already-pending action is dropped."""
-        # Simulate start running with end already pending
-        _processing_sessions[mock_member.id] = {"current": "start", "pending": "end"}
+    async def test_insert_failure_skips_char_deaths(self, mock_bot):
+        """Test that a failed session insert is logged and no character rows are written."""
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", return_value={"acc_name": "A.1"}),
+            patch("src.gw2.tools.gw2_utils.Gw2SessionsDal") as mock_session_dal,
+            patch("src.gw2.tools.gw2_utils.insert_start_char_deaths") as mock_insert_char,
+        ):
+            mock_session_dal.return_value.insert_start_sessions = AsyncMock(side_effect=RuntimeError("db down"))
 
-        try:
-            await _handle_gw2_activity_change(mock_bot, mock_member, "end")
+            states = await _start_sessions(mock_bot, [(self._member(1), "key-1")])
 
-            # Duplicate should be ignored, pending stays "end"
-            assert _processing_sessions[mock_member.id]["pending"] == "end"
-            mock_bot.log.debug.assert_called_with(f"Duplicate 'end' event for user {mock_member.id}, ignoring")
-        finally:
-            _processing_sessions.pop(mock_member.id, None)
+            mock_bot.log.error.assert_called_once()
+            mock_insert_char.assert_not_called()
+            assert states == {1: SessionState.IDLE}
 
     @pytest.mark.asyncio
-    async def test_processing_sessions_cleaned_up_on_error(self, mock_bot, mock_member):
-        """Test that _processing_sessions is cleaned up even when an error occurs."""
-        with patch("src.gw2.tools.gw2_utils._execute_session_action") as mock_execute:
-            mock_execute.side_effect = RuntimeError("test error")
+    async def test_records_pipeline_metrics(self, mock_bot):
+        """Test that written starts, the insert latency and scheduled retries reach the session metrics."""
+        members = [self._member(1), self._member(2)]
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", side_effect=[None, {"acc_name": "B.2"}]),
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+            patch("src.gw2.tools.gw2_utils._session_metrics") as mock_metrics,
+            patch("src.gw2.tools.gw2_utils.Gw2SessionsDal") as mock_session_dal,
+            patch("src.gw2.tools.gw2_utils.insert_start_char_deaths", AsyncMock()),
+        ):
+            mock_jobs.schedule_many = AsyncMock()
+            mock_session_dal.return_value.insert_start_sessions = AsyncMock(return_value={2: "s2"})
 
-            with pytest.raises(RuntimeError, match="test error"):
-                await _handle_gw2_activity_change(mock_bot, mock_member, "start")
+            await _start_sessions(mock_bot, [(members[0], "key-1"), (members[1], "key-2")])
 
-            assert mock_member.id not in _processing_sessions
+            mock_metrics.count.assert_any_call("retries_scheduled", 1)
+            mock_metrics.session_written.assert_called_once_with(2, "start")
+            assert [call.args[0] for call in mock_metrics.observe.call_args_list].count("db_write") == 1
 
 
 class TestStartSession:
@@ -931,19 +1127,35 @@ def mock_member(self):
 
     @pytest.mark.asyncio
     async def test_get_user_stats_returns_none_schedules_bg_retry(self, mock_bot, mock_member):
-        """Test that None user stats schedules background retry task."""
-        with patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats:
-            mock_stats.return_value = None
+        """Test that None user stats stores a background retry job."""
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=None),
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+        ):
+            mock_jobs.schedule = AsyncMock()
 
-            with patch("src.gw2.tools.gw2_utils.asyncio.create_task") as mock_create_task:
-                mock_task = MagicMock()
-                mock_create_task.return_value = mock_task
+            await start_session(mock_bot, mock_member, "api-key")
 
-                await start_session(mock_bot, mock_member, "api-key")
+            mock_jobs.schedule.assert_awaited_once()
+            args, kwargs = mock_jobs.schedule.call_args
+            assert args[:3] == (mock_bot, 12345, "start")
+            assert kwargs == {"attempt": 1}
+            assert mock_bot.log.warning.call_count == 2
 
-                mock_create_task.assert_called_once()
-                mock_task.add_done_callback.assert_called_once()
-                mock_bot.log.warning.assert_called_once()
+    @pytest.mark.asyncio
+    async def test_failed_start_with_retry_pending_is_coalesced(self, mock_bot, mock_member):
+        """Test that a failed start does not add a retry when the user's last pending job is a start."""
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=None),
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+        ):
+            mock_jobs.schedule = AsyncMock()
+            mock_jobs.get_pending_actions.return_value = ["end", "start"]
+
+            await start_session(mock_bot, mock_member, "api-key")
+
+            mock_jobs.schedule.assert_not_called()
+            mock_jobs.api_failed.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_successful_start_session(self, mock_bot, mock_member):
@@ -976,6 +1188,47 @@ async def test_successful_start_session(self, mock_bot, mock_member):
                             mock_insert_char.assert_called_once_with(mock_bot, mock_member, "api-key", 42)
 
 
+class TestTakeSessionSnapshot:
+    """Test cases for _take_session_snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_answered_snapshot(self):
+        """Test that a snapshot the GW2 API answered is reported to the session jobs."""
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", AsyncMock(return_value={"gold": 1})),
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+        ):
+            assert await _take_session_snapshot(MagicMock(), "api-key") == {"gold": 1}
+
+            mock_jobs.api_answered.assert_called_once()
+            mock_jobs.api_failed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_snapshot(self):
+        """Test that a snapshot the GW2 API failed is reported to the session jobs."""
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", AsyncMock(return_value=None)),
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+        ):
+            assert await _take_session_snapshot(MagicMock(), "api-key") is None
+
+            mock_jobs.api_failed.assert_called_once()
+            mock_jobs.api_answered.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_metrics(self):
+        """Test that the snapshot latency is recorded and a failed snapshot counted."""
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", AsyncMock(return_value=None)),
+            patch("src.gw2.tools.gw2_utils._session_jobs"),
+            patch("src.gw2.tools.gw2_utils._session_metrics") as mock_metrics,
+        ):
+            await _take_session_snapshot(MagicMock(), "api-key")
+
+            assert mock_metrics.observe.call_args[0][0] == "snapshot"
+            mock_metrics.count.assert_called_once_with("snapshot_failures")
+
+
 class TestEndSession:
     """Test cases for end_session function."""
 
@@ -996,19 +1249,19 @@ def mock_member(self):
 
     @pytest.mark.asyncio
     async def test_get_user_stats_returns_none_schedules_bg_retry(self, mock_bot, mock_member):
-        """Test that None user stats schedules background retry task."""
-        with patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats:
-            mock_stats.return_value = None
-
-            with patch("src.gw2.tools.gw2_utils.asyncio.create_task") as mock_create_task:
-                mock_task = MagicMock()
-                mock_create_task.return_value = mock_task
+        """Test that None user stats stores a background retry job."""
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=None),
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+        ):
+            mock_jobs.schedule = AsyncMock()
 
-                await end_session(mock_bot, mock_member, "api-key", skip_delay=True)
+            await end_session(mock_bot, mock_member, "api-key", skip_delay=True)
 
-                mock_create_task.assert_called_once()
-                mock_task.add_done_callback.assert_called_once()
-                mock_bot.log.warning.assert_called_once()
+            mock_jobs.schedule.assert_awaited_once()
+            args, kwargs = mock_jobs.schedule.call_args
+            assert args[:3] == (mock_bot, 12345, "end")
+            assert kwargs == {"attempt": 1}
 
     @pytest.mark.asyncio
     async def test_successful_end_session(self, mock_bot, mock_member):
@@ -1066,35 +1319,50 @@ async def test_end_session_no_active_session(self, mock_bot, mock_member):
                             mock_bot.log.warning.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_end_session_waits_for_api_cache(self, mock_bot, mock_member):
-        """Test that end_session waits for the API cache delay before fetching stats."""
-        with patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings:
+    async def test_end_session_schedules_job_after_api_cache_delay(self, mock_bot, mock_member):
+        """Test that end_session stores an end job due after the API cache delay instead of waiting."""
+        with (
+            patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+            patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats,
+        ):
             mock_settings.api_session_end_delay = 300.0
+            mock_jobs.get_pending_actions.return_value = []
+            mock_jobs.schedule = AsyncMock()
 
-            with patch("src.gw2.tools.gw2_utils.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-                with patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats:
-                    mock_stats.return_value = None
+            await end_session(mock_bot, mock_member, "api-key")
 
-                    with patch("src.gw2.tools.gw2_utils.asyncio.create_task") as mock_task:
-                        mock_task.return_value = MagicMock()
+            mock_jobs.schedule.assert_awaited_once_with(mock_bot, 12345, "end", 300.0)
+            mock_stats.assert_not_called()
 
-                        await end_session(mock_bot, mock_member, "api-key")
+    @pytest.mark.asyncio
+    async def test_end_session_duplicate_scheduled_end_is_dropped(self, mock_bot, mock_member):
+        """Test that an end event is dropped when the last scheduled job is already an end."""
+        with (
+            patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+        ):
+            mock_settings.api_session_end_delay = 180.0
+            mock_jobs.get_pending_actions.return_value = ["end"]
+            mock_jobs.schedule = AsyncMock()
 
-                        mock_sleep.assert_called_once_with(300.0)
+            await end_session(mock_bot, mock_member, "api-key")
+
+            mock_jobs.schedule.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_end_session_skip_delay(self, mock_bot, mock_member):
-        """Test that skip_delay=True bypasses the API cache wait."""
-        with patch("src.gw2.tools.gw2_utils.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            with patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats:
-                mock_stats.return_value = None
-
-                with patch("src.gw2.tools.gw2_utils.asyncio.create_task") as mock_task:
-                    mock_task.return_value = MagicMock()
+        """Test that skip_delay=True fetches the end stats right away."""
+        with (
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+            patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=None) as mock_stats,
+        ):
+            mock_jobs.schedule = AsyncMock()
 
-                    await end_session(mock_bot, mock_member, "api-key", skip_delay=True)
+            await end_session(mock_bot, mock_member, "api-key", skip_delay=True)
 
-                    mock_sleep.assert_not_called()
+            mock_stats.assert_called_once_with(mock_bot, "api-key")
+            assert mock_jobs.schedule.call_args[0][2] == "end"
 
 
 class TestGetUserStats:
@@ -1111,15 +1379,24 @@ def mock_bot(self):
     @pytest.mark.asyncio
     async def test_api_exception_returns_none(self, mock_bot):
         """Test that API exception returns None (lines 336-338)."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(side_effect=Exception("API Error"))
+            mock_client.fetch_many = AsyncMock(return_value=({}, []))
 
             result = await get_user_stats(mock_bot, "api-key")
 
             assert result is None
             mock_bot.log.error.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_failed_achievements_chunk_returns_none(self, mock_bot):
+        """Test that a snapshot with achievements the API failed to return is not taken."""
+        with patch.object(mock_bot, "gw2_client") as mock_client:
+            mock_client.call_api = AsyncMock(side_effect=[{"name": "TestUser.1234", "wvw_rank": 50}, []])
+            mock_client.fetch_many = AsyncMock(side_effect=APIConnectionError(mock_bot, "timeout"))
+
+            assert await get_user_stats(mock_bot, "api-key") is None
+
     @pytest.mark.asyncio
     async def test_successful_stats_retrieval(self, mock_bot):
         """Test successful user stats retrieval with legacy wvw_rank."""
@@ -1134,12 +1411,19 @@ async def test_successful_stats_retrieval(self, mock_bot):
             {"id": 291, "current": 42},  # camps
         ]
 
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
-            mock_client.call_api = AsyncMock(side_effect=[account_data, wallet_data, achievements_data])
+        with patch.object(mock_bot, "gw2_client") as mock_client:
+            mock_client.call_api = AsyncMock(side_effect=[account_data, wallet_data])
+            mock_client.fetch_many = AsyncMock(return_value=({a["id"]: a for a in achievements_data}, []))
 
             result = await get_user_stats(mock_bot, "api-key")
 
+            mock_client.fetch_many.assert_awaited_once_with(
+                "account/achievements",
+                list(ACHIEVEMENT_MAPPING),
+                "api-key",
+                priority=RequestPriority.BACKGROUND,
+                strict=True,
+            )
             assert result is not None
             assert result["acc_name"] == "TestUser.1234"
             assert "age" not in result
@@ -1157,9 +1441,9 @@ async def test_successful_stats_retrieval_new_wvw_format(self, mock_bot):
         wallet_data = []
         achievements_data = []
 
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
-            mock_client.call_api = AsyncMock(side_effect=[account_data, wallet_data, achievements_data])
+        with patch.object(mock_bot, "gw2_client") as mock_client:
+            mock_client.call_api = AsyncMock(side_effect=[account_data, wallet_data])
+            mock_client.fetch_many = AsyncMock(return_value=({a["id"]: a for a in achievements_data}, []))
 
             result = await get_user_stats(mock_bot, "api-key")
 
@@ -1184,9 +1468,9 @@ async def test_stats_with_all_wallet_items(self, mock_bot):
         ]
         achievements_data = []
 
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
-            mock_client.call_api = AsyncMock(side_effect=[account_data, wallet_data, achievements_data])
+        with patch.object(mock_bot, "gw2_client") as mock_client:
+            mock_client.call_api = AsyncMock(side_effect=[account_data, wallet_data])
+            mock_client.fetch_many = AsyncMock(return_value=({a["id"]: a for a in achievements_data}, []))
 
             result = await get_user_stats(mock_bot, "api-key")
 
@@ -1381,8 +1665,7 @@ def mock_member(self):
     @pytest.mark.asyncio
     async def test_successful_insert(self, mock_bot, mock_member):
         """Test successful start char deaths insert."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             characters_data = [{"name": "CharName", "profession": "Warrior", "deaths": 5}]
             mock_client.call_api = AsyncMock(return_value=characters_data)
 
@@ -1392,14 +1675,15 @@ async def test_successful_insert(self, mock_bot, mock_member):
 
                 await insert_start_char_deaths(mock_bot, mock_member, "api-key", 42)
 
-                mock_client.call_api.assert_called_once_with("characters?ids=all", "api-key")
+                mock_client.call_api.assert_called_once_with(
+                    "characters?ids=all", "api-key", priority=RequestPriority.BACKGROUND
+                )
                 mock_instance.insert_start_char_deaths.assert_called_once_with(42, 12345, characters_data)
 
     @pytest.mark.asyncio
     async def test_exception_logs_error(self, mock_bot, mock_member):
         """Test that exception is caught and logged."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(side_effect=Exception("API Error"))
 
             await insert_start_char_deaths(mock_bot, mock_member, "api-key", 42)
@@ -1429,8 +1713,7 @@ def mock_member(self):
     @pytest.mark.asyncio
     async def test_successful_update(self, mock_bot, mock_member):
         """Test successful end char deaths update."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             characters_data = [{"name": "CharName", "profession": "Warrior", "deaths": 8}]
             mock_client.call_api = AsyncMock(return_value=characters_data)
 
@@ -1440,14 +1723,15 @@ async def test_successful_update(self, mock_bot, mock_member):
 
                 await update_end_char_deaths(mock_bot, mock_member, "api-key", 42)
 
-                mock_client.call_api.assert_called_once_with("characters?ids=all", "api-key")
+                mock_client.call_api.assert_called_once_with(
+                    "characters?ids=all", "api-key", priority=RequestPriority.BACKGROUND
+                )
                 mock_instance.update_end_char_deaths.assert_called_once_with(42, 12345, characters_data)
 
     @pytest.mark.asyncio
     async def test_exception_logs_error(self, mock_bot, mock_member):
         """Test that exception is caught and logged."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(side_effect=Exception("API Error"))
 
             await update_end_char_deaths(mock_bot, mock_member, "api-key", 42)
@@ -1858,8 +2142,7 @@ def mock_ctx(self):
     @pytest.mark.asyncio
     async def test_get_worlds_ids_success(self, mock_ctx):
         """Test successful world IDs retrieval."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_ctx.bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(return_value=[{"id": 1001, "name": "Anvil Rock"}])
 
             success, results = await get_worlds_ids(mock_ctx)
@@ -1871,8 +2154,7 @@ async def test_get_worlds_ids_success(self, mock_ctx):
     @pytest.mark.asyncio
     async def test_get_worlds_ids_api_error(self, mock_ctx):
         """Test get_worlds_ids with API error."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
+        with patch.object(mock_ctx.bot, "gw2_client") as mock_client:
             mock_client.call_api = AsyncMock(side_effect=APIConnectionError(mock_ctx.bot, "API Error"))
 
             with patch("src.gw2.tools.gw2_utils.bot_utils.send_error_msg") as mock_error:
@@ -2057,9 +2339,8 @@ async def test_wr_team_ids_only(self, mock_ctx):
     @pytest.mark.asyncio
     async def test_mixed_legacy_and_wr_ids(self, mock_ctx):
         """Test resolving a mix of legacy world IDs and WR team IDs."""
-        with patch("src.gw2.tools.gw2_utils.Gw2Client") as mock_client_class:
-            mock_client = mock_client_class.return_value
-            mock_client.call_api = AsyncMock(return_value=[{"id": 1001, "name": "Anvil Rock", "population": "High"}])
+        with patch("src.gw2.tools.gw2_utils.get_static_data", new_callable=AsyncMock) as mock_static:
+            mock_static.return_value = {1001: {"id": 1001, "name": "Anvil Rock", "population": "High"}}
 
             result = await get_world_name_population(mock_ctx, "1001,11005")
 
@@ -2148,142 +2429,466 @@ def test_known_currency_ids(self):
         assert WALLET_MAPPING[18] == "transmutation_charges"
 
 
-class TestRetrySessionLater:
-    """Test cases for _retry_session_later background retry function."""
+class TestRunSessionJob:
+    """Test cases for _run_session_job, the runner of stored session jobs."""
+
+    @pytest.fixture(autouse=True)
+    def retry_settings(self):
+        """Use fixed retry settings and make full jitter deterministic by always picking the backoff ceiling."""
+        with (
+            patch("src.gw2.tools.gw2_retry._random.uniform", side_effect=lambda low, high: high),
+            patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+        ):
+            mock_settings.api_session_retry_bg_delay = 60.0
+            mock_settings.api_session_retry_bg_max_delay = 300.0
+            mock_settings.api_retry_max_attempts = 3
+            yield mock_settings
+
+    @pytest.fixture
+    def mock_user(self):
+        """Create a mock user."""
+        user = MagicMock()
+        user.id = 12345
+        user.send = AsyncMock()
+        return user
 
     @pytest.fixture
-    def mock_bot(self):
-        """Create a mock bot."""
+    def mock_bot(self, mock_user):
+        """Create a mock bot that knows the user."""
         bot = MagicMock()
         bot.db_session = MagicMock()
         bot.log = MagicMock()
+        bot.get_user.return_value = mock_user
         return bot
 
     @pytest.fixture
-    def mock_member(self):
-        """Create a mock member."""
-        member = MagicMock()
-        member.id = 12345
-        member.send = AsyncMock()
-        return member
+    def mock_key_dal(self):
+        with patch("src.gw2.tools.gw2_utils.Gw2KeyDal") as mock_dal:
+            mock_dal.return_value.get_api_key_by_user = AsyncMock(return_value=[{"key": "api-key"}])
+            yield mock_dal.return_value
+
+    @staticmethod
+    def _job(action: str, attempt: int = 0) -> dict:
+        return {"id": "job-1", "user_id": 12345, "action": action, "attempt": attempt}
 
     @pytest.mark.asyncio
-    async def test_retry_succeeds_on_first_bg_attempt_start(self, mock_bot, mock_member):
-        """Test background retry succeeds on first attempt for start session."""
+    async def test_end_job_ends_session(self, mock_bot, mock_user, mock_key_dal):
+        """Test that a due end job takes the end snapshot."""
         session_data = {"acc_name": "TestUser.1234", "wvw_rank": 50}
 
         with (
-            patch("src.gw2.tools.gw2_utils.asyncio.sleep") as mock_sleep,
-            patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats,
+            patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=session_data),
+            patch("src.gw2.tools.gw2_utils._do_end_session") as mock_do_end,
+        ):
+            result = await _run_session_job(mock_bot, self._job("end"))
+
+        assert result is None
+        mock_do_end.assert_called_once_with(mock_bot, mock_user, "api-key", session_data)
+        mock_user.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retry_job_starts_session(self, mock_bot, mock_user, mock_key_dal):
+        """Test that a start retry takes the start snapshot and logs the attempt."""
+        session_data = {"acc_name": "TestUser.1234", "wvw_rank": 50}
+
+        with (
+            patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=session_data),
             patch("src.gw2.tools.gw2_utils._do_start_session") as mock_do_start,
-            patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
         ):
-            mock_settings.api_session_retry_bg_delay = 60.0
-            mock_settings.api_retry_max_attempts = 5
-            mock_stats.return_value = session_data
-            mock_do_start.return_value = None
+            result = await _run_session_job(mock_bot, self._job("start", attempt=2))
 
-            await _retry_session_later(mock_bot, mock_member, "api-key", "start")
+        assert result is None
+        mock_do_start.assert_called_once_with(mock_bot, mock_user, "api-key", session_data)
+        mock_bot.log.info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_end_job_is_retried(self, mock_bot, mock_key_dal):
+        """Test that a failed end snapshot asks for the first background retry."""
+        with patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=None):
+            result = await _run_session_job(mock_bot, self._job("end"))
 
-            mock_sleep.assert_called_once_with(60.0)
-            mock_do_start.assert_called_once_with(mock_bot, mock_member, "api-key", session_data)
-            mock_member.send.assert_not_called()
+        assert result == 60.0
+        mock_bot.log.warning.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_retry_succeeds_on_first_bg_attempt_end(self, mock_bot, mock_member):
-        """Test background retry succeeds on first attempt for end session."""
-        session_data = {"acc_name": "TestUser.1234", "wvw_rank": 50}
+    async def test_failed_retry_backs_off(self, mock_bot, mock_key_dal):
+        """Test that failed retries wait longer each attempt."""
+        with patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=None):
+            assert await _run_session_job(mock_bot, self._job("start", attempt=1)) == 120.0
+            assert await _run_session_job(mock_bot, self._job("start", attempt=2)) == 240.0
+
+    @pytest.mark.asyncio
+    async def test_all_retries_exhausted_sends_dm(self, mock_bot, mock_user, mock_key_dal):
+        """Test DM is sent when all background retries are exhausted."""
+        with patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=None):
+            result = await _run_session_job(mock_bot, self._job("start", attempt=3))
+
+        assert result is None
+        mock_user.send.assert_called_once()
+        assert "GW2 API was unreachable" in mock_user.send.call_args[0][0]
+        mock_bot.log.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_dm_failure_handled_gracefully(self, mock_bot, mock_user, mock_key_dal):
+        """Test that DM send failure is handled gracefully when user has DMs disabled."""
+        mock_user.send.side_effect = discord.HTTPException(MagicMock(), "Forbidden")
+
+        with patch("src.gw2.tools.gw2_utils.get_user_stats", return_value=None):
+            result = await _run_session_job(mock_bot, self._job("end", attempt=3))
+
+        assert result is None
+        mock_user.send.assert_called_once()
+        mock_bot.log.warning.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_job_without_api_key_is_dropped(self, mock_bot, mock_key_dal):
+        """Test that jobs of users who removed their key are dropped."""
+        mock_key_dal.get_api_key_by_user.return_value = None
+
+        with patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats:
+            result = await _run_session_job(mock_bot, self._job("end"))
+
+        assert result is None
+        mock_stats.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_uncached_user_is_fetched(self, mock_bot, mock_user, mock_key_dal):
+        """Test that a user missing from the cache is fetched."""
+        mock_bot.get_user.return_value = None
+        mock_bot.fetch_user = AsyncMock(return_value=mock_user)
 
         with (
-            patch("src.gw2.tools.gw2_utils.asyncio.sleep") as mock_sleep,
-            patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats,
+            patch("src.gw2.tools.gw2_utils.get_user_stats", return_value={"acc_name": "TestUser.1234"}),
             patch("src.gw2.tools.gw2_utils._do_end_session") as mock_do_end,
+        ):
+            await _run_session_job(mock_bot, self._job("end"))
+
+        mock_bot.fetch_user.assert_awaited_once_with(12345)
+        assert mock_do_end.call_args[0][1] is mock_user
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_dropped(self, mock_bot, mock_key_dal):
+        """Test that jobs of users Discord no longer knows are dropped."""
+        mock_bot.get_user.return_value = None
+        mock_bot.fetch_user = AsyncMock(side_effect=discord.NotFound(MagicMock(), "Unknown User"))
+
+        with patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats:
+            result = await _run_session_job(mock_bot, self._job("end"))
+
+        assert result is None
+        mock_stats.assert_not_called()
+
+
+class TestSessionEndState:
+    """Test cases for is_session_ending and get_session_end_remaining_seconds."""
+
+    def test_scheduled_end_is_ending(self):
+        """Test that a user with a scheduled end job is ending a session."""
+        with patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs:
+            mock_jobs.get_pending_actions.return_value = ["end"]
+
+            assert is_session_ending(12345) is True
+
+    def test_no_job_is_not_ending(self):
+        """Test that a user without jobs or a running end is not ending a session."""
+        with (
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+            patch("src.gw2.tools.gw2_utils._session_actors") as mock_actors,
+        ):
+            mock_jobs.get_pending_actions.return_value = []
+            mock_actors.is_ending.return_value = False
+
+            assert is_session_ending(12345) is False
+
+    def test_queued_end_is_ending(self):
+        """Test that a user whose session actor is running or holding an end is ending a session."""
+        with (
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+            patch("src.gw2.tools.gw2_utils._session_actors") as mock_actors,
+        ):
+            mock_jobs.get_pending_actions.return_value = []
+            mock_actors.is_ending.return_value = True
+
+            assert is_session_ending(12345) is True
+            mock_actors.is_ending.assert_called_once_with(12345)
+
+    def test_remaining_seconds_until_end_job(self):
+        """Test the seconds left until the scheduled end job runs."""
+        now = datetime(2026, 10, 18, 12, 0, 0)
+        with (
+            patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs,
+            patch("src.gw2.tools.gw2_utils.bot_utils.get_current_date_time", return_value=now),
+        ):
+            mock_jobs.get_run_at.return_value = now + timedelta(seconds=95)
+
+            assert get_session_end_remaining_seconds(12345) == 95
+            mock_jobs.get_run_at.assert_called_once_with(12345, "end")
+
+    def test_remaining_seconds_without_end_job(self):
+        """Test that None is returned when no end job is scheduled."""
+        with patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs:
+            mock_jobs.get_run_at.return_value = None
+
+            assert get_session_end_remaining_seconds(12345) is None
+
+
+class TestStartSessionJobs:
+    """Test cases for start_session_jobs."""
+
+    def test_starts_scheduler_with_job_runner(self):
+        """Test that the scheduler is started with the session job runner."""
+        bot = MagicMock()
+        with patch("src.gw2.tools.gw2_utils._session_jobs") as mock_jobs:
+            start_session_jobs(bot)
+
+            mock_jobs.start.assert_called_once_with(bot, _run_actor_session_job)
+
+
+class TestStartSessionSampler:
+    """Test cases for start_session_sampler."""
+
+    def test_disabled_by_default(self):
+        """Test that nothing is sampled unless sampling is enabled."""
+        with (
             patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+            patch("src.gw2.tools.gw2_utils._session_sampler") as mock_sampler,
         ):
-            mock_settings.api_session_retry_bg_delay = 60.0
-            mock_settings.api_retry_max_attempts = 5
-            mock_stats.return_value = session_data
-            mock_do_end.return_value = None
+            mock_settings.api_session_sampling_enabled = False
 
-            await _retry_session_later(mock_bot, mock_member, "api-key", "end")
+            assert start_session_sampler(MagicMock()) is None
 
-            mock_sleep.assert_called_once_with(60.0)
-            mock_do_end.assert_called_once_with(mock_bot, mock_member, "api-key", session_data)
-            mock_member.send.assert_not_called()
+            mock_sampler.start.assert_not_called()
+
+    def test_samples_playing_members(self):
+        """Test that the sampler is started on the members the session actors see playing."""
+        bot = MagicMock()
+        with (
+            patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+            patch("src.gw2.tools.gw2_utils._session_sampler") as mock_sampler,
+            patch("src.gw2.tools.gw2_utils._session_actors") as mock_actors,
+        ):
+            mock_settings.api_session_sampling_enabled = True
+
+            assert start_session_sampler(bot) is mock_sampler.start.return_value
+
+            mock_sampler.start.assert_called_once_with(bot, mock_actors.playing_members, _sample_user_stats)
 
     @pytest.mark.asyncio
-    async def test_retry_succeeds_on_third_attempt(self, mock_bot, mock_member):
-        """Test background retry succeeds after multiple failed attempts."""
-        session_data = {"acc_name": "TestUser.1234", "wvw_rank": 50}
+    async def test_samples_at_prefetch_priority(self):
+        """Test that samples yield the GW2 API to commands and session snapshots."""
+        bot = MagicMock()
+        with patch("src.gw2.tools.gw2_utils.get_user_stats", AsyncMock(return_value={"gold": 1})) as mock_stats:
+            assert await _sample_user_stats(bot, "api-key") == {"gold": 1}
+
+            mock_stats.assert_awaited_once_with(bot, "api-key", RequestPriority.PREFETCH)
+
 
+class TestRunActorSessionJob:
+    """Test cases for _run_actor_session_job."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("retry_delay", "retrying"), [(None, False), (30.0, True)])
+    async def test_job_moves_actor_states(self, retry_delay, retrying):
+        """Test that the session actor of the user follows the job from start to finish."""
+        bot = MagicMock()
+        job = {"id": "job-1", "user_id": 12345, "action": "end", "attempt": 0, "run_at": datetime(2024, 1, 1)}
         with (
-            patch("src.gw2.tools.gw2_utils.asyncio.sleep") as mock_sleep,
-            patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats,
-            patch("src.gw2.tools.gw2_utils._do_start_session") as mock_do_start,
-            patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+            patch("src.gw2.tools.gw2_utils._session_actors") as mock_actors,
+            patch("src.gw2.tools.gw2_utils._run_session_job", AsyncMock(return_value=retry_delay)) as mock_run,
         ):
-            mock_settings.api_session_retry_bg_delay = 60.0
-            mock_settings.api_retry_max_attempts = 5
-            mock_stats.side_effect = [None, None, session_data]
-            mock_do_start.return_value = None
+            assert await _run_actor_session_job(bot, job) == retry_delay
 
-            await _retry_session_later(mock_bot, mock_member, "api-key", "start")
+            mock_run.assert_awaited_once_with(bot, job)
+            mock_actors.job_started.assert_called_once_with(12345, "end")
+            mock_actors.job_finished.assert_called_once_with(12345, "end", retrying=retrying)
 
-            assert mock_sleep.call_count == 3
-            mock_do_start.assert_called_once_with(mock_bot, mock_member, "api-key", session_data)
-            mock_member.send.assert_not_called()
+    @pytest.mark.asyncio
+    async def test_failing_job_finishes_actor_job(self):
+        """Test that a failing job still moves the session actor out of its running state."""
+        job = {"id": "job-1", "user_id": 12345, "action": "start", "attempt": 0, "run_at": datetime(2024, 1, 1)}
+        with (
+            patch("src.gw2.tools.gw2_utils._session_actors") as mock_actors,
+            patch("src.gw2.tools.gw2_utils._run_session_job", AsyncMock(side_effect=RuntimeError("boom"))),
+        ):
+            with pytest.raises(RuntimeError, match="boom"):
+                await _run_actor_session_job(MagicMock(), job)
+
+            mock_actors.job_finished.assert_called_once_with(12345, "start", retrying=False)
 
     @pytest.mark.asyncio
-    async def test_all_retries_exhausted_sends_dm(self, mock_bot, mock_member):
-        """Test DM is sent when all background retries are exhausted."""
+    @pytest.mark.parametrize(
+        ("action", "attempt", "end_delay"), [("end", 0, True), ("end", 1, False), ("start", 0, False)]
+    )
+    async def test_job_metrics(self, action, attempt, end_delay):
+        """Test that the job lag is recorded, and the end delay only for the first try of an end."""
+        job = {"id": "job-1", "user_id": 12345, "action": action, "attempt": attempt, "run_at": datetime(2024, 1, 1)}
         with (
-            patch("src.gw2.tools.gw2_utils.asyncio.sleep"),
-            patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats,
-            patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+            patch("src.gw2.tools.gw2_utils._session_actors"),
+            patch("src.gw2.tools.gw2_utils._session_metrics") as mock_metrics,
+            patch("src.gw2.tools.gw2_utils._run_session_job", AsyncMock(return_value=None)),
+            patch(
+                "src.gw2.tools.gw2_utils.bot_utils.get_current_date_time",
+                return_value=datetime(2024, 1, 1, 0, 0, 2, tzinfo=UTC),
+            ),
         ):
-            mock_settings.api_session_retry_bg_delay = 60.0
-            mock_settings.api_retry_max_attempts = 3
-            mock_stats.return_value = None
+            await _run_actor_session_job(MagicMock(), job)
 
-            await _retry_session_later(mock_bot, mock_member, "api-key", "start")
+            mock_metrics.observe.assert_called_once_with("job_lag", 2.0)
+            assert mock_metrics.end_job_started.called is end_delay
 
-            mock_member.send.assert_called_once()
-            sent_msg = mock_member.send.call_args[0][0]
-            assert "GW2 API was unreachable" in sent_msg
-            mock_bot.log.error.assert_called_once()
+
+class TestSessionPipelineStats:
+    """Test cases for the session pipeline stats and their JSON log export."""
+
+    def test_every_stage_is_reported(self):
+        """Test that the stats gather every stage of the session pipeline."""
+        stats = get_session_pipeline_stats()
+
+        assert set(stats) == {"presence", "actors", "states", "batches", "jobs", "sampler", "pipeline"}
+        assert "presence_to_db" in stats["pipeline"]["latency"]
+
+    def test_log_disabled_by_default(self):
+        """Test that nothing is logged unless an interval is set."""
+        with patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings:
+            mock_settings.api_session_metrics_log_interval = 0.0
+
+            assert start_session_metrics_log(MagicMock()) is None
 
     @pytest.mark.asyncio
-    async def test_dm_failure_handled_gracefully(self, mock_bot, mock_member):
-        """Test that DM send failure is handled gracefully when user has DMs disabled."""
+    async def test_logs_stats_as_json(self):
+        """Test that the stats are logged as one JSON line per interval."""
+        bot = MagicMock()
         with (
-            patch("src.gw2.tools.gw2_utils.asyncio.sleep"),
-            patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats,
             patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+            patch("src.gw2.tools.gw2_utils.get_session_pipeline_stats", return_value={"jobs": {"pending": 1}}),
         ):
-            mock_settings.api_session_retry_bg_delay = 60.0
-            mock_settings.api_retry_max_attempts = 2
-            mock_stats.return_value = None
-            mock_member.send.side_effect = discord.HTTPException(MagicMock(), "Forbidden")
+            mock_settings.api_session_metrics_log_interval = 0.001
+            task = start_session_metrics_log(bot)
+            for _ in range(100):
+                if bot.log.info.called:
+                    break
+                await asyncio.sleep(0.001)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        bot.log.info.assert_called_with('GW2 session metrics: {"jobs":{"pending":1}}')
 
-            await _retry_session_later(mock_bot, mock_member, "api-key", "end")
 
-            mock_member.send.assert_called_once()
-            mock_bot.log.warning.assert_called()
+class TestMaintainSessionPartitions:
+    """Test cases for the monthly session partition maintenance."""
+
+    @pytest.fixture
+    def mock_bot(self):
+        bot = MagicMock()
+        bot.db_session = MagicMock()
+        bot.log = MagicMock()
+        return bot
+
+    @pytest.fixture
+    def mock_dal(self):
+        with (
+            patch("src.gw2.tools.gw2_utils.Gw2SessionsDal") as mock_dal_class,
+            patch(
+                "src.gw2.tools.gw2_utils.bot_utils.get_current_date_time",
+                return_value=datetime(2026, 1, 18, 12, 0, 0, tzinfo=UTC),
+            ),
+        ):
+            dal = mock_dal_class.return_value
+            dal.create_partition = AsyncMock()
+            dal.drop_partitions_before = AsyncMock(return_value=[])
+            yield dal
+
+    @pytest.fixture(autouse=True)
+    def mock_samples_dal(self):
+        with patch("src.gw2.tools.gw2_utils.Gw2SessionSamplesDal") as mock_samples_dal_class:
+            samples_dal = mock_samples_dal_class.return_value
+            samples_dal.delete_samples_before = AsyncMock(return_value=0)
+            yield samples_dal
+
+    @pytest.mark.asyncio
+    async def test_creates_this_and_next_month(self, mock_bot, mock_dal):
+        """Test that the partitions of this month and the next one are created."""
+        await maintain_session_partitions(mock_bot)
+
+        assert mock_dal.create_partition.call_args_list == [((date(2026, 1, 1),),), ((date(2026, 2, 1),),)]
+
+    @pytest.mark.asyncio
+    async def test_drops_partitions_past_retention(self, mock_bot, mock_dal):
+        """Test that partitions older than the retention months are dropped."""
+        mock_dal.drop_partitions_before.return_value = ["gw2_sessions_p202412"]
+        with patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings:
+            mock_settings.api_session_retention_months = 12
+
+            await maintain_session_partitions(mock_bot)
+
+        mock_dal.drop_partitions_before.assert_awaited_once_with(date(2025, 1, 1))
+        mock_bot.log.info.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_retry_uses_correct_delay_and_attempts(self, mock_bot, mock_member):
-        """Test that retry uses configured delay and max attempts."""
+    async def test_retention_disabled_keeps_partitions(self, mock_bot, mock_dal, mock_samples_dal):
+        """Test that no partition is dropped with a retention of 0 months."""
+        with patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings:
+            mock_settings.api_session_retention_months = 0
+
+            await maintain_session_partitions(mock_bot)
+
+        mock_dal.drop_partitions_before.assert_not_called()
+        mock_samples_dal.delete_samples_before.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deletes_samples_past_retention(self, mock_bot, mock_dal, mock_samples_dal):
+        """Test that session samples older than the retention months are deleted with the partitions."""
+        mock_samples_dal.delete_samples_before.return_value = 250
+        with patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings:
+            mock_settings.api_session_retention_months = 12
+
+            await maintain_session_partitions(mock_bot)
+
+        mock_samples_dal.delete_samples_before.assert_awaited_once_with(datetime(2025, 1, 1))
+        mock_bot.log.info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_runs_maintenance_in_background(self, mock_bot):
+        """Test that the daily maintenance task logs failures and keeps running."""
+        with (
+            patch("src.gw2.tools.gw2_utils.maintain_session_partitions", side_effect=RuntimeError("db down")),
+            patch("src.gw2.tools.gw2_utils.asyncio.sleep", side_effect=asyncio.CancelledError),
+        ):
+            task = start_session_partitions(mock_bot)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        mock_bot.log.error.assert_called_once()
+
+
+class TestGetSessionRetryPolicy:
+    """Test cases for get_session_retry_policy."""
+
+    def test_policy_uses_session_settings(self):
+        """Test that the background policy is built from the session retry settings."""
+        with patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings:
+            mock_settings.api_retry_max_attempts = 4
+            mock_settings.api_session_retry_bg_delay = 30.0
+            mock_settings.api_session_retry_bg_max_delay = 300.0
+
+            policy = get_session_retry_policy()
+
+        assert policy.max_attempts == 4
+        assert policy.base_delay == 30.0
+        assert policy.max_delay == 300.0
+        assert policy.max_elapsed is None
+
+    def test_backoff_is_capped(self):
+        """Test that background backoff never exceeds the configured maximum."""
         with (
-            patch("src.gw2.tools.gw2_utils.asyncio.sleep") as mock_sleep,
-            patch("src.gw2.tools.gw2_utils.get_user_stats") as mock_stats,
             patch("src.gw2.tools.gw2_utils._gw2_settings") as mock_settings,
+            patch("src.gw2.tools.gw2_retry._random.uniform", side_effect=lambda low, high: high),
         ):
-            mock_settings.api_session_retry_bg_delay = 120.0
-            mock_settings.api_retry_max_attempts = 2
-            mock_stats.return_value = None
+            mock_settings.api_retry_max_attempts = 10
+            mock_settings.api_session_retry_bg_delay = 30.0
+            mock_settings.api_session_retry_bg_max_delay = 300.0
 
-            await _retry_session_later(mock_bot, mock_member, "api-key", "start")
+            policy = get_session_retry_policy()
+            delays = [policy.compute_delay(attempt) for attempt in range(1, 7)]
 
-            assert mock_sleep.call_count == 2
-            mock_sleep.assert_called_with(120.0)
-            assert mock_stats.call_count == 2
+        assert delays == [30.0, 60.0, 120.0, 240.0, 300.0, 300.0]